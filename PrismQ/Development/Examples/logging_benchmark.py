@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of log calls per second under thread concurrency.
+
+Compares file logging written synchronously by a FileHandler on the calling
+threads with the default queued pipeline (QueueHandler + QueueListener), in
+text and JSON format. Every call runs inside log_context() so the context
+lookup is part of the measured hot path.
+
+Usage:
+    python PrismQ/Development/Examples/logging_benchmark.py --threads 8 --calls 20000
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from PrismQ.Shared.logging import flush_logging, get_logger, log_context, reset_logging, setup_logging
+
+
+def run(threads: int, calls: int, queue_output: bool, json_format: bool, log_dir: Path) -> dict:
+    """Log `calls` records from each of `threads` threads and time it."""
+    reset_logging()
+    setup_logging(
+        level="INFO",
+        log_dir=log_dir,
+        console_output=False,
+        file_output=True,
+        json_format=json_format,
+        queue_output=queue_output,
+    )
+    logger = get_logger("benchmark")
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(n: int) -> None:
+        with log_context(request_id=f"req-{n}", worker=n):
+            barrier.wait()
+            for i in range(calls):
+                logger.info("Processed item %d", i, extra={"item": i})
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for t in workers:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in workers:
+        t.join()
+    hot_path = time.perf_counter() - start
+    flush_logging()
+    total = time.perf_counter() - start
+    reset_logging()
+
+    records = threads * calls
+    return {
+        "calls_per_sec": records / hot_path,
+        "written_per_sec": records / total,
+        "hot_path_seconds": hot_path,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark log calls/sec under concurrency")
+    parser.add_argument("--threads", type=int, default=8, help="Logging threads")
+    parser.add_argument("--calls", type=int, default=20000, help="Log calls per thread")
+    args = parser.parse_args()
+
+    print(f"{args.threads} threads x {args.calls} calls")
+    print(f"{'mode':<18}{'format':<8}{'calls/s':>12}{'written/s':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for json_format in (False, True):
+            for queue_output in (False, True):
+                result = run(args.threads, args.calls, queue_output, json_format, Path(tmp))
+                print(
+                    f"{'queued' if queue_output else 'synchronous':<18}"
+                    f"{'json' if json_format else 'text':<8}"
+                    f"{result['calls_per_sec']:>12,.0f}{result['written_per_sec']:>12,.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
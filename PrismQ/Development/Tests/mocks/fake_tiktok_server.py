@@ -0,0 +1,157 @@
+"""
+Fake TikTok Content Posting API server for upload tests.
+
+Runs a real HTTP server on localhost that implements the init, chunk PUT and
+status endpoints, reassembles chunks from their Content-Range headers and can
+inject failures, so chunked and resumable uploads are tested end to end.
+"""
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+
+
+class FakeTikTokServer:
+    """
+    In-process TikTok upload server.
+
+    Example:
+        with FakeTikTokServer() as server:
+            uploader = TikTokUploader(access_token="token", api_base_url=server.base_url)
+            uploader.upload_video("video.mp4", metadata)
+            assert server.video_bytes(server.last_publish_id) == data
+    """
+
+    def __init__(self, chunk_delay: float = 0.0):
+        self.chunk_delay = chunk_delay
+        self.init_requests: List[dict] = []
+        self.chunk_requests: List[Tuple[str, str]] = []
+        self.uploads: Dict[str, dict] = {}
+        # Status codes returned (in order) for the next PUTs of a chunk index
+        self.fail_chunks: Dict[int, List[int]] = {}
+        self.active_puts = 0
+        self.max_active_puts = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v2"
+
+    @property
+    def last_publish_id(self) -> Optional[str]:
+        return list(self.uploads)[-1] if self.uploads else None
+
+    def start(self) -> "FakeTikTokServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeTikTokServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def video_bytes(self, publish_id: str) -> bytes:
+        """Reassembled upload, ordered by chunk offset."""
+        chunks = self.uploads[publish_id]["chunks"]
+        return b"".join(chunks[offset] for offset in sorted(chunks))
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, payload: dict, status: int = 200) -> None:
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _read_body(self) -> bytes:
+                return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+            def do_POST(self):
+                payload = json.loads(self._read_body() or b"{}")
+                if self.path.endswith("/post/publish/video/init/"):
+                    source = payload.get("source_info", {})
+                    video_size, chunk_size = source.get("video_size", 0), source.get("chunk_size", 0)
+                    if (
+                        not 0 < chunk_size <= video_size
+                        or source.get("total_chunk_count") != max(1, video_size // chunk_size)
+                    ):
+                        self._send_json(
+                            {"error": {"code": "invalid_params", "message": "bad chunk declaration"}},
+                            status=400,
+                        )
+                        return
+                    with server._lock:
+                        server.init_requests.append(payload)
+                        publish_id = f"pub_{len(server.init_requests)}"
+                        server.uploads[publish_id] = {"source_info": payload["source_info"], "chunks": {}}
+                    host, port = server._httpd.server_address[:2]
+                    self._send_json({
+                        "data": {"publish_id": publish_id, "upload_url": f"http://{host}:{port}/upload/{publish_id}"},
+                        "error": {"code": "ok", "message": ""},
+                    })
+                elif self.path.endswith("/post/publish/status/fetch/"):
+                    upload = server.uploads.get(payload.get("publish_id"))
+                    received = sum(len(c) for c in upload["chunks"].values()) if upload else 0
+                    complete = upload and received == upload["source_info"]["video_size"]
+                    self._send_json({"data": {
+                        "status": "PUBLISH_COMPLETE" if complete else "FAILED",
+                        "video_id": f"video_{payload.get('publish_id')}" if complete else None,
+                        "fail_reason": None if complete else "incomplete upload",
+                    }})
+                else:
+                    self._send_json({"error": {"code": "not_found"}}, status=404)
+
+            def do_PUT(self):
+                publish_id = self.path.rsplit("/", 1)[-1]
+                content_range = self.headers.get("Content-Range", "")
+                body = self._read_body()
+                upload = server.uploads.get(publish_id)
+                match = CONTENT_RANGE.fullmatch(content_range)
+                if upload is None or match is None:
+                    self._send_json({"error": {"code": "invalid_params"}}, status=400)
+                    return
+
+                first, last, total = (int(g) for g in match.groups())
+                index = first // upload["source_info"]["chunk_size"]
+                with server._lock:
+                    server.chunk_requests.append((publish_id, content_range))
+                    failures = server.fail_chunks.get(index)
+                    status = failures.pop(0) if failures else 200
+                    server.active_puts += 1
+                    server.max_active_puts = max(server.max_active_puts, server.active_puts)
+                try:
+                    if server.chunk_delay:
+                        time.sleep(server.chunk_delay)
+                    if status != 200:
+                        self._send_json({"error": {"code": "internal_error"}}, status=status)
+                    elif len(body) != last - first + 1 or total != upload["source_info"]["video_size"]:
+                        self._send_json({"error": {"code": "invalid_range"}}, status=416)
+                    else:
+                        with server._lock:
+                            upload["chunks"][first] = body
+                        self._send_json({}, status=201 if last + 1 < total else 200)
+                finally:
+                    with server._lock:
+                        server.active_puts -= 1
+
+        return Handler
@@ -0,0 +1,94 @@
+"""
+Recorded-response fake of the YouTube Analytics API v2 service.
+
+``RecordedAnalyticsService`` replays report responses captured from the real
+API: each ``reports().query(**params).execute()`` call returns the recorded
+response whose request parameters match exactly, and fails loudly when there
+is none, so tests notice when the queries a provider sends change.
+``RecordingAnalyticsService`` wraps a real service to capture new recordings.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+RECORDINGS_DIR = Path(__file__).parent / "recordings"
+
+
+def _key(params: Dict[str, Any]) -> str:
+    return json.dumps(params, sort_keys=True)
+
+
+class _Request:
+    def __init__(self, execute):
+        self.execute = execute
+
+
+class RecordedAnalyticsService:
+    """
+    Offline stand-in for ``build("youtubeAnalytics", "v2", ...)``.
+
+    Example:
+        service = RecordedAnalyticsService("youtube_analytics_reports.json")
+        analytics = YouTubeAnalytics(analytics_service=service)
+    """
+
+    def __init__(self, recording: Union[str, Path]):
+        path = Path(recording)
+        if not path.is_absolute():
+            path = RECORDINGS_DIR / path
+        with open(path) as f:
+            self.recordings = {_key(item["request"]): item["response"] for item in json.load(f)}
+        self.queries: List[Dict[str, Any]] = []
+
+    def reports(self) -> "RecordedAnalyticsService":
+        return self
+
+    def query(self, **params: Any) -> _Request:
+        self.queries.append(params)
+
+        def execute() -> Dict[str, Any]:
+            try:
+                return json.loads(json.dumps(self.recordings[_key(params)]))
+            except KeyError:
+                raise LookupError(f"No recorded YouTube Analytics response for {params}") from None
+
+        return _Request(execute)
+
+
+class RecordingAnalyticsService:
+    """
+    Wraps a real Analytics service and captures request/response pairs.
+
+    Example:
+        recorder = RecordingAnalyticsService(analytics.youtube_analytics)
+        analytics.youtube_analytics = recorder
+        analytics.get_bulk_video_analytics(video_ids)
+        recorder.save("youtube_analytics_reports.json")
+    """
+
+    def __init__(self, service: Any):
+        self.service = service
+        self.recorded: List[Dict[str, Any]] = []
+
+    def reports(self) -> "RecordingAnalyticsService":
+        return self
+
+    def query(self, **params: Any) -> _Request:
+        request = self.service.reports().query(**params)
+
+        def execute() -> Dict[str, Any]:
+            response = request.execute()
+            self.recorded.append({"request": params, "response": response})
+            return response
+
+        return _Request(execute)
+
+    def save(self, recording: Union[str, Path]) -> Path:
+        path = Path(recording)
+        if not path.is_absolute():
+            path = RECORDINGS_DIR / path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.recorded, f, indent=2)
+        return path
@@ -0,0 +1,154 @@
+"""
+Unit tests for the batch audio production scheduler.
+"""
+
+import json
+from pathlib import Path
+
+from PrismQ.VoiceOverGenerator.audio_production import AudioNormalizer, TTSGenerator
+from PrismQ.VoiceOverGenerator.audio_scheduler import (
+    STATUS_DONE,
+    STATUS_FAILED,
+    AudioProductionScheduler,
+    load_scripts,
+)
+
+
+class CountingTTS(TTSGenerator):
+    """Mock-provider generator that counts synthesis calls."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, provider="mock", **kwargs)
+        self.calls = 0
+
+    def _generate_audio(self, text, voice_id, model):
+        self.calls += 1
+        return b"MOCK_AUDIO_DATA"
+
+
+class CopyNormalizer(AudioNormalizer):
+    """Normalizer that copies the raw file, optionally failing for some scripts."""
+
+    def __init__(self, output_root, fail_ids=()):
+        super().__init__(output_root=output_root, engine="ffmpeg")
+        self.fail_ids = set(fail_ids)
+
+    def normalize_audio(self, audio, target_lufs=-14.0, true_peak=-1.0):
+        if audio.script_id in self.fail_ids:
+            raise RuntimeError("normalization failed")
+        output = self.output_root / "normalized" / f"{audio.script_id}_normalized.mp3"
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_bytes(Path(audio.raw_path).read_bytes())
+        audio.normalized_path = str(output)
+        audio.metadata.lufs = target_lufs
+        return audio
+
+
+def _write_scripts(root, count):
+    for i in range(count):
+        path = root / "v0" / "women" / "18-23" / f"script_{i:03d}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({
+            'script_id': f'script_{i:03d}',
+            'content': f'Script number {i}',
+            'target_gender': 'women',
+            'target_age': '18-23',
+        }))
+
+
+def _scheduler(tmp_path, generator, normalizer, use_processes=False):
+    return AudioProductionScheduler(
+        generator=generator,
+        normalizer=normalizer,
+        manifest_path=tmp_path / "audio" / "production_manifest.json",
+        tts_workers=3,
+        normalize_workers=2,
+        use_processes=use_processes,
+        metadata_root=tmp_path / "audio" / "metadata",
+    )
+
+
+class TestLoadScripts:
+    def test_directory(self, tmp_path):
+        _write_scripts(tmp_path / "scripts", 3)
+        (tmp_path / "scripts" / "notes.json").write_text('{"not": "a script"}')
+
+        scripts = load_scripts(tmp_path / "scripts")
+
+        assert [s['script_id'] for s in scripts] == ['script_000', 'script_001', 'script_002']
+
+    def test_jsonl_manifest_with_paths_and_inline_scripts(self, tmp_path):
+        _write_scripts(tmp_path / "scripts", 1)
+        manifest = tmp_path / "manifest.jsonl"
+        manifest.write_text(
+            json.dumps("scripts/v0/women/18-23/script_000.json") + "\n"
+            + json.dumps({'script_id': 'inline', 'content': 'Inline script'}) + "\n"
+        )
+
+        scripts = load_scripts(manifest)
+
+        assert [s['script_id'] for s in scripts] == ['script_000', 'inline']
+
+
+class TestScheduler:
+    def test_run_produces_all_audio(self, tmp_path):
+        _write_scripts(tmp_path / "scripts", 5)
+        root = str(tmp_path / "audio")
+        scheduler = _scheduler(tmp_path, CountingTTS(output_root=root), CopyNormalizer(root))
+
+        report = scheduler.run(load_scripts(tmp_path / "scripts"))
+
+        assert report.completed == 5 and report.failed == 0 and report.resumed == 0
+        assert report.scripts_per_minute > 0
+        assert set(report.phase_seconds) == {'tts', 'normalize'}
+        manifest = json.loads((tmp_path / "audio" / "production_manifest.json").read_text())
+        assert all(r['status'] == STATUS_DONE for r in manifest['scripts'].values())
+        assert len(list((tmp_path / "audio" / "metadata").glob("*.json"))) == 5
+
+    def test_resume_skips_finished_and_retries_normalization_only(self, tmp_path):
+        _write_scripts(tmp_path / "scripts", 4)
+        scripts = load_scripts(tmp_path / "scripts")
+        root = str(tmp_path / "audio")
+
+        first = _scheduler(
+            tmp_path, CountingTTS(output_root=root), CopyNormalizer(root, fail_ids={'script_002'})
+        )
+        report = first.run(scripts)
+        assert report.completed == 3 and report.failed == 1
+        assert first.records['script_002'].status == STATUS_FAILED
+
+        generator = CountingTTS(output_root=root)
+        second = _scheduler(tmp_path, generator, CopyNormalizer(root))
+        report = second.run(scripts)
+
+        assert generator.calls == 0
+        assert report.resumed == 3
+        assert report.completed == 4 and report.failed == 0
+        assert len(second._phase_times['normalize']) == 1
+
+    def test_missing_output_is_regenerated(self, tmp_path):
+        _write_scripts(tmp_path / "scripts", 2)
+        scripts = load_scripts(tmp_path / "scripts")
+        root = str(tmp_path / "audio")
+        first = _scheduler(tmp_path, CountingTTS(output_root=root), CopyNormalizer(root))
+        first.run(scripts)
+
+        Path(first.records['script_001'].audio['normalized_path']).unlink()
+        second = _scheduler(tmp_path, CountingTTS(output_root=root), CopyNormalizer(root))
+        report = second.run(scripts)
+
+        assert report.resumed == 1 and report.completed == 2
+
+    def test_process_pool_normalization(self, tmp_path):
+        _write_scripts(tmp_path / "scripts", 3)
+        root = str(tmp_path / "audio")
+        scheduler = _scheduler(
+            tmp_path, CountingTTS(output_root=root), CopyNormalizer(root), use_processes=True
+        )
+
+        report = scheduler.run(load_scripts(tmp_path / "scripts"))
+
+        assert report.completed == 3
+        assert all(
+            Path(r.audio['normalized_path']).exists() for r in scheduler.records.values()
+        )
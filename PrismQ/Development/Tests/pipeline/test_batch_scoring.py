@@ -0,0 +1,110 @@
+"""
+Unit tests for batch title scoring module.
+"""
+
+import numpy as np
+
+from PrismQ.StoryTitleScoring.batch_scoring import (
+    DIMENSIONS,
+    FEATURE_NAMES,
+    extract_features,
+    score_titles_batch,
+)
+from PrismQ.StoryTitleScoring.title_scoring import TitleScorer
+
+
+SAMPLE_TEXTS = [
+    "Why nobody tells you about this shocking secret?",
+    "The 3 secrets nobody told me about",
+    "Some things about stuff",
+    "How I learned to overcome my biggest fear",
+    "Thing",
+    "What my boss said when I quit!!",
+    "10 reasons why everyone should tell their family the truth",
+    "An extraordinarily incomprehensible characterization of bureaucratic procedures",
+]
+
+
+class TestBatchScoring:
+    """Tests for vectorized batch scoring."""
+
+    def test_feature_matrix_shape(self):
+        """Test feature extraction returns one row per title."""
+        features = extract_features(SAMPLE_TEXTS, TitleScorer().config)
+
+        assert features.shape == (len(SAMPLE_TEXTS), len(FEATURE_NAMES))
+
+    def test_empty_batch(self):
+        """Test scoring an empty batch."""
+        result = score_titles_batch([], TitleScorer().config)
+
+        assert len(result) == 0
+        assert result.breakdown.shape == (0, len(DIMENSIONS))
+        assert result.to_dicts() == []
+
+    def test_matches_per_title_scoring(self):
+        """Test batch scores equal score_title() for every title."""
+        scorer = TitleScorer()
+        titles = [
+            {"id": f"t{i}", "text": text, "topic_id": "topic_01"}
+            for i, text in enumerate(SAMPLE_TEXTS)
+        ]
+
+        batch = scorer.score_titles_batch(titles)
+
+        for title, row in zip(titles, batch.to_dicts()):
+            expected = scorer.score_title(title)
+            assert row["score"] == expected["score"]
+            assert row["score_breakdown"] == expected["score_breakdown"]
+            assert row["score_tier"] == expected["score_tier"]
+
+    def test_does_not_mutate_input(self):
+        """Test batch scoring leaves the input dicts untouched."""
+        titles = [{"id": "t1", "text": SAMPLE_TEXTS[0]}]
+
+        batch = score_titles_batch(titles, TitleScorer().config)
+        batch.to_dicts()
+
+        assert titles == [{"id": "t1", "text": SAMPLE_TEXTS[0]}]
+
+    def test_accepts_plain_strings(self):
+        """Test scoring plain title strings."""
+        batch = score_titles_batch(SAMPLE_TEXTS[:2], TitleScorer().config)
+
+        assert len(batch) == 2
+        assert batch.to_dicts()[0]["text"] == SAMPLE_TEXTS[0]
+
+    def test_all_titles_batch_regroups_by_topic(self):
+        """Test score_all_titles_batch round-trips to score_all_titles shape."""
+        scorer = TitleScorer()
+        titles_by_topic = {
+            "topic_01": [
+                {"id": "t1", "text": "Amazing discovery revealed!"},
+                {"id": "t2", "text": "5 shocking truths about life"}
+            ],
+            "topic_02": [],
+            "topic_03": [
+                {"id": "t3", "text": "Why nobody told me this?"}
+            ]
+        }
+
+        batch = scorer.score_all_titles_batch(titles_by_topic)
+        grouped = batch.to_titles_by_topic()
+
+        assert list(grouped) == ["topic_01", "topic_02", "topic_03"]
+        assert [t["id"] for t in grouped["topic_01"]] == ["t1", "t2"]
+        assert grouped["topic_02"] == []
+        assert grouped["topic_03"][0]["score"] == scorer.score_title(
+            titles_by_topic["topic_03"][0]
+        )["score"]
+
+    def test_top_k(self):
+        """Test top_k returns best-first row indices."""
+        batch = score_titles_batch(SAMPLE_TEXTS, TitleScorer().config)
+
+        top = batch.top_k(3)
+
+        assert len(top) == 3
+        assert np.all(np.diff(batch.scores[top]) <= 0)
+        assert batch.scores[top[0]] == batch.scores.max()
+        assert len(batch.top_k(100)) == len(SAMPLE_TEXTS)
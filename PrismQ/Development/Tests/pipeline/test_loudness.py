@@ -0,0 +1,138 @@
+"""
+Unit tests for the native BS.1770 loudness engine.
+"""
+
+import json
+import shutil
+import subprocess
+
+import numpy as np
+import pytest
+
+from PrismQ.VoiceOverGenerator.audio_production import AudioNormalizer, VoiceoverAudio
+from PrismQ.VoiceOverGenerator.loudness import (
+    decode_audio,
+    encode_audio,
+    integrated_loudness,
+    normalize_loudness,
+    true_peak,
+)
+
+SAMPLE_RATE = 48000
+
+requires_ffmpeg = pytest.mark.skipif(shutil.which('ffmpeg') is None, reason="ffmpeg not installed")
+
+
+def _sine(freq, seconds=5.0, amplitude=1.0, phase=0.0, sample_rate=SAMPLE_RATE):
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return amplitude * np.sin(2 * np.pi * freq * t + phase)
+
+
+def _reference_corpus():
+    rng = np.random.default_rng(7)
+    n = SAMPLE_RATE * 10
+    envelope = (np.arange(n) % (SAMPLE_RATE * 2) < SAMPLE_RATE * 1.5).astype(float)
+    return {
+        'noise': rng.normal(0, 0.1, n),
+        'speech_like': rng.normal(0, 0.2, n) * envelope,
+        'low_tone': _sine(60, 8, 0.3),
+        'high_tone': _sine(8000, 8, 0.5),
+        'quiet': rng.normal(0, 0.005, n),
+    }
+
+
+def _ffmpeg_input_lufs(path):
+    result = subprocess.run(
+        ['ffmpeg', '-i', str(path), '-af', 'loudnorm=print_format=json', '-f', 'null', '-'],
+        capture_output=True, text=True, timeout=30
+    )
+    output = result.stderr
+    return float(json.loads(output[output.rfind('{'):output.rfind('}') + 1])['input_i'])
+
+
+class TestMeasurement:
+    def test_full_scale_sine_reference(self):
+        # BS.1770: a 0 dBFS 997 Hz sine in one channel reads -3.01 LUFS
+        assert integrated_loudness(_sine(997), SAMPLE_RATE) == pytest.approx(-3.01, abs=0.05)
+
+    def test_stereo_sums_channel_energy(self):
+        mono = _sine(997, amplitude=0.5)
+        stereo = np.column_stack([mono, mono])
+        assert integrated_loudness(stereo, SAMPLE_RATE) == pytest.approx(
+            integrated_loudness(mono, SAMPLE_RATE) + 3.01, abs=0.05
+        )
+
+    def test_silence_and_short_input(self):
+        assert integrated_loudness(np.zeros(SAMPLE_RATE), SAMPLE_RATE) == float('-inf')
+        assert integrated_loudness(_sine(997, seconds=0.2), SAMPLE_RATE) == float('-inf')
+
+    def test_true_peak_finds_inter_sample_peak(self):
+        # fs/4 sine at 45 degrees: samples peak at 0.707, the waveform at 1.0
+        x = _sine(SAMPLE_RATE / 4, seconds=1.0, phase=np.pi / 4)
+        assert 20 * np.log10(np.abs(x).max()) == pytest.approx(-3.01, abs=0.05)
+        assert true_peak(x, SAMPLE_RATE) == pytest.approx(0.0, abs=0.5)
+
+
+class TestNormalization:
+    def test_reaches_target_without_limiting(self):
+        processed, result = normalize_loudness(_sine(997, amplitude=0.05), SAMPLE_RATE, -14.0, -1.0)
+
+        assert not result.limited
+        assert result.output_lufs == pytest.approx(-14.0, abs=0.01)
+        assert result.gain_db == pytest.approx(-14.0 - result.input_lufs)
+        assert result.output_lufs == pytest.approx(integrated_loudness(processed, SAMPLE_RATE))
+
+    def test_limits_true_peak(self):
+        rng = np.random.default_rng(0)
+        x = rng.normal(0, 0.05, SAMPLE_RATE * 5)
+        x[::SAMPLE_RATE] = 0.9  # sparse transients
+
+        processed, result = normalize_loudness(x, SAMPLE_RATE, -10.0, -1.0)
+
+        assert result.limited
+        assert result.output_true_peak_db <= -1.0 + 1e-6
+        assert true_peak(processed, SAMPLE_RATE) <= -1.0 + 1e-6
+        assert result.output_lufs == pytest.approx(-10.0, abs=0.5)
+
+    def test_silence_is_left_untouched(self):
+        processed, result = normalize_loudness(np.zeros(SAMPLE_RATE), SAMPLE_RATE)
+        assert result.gain_db == 0.0
+        assert not processed.any()
+
+
+@requires_ffmpeg
+class TestAgainstFfmpeg:
+    @pytest.mark.parametrize('name', sorted(_reference_corpus()))
+    def test_agrees_with_loudnorm(self, tmp_path, name):
+        path = tmp_path / f'{name}.mp3'
+        encode_audio(_reference_corpus()[name], SAMPLE_RATE, path)
+
+        native = integrated_loudness(decode_audio(path, 44100, 1), 44100)
+
+        assert native == pytest.approx(_ffmpeg_input_lufs(path), abs=0.5)
+
+    def test_normalizer_native_engine(self, tmp_path):
+        raw_dir = tmp_path / 'tts' / 'women' / '18-23' / 'raw'
+        raw_dir.mkdir(parents=True)
+        raw_path = raw_dir / 'test_001.mp3'
+        encode_audio(_reference_corpus()['speech_like'], SAMPLE_RATE, raw_path)
+
+        audio = VoiceoverAudio(
+            audio_id='test_001_tts',
+            script_id='test_001',
+            content_text='Test',
+            voice_gender='female',
+            voice_provider='mock',
+            raw_path=str(raw_path)
+        )
+        normalized = AudioNormalizer(output_root=str(tmp_path)).normalize_audio(audio)
+
+        assert normalized.metadata.lufs == pytest.approx(-14.0, abs=0.5)
+        assert normalized.metadata.peak_db <= -1.0 + 1e-6
+        assert normalized.metadata.processing_seconds > 0
+        assert _ffmpeg_input_lufs(normalized.normalized_path) == pytest.approx(-14.0, abs=1.0)
+
+
+def test_unknown_engine_rejected():
+    with pytest.raises(ValueError):
+        AudioNormalizer(engine='sox')
@@ -0,0 +1,125 @@
+"""
+Unit tests for the warm-model synthesis worker.
+
+The worker runs as a real subprocess on CPU with a tiny fake model factory.
+"""
+
+import json
+import os
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from PrismQ.VoiceOverGenerator.synthesis_worker import SynthesisWorkerClient
+from PrismQ.VoiceOverGenerator.voice_cloning import VoiceCloner, VoiceProfile
+
+FAKE_MODEL = textwrap.dedent('''
+    import json
+    import os
+    import time
+
+    LOADS = 0
+
+
+    class _Synthesizer:
+        def compute_speaker_embedding(self, audio_path):
+            return [float(len(audio_path))] * 4
+
+
+    class FakeXTTS:
+        def __init__(self, device):
+            self.device = device
+            self.synthesizer = _Synthesizer()
+
+        def tts_to_file(self, text, speaker_embedding, file_path, language):
+            time.sleep(0.01)
+            with open(file_path, "w") as f:
+                json.dump({
+                    "text": text,
+                    "embedding_sum": float(speaker_embedding.sum()),
+                    "dtype": str(speaker_embedding.dtype),
+                    "device": self.device,
+                    "pid": os.getpid(),
+                    "loads": LOADS,
+                }, f)
+
+
+    def load(model_name, device):
+        global LOADS
+        LOADS += 1
+        return FakeXTTS(device)
+''')
+
+
+@pytest.fixture
+def worker(tmp_path):
+    (tmp_path / "fake_xtts.py").write_text(FAKE_MODEL)
+    env = dict(os.environ, PYTHONPATH=str(tmp_path))
+    client = SynthesisWorkerClient(
+        model_factory="fake_xtts:load", max_batch=8, batch_wait=0.2, env=env
+    )
+    with client:
+        yield client
+
+
+class TestSynthesisWorker:
+    def test_model_loads_once_and_stays_warm(self, worker, tmp_path):
+        assert worker.ping(timeout=30)['loaded'] is False
+        worker.register_voice("alice", [0.5, 0.5])
+
+        first = json.loads(worker.synthesize("one", "alice", tmp_path / "a.wav", timeout=30).read_text())
+        second = json.loads(worker.synthesize("two", "alice", tmp_path / "b.wav", timeout=30).read_text())
+
+        assert first['loads'] == second['loads'] == 1
+        assert first['pid'] == second['pid'] != os.getpid()
+        assert first['device'] == "cpu"
+        assert first['dtype'] == "float32" and first['embedding_sum'] == pytest.approx(1.0)
+
+    def test_concurrent_requests_are_micro_batched(self, worker, tmp_path):
+        worker.register_voice("alice", [1.0])
+        worker.register_voice("bob", [2.0])
+
+        futures = [
+            worker.submit(f"text {i}", "alice" if i % 2 else "bob", tmp_path / f"{i}.wav")
+            for i in range(6)
+        ]
+        results = [f.result(timeout=30) for f in futures]
+
+        assert max(r['batch_size'] for r in results) > 1
+        assert worker.stats()['max_batch_size'] > 1
+        assert all(Path(r['out_path']).exists() for r in results)
+
+    def test_unregistered_voice_fails_request_only(self, worker, tmp_path):
+        with pytest.raises(RuntimeError, match="not registered"):
+            worker.synthesize("text", "nobody", tmp_path / "x.wav", timeout=30)
+        assert worker.ping(timeout=30)['model']
+
+    def test_voice_registration_is_sent_once(self, worker):
+        worker.register_voice("alice", [1.0, 2.0])
+        worker.register_voice("alice", [1.0, 2.0])
+        assert worker.stats()['requests'] == 2  # one register + this stats call
+
+
+class TestVoiceClonerWithWorker:
+    def test_compare_voices_through_worker(self, worker, tmp_path):
+        cloner = VoiceCloner(voice_profiles_dir=tmp_path / "profiles", worker=worker)
+        for name, value in (("warm", 1.0), ("calm", 3.0)):
+            cloner.voice_profiles[name] = VoiceProfile(
+                name=name, gender="Female", age_bracket="18-25",
+                embedding=[value] * 4, reference_audio_path="ref.wav",
+            )
+
+        results = cloner.compare_voices(["warm", "calm", "missing"], "Hello", tmp_path / "ab")
+
+        assert set(results) == {"warm", "calm"}
+        assert json.loads(results["calm"].read_text())['embedding_sum'] == pytest.approx(12.0)
+
+    def test_clone_voice_uses_worker_embedding(self, worker, tmp_path):
+        reference = tmp_path / "ref.wav"
+        reference.write_bytes(b"RIFF")
+        cloner = VoiceCloner(voice_profiles_dir=tmp_path / "profiles", worker=worker)
+
+        profile = cloner.clone_voice(reference, "cloned", "Male", "26-35")
+
+        assert profile.embedding == [float(len(str(reference)))] * 4
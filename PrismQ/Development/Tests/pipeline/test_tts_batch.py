@@ -0,0 +1,155 @@
+"""
+Unit tests for batch TTS generation, streaming and MP3 frame parsing.
+"""
+
+import threading
+import time
+
+import pytest
+
+from PrismQ.Shared.rate_limit import get_rate_limiter
+from PrismQ.VoiceOverGenerator.audio_production import ProviderRateLimit, TTSGenerator
+from PrismQ.VoiceOverGenerator.mp3_frames import Mp3FrameCounter, mp3_duration, parse_frame_header
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, no padding: 417-byte frames of 1152 samples
+FRAME_HEADER = b"\xff\xfb\x90\x64"
+FRAME_LENGTH = 417
+
+
+def _mp3_bytes(frames, id3=True):
+    tag = b"ID3\x04\x00\x00\x00\x00\x00\x0a" + b"\x00" * 10 if id3 else b""
+    frame = FRAME_HEADER + b"\x00" * (FRAME_LENGTH - len(FRAME_HEADER))
+    return tag + frame * frames
+
+
+class FakeStreamingTTS(TTSGenerator):
+    """TTSGenerator whose provider streams synthetic MP3 chunks."""
+
+    def __init__(self, *args, fail_on=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fail_on = fail_on
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def _stream_audio(self, text, voice_id, model):
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(0.02)
+            if text == self.fail_on:
+                raise RuntimeError("provider error")
+            data = _mp3_bytes(frames=len(text))
+            for i in range(0, len(data), 1000):
+                yield data[i:i + 1000]
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _scripts(count):
+    return [
+        {
+            'script_id': f'script_{i:03d}',
+            'content': 'x' * (10 + i),
+            'target_gender': 'women',
+            'target_age': '18-23',
+        }
+        for i in range(count)
+    ]
+
+
+class TestMp3Frames:
+    def test_parse_frame_header(self):
+        assert parse_frame_header(FRAME_HEADER) == (FRAME_LENGTH, 1152, 44100)
+        assert parse_frame_header(b"\x00\x00\x00\x00") is None
+
+    def test_duration_from_file(self, tmp_path):
+        path = tmp_path / "audio.mp3"
+        path.write_bytes(_mp3_bytes(frames=100))
+        assert mp3_duration(path) == pytest.approx(100 * 1152 / 44100)
+
+    def test_counter_handles_arbitrary_chunking(self):
+        data = _mp3_bytes(frames=25)
+        counter = Mp3FrameCounter()
+        for i in range(0, len(data), 7):
+            counter.feed(data[i:i + 7])
+        assert counter.frames == 25
+
+    def test_non_mp3_returns_none(self, tmp_path):
+        path = tmp_path / "audio.mp3"
+        path.write_bytes(b"MOCK_AUDIO_DATA")
+        assert mp3_duration(path) is None
+
+
+class TestTTSBatch:
+    def test_batch_respects_concurrency_and_order(self, tmp_path):
+        generator = FakeStreamingTTS(
+            provider="fake-concurrency",
+            output_root=str(tmp_path),
+            rate_limit=ProviderRateLimit(max_concurrency=3),
+        )
+
+        items = generator.generate_tts_batch(_scripts(9), max_workers=6)
+
+        assert [item.script_id for item in items] == [s['script_id'] for s in _scripts(9)]
+        assert all(item.error is None and not item.cached for item in items)
+        assert generator.max_active <= 3
+        assert items[2].audio.metadata.duration_seconds == pytest.approx(12 * 1152 / 44100)
+        assert not list(tmp_path.rglob("*.part"))
+
+    def test_unchanged_scripts_are_cached(self, tmp_path):
+        first = FakeStreamingTTS(provider="fake", output_root=str(tmp_path))
+        first.generate_tts_batch(_scripts(4))
+
+        scripts = _scripts(4)
+        scripts[1]['content'] = 'changed text'
+        second = FakeStreamingTTS(provider="fake", output_root=str(tmp_path))
+        items = second.generate_tts_batch(scripts)
+
+        assert second.calls == 1
+        assert [item.cached for item in items] == [True, False, True, True]
+        assert items[0].audio.metadata.duration_seconds == pytest.approx(10 * 1152 / 44100)
+
+    def test_failure_is_reported_per_script(self, tmp_path):
+        scripts = _scripts(3)
+        generator = FakeStreamingTTS(
+            provider="fake", output_root=str(tmp_path), fail_on=scripts[1]['content']
+        )
+
+        items = generator.generate_tts_batch(scripts)
+
+        assert items[1].error == "provider error"
+        assert items[0].audio and items[2].audio
+        assert not list(tmp_path.rglob("*.part"))
+
+    def test_requests_per_minute_spacing(self, tmp_path):
+        generator = FakeStreamingTTS(
+            provider="fake-rpm",
+            output_root=str(tmp_path),
+            rate_limit=ProviderRateLimit(max_concurrency=4, requests_per_minute=600),
+        )
+
+        start = time.perf_counter()
+        generator.generate_tts_batch(_scripts(4))
+
+        # 600 rpm spaces request starts 0.1s apart
+        assert time.perf_counter() - start >= 0.3
+
+    def test_provider_limit_is_not_overridden(self, tmp_path):
+        FakeStreamingTTS(
+            provider="fake-shared",
+            output_root=str(tmp_path),
+            rate_limit=ProviderRateLimit(max_concurrency=2),
+        )
+        FakeStreamingTTS(
+            provider="fake-shared",
+            output_root=str(tmp_path),
+            rate_limit=ProviderRateLimit(max_concurrency=5),
+        )
+
+        # The first generator's limit stays the provider's shared budget
+        assert get_rate_limiter().get_limit("tts:fake-shared").max_concurrency == 2
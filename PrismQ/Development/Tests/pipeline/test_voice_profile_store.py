@@ -0,0 +1,117 @@
+"""
+Unit tests for the memory-mapped voice profile store.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from PrismQ.VoiceOverGenerator.voice_cloning import VoiceCloner, VoiceProfile
+from PrismQ.VoiceOverGenerator.voice_profile_store import VoiceProfileStore
+
+
+def _profile(name, embedding, gender="Female", age="18-25"):
+    return VoiceProfile(
+        name=name, gender=gender, age_bracket=age,
+        embedding=list(embedding), reference_audio_path=f"/{name}.wav", quality_score=0.9,
+    )
+
+
+class TestVoiceProfileStore:
+    def test_put_and_reopen(self, tmp_path):
+        store = VoiceProfileStore(tmp_path)
+        store.put("a", [1.0, 0.0, 0.0], gender="Female")
+        store.put("b", [0.0, 2.0, 0.0], gender="Male")
+
+        reopened = VoiceProfileStore(tmp_path)
+
+        assert reopened._matrix is None  # nothing mapped until an embedding is read
+        assert reopened.filter(gender="Male") == ["b"]
+        np.testing.assert_array_equal(reopened.embedding("b"), [0.0, 2.0, 0.0])
+        assert isinstance(reopened.matrix, np.memmap)
+        assert (tmp_path / "voice_embeddings.f32").stat().st_size == 2 * 3 * 4
+
+    def test_replacing_a_voice_overwrites_its_row(self, tmp_path):
+        store = VoiceProfileStore(tmp_path)
+        store.put("a", [1.0, 1.0])
+        store.embedding("a")
+        store.put("a", [3.0, 4.0], gender="Male")
+
+        assert store.rows == 1
+        np.testing.assert_array_equal(store.embedding("a"), [3.0, 4.0])
+        assert VoiceProfileStore(tmp_path).metadata("a")['gender'] == "Male"
+
+    def test_new_voice_ignores_unindexed_rows(self, tmp_path):
+        store = VoiceProfileStore(tmp_path)
+        store.put("a", [1.0, 0.0, 0.0])
+        store.put("b", [0.0, 1.0, 0.0])
+        # A row appended by a writer that crashed before saving the index
+        with open(tmp_path / "voice_embeddings.f32", "ab") as f:
+            f.write(np.full(3, 9.0, dtype=np.float32).tobytes())
+
+        reopened = VoiceProfileStore(tmp_path)
+        reopened.put("c", [0.0, 0.0, 1.0])
+
+        np.testing.assert_array_equal(reopened.embedding("c"), [0.0, 0.0, 1.0])
+        np.testing.assert_array_equal(VoiceProfileStore(tmp_path).embedding("c"), [0.0, 0.0, 1.0])
+
+    def test_dimension_mismatch(self, tmp_path):
+        store = VoiceProfileStore(tmp_path)
+        store.put("a", np.ones(4))
+        with pytest.raises(ValueError):
+            store.put("b", np.ones(5))
+
+    def test_nearest_by_cosine_similarity(self, tmp_path):
+        rng = np.random.default_rng(0)
+        store = VoiceProfileStore(tmp_path)
+        vectors = rng.normal(size=(50, 16)).astype(np.float32)
+        for i, vector in enumerate(vectors):
+            store.put(f"v{i}", vector, gender="Male" if i % 2 else "Female")
+
+        query = vectors[7] * 3.0 + rng.normal(scale=0.01, size=16)
+        results = store.nearest(query, top_k=3)
+
+        normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        expected = np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:3]
+        assert [name for name, _ in results] == [f"v{i}" for i in expected]
+        assert results[0] == ("v7", pytest.approx(1.0, abs=1e-3))
+        assert all(int(name[1:]) % 2 == 0 for name, _ in store.nearest(query, top_k=5, gender="Female"))
+
+    def test_migrates_legacy_json_profiles(self, tmp_path):
+        profile = _profile("legacy", [0.5, 0.5])
+        (tmp_path / "legacy_profile.json").write_text(json.dumps(profile.to_dict()))
+
+        store = VoiceProfileStore(tmp_path)
+        assert store.migrate_json_profiles() == 1
+        assert store.migrate_json_profiles() == 0
+        assert store.metadata("legacy")['quality_score'] == 0.9
+        # Migrated files are renamed so later startups skip them
+        assert not (tmp_path / "legacy_profile.json").exists()
+        assert (tmp_path / "legacy_profile.json.migrated").exists()
+
+
+class TestVoiceClonerStore:
+    def test_profiles_round_trip_through_store(self, tmp_path):
+        cloner = VoiceCloner(voice_profiles_dir=tmp_path)
+        cloner._save_profile(_profile("warm", [1.0, 2.0], gender="Female"))
+        cloner._save_profile(_profile("deep", [2.0, 1.0], gender="Male", age="36-50"))
+
+        reloaded = VoiceCloner(voice_profiles_dir=tmp_path)
+
+        assert set(reloaded.voice_profiles) == {"warm", "deep"}
+        warm = reloaded.voice_profiles["warm"]
+        assert (warm.embedding, warm.gender, warm.quality_score) == ([1.0, 2.0], "Female", 0.9)
+        assert [p.name for p in reloaded.get_profiles_by_demographic(gender="Male")] == ["deep"]
+
+    def test_find_similar_voices(self, tmp_path, monkeypatch):
+        cloner = VoiceCloner(voice_profiles_dir=tmp_path)
+        cloner._save_profile(_profile("warm", [1.0, 0.0]))
+        cloner._save_profile(_profile("deep", [0.0, 1.0]))
+        reference = tmp_path / "clip.wav"
+        reference.write_bytes(b"RIFF")
+        monkeypatch.setattr(cloner, "_extract_embedding", lambda path: np.array([0.1, 0.9]))
+
+        results = cloner.find_similar_voices(reference, top_k=1)
+
+        assert results[0][0] == "deep"
@@ -0,0 +1,205 @@
+"""
+Tests for batched Graph API analytics and bulk collection into PlatformDatabase.
+
+A fake HTTP pool stands in for the Graph API batch endpoint, so batching,
+field expansion, retries of timed-out sub-requests and platform concurrency
+are tested without network access.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from PrismQ.Providers.facebook_provider import FacebookAnalytics
+from PrismQ.Providers.instagram_provider import InstagramAnalytics
+from PrismQ.Shared.analytics_collector import AnalyticsCollector
+from PrismQ.Shared.database import PlatformDatabase
+from PrismQ.Shared.interfaces.platform_provider import PlatformType, UploadResult, VideoAnalytics
+from PrismQ.Shared.platform_comparison import PlatformComparator
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self._data = data
+        self.status_code = 200
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._data
+
+
+class FakeGraphPool:
+    """Answers Graph API batch POSTs from a per-media metrics table."""
+
+    def __init__(self, delay=0.0, timeout_once=(), fail=()):
+        self.delay = delay
+        self.timeout_once = set(timeout_once)
+        self.fail = set(fail)
+        self.batches = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def _body(self, media_id, fields):
+        n = int(media_id.split("_")[-1])
+        if fields.startswith("insights"):
+            names = fields[len("insights.metric("):-1].split(",")
+            values = {"plays": n * 100, "likes": n, "comments": 2, "shares": 1, "saves": 3,
+                      "reach": n * 50, "total_interactions": n + 6}
+            return {"id": media_id, "insights": {"data": [
+                {"name": name, "values": [{"value": values[name]}]} for name in names
+            ]}}
+        return {"id": media_id, "views": n * 10, "shares": {"count": 1},
+                "likes": {"data": [], "summary": {"total_count": n}},
+                "comments": {"data": [], "summary": {"total_count": 2}}}
+
+    def post(self, url, data=None, **kwargs):
+        batch = json.loads(data["batch"])
+        with self._lock:
+            self.batches.append(batch)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        responses = []
+        for sub in batch:
+            parts = urlsplit(sub["relative_url"])
+            media_id = parts.path
+            if media_id in self.timeout_once:
+                self.timeout_once.discard(media_id)
+                responses.append(None)
+            elif media_id in self.fail:
+                responses.append({"code": 400, "body": json.dumps({"error": {"message": "bad id"}})})
+            else:
+                fields = parse_qs(parts.query)["fields"][0]
+                responses.append({"code": 200, "body": json.dumps(self._body(media_id, fields))})
+        with self._lock:
+            self.active -= 1
+        return FakeResponse(responses)
+
+
+def media_ids(prefix, count):
+    return [f"{prefix}_{i}" for i in range(1, count + 1)]
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = PlatformDatabase(str(tmp_path / "analytics.db"))
+    database.initialize()
+    yield database
+    database.close()
+
+
+def record_uploads(db, platform, ids):
+    for video_id in ids:
+        db.save_upload_result(
+            UploadResult(success=True, platform=platform, video_id=video_id, upload_time=datetime.now()),
+            title_id=f"title_{video_id}",
+            title="Title",
+        )
+
+
+def test_instagram_bulk_uses_batches_of_fifty():
+    pool = FakeGraphPool()
+    analytics = InstagramAnalytics(access_token="token", instagram_user_id="1", http_pool=pool)
+
+    results = analytics.get_bulk_video_analytics(media_ids("ig", 120))
+
+    assert [len(batch) for batch in pool.batches] == [50, 50, 20]
+    assert pool.batches[0][0]["relative_url"] == (
+        "ig_1?fields=insights.metric(plays,likes,comments,shares,saves,reach,total_interactions)"
+    )
+    reel = results["ig_7"]
+    assert (reel.views, reel.likes, reel.saves, reel.impressions) == (700, 7, 3, 350)
+    assert reel.engagement_rate == pytest.approx(13 / 350 * 100)
+    assert len(results) == 120
+
+
+def test_facebook_bulk_expands_summaries_and_skips_failures():
+    pool = FakeGraphPool(timeout_once={"fb_3"}, fail={"fb_4"})
+    analytics = FacebookAnalytics(access_token="token", page_id="1", http_pool=pool)
+
+    results = analytics.get_bulk_video_analytics(media_ids("fb", 5) + ["fb_1"])
+
+    assert "likes.summary(true).limit(0)" in pool.batches[0][0]["relative_url"]
+    # Duplicates are dropped and the timed-out lookup is retried in its own batch
+    assert [len(batch) for batch in pool.batches] == [5, 1]
+    assert sorted(results) == ["fb_1", "fb_2", "fb_3", "fb_5"]
+    assert (results["fb_5"].views, results["fb_5"].likes, results["fb_5"].shares) == (50, 5, 1)
+
+
+def test_bulk_insert_skips_unknown_videos(db):
+    record_uploads(db, PlatformType.INSTAGRAM, ["a", "b"])
+    now = datetime.now()
+    rows = [VideoAnalytics(platform=PlatformType.INSTAGRAM, video_id=v, title_id="", collected_at=now, views=i)
+            for i, v in enumerate(["a", "b", "missing"], 1)]
+
+    assert db.save_analytics_bulk(rows) == 2
+    assert db.get_latest_analytics("b", "instagram")["views"] == 2
+    assert db.save_analytics_bulk([]) == 0
+
+
+def test_collector_runs_platforms_concurrently(db):
+    ig_ids, fb_ids = media_ids("ig", 60), media_ids("fb", 60)
+    record_uploads(db, PlatformType.INSTAGRAM, ig_ids)
+    record_uploads(db, PlatformType.FACEBOOK, fb_ids)
+    pool = FakeGraphPool(delay=0.2)
+    collector = AnalyticsCollector(db, {
+        "instagram": InstagramAnalytics(access_token="token", instagram_user_id="1", http_pool=pool),
+        "facebook": FacebookAnalytics(access_token="token", page_id="1", http_pool=pool),
+    })
+
+    start = time.monotonic()
+    saved = collector.collect()
+    elapsed = time.monotonic() - start
+
+    assert saved == {"instagram": 60, "facebook": 60}
+    assert len(pool.batches) == 4
+    assert pool.max_active == 2
+    assert elapsed < 0.7
+    assert db.get_latest_analytics("fb_12", "facebook")["views"] == 120
+
+
+def test_collector_falls_back_to_per_video_calls(db):
+    class SingleVideoAnalytics:
+        def __init__(self):
+            self.calls = 0
+
+        def get_video_analytics(self, video_id):
+            self.calls += 1
+            return VideoAnalytics(platform=PlatformType.TIKTOK, video_id=video_id, title_id="",
+                                  collected_at=datetime.now(), views=5)
+
+    ids = media_ids("tt", 7)
+    record_uploads(db, PlatformType.TIKTOK, ids)
+    provider = SingleVideoAnalytics()
+
+    saved = AnalyticsCollector(db, {"tiktok": provider}, batch_size=3).collect()
+
+    assert saved == {"tiktok": 7}
+    assert provider.calls == 7
+
+
+def test_platform_trends_use_latest_analytics(tmp_path):
+    with PlatformComparator(str(tmp_path / "analytics.db")) as comparator:
+        record_uploads(comparator.db, PlatformType.FACEBOOK, ["v1", "v2", "v3"])
+        older = datetime(2025, 1, 1)
+        comparator.db.save_analytics_bulk(
+            VideoAnalytics(platform=PlatformType.FACEBOOK, video_id=v, title_id="", collected_at=older, views=1)
+            for v in ["v1", "v2", "v3"]
+        )
+        comparator.db.save_analytics_bulk([
+            VideoAnalytics(platform=PlatformType.FACEBOOK, video_id="v1", title_id="",
+                           collected_at=datetime.now(), views=100, likes=10),
+        ])
+
+        trends = comparator.get_platform_trends("facebook")
+
+    assert trends["video_count"] == 3
+    assert trends["total_views"] == 102
+    assert trends["total_engagement"] == 10
@@ -158,7 +158,7 @@ class TestTTSGenerator:
         # Mock ffprobe output
         mock_run.return_value = Mock(
             returncode=0,
-            stdout="30.5\n"
+            stdout=json.dumps({'format': {'duration': '30.5'}, 'streams': []})
         )
         
         generator = TTSGenerator(provider="mock")
@@ -277,7 +277,7 @@ class TestAudioNormalizer:
                 raw_path=str(raw_path)
             )
             
-            normalizer = AudioNormalizer(output_root=tmpdir)
+            normalizer = AudioNormalizer(output_root=tmpdir, engine="ffmpeg")
             
             # Mock the actual ffmpeg file creation
             with patch.object(normalizer, '_apply_loudnorm') as mock_apply:
@@ -369,7 +369,7 @@ class TestIntegration:
                 assert audio.raw_path
                 
                 # Normalize
-                normalizer = AudioNormalizer(output_root=tmpdir)
+                normalizer = AudioNormalizer(output_root=tmpdir, engine="ffmpeg")
                 
                 with patch.object(normalizer, '_apply_loudnorm') as mock_apply:
                     def create_output(input_path, output_path, target_lufs, true_peak):
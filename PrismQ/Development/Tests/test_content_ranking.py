@@ -303,6 +303,69 @@ def test_end_to_end_ranking():
         print(f"     Top item: {ranked_content[0]['id']} (rank {ranked_content[0]['rank']})")
 
 
+def test_compute_final_scores_matches_per_item():
+    """Test vectorized scoring equals calculate_final_score for mixed schemas."""
+    print("\n✓ Testing vectorized final scores...")
+    
+    config = content_ranking.DEFAULT_SCORING_CONFIG
+    content = [
+        {'id': 'a', 'novelty': 80, 'emotional_impact': 90, 'clarity': 85,
+         'replay_value': 75, 'shareability': 88},
+        {'id': 'b', 'novelty_score': 70, 'emotional': 60, 'share_score': 50},
+        {'id': 'c', 'final_score': 87.5, 'novelty': 10},
+        {'id': 'd', 'overall_score': 66},
+        {'id': 'e', 'quality_score': 72},
+        {'id': 'f', 'viral_score': 64, 'score': 12},
+        {'id': 'g'},
+    ]
+    
+    scores = content_ranking.compute_final_scores(content, config)
+    
+    for item, score in zip(content, scores):
+        assert score == content_ranking.calculate_final_score(item, config), item['id']
+    print(f"  ✅ {len(content)} scores match per-item calculation")
+
+
+def test_rank_top_content():
+    """Test top-K selection returns the same head as a full ranking."""
+    print("\n✓ Testing top-K ranking...")
+    
+    config = content_ranking.DEFAULT_SCORING_CONFIG
+    content = [{'id': f'c{i}', 'quality_score': (i * 37) % 101} for i in range(200)]
+    content.append({'id': 'tie', 'quality_score': 100})
+    duplicate_ids = frozenset({'c0', 'c30'})
+    
+    full = content_ranking.rank_content(content, {'duplicates': sorted(duplicate_ids)}, config)
+    top = content_ranking.rank_top_content(content, duplicate_ids, config, top_k=5)
+    
+    assert [item['id'] for item in top] == [item['id'] for item in full[:5]]
+    assert [item['rank'] for item in top] == [1, 2, 3, 4, 5]
+    assert all(item['id'] not in duplicate_ids for item in full)
+    assert 'final_score' not in content[0], "Input items should not be modified"
+    print(f"  ✅ Top 5: {[item['id'] for item in top]}")
+
+
+def test_load_duplicate_ids_cached():
+    """Test dedup reports are parsed once per unchanged file."""
+    print("\n✓ Testing dedup report cache...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        scores_path = Path(tmpdir)
+        segment = scores_path / "women" / "18-23"
+        segment.mkdir(parents=True)
+        report = segment / "dedup_report_2024-01-01.json"
+        report.write_text(json.dumps({'duplicates': [{'id': 'x'}]}))
+        
+        content_ranking._parse_duplicate_ids.cache_clear()
+        first = content_ranking.load_duplicate_ids(scores_path, "women", "18-23")
+        second = content_ranking.load_duplicate_ids(scores_path, "women", "18-23")
+        
+        assert first == second == frozenset({'x'})
+        assert content_ranking._parse_duplicate_ids.cache_info().hits == 1
+        assert content_ranking.load_duplicate_ids(scores_path, "men", "18-23") == frozenset()
+    print("  ✅ Dedup report parsed once")
+
+
 def run_all_tests():
     """Run all tests."""
     print("="*60)
@@ -316,6 +379,9 @@ def run_all_tests():
         test_rank_content,
         test_find_latest_file,
         test_end_to_end_ranking,
+        test_compute_final_scores_matches_per_item,
+        test_rank_top_content,
+        test_load_duplicate_ids_cached,
     ]
     
     passed = 0
@@ -7,11 +7,16 @@ Tests the structured logging system including:
 - JSON formatting
 - Request ID tracking
 - Context managers
+- Queued file output
 - Integration with config
 """
 
+import asyncio
+import json
 import os
 import logging
+import logging.handlers
+import threading
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
@@ -20,6 +25,9 @@ import pytest
 from PrismQ.Shared.logging import (
     setup_logging,
     get_logger,
+    get_log_context,
+    get_log_listener,
+    flush_logging,
     log_context,
     LoggerContext,
     reset_logging,
@@ -87,9 +95,9 @@ class TestLoggingSetup:
             log_dir=log_dir
         )
         
-        # Should have file handler
-        assert len(logger.handlers) >= 1
-        assert any(isinstance(h, logging.FileHandler) for h in logger.handlers)
+        # File handler sits behind the queue listener
+        assert any(isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers)
+        assert any(isinstance(h, logging.FileHandler) for h in get_log_listener().handlers)
         
         # Log file should exist
         log_file = log_dir / "app.log"
@@ -207,6 +215,7 @@ class TestLoggingOutput:
         logger = get_logger("test")
         
         logger.info("Test file message")
+        flush_logging()
         
         log_file = log_dir / "app.log"
         assert log_file.exists()
@@ -276,6 +285,120 @@ class TestLogContext:
         assert original_factory == restored_factory
 
 
+    def test_log_context_nests_and_restores(self):
+        """Test that nested contexts merge and unwind."""
+        with log_context(request_id="outer", step="a"):
+            with log_context(step="b"):
+                assert get_log_context() == {"request_id": "outer", "step": "b"}
+            assert get_log_context() == {"request_id": "outer", "step": "a"}
+        assert get_log_context() == {}
+    
+    def test_log_context_isolated_between_threads(self):
+        """Test that concurrent threads never see each other's context."""
+        records = []
+        class RecordCapture(logging.Handler):
+            def emit(self, record):
+                records.append(record)
+        
+        logger = logging.getLogger("test.threads")
+        logger.setLevel(logging.INFO)
+        logger.addHandler(RecordCapture())
+        barrier = threading.Barrier(4)
+        
+        def worker(n):
+            with log_context(worker=n):
+                barrier.wait()
+                for _ in range(50):
+                    logger.info("tick")
+        
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert len(records) == 200
+        by_thread = {}
+        for r in records:
+            by_thread.setdefault(r.thread, set()).add(r.worker)
+        assert all(len(workers) == 1 for workers in by_thread.values())
+        assert sorted(w for workers in by_thread.values() for w in workers) == [0, 1, 2, 3]
+    
+    def test_log_context_isolated_between_tasks(self):
+        """Test that asyncio tasks keep their own context across awaits."""
+        seen = {}
+        
+        async def task(name):
+            with log_context(task=name):
+                await asyncio.sleep(0.01)
+                seen[name] = get_log_context()["task"]
+        
+        async def main():
+            await asyncio.gather(task("a"), task("b"), task("c"))
+        
+        asyncio.run(main())
+        assert seen == {"a": "a", "b": "b", "c": "c"}
+        assert get_log_context() == {}
+
+
+class TestQueuedOutput:
+    """Test the QueueHandler/QueueListener file pipeline."""
+    
+    def test_json_output_keeps_context_and_exception(self, tmp_path):
+        """Test that JSON lines written by the listener keep all fields."""
+        log_dir = tmp_path / "logs"
+        setup_logging(
+            level="INFO",
+            log_dir=log_dir,
+            console_output=False,
+            file_output=True,
+            json_format=True,
+        )
+        logger = get_logger("test.json")
+        
+        with log_context(request_id="req-1"):
+            logger.info("Rendered %s", "video", extra={"video_id": "v1"})
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.error("Failed", exc_info=True)
+        flush_logging()
+        
+        lines = [json.loads(line) for line in (log_dir / "app.log").read_text().splitlines()]
+        rendered, failed = lines[-2], lines[-1]
+        assert rendered["message"] == "Rendered video"
+        assert rendered["request_id"] == "req-1"
+        assert rendered["video_id"] == "v1"
+        assert rendered["logger"] == "test.json"
+        assert "ValueError: boom" in failed["exc_info"]
+    
+    def test_synchronous_file_output(self, tmp_path):
+        """Test that queue_output=False attaches the file handler directly."""
+        log_dir = tmp_path / "logs"
+        logger = setup_logging(
+            log_dir=log_dir,
+            console_output=False,
+            file_output=True,
+            queue_output=False,
+        )
+        
+        assert get_log_listener() is None
+        assert any(isinstance(h, logging.FileHandler) for h in logger.handlers)
+    
+    def test_reset_stops_listener(self, tmp_path):
+        """Test that reset_logging writes out queued records and stops the thread."""
+        log_dir = tmp_path / "logs"
+        setup_logging(log_dir=log_dir, console_output=False, file_output=True)
+        listener = get_log_listener()
+        get_logger("test").warning("Last words")
+        
+        reset_logging()
+        
+        assert get_log_listener() is None
+        assert listener._thread is None
+        assert "Last words" in (log_dir / "app.log").read_text()
+
+
 class TestLoggerContext:
     """Test LoggerContext class."""
     
@@ -324,6 +447,7 @@ class TestLoggerContext:
             with LoggerContext(logger, inner="value2"):
                 logger.info("Inner context")
         
+        flush_logging()
         log_file = log_dir / "app.log"
         content = log_file.read_text()
         
@@ -361,6 +485,7 @@ class TestLoggingIntegration:
             logger.info("Context message")
         
         # Check log file
+        flush_logging()
         log_file = log_dir / "app.log"
         assert log_file.exists()
         
@@ -387,6 +512,7 @@ class TestLoggingIntegration:
         except ValueError:
             logger.error("Exception occurred", exc_info=True)
         
+        flush_logging()
         log_file = log_dir / "app.log"
         content = log_file.read_text()
         
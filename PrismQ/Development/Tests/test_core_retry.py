@@ -2,15 +2,26 @@
 Tests for core.retry module - retry logic and circuit breaker.
 """
 
+import asyncio
+import random
+import threading
 import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
 from PrismQ.Shared.errors import APIError, RateLimitError, TimeoutError
 from PrismQ.Shared.retry import (
     CircuitBreaker,
+    CircuitBreakerOpenError,
     RetryContext,
+    compute_backoff,
+    get_circuit_breaker,
+    get_circuit_breaker_metrics,
+    get_retry_after,
     retry_api_call,
     retry_with_backoff,
     with_circuit_breaker,
@@ -360,3 +371,242 @@ class TestRetryContext:
                 break
         
         assert attempt_count == 3
+
+
+def http_error(status_code, retry_after):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers["Retry-After"] = retry_after
+    return requests.HTTPError(f"HTTP {status_code}", response=response)
+
+
+class TestBackoffJitter:
+    """Test backoff delay calculation."""
+
+    def test_no_jitter_is_exponential(self):
+        """Test plain exponential backoff is capped at max_delay."""
+        delays = [compute_backoff(n, initial_delay=1.0, max_delay=5.0) for n in range(1, 5)]
+        assert delays == [1.0, 2.0, 4.0, 5.0]
+
+    def test_full_jitter_stays_under_exponential_delay(self):
+        """Test full jitter picks delays between 0 and the exponential delay."""
+        rng = random.Random(1)
+        delays = [compute_backoff(3, initial_delay=1.0, jitter="full", rng=rng) for _ in range(200)]
+        assert all(0 <= d <= 4.0 for d in delays)
+        assert len(set(delays)) == 200  # Callers no longer retry in lockstep
+
+    def test_decorrelated_jitter_grows_from_previous_delay(self):
+        """Test decorrelated jitter stays between initial_delay and 3x previous."""
+        rng = random.Random(2)
+        previous = None
+        for attempt in range(1, 20):
+            delay = compute_backoff(attempt, initial_delay=0.5, max_delay=30.0,
+                                    jitter="decorrelated", previous_delay=previous, rng=rng)
+            assert 0.5 <= delay <= min(30.0, 3 * (previous or 0.5))
+            previous = delay
+
+    def test_unknown_jitter_rejected(self):
+        """Test invalid jitter modes fail fast."""
+        with pytest.raises(ValueError):
+            retry_with_backoff(jitter="random")
+
+
+class TestRetryAfter:
+    """Test Retry-After extraction and handling."""
+
+    def test_retry_after_sources(self):
+        """Test Retry-After from error attributes and HTTP headers."""
+        assert get_retry_after(RateLimitError("Slow down", retry_after=7)) == 7.0
+        assert get_retry_after(http_error(429, "3")) == 3.0
+        future = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert get_retry_after(http_error(503, format_datetime(future, usegmt=True))) == pytest.approx(30, abs=2)
+        assert get_retry_after(http_error(503, "soon")) is None
+        assert get_retry_after(ValueError("no hint")) is None
+
+    def test_sync_retry_honors_retry_after_header(self):
+        """Test sync retries wait at least the Retry-After header."""
+        call_times = []
+
+        @retry_with_backoff(max_attempts=2, initial_delay=0.01, jitter="full",
+                            exceptions=(requests.HTTPError,))
+        def throttled():
+            call_times.append(time.monotonic())
+            raise http_error(429, "0.2")
+
+        with pytest.raises(requests.HTTPError):
+            throttled()
+        assert call_times[1] - call_times[0] >= 0.2
+
+    def test_async_retry_honors_retry_after(self):
+        """Test async retries wait at least the RateLimitError retry_after."""
+        call_times = []
+
+        @retry_with_backoff(max_attempts=2, initial_delay=0.01)
+        async def throttled():
+            call_times.append(time.monotonic())
+            raise RateLimitError("Rate limited", retry_after=0.2)
+
+        with pytest.raises(RateLimitError):
+            asyncio.run(throttled())
+        assert call_times[1] - call_times[0] >= 0.2
+
+
+class TestAsyncRetry:
+    """Test retry_with_backoff on coroutine functions."""
+
+    def test_async_retry_does_not_block_event_loop(self):
+        """Test async backoff sleeps with asyncio.sleep."""
+        attempts = []
+        ticks = []
+
+        @retry_with_backoff(max_attempts=3, initial_delay=0.1)
+        async def flaky():
+            attempts.append(time.monotonic())
+            if len(attempts) < 3:
+                raise APIError("Temporary failure")
+            return "success"
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.05)
+
+        async def main():
+            return await asyncio.gather(flaky(), ticker())
+
+        result, _ = asyncio.run(main())
+
+        assert result == "success"
+        assert len(attempts) == 3
+        # The ticker kept running while flaky() was backing off
+        assert sum(attempts[0] < t < attempts[1] for t in ticks) >= 1
+        assert asyncio.iscoroutinefunction(flaky)
+
+    def test_async_on_retry_callback_may_be_async(self):
+        """Test async on_retry callbacks are awaited."""
+        seen = []
+
+        async def on_retry(exc, attempt):
+            seen.append(attempt)
+
+        @retry_with_backoff(max_attempts=3, initial_delay=0.01, on_retry=on_retry)
+        async def failing():
+            raise APIError("Test failure")
+
+        with pytest.raises(APIError):
+            asyncio.run(failing())
+        assert seen == [1, 2]
+
+
+class TestCircuitBreakerConcurrency:
+    """Test shared, thread-safe circuit breakers."""
+
+    def test_concurrent_failures_are_all_counted(self):
+        """Test failure counting is exact under contention."""
+        cb = CircuitBreaker(failure_threshold=10_000, expected_exception=APIError)
+
+        def failing():
+            raise APIError("Test failure")
+
+        def worker():
+            for _ in range(200):
+                with pytest.raises(APIError):
+                    cb.call(failing)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cb.failure_count == 1600
+        assert cb.get_metrics()["failures"] == 1600
+
+    def test_half_open_allows_one_trial_call(self):
+        """Test only one recovery trial runs while half-open."""
+        cb = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+        with pytest.raises(Exception):
+            cb.call(lambda: 1 / 0)
+        time.sleep(0.1)
+
+        started, release = threading.Event(), threading.Event()
+
+        def slow_recovery():
+            started.set()
+            release.wait(5)
+            return "recovered"
+
+        result = []
+        trial = threading.Thread(target=lambda: result.append(cb.call(slow_recovery)))
+        trial.start()
+        started.wait(5)
+
+        with pytest.raises(CircuitBreakerOpenError):
+            cb.call(lambda: "second")
+        release.set()
+        trial.join()
+
+        assert result == ["recovered"]
+        assert cb.state == "CLOSED"
+
+    def test_open_error_reports_remaining_time(self):
+        """Test rejected calls say when the circuit half-opens."""
+        cb = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+        with pytest.raises(ZeroDivisionError):
+            cb.call(lambda: 1 / 0)
+
+        with pytest.raises(CircuitBreakerOpenError) as exc_info:
+            cb.call(lambda: "rejected")
+        assert 9 < exc_info.value.retry_after <= 10
+
+    def test_metrics(self):
+        """Test breaker metrics count calls, failures, rejections and openings."""
+        cb = CircuitBreaker(failure_threshold=2, recovery_timeout=10, name="metrics")
+        cb.call(lambda: "ok")
+        for _ in range(2):
+            with pytest.raises(ZeroDivisionError):
+                cb.call(lambda: 1 / 0)
+        with pytest.raises(CircuitBreakerOpenError):
+            cb.call(lambda: "rejected")
+
+        metrics = cb.get_metrics()
+        assert metrics["name"] == "metrics"
+        assert metrics["state"] == "OPEN"
+        assert (metrics["calls"], metrics["successes"], metrics["failures"]) == (3, 1, 2)
+        assert (metrics["rejected"], metrics["opened"]) == (1, 1)
+        assert metrics["seconds_in_state"] >= 0
+
+        cb.reset()
+        assert cb.get_metrics()["state"] == "CLOSED"
+
+    def test_named_breaker_shared_between_functions(self):
+        """Test functions using the same breaker name share its state."""
+
+        @with_circuit_breaker(failure_threshold=2, recovery_timeout=10, name="shared-service-test")
+        def upload():
+            raise APIError("Service down")
+
+        @with_circuit_breaker(name="shared-service-test")
+        def fetch_status():
+            return "ok"
+
+        for _ in range(2):
+            with pytest.raises(APIError):
+                upload()
+
+        with pytest.raises(CircuitBreakerOpenError):
+            fetch_status()
+        assert upload.circuit_breaker is get_circuit_breaker("shared-service-test")
+        assert get_circuit_breaker_metrics()["shared-service-test"]["state"] == "OPEN"
+
+    def test_async_circuit_breaker(self):
+        """Test the decorator on coroutine functions."""
+
+        @with_circuit_breaker(failure_threshold=1, recovery_timeout=10)
+        async def failing():
+            raise APIError("Service down")
+
+        with pytest.raises(APIError):
+            asyncio.run(failing())
+        with pytest.raises(CircuitBreakerOpenError):
+            asyncio.run(failing())
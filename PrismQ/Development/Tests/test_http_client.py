@@ -0,0 +1,132 @@
+"""
+Tests for the pooled HTTP client layer against a local keep-alive server.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from PrismQ.Shared.http_client import HttpClientPool, get_http_pool, host_key
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        if self.path == "/slow":
+            threading.Event().wait(0.5)
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.daemon_threads = True
+    httpd.connections = set()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd, f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_host_key():
+    assert host_key("HTTPS://Graph.Facebook.com/v18.0/me?x=1") == "https://graph.facebook.com"
+    assert host_key("http://localhost:11434/api/generate") == "http://localhost:11434"
+    with pytest.raises(ValueError):
+        host_key("/relative/path")
+
+
+def test_sequential_requests_reuse_one_connection(server):
+    httpd, base_url = server
+    pool = HttpClientPool()
+
+    for _ in range(10):
+        assert pool.get(f"{base_url}/item").text == "ok"
+
+    stats = pool.get_stats()[base_url]
+    assert stats["requests"] == 10
+    assert stats["new_connections"] == 1
+    assert stats["reused_connections"] == 9
+    assert stats["reuse_ratio"] == pytest.approx(0.9)
+    assert len(httpd.connections) == 1
+    pool.close()
+
+
+def test_hosts_get_separate_sessions(server):
+    _, base_url = server
+    other_url = base_url.replace("127.0.0.1", "localhost")
+    pool = HttpClientPool()
+
+    pool.get(f"{base_url}/a")
+    pool.get(f"{other_url}/b")
+
+    assert pool.session(base_url) is not pool.session(other_url)
+    assert pool.session(f"{base_url}/deep/path") is pool.session(base_url)
+    assert set(pool.get_stats()) == {base_url, other_url}
+    pool.close()
+
+
+def test_default_and_per_host_timeouts(server):
+    _, base_url = server
+    pool = HttpClientPool(timeout=5)
+    pool.configure_host(base_url, timeout=0.1)
+
+    with pytest.raises(requests.Timeout):
+        pool.get(f"{base_url}/slow")
+    # An explicit timeout wins over the host default
+    assert pool.get(f"{base_url}/slow", timeout=5).status_code == 200
+
+    stats = pool.get_stats()[base_url]
+    assert (stats["requests"], stats["errors"]) == (2, 1)
+    pool.close()
+
+
+def test_pool_size_caps_idle_connections(server):
+    _, base_url = server
+    pool = HttpClientPool(pool_maxsize=2)
+    pool.get(base_url)
+
+    def fetch():
+        pool.get(f"{base_url}/slow")
+
+    threads = [threading.Thread(target=fetch) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    stats = pool.get_stats()[base_url]
+    assert stats["pool_maxsize"] == 2
+    assert stats["requests"] == 5
+    assert stats["new_connections"] >= 4  # Concurrent requests overflow the pool
+
+    pool.configure_host(base_url, pool_maxsize=8)
+    pool.get(base_url)
+    assert pool.get_stats()[base_url]["pool_maxsize"] == 8
+    # Connections from the replaced pool still count towards the total
+    assert pool.get_stats()[base_url]["new_connections"] >= stats["new_connections"] + 1
+    pool.close()
+
+
+def test_shared_pool_is_a_singleton():
+    assert get_http_pool() is get_http_pool()
+
+
+def test_providers_use_the_shared_pool():
+    from PrismQ.Providers.instagram_provider import InstagramAnalytics
+    from PrismQ.Providers.tiktok_provider import TikTokUploader
+
+    custom = HttpClientPool()
+    assert TikTokUploader(access_token="token").http is get_http_pool()
+    assert InstagramAnalytics(access_token="token", instagram_user_id="1", http_pool=custom).http is custom
@@ -0,0 +1,119 @@
+"""
+Import-time budget tests.
+
+Each module is imported in a fresh interpreter under ``python -X importtime``;
+its cumulative import time must stay within budget and heavy optional
+dependencies must not be loaded until they are used. CLIs must answer
+``--help`` well under a second.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import PrismQ
+
+# Cumulative import time budget per module (milliseconds)
+IMPORT_BUDGET_MS = {
+    "PrismQ.Shared.logging": 150,
+    "PrismQ.Shared.retry": 150,
+    "PrismQ.Providers": 200,
+    "PrismQ.Tools": 100,
+}
+
+# Modules that must still be unloaded after importing each module
+DEFERRED_IMPORTS = {
+    "PrismQ.Shared.logging": ["pydantic", "pydantic_settings", "PrismQ.Shared.config"],
+    "PrismQ.Shared.retry": ["asyncio", "pydantic"],
+    "PrismQ.Providers": ["openai", "tiktoken", "tenacity", "requests", "pydantic"],
+    "PrismQ.Tools": ["numpy", "PrismQ.Tools.VideoQualityChecker"],
+}
+
+CLI_BUDGET_SECONDS = 1.0
+
+# Rebuild this interpreter's PrismQ package path in the child, then import
+_CHILD = (
+    "import json, sys, logging, PrismQ\n"
+    "PrismQ.__path__[:] = json.loads(sys.argv[1])\n"
+    "__import__(sys.argv[2])\n"
+    "print(json.dumps({'modules': sorted(sys.modules), 'handlers': len(logging.getLogger().handlers)}))\n"
+)
+
+
+def _child_env():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in sys.path if p)
+    return env
+
+
+def import_in_child(module, cwd):
+    """Import a module in a fresh interpreter; returns (cumulative ms, child state)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD, json.dumps(list(PrismQ.__path__)), module],
+        capture_output=True, text=True, cwd=cwd, env=_child_env(), timeout=60,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.strip() == module:
+            cumulative_us = int(cumulative)
+    assert cumulative_us is not None, f"{module} missing from -X importtime output"
+    return cumulative_us / 1000, json.loads(result.stdout.splitlines()[-1])
+
+
+@pytest.mark.parametrize("module", sorted(IMPORT_BUDGET_MS))
+def test_import_time_budget(module, tmp_path):
+    # Best of three runs, to ride out a cold disk cache
+    runs = [import_in_child(module, tmp_path) for _ in range(3)]
+    best_ms = min(ms for ms, _ in runs)
+    state = runs[0][1]
+
+    assert best_ms <= IMPORT_BUDGET_MS[module], f"{module} imported in {best_ms:.0f} ms"
+    loaded = [name for name in DEFERRED_IMPORTS[module] if name in state["modules"]]
+    assert loaded == [], f"importing {module} loaded {loaded}"
+
+
+def test_logging_import_has_no_side_effects(tmp_path):
+    _, state = import_in_child("PrismQ.Shared.logging", tmp_path)
+
+    # No settings built: no .env read, no Stories/data/cache/logs directories
+    assert state["handlers"] == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_settings_are_built_on_first_access(tmp_path, monkeypatch):
+    from PrismQ.Shared import config
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("DATA_ROOT", str(tmp_path / "lazy-data"))
+    config.reset_settings()
+    try:
+        assert not (tmp_path / "lazy-data").exists()
+        assert config.settings.data_root == tmp_path / "lazy-data"
+        assert (tmp_path / "lazy-data").is_dir()
+        assert config.get_settings() is config.get_settings()
+    finally:
+        config.reset_settings()
+
+
+def test_run_step_help_starts_quickly(tmp_path):
+    script = Path(PrismQ.__file__).parent / "Infrastructure" / "Platform" / "Pipeline" / "orchestration" / "run_step.py"
+
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, str(script), "--help"],
+        capture_output=True, text=True, cwd=tmp_path, env=_child_env(), timeout=60,
+    )
+    elapsed = time.perf_counter() - start
+
+    assert result.returncode == 0, result.stderr[-2000:]
+    assert "usage" in result.stdout
+    assert elapsed < CLI_BUDGET_SECONDS
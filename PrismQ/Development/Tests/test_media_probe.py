@@ -0,0 +1,162 @@
+"""
+Tests for the shared media probe.
+
+A small executable stands in for ffprobe so the real subprocess path runs.
+"""
+
+import stat
+import sys
+import time
+
+import pytest
+
+from PrismQ.Shared.media_probe import MediaInfo, MediaProbe
+
+FAKE_FFPROBE = """#!{python}
+import json, os, sys, time
+path = sys.argv[-1]
+with open(os.environ["FAKE_FFPROBE_LOG"], "a") as log:
+    log.write(path + "\\n")
+time.sleep(0.2)
+if path.endswith(".bad"):
+    sys.exit(1)
+print(json.dumps({{
+    "format": {{"format_name": "mov,mp4", "duration": "12.5", "bit_rate": "8000000"}},
+    "streams": [
+        {{"codec_type": "video", "codec_name": "h264", "width": 1080, "height": 1920,
+          "r_frame_rate": "30000/1001", "nb_frames": "375", "start_time": "0.0"}},
+        {{"codec_type": "audio", "codec_name": "aac", "bit_rate": "192000",
+          "sample_rate": "48000", "channels": 2}}
+    ]
+}}))
+"""
+
+
+@pytest.fixture
+def fake_ffprobe(tmp_path, monkeypatch):
+    """Install a fake ffprobe and return (command, log_path)."""
+    script = tmp_path / "ffprobe"
+    script.write_text(FAKE_FFPROBE.format(python=sys.executable))
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    log = tmp_path / "calls.log"
+    log.write_text("")
+    monkeypatch.setenv("FAKE_FFPROBE_LOG", str(log))
+    return str(script), log
+
+
+def _videos(tmp_path, count, suffix=".mp4"):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"video_{i}{suffix}"
+        path.write_bytes(b"x" * (i + 1))
+        paths.append(str(path))
+    return paths
+
+
+def _calls(log):
+    return [line for line in log.read_text().splitlines() if line]
+
+
+def test_probe_normalizes_metadata(tmp_path, fake_ffprobe):
+    cmd, _ = fake_ffprobe
+    info = MediaProbe(ffprobe_cmd=cmd).probe(_videos(tmp_path, 1)[0])
+
+    assert isinstance(info, MediaInfo)
+    assert (info.width, info.height, info.video_codec, info.audio_codec) == (1080, 1920, "h264", "aac")
+    assert info.fps == pytest.approx(29.97, abs=0.01)
+    assert info.duration == 12.5 and info.bit_rate == 8_000_000
+    assert info.sample_rate == 48000 and info.channels == 2
+    assert info.video_stream["nb_frames"] == "375"
+
+
+def test_probe_many_runs_concurrently(tmp_path, fake_ffprobe):
+    cmd, log = fake_ffprobe
+    paths = _videos(tmp_path, 6)
+
+    start = time.perf_counter()
+    results = MediaProbe(ffprobe_cmd=cmd, max_workers=6).probe_many(paths)
+    elapsed = time.perf_counter() - start
+
+    assert set(results) == set(paths)
+    assert all(info is not None for info in results.values())
+    assert len(_calls(log)) == 6
+    # Six 0.2s probes in parallel finish well under the serial 1.2s
+    assert elapsed < 1.0
+
+
+def test_unchanged_files_are_served_from_cache(tmp_path, fake_ffprobe):
+    cmd, log = fake_ffprobe
+    paths = _videos(tmp_path, 3)
+    probe = MediaProbe(ffprobe_cmd=cmd)
+
+    probe.probe_many(paths)
+    probe.probe_many(paths)
+    assert len(_calls(log)) == 3
+    assert probe.get_stats()["hits"] == 3
+
+    # Changing a file's size or mtime invalidates its entry
+    with open(paths[0], "ab") as f:
+        f.write(b"more")
+    probe.probe_many(paths)
+    assert len(_calls(log)) == 4
+    # The stale entry was replaced, not kept alongside
+    assert probe.get_stats()["entries"] == 3
+
+
+def test_cache_keeps_most_recently_used_entries(tmp_path, fake_ffprobe):
+    cmd, log = fake_ffprobe
+    paths = _videos(tmp_path, 3)
+    probe = MediaProbe(ffprobe_cmd=cmd, max_entries=2)
+
+    probe.probe(paths[0])
+    probe.probe(paths[1])
+    probe.probe(paths[0])
+    probe.probe(paths[2])
+
+    assert probe.get_stats()["entries"] == 2
+    probe.probe(paths[0])
+    assert len(_calls(log)) == 3
+    probe.probe(paths[1])
+    assert len(_calls(log)) == 4
+
+
+def test_persistent_cache_survives_restart(tmp_path, fake_ffprobe):
+    cmd, log = fake_ffprobe
+    paths = _videos(tmp_path, 2)
+    cache_path = tmp_path / "cache" / "media_probe.json"
+
+    MediaProbe(ffprobe_cmd=cmd, cache_path=cache_path).probe_many(paths)
+    assert cache_path.exists()
+
+    results = MediaProbe(ffprobe_cmd=cmd, cache_path=cache_path).probe_many(paths)
+    assert len(_calls(log)) == 2
+    assert results[paths[1]].height == 1920
+
+
+def test_failures_and_missing_files_are_not_cached(tmp_path, fake_ffprobe):
+    cmd, log = fake_ffprobe
+    bad = _videos(tmp_path, 1, suffix=".bad")[0]
+    probe = MediaProbe(ffprobe_cmd=cmd)
+
+    assert probe.probe(bad) is None
+    assert probe.probe(bad) is None
+    assert probe.probe(tmp_path / "missing.mp4") is None
+    assert len(_calls(log)) == 2
+    assert probe.get_stats()["errors"] == 2
+
+
+def test_quality_checker_and_selector_share_probe(tmp_path, fake_ffprobe):
+    from PrismQ.Tools.VideoQualityChecker import VideoQualityChecker
+    from PrismQ.Tools.VideoVariantSelector import VideoVariantSelector
+
+    cmd, log = fake_ffprobe
+    probe = MediaProbe(ffprobe_cmd=cmd)
+    paths = _videos(tmp_path, 2)
+
+    VideoQualityChecker(probe=probe).prefetch_metadata(paths)
+    metadata = VideoQualityChecker(probe=probe)._get_video_metadata(paths[0])
+    info = VideoVariantSelector(probe=probe)._get_video_info(paths[1])
+
+    assert metadata["video_stream"]["codec_name"] == "h264"
+    assert info["width"] == 1080 and info["nb_frames"] == 375
+    assert len(_calls(log)) == 2
@@ -0,0 +1,184 @@
+"""
+Tests for concurrent fan-out in MultiPlatformPublisher.
+
+Fake platform clients stand in for the real providers so timing, worker caps,
+the shared video buffer and timeout reporting are tested without network access.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from PrismQ.Shared.interfaces.platform_provider import PlatformType
+from PrismQ.Shared.interfaces.platform_provider import UploadResult as ProviderResult
+from PrismQ.Tools.MultiPlatformPublisher import (
+    MultiPlatformPublisher,
+    Platform,
+    PlatformMetadata,
+    SharedVideoBuffer,
+    UploadStatus,
+)
+
+
+class FakeClient:
+    """Provider double that sleeps to simulate upload time."""
+
+    def __init__(self, platform, delay=0.0):
+        self.platform = platform
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def authenticate(self):
+        return True
+
+    def upload_video(self, video_path, metadata):
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+        finally:
+            with self._lock:
+                self.active -= 1
+        return ProviderResult(success=True, platform=PlatformType(self.platform.value),
+                              video_id=f"{self.platform.value}_1", url=f"https://example.com/{self.platform.value}")
+
+
+class BufferedFakeClient(FakeClient):
+    """Provider double that accepts the shared file buffer, like TikTok and Facebook."""
+
+    def __init__(self, platform, delay=0.0):
+        super().__init__(platform, delay)
+        self.received = []
+
+    def upload_video(self, video_path, metadata, video_buffer=None):
+        self.received.append(bytes(video_buffer) if video_buffer is not None else None)
+        return super().upload_video(video_path, metadata)
+
+
+@pytest.fixture
+def video(tmp_path):
+    path = tmp_path / "video.mp4"
+    path.write_bytes(b"video-bytes" * 1000)
+    return path
+
+
+def make_publisher(tmp_path, clients, **kwargs):
+    publisher = MultiPlatformPublisher(output_dir=str(tmp_path / "reports"), **kwargs)
+    for platform, client in clients.items():
+        publisher.available_platforms[platform] = True
+        setattr(publisher, f"_{platform.value}", client)
+    return publisher
+
+
+def metadata_for(platforms):
+    return {p.value: PlatformMetadata(title="Title", description="Description") for p in platforms}
+
+
+def test_concurrent_publish_takes_the_slowest_upload_time(tmp_path, video):
+    clients = {
+        Platform.YOUTUBE: FakeClient(Platform.YOUTUBE, delay=0.4),
+        Platform.TIKTOK: BufferedFakeClient(Platform.TIKTOK, delay=0.4),
+        Platform.FACEBOOK: BufferedFakeClient(Platform.FACEBOOK, delay=0.4),
+    }
+    with make_publisher(tmp_path, clients) as publisher:
+        start = time.monotonic()
+        results = publisher.publish_to_all(str(video), metadata_for(clients), list(clients), concurrent=True)
+        elapsed = time.monotonic() - start
+
+    assert elapsed < 1.0
+    assert [r.platform for r in results] == list(clients)
+    assert all(r.status == UploadStatus.SUCCESS for r in results)
+    assert all(r.elapsed_seconds >= 0.4 for r in results)
+    assert results[1].video_id == "tiktok_1"
+
+
+def test_shared_buffer_goes_to_byte_sending_providers(tmp_path, video):
+    youtube = FakeClient(Platform.YOUTUBE)
+    tiktok = BufferedFakeClient(Platform.TIKTOK)
+    publisher = make_publisher(tmp_path, {Platform.YOUTUBE: youtube, Platform.TIKTOK: tiktok})
+
+    publisher.publish_to_all(str(video), metadata_for([Platform.YOUTUBE, Platform.TIKTOK]),
+                             [Platform.YOUTUBE, Platform.TIKTOK], concurrent=True, save_report=False)
+    publisher.publish_to_all(str(video), metadata_for([Platform.TIKTOK]), [Platform.TIKTOK], save_report=False)
+    publisher.close()
+
+    # Concurrent mode shares the mapped file; sequential mode leaves providers to read it
+    assert tiktok.received == [video.read_bytes(), None]
+    assert youtube.calls == 1
+
+
+def test_platform_concurrency_caps_apply_across_publish_calls(tmp_path, video):
+    youtube = FakeClient(Platform.YOUTUBE, delay=0.2)
+    tiktok = BufferedFakeClient(Platform.TIKTOK, delay=0.2)
+    publisher = make_publisher(
+        tmp_path,
+        {Platform.YOUTUBE: youtube, Platform.TIKTOK: tiktok},
+        platform_concurrency={Platform.YOUTUBE: 1, Platform.TIKTOK: 3},
+    )
+    platforms = [Platform.YOUTUBE, Platform.TIKTOK]
+
+    threads = [
+        threading.Thread(target=publisher.publish_to_all, args=(str(video), metadata_for(platforms), platforms),
+                         kwargs={"concurrent": True, "save_report": False})
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    publisher.close()
+
+    assert youtube.calls == tiktok.calls == 3
+    assert youtube.max_active == 1
+    assert tiktok.max_active > 1
+
+
+def test_timed_out_platforms_are_reported(tmp_path, video):
+    clients = {
+        Platform.YOUTUBE: FakeClient(Platform.YOUTUBE, delay=1.0),
+        Platform.TIKTOK: BufferedFakeClient(Platform.TIKTOK),
+    }
+    with make_publisher(tmp_path, clients, upload_timeout=0.3) as publisher:
+        results = publisher.publish_to_all(str(video), metadata_for(clients), list(clients), concurrent=True)
+
+    youtube, tiktok = results
+    assert youtube.status == UploadStatus.FAILED and "Timed out" in youtube.error
+    assert tiktok.status == UploadStatus.SUCCESS
+
+    (report_path,) = (tmp_path / "reports").glob("*_upload.json")
+    report = json.loads(report_path.read_text())
+    assert report["mode"] == "concurrent"
+    assert report["elapsed_seconds"] < 1.0
+    assert report["summary"]["timed_out"] == ["youtube"]
+    assert report["summary"]["success"] == 1
+
+
+def test_provider_failure_message_is_reported(tmp_path, video):
+    class FailingClient(FakeClient):
+        def upload_video(self, video_path, metadata):
+            return ProviderResult(success=False, platform=PlatformType.YOUTUBE, error_message="quota exceeded")
+
+    publisher = make_publisher(tmp_path, {Platform.YOUTUBE: FailingClient(Platform.YOUTUBE)})
+    (result,) = publisher.publish_to_all(str(video), metadata_for([Platform.YOUTUBE]), [Platform.YOUTUBE],
+                                         save_report=False)
+
+    assert result.status == UploadStatus.FAILED
+    assert result.error == "quota exceeded"
+
+
+def test_shared_video_buffer(tmp_path, video):
+    with SharedVideoBuffer(video) as buffer:
+        assert buffer.size == video.stat().st_size
+        assert bytes(buffer.view()[:11]) == b"video-bytes"
+
+    empty = tmp_path / "empty.mp4"
+    empty.write_bytes(b"")
+    with SharedVideoBuffer(empty) as buffer:
+        assert bytes(buffer.view()) == b""
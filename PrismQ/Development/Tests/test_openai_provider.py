@@ -170,6 +170,30 @@ class TestOpenAIProvider:
             with pytest.raises(RetryError):
                 provider.chat_completion(messages)
 
+    def test_rate_limit_pauses_shared_limiter(self):
+        """Test that a 429 pauses the API key on the shared rate limiter."""
+        from tenacity import stop_after_attempt
+        from PrismQ.Shared.rate_limit import get_rate_limiter
+
+        provider = OpenAIProvider(api_key="rate-limit-test-key", model="gpt-4o-mini")
+
+        mock_http_response = Mock()
+        mock_http_response.status_code = 429
+        mock_http_response.headers = {"Retry-After": "30"}
+
+        with patch.object(
+            provider.client.chat.completions,
+            "create",
+            side_effect=RateLimitError("Rate limit", response=mock_http_response, body=None),
+        ):
+            single_attempt = OpenAIProvider.chat_completion.retry_with(stop=stop_after_attempt(1))
+            with pytest.raises(Exception):
+                single_attempt(provider, [{"role": "user", "content": "Test"}])
+
+        metrics = get_rate_limiter().get_metrics()[provider.rate_key]
+        assert metrics["throttled"] == 1
+        assert metrics["blocked_for"] > 25
+
 
 class TestAsyncOpenAIProvider:
     """Tests for asynchronous AsyncOpenAIProvider."""
@@ -0,0 +1,147 @@
+"""
+Tests for incremental, parallel quality processing in process_quality.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        "Infrastructure",
+        "Utilities",
+        "Scripts",
+    ),
+)
+
+import process_quality
+from process_quality import (
+    MANIFEST_FILENAME,
+    SCORES_INDEX_FILENAME,
+    load_manifest,
+    process_stages_parallel,
+    score_folder,
+)
+
+
+CONFIG = {
+    "quality_thresholds": {"min_score": 0, "reprocess_score": 0, "underscore_prefix": "_"},
+    "audience": {
+        "genders": [{"name": "women"}, {"name": "men"}],
+        "age_groups": [{"range": "18-23"}],
+    },
+}
+
+STAGES = [("ideas", None), ("topics", "ideas")]
+
+
+@pytest.fixture
+def generator_root(temp_dir):
+    """Create a small generator tree with a few content files."""
+    for stage in ("ideas", "topics"):
+        for gender in ("women", "men"):
+            folder = temp_dir / stage / gender / "18-23"
+            folder.mkdir(parents=True)
+            for i in range(3):
+                (folder / f"item_{i}.json").write_text(
+                    json.dumps({"title": f"The secret truth #{i}", "synopsis": "A hidden story"})
+                )
+    return temp_dir
+
+
+def count_scored(monkeypatch):
+    """Patch calculate_score with a counting wrapper."""
+    calls = []
+    original = process_quality.calculate_score
+
+    def counting(content_data, scoring_config=None):
+        calls.append(content_data)
+        return original(content_data, scoring_config)
+
+    monkeypatch.setattr(process_quality, "calculate_score", counting)
+    return calls
+
+
+class TestIncrementalQuality:
+    """Tests for manifest-based incremental scoring."""
+
+    def test_writes_index_per_stage(self, generator_root):
+        """Test one consolidated index is written per stage."""
+        indexes = process_stages_parallel(
+            generator_root, STAGES, ["women", "men"], ["18-23"], CONFIG
+        )
+
+        assert set(indexes) == {"ideas", "topics"}
+        index = json.loads((generator_root / "ideas" / SCORES_INDEX_FILENAME).read_text())
+        assert index["summary"]["total_files"] == 6
+        assert [r["file"] for r in index["files"]][:3] == [
+            f"ideas/women/18-23/item_{i}.json" for i in range(3)
+        ]
+        assert all(r["action"] == "kept" for r in index["files"])
+
+    def test_second_run_uses_manifest(self, generator_root, monkeypatch):
+        """Test unchanged files are not re-scored on the next run."""
+        calls = count_scored(monkeypatch)
+        process_stages_parallel(generator_root, STAGES, ["women", "men"], ["18-23"], CONFIG)
+        assert len(calls) == 12
+        assert len(load_manifest(generator_root / MANIFEST_FILENAME)) == 12
+
+        calls.clear()
+        changed = generator_root / "topics" / "men" / "18-23" / "item_1.json"
+        changed.write_text(json.dumps({"title": "A completely different title here"}))
+        os.utime(changed, ns=(0, 0))
+
+        process_stages_parallel(generator_root, STAGES, ["women", "men"], ["18-23"], CONFIG)
+
+        assert len(calls) == 1
+        index = json.loads((generator_root / "topics" / SCORES_INDEX_FILENAME).read_text())
+        assert index["summary"]["cached"] == 5
+
+    def test_scoring_config_change_rescores_all(self, generator_root, monkeypatch):
+        """Test cached scores are dropped when the scoring config changes."""
+        process_stages_parallel(generator_root, STAGES, ["women", "men"], ["18-23"], CONFIG)
+
+        scoring_config = process_quality.load_scoring_config()
+        scoring_config["viral"] = dict(scoring_config["viral"], novelty=0.5)
+        monkeypatch.setattr(process_quality, "load_scoring_config", lambda: scoring_config)
+        calls = count_scored(monkeypatch)
+
+        process_stages_parallel(generator_root, STAGES, ["women", "men"], ["18-23"], CONFIG)
+        assert len(calls) == 12
+
+        calls.clear()
+        process_stages_parallel(generator_root, STAGES, ["women", "men"], ["18-23"], CONFIG)
+        assert calls == []
+
+    def test_touched_file_with_same_content_is_cached(self, generator_root, monkeypatch):
+        """Test a changed mtime with identical content reuses the score."""
+        folder = generator_root / "ideas" / "women" / "18-23"
+        first = score_folder(folder, "ideas", config=CONFIG, manifest_entries={}, root=generator_root)
+
+        os.utime(folder / "item_0.json", ns=(1, 1))
+        calls = count_scored(monkeypatch)
+        second = score_folder(
+            folder, "ideas", config=CONFIG, manifest_entries=first["manifest"], root=generator_root
+        )
+
+        assert calls == []
+        assert second["counts"]["cached"] == 3
+        assert second["manifest"]["ideas/women/18-23/item_0.json"]["mtime_ns"] == 1
+
+    def test_process_pool_matches_serial(self, generator_root):
+        """Test pooled scoring produces the same index as serial scoring."""
+        serial = process_stages_parallel(
+            generator_root, STAGES, ["women", "men"], ["18-23"], CONFIG, incremental=False
+        )
+        serial_index = json.loads(serial["topics"].read_text())
+
+        pooled = process_stages_parallel(
+            generator_root, STAGES, ["women", "men"], ["18-23"], CONFIG, incremental=False, jobs=2
+        )
+        pooled_index = json.loads(pooled["topics"].read_text())
+
+        assert pooled_index["files"] == serial_index["files"]
@@ -0,0 +1,128 @@
+"""
+Tests for streaming, bounded-memory trend processing in process_trends.
+"""
+
+import csv
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        "Infrastructure",
+        "Utilities",
+        "Scripts",
+    ),
+)
+
+from process_trends import (
+    TrendAccumulator,
+    accumulate_csv_files,
+    aggregate_trends,
+    detect_country,
+    load_csv_file,
+    process_trending_data,
+    process_trends_streaming,
+)
+
+
+FIELDS = ["query", "value", "link", "time", "geo", "property"]
+
+
+def write_trends_csv(path, geo, rows):
+    """Write a Google Trends style CSV."""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        for query, value in rows:
+            writer.writerow(
+                {"query": query, "value": value, "link": "", "time": "", "geo": geo, "property": ""}
+            )
+
+
+@pytest.fixture
+def trends_dir(temp_dir):
+    """Create CSV exports for two countries."""
+    raw = temp_dir / "raw"
+    raw.mkdir()
+    us_rows = [("ai tools", 90 - i) for i in range(20)] + [("space news", 60), ("cats", 10)]
+    gb_rows = [("ai tools", 70), ("football", 80), ("space news", 55)]
+    write_trends_csv(raw / "trending_US_7d.csv", "US", us_rows)
+    write_trends_csv(raw / "trending_GB_7d.csv", "GB", gb_rows)
+    return raw
+
+
+class TestStreamingTrends:
+    """Tests for the streaming trends processor."""
+
+    def test_detect_country(self):
+        """Test country codes are read from the original filename."""
+        assert detect_country("trending_US_7d.csv") == "US"
+        assert detect_country("trending_7d.csv") == "global"
+
+    def test_matches_in_memory_aggregation(self, trends_dir):
+        """Test running sums and counts equal aggregate_trends()."""
+        all_trends = []
+        for csv_file in sorted(trends_dir.glob("*.csv")):
+            all_trends.extend(process_trending_data(load_csv_file(csv_file)))
+        expected = aggregate_trends(all_trends, min_value=50)
+
+        streamed = accumulate_csv_files(sorted(trends_dir.glob("*.csv"))).results(min_value=50)
+
+        def summary(trends):
+            return [
+                (t["topic"], t["average_value"], t["occurrences"], t["total_value"])
+                for t in trends
+            ]
+
+        assert summary(streamed) == summary(expected)
+
+    def test_keeps_only_top_k_exemplars(self, trends_dir):
+        """Test details are bounded to the top-K rows by value."""
+        accumulator = accumulate_csv_files(sorted(trends_dir.glob("*.csv")), top_k=3)
+        ai_tools = next(t for t in accumulator.results(0) if t["topic"] == "ai tools")
+
+        assert ai_tools["occurrences"] == 21
+        assert [d["value"] for d in ai_tools["details"]] == [90, 89, 88]
+        assert ai_tools["geos"] == ["GB", "US"]
+
+    def test_merge_equals_single_pass(self, trends_dir):
+        """Test merging per-country accumulators equals one pass over all files."""
+        files = sorted(trends_dir.glob("*.csv"))
+        single = accumulate_csv_files(files, top_k=2)
+        merged = TrendAccumulator(top_k=2)
+        for csv_file in files:
+            merged.merge(accumulate_csv_files([csv_file], top_k=2))
+
+        assert merged.results(0) == single.results(0)
+        assert merged.rows == single.rows == 25
+
+    def test_parallel_writes_country_files(self, trends_dir, temp_dir):
+        """Test the process pool path writes per-country and global outputs."""
+        output_dir = temp_dir / "processed"
+
+        aggregated = process_trends_streaming(trends_dir, output_dir, min_value=50, jobs=2)
+
+        assert "cats" not in [t["topic"] for t in aggregated]
+        names = sorted(p.name.split("_")[1] for p in output_dir.glob("trends_*.json"))
+        assert names == ["GB", "US", "global"]
+        gb_file = next(output_dir.glob("trends_GB_*.json"))
+        gb_topics = [t["topic"] for t in json.loads(gb_file.read_text())["trends"]]
+        assert "football" in gb_topics
+
+    def test_columnar_output(self, trends_dir, temp_dir):
+        """Test the optional Parquet output."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        output_dir = temp_dir / "processed"
+
+        process_trends_streaming(trends_dir, output_dir, min_value=50, columnar="parquet")
+
+        table = pq.read_table(next(output_dir.glob("trends_global_*.parquet")))
+        assert table.column_names == [
+            "topic", "average_value", "occurrences", "total_value", "geos"
+        ]
+        assert table.num_rows == 3
@@ -0,0 +1,168 @@
+"""
+Tests for the shared adaptive rate limiter.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from PrismQ.Shared.rate_limit import (
+    RateLimiter,
+    SQLiteStateStore,
+    create_state_store,
+    parse_retry_after,
+    rate_key,
+)
+
+HOST = "https://api.example.com"
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def test_rate_key_normalizes_host_and_hashes_api_key():
+    assert rate_key("HTTPS://API.example.com/v1/items?x=1") == HOST
+    assert rate_key("reddit") == "reddit"
+    keyed = rate_key(HOST + "/v1", api_key="secret-token")
+    assert keyed.startswith(HOST + "|") and "secret" not in keyed
+
+
+def test_acquire_spaces_requests_and_records_waits():
+    limiter = RateLimiter()
+    limiter.configure(HOST, rate=20, burst=2)
+
+    start = time.monotonic()
+    waits = [limiter.acquire(HOST + "/v1/items") for _ in range(4)]
+
+    # Two burst tokens, then 0.05s per request
+    assert waits[:2] == [0.0, 0.0]
+    assert time.monotonic() - start >= 0.09
+    metrics = limiter.get_metrics()[HOST]
+    assert metrics["acquired"] == 4
+    assert metrics["total_wait"] == pytest.approx(sum(waits))
+    assert metrics["max_wait"] > 0
+
+
+def test_unconfigured_keys_pass_through_and_api_keys_inherit_host_limit():
+    limiter = RateLimiter()
+    assert limiter.acquire("https://other.example.com") == 0.0
+    assert limiter.get_limit("https://other.example.com") is None
+
+    limiter.configure(HOST, rate=1, burst=1)
+    key = rate_key(HOST, api_key="a")
+    assert limiter.get_limit(key).rate == 1
+    limiter.acquire(key)
+    with pytest.raises(TimeoutError):
+        limiter.acquire(key, timeout=0.1)
+
+
+def test_limit_caps_concurrency():
+    limiter = RateLimiter(poll_interval=0.01)
+    limiter.configure(HOST, max_concurrency=2)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def call():
+        with limiter.limit(HOST):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=call) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert peak[0] == 2
+    assert limiter.get_metrics()[HOST]["in_flight"] == 0
+
+
+def test_throttling_response_pauses_and_slows_key():
+    limiter = RateLimiter()
+    limiter.configure(HOST, rate=100, burst=1, recovery_step=0.25)
+
+    assert limiter.observe(HOST, FakeResponse(429, {"Retry-After": "0.2"}))
+    start = time.monotonic()
+    limiter.acquire(HOST)
+    assert time.monotonic() - start >= 0.15
+
+    metrics = limiter.get_metrics()[HOST]
+    assert metrics["throttled"] == 1
+    assert metrics["rate_factor"] == 0.5
+
+    assert not limiter.observe(HOST, FakeResponse(200))
+    assert limiter.get_metrics()[HOST]["rate_factor"] == 0.75
+
+
+def test_throttling_pauses_unconfigured_key():
+    limiter = RateLimiter()
+    assert limiter.get_limit(HOST) is None
+
+    assert limiter.feedback(HOST, 429, retry_after=0.2)
+    start = time.monotonic()
+    limiter.acquire(HOST + "/v1/items")
+    assert time.monotonic() - start >= 0.15
+    assert limiter.get_metrics()[HOST]["throttled"] == 1
+
+    # Later requests pass straight through again
+    start = time.monotonic()
+    limiter.acquire(HOST)
+    assert time.monotonic() - start < 0.05
+
+
+def test_acquire_async_waits_without_blocking_loop():
+    limiter = RateLimiter()
+    limiter.configure(HOST, rate=20, burst=1, max_concurrency=1)
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        waits = [await limiter.acquire_async(HOST) for _ in range(3)]
+        async with limiter.limit_async(HOST) as waited:
+            waits.append(waited)
+        task.cancel()
+        return waits, ticks
+
+    waits, ticks = asyncio.run(main())
+    assert waits[0] == 0.0 and all(w > 0 for w in waits[1:])
+    assert ticks >= 5
+
+
+def test_sqlite_store_shares_quota_between_limiters(tmp_path):
+    path = tmp_path / "limits.db"
+    first = RateLimiter(SQLiteStateStore(path))
+    second = RateLimiter(create_state_store(f"sqlite:///{path}"))
+    for limiter in (first, second):
+        limiter.configure(HOST, rate=1, burst=2)
+
+    first.acquire(HOST)
+    second.acquire(HOST)
+
+    # Both burst tokens are gone, whichever limiter asks
+    with pytest.raises(TimeoutError):
+        first.acquire(HOST, timeout=0.1)
+    second.feedback(HOST, 429, retry_after=30)
+    assert first.get_metrics()[HOST]["blocked_for"] > 25
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
@@ -0,0 +1,205 @@
+"""
+Tests for the persistent SDXL pipeline server.
+
+A fake backend stands in for diffusers so queueing, batching and style caching
+run without model weights; the tiny-model test exercises the real pipeline on
+CPU when diffusers and torch are installed.
+"""
+
+import importlib.util
+import threading
+
+import pytest
+from PIL import Image
+
+from PrismQ.Shared.sdxl_server import (
+    TINY_TEST_MODEL,
+    SDXLPipelineServer,
+    make_jsonl_handler,
+)
+
+
+class FakeBackend:
+    """Records calls and returns solid images colored by seed."""
+
+    instances = 0
+
+    def __init__(self, model_id, device, ip_adapter):
+        FakeBackend.instances += 1
+        self.calls = []
+        self.embedded = []
+        self.fail = False
+
+    def embed_style(self, image):
+        self.embedded.append(image.getpixel((0, 0)))
+        return {"color": image.getpixel((0, 0))}
+
+    def generate(self, prompts, seeds, style_embeds=None, ip_adapter_scale=0.0, **settings):
+        if self.fail:
+            raise RuntimeError("out of memory")
+        self.calls.append({
+            "prompts": list(prompts),
+            "style_embeds": style_embeds,
+            "ip_adapter_scale": ip_adapter_scale,
+            **settings,
+        })
+        return [Image.new("RGB", (8, 8), (seed % 256, 0, 0)) for seed in seeds]
+
+
+@pytest.fixture
+def server():
+    FakeBackend.instances = 0
+    server = SDXLPipelineServer(device="cpu", max_batch=8, batch_wait=0.2, backend_factory=FakeBackend)
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def style_image(tmp_path):
+    path = tmp_path / "style.png"
+    Image.new("RGB", (16, 16), (10, 20, 30)).save(path)
+    return path
+
+
+def test_same_style_prompts_run_in_one_batch(server, style_image, tmp_path):
+    server.register_style("noir", style_image, ip_adapter_scale=0.6)
+
+    futures = [
+        server.submit(f"noir {i}", style="noir", seed=i, out_path=tmp_path / f"noir_{i}.png")
+        for i in range(4)
+    ]
+    futures += [server.submit(f"plain {i}", seed=100 + i) for i in range(2)]
+    results = [future.result(timeout=5) for future in futures]
+
+    calls = server.backend.calls
+    assert sorted(len(call["prompts"]) for call in calls) == [2, 4]
+    styled = next(call for call in calls if call["style_embeds"] is not None)
+    assert styled["prompts"] == [f"noir {i}" for i in range(4)]
+    assert styled["ip_adapter_scale"] == 0.6
+
+    assert [r.batch_size for r in results] == [4, 4, 4, 4, 2, 2]
+    assert results[0].image.getpixel((0, 0)) == (0, 0, 0)
+    assert Image.open(tmp_path / "noir_3.png").getpixel((0, 0)) == (3, 0, 0)
+    assert server.get_stats()["batches"] == 2
+
+
+def test_different_settings_are_not_mixed(server):
+    futures = [
+        server.submit("a", width=512, height=512),
+        server.submit("b", width=512, height=512),
+        server.submit("c", width=1024, height=1024),
+    ]
+    for future in futures:
+        future.result(timeout=5)
+
+    sizes = sorted((call["width"], len(call["prompts"])) for call in server.backend.calls)
+    assert sizes == [(512, 2), (1024, 1)]
+
+
+def test_model_loads_once_and_lazily(server):
+    assert not server.is_loaded
+
+    server.generate("one", seed=1)
+    server.generate_many(["two", "three"], seeds=[2, 3])
+
+    assert FakeBackend.instances == 1
+    assert server.get_stats()["images"] == 3
+
+
+def test_style_embeddings_are_cached_by_content(server, style_image):
+    assert server.register_style("noir", style_image) is True
+    assert server.register_style("noir", style_image, ip_adapter_scale=0.9) is False
+    assert server.backend.embedded == [(10, 20, 30)]
+
+    # A changed reference image is encoded again
+    Image.new("RGB", (16, 16), (200, 0, 0)).save(style_image)
+    assert server.register_style("noir", style_image) is True
+    assert server.backend.embedded == [(10, 20, 30), (200, 0, 0)]
+
+    stats = server.get_stats()
+    assert (stats["style_cache_hits"], stats["style_cache_misses"]) == (1, 2)
+
+
+def test_unknown_style_is_rejected(server):
+    with pytest.raises(ValueError, match="not registered"):
+        server.submit("prompt", style="missing")
+
+
+def test_backend_errors_reach_every_caller(server):
+    server.backend.fail = True
+    futures = [server.submit(f"p{i}") for i in range(3)]
+    for future in futures:
+        with pytest.raises(RuntimeError, match="out of memory"):
+            future.result(timeout=5)
+
+
+def test_jsonl_handler(server, style_image, tmp_path):
+    handle = make_jsonl_handler(server)
+
+    assert handle("1", "style.register", {"name": "noir", "reference_image_path": str(style_image)}) == {
+        "name": "noir", "cached": False
+    }
+    data = handle("2", "img.generate_batch", {
+        "prompts": ["a", "b", "c"],
+        "style": "noir",
+        "seeds": [1, 2, 3],
+        "out_paths": [str(tmp_path / f"{i}.png") for i in range(3)],
+    })
+
+    assert [image["seed"] for image in data["images"]] == [1, 2, 3]
+    assert {image["batch_size"] for image in data["images"]} == {3}
+    assert (tmp_path / "2.png").exists()
+    assert handle("3", "ping", {})["styles"] == ["noir"]
+    with pytest.raises(ValueError, match="Unknown operation"):
+        handle("4", "img.upscale", {})
+
+
+def test_style_manager_generates_through_server(server, style_image, tmp_path):
+    from PrismQ.StoryGenerator.style_consistency import StyleConsistencyManager, StyleProfile
+
+    manager = StyleConsistencyManager(style_library_dir=tmp_path / "styles", device="cpu", server=server)
+    manager.style_profiles["noir"] = StyleProfile("noir", str(style_image), "film noir", ip_adapter_scale=0.7)
+
+    paths = manager.generate_with_style(["scene 1", "scene 2", "scene 3"], "noir", tmp_path / "out")
+
+    assert all(path.exists() for path in paths)
+    (call,) = server.backend.calls
+    assert call["prompts"] == ["scene 1, film noir", "scene 2, film noir", "scene 3, film noir"]
+    assert call["ip_adapter_scale"] == 0.7
+
+
+def test_server_is_thread_safe_for_concurrent_callers(server):
+    results = []
+
+    def caller(i):
+        results.append(server.generate(f"prompt {i}", seed=i).seed)
+
+    threads = [threading.Thread(target=caller, args=(i,)) for i in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert sorted(results) == list(range(6))
+    assert server.get_stats()["requests"] == 6
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+@pytest.mark.skipif(
+    importlib.util.find_spec("diffusers") is None or importlib.util.find_spec("torch") is None,
+    reason="diffusers and torch not installed",
+)
+def test_tiny_model_on_cpu(tmp_path):
+    with SDXLPipelineServer(model_id=TINY_TEST_MODEL, device="cpu", ip_adapter=False) as server:
+        results = server.generate_many(
+            ["a red square", "a blue circle"],
+            seeds=[1, 2],
+            out_paths=[tmp_path / "a.png", tmp_path / "b.png"],
+            width=64,
+            height=64,
+            num_inference_steps=2,
+        )
+
+    assert [result.batch_size for result in results] == [2, 2]
+    assert Image.open(tmp_path / "b.png").size == (64, 64)
@@ -0,0 +1,93 @@
+"""
+Tests for the shared segment executor used by the title and ranking scripts.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        "Infrastructure",
+        "Utilities",
+        "Scripts",
+    ),
+)
+
+import title_improve
+from segment_executor import print_segment_summary, run_segments
+
+SEGMENTS = [("women", "10-13"), ("women", "14-17"), ("men", "18-23"), ("men", "24-30")]
+
+
+def _echo_worker(gender, age, prefix):
+    """Module-level worker so it can be sent to worker processes."""
+    if age == "14-17":
+        raise ValueError("boom")
+    print(f"{prefix} {gender}/{age}")
+    return f"{gender}-{age}"
+
+
+def test_run_segments_inline_keeps_order_and_captures_errors():
+    runs = run_segments(_echo_worker, SEGMENTS, {"prefix": "seg"}, jobs=1)
+
+    assert [run["segment"] for run in runs] == SEGMENTS
+    assert [run["result"] for run in runs] == ["women-10-13", None, "men-18-23", "men-24-30"]
+    assert "ValueError: boom" in runs[1]["error"]
+    assert all(run["error"] is None for i, run in enumerate(runs) if i != 1)
+
+
+def test_run_segments_parallel_replays_output_in_segment_order(capsys):
+    runs = run_segments(_echo_worker, SEGMENTS, {"prefix": "seg"}, jobs=3)
+
+    assert [run["segment"] for run in runs] == SEGMENTS
+    assert runs[0]["output"] == "seg women/10-13\n"
+    assert "ValueError: boom" in runs[1]["error"]
+
+    out = capsys.readouterr().out
+    positions = [out.index(f"seg {g}/{a}") for g, a in SEGMENTS if a != "14-17"]
+    assert positions == sorted(positions)
+
+
+def test_print_segment_summary_counts_failures(capsys):
+    runs = run_segments(_echo_worker, SEGMENTS, {"prefix": "seg"}, jobs=1)
+    capsys.readouterr()
+
+    print_segment_summary(runs, "Test Summary", lambda result: f"ok {result}")
+
+    out = capsys.readouterr().out
+    assert "women/14-17: ❌ failed" in out
+    assert "men/24-30: ok men-24-30" in out
+    assert "Segments processed: 3/4" in out
+
+
+def test_improve_segment_generates_variants_concurrently(tmp_path):
+    titles_dir = tmp_path / "titles" / "women" / "18-23"
+    titles_dir.mkdir(parents=True)
+    for i, title in enumerate(["5 Tips for Success", "My Secret Morning Routine"]):
+        with open(titles_dir / f"title_{i:03d}.json", "w") as f:
+            json.dump({"title": title}, f)
+
+    config_path = Path(__file__).parent.parent.parent / "Resources" / "Data" / "config" / "scoring.yaml"
+    scoring_config = title_improve.title_score.load_scoring_config(str(config_path))
+
+    results = title_improve.improve_segment(
+        "women",
+        "18-23",
+        tmp_path / "titles",
+        tmp_path / "titles",
+        {"provider": "local"},
+        scoring_config,
+        variant_count=3,
+        llm_concurrency=2,
+    )
+
+    assert sorted(r["original_title"]["title"] for r in results) == [
+        "5 Tips for Success",
+        "My Secret Morning Routine",
+    ]
+    assert all(r["metadata"]["variant_count"] == 3 for r in results)
+    assert (titles_dir / "title_000_improved.json").exists()
@@ -21,7 +21,9 @@ from PIL import Image
 from PrismQ.StoryGenerator.style_consistency import (
     StyleConsistencyManager,
     StyleProfile,
-    ConsistencyMetrics
+    ConsistencyMetrics,
+    ImageFeatures,
+    palette_similarity_matrix
 )
 
 
@@ -469,6 +471,95 @@ class TestStyleConsistencyManager(unittest.TestCase):
         self.assertIn("not found", str(ctx.exception))
 
 
+class TestVectorizedScoring(unittest.TestCase):
+    """Test feature extraction, caching and matrix-based scoring."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = StyleConsistencyManager(
+            style_library_dir=Path(self.temp_dir) / "styles",
+            device="cpu"
+        )
+        rng = np.random.default_rng(0)
+        self.paths = []
+        for i in range(5):
+            pixels = rng.integers(0, 255, (8, 8, 3), dtype=np.uint8)
+            img_path = Path(self.temp_dir) / f"frame_{i}.png"
+            Image.fromarray(pixels).resize((96, 160)).save(img_path)
+            self.paths.append(img_path)
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_similarity_matrices_are_pairwise(self):
+        """Test each matrix covers all frame pairs."""
+        features = [self.manager.extract_features(p) for p in self.paths]
+        matrices = self.manager.similarity_matrices(features)
+        
+        for name in ('color', 'structural', 'style'):
+            self.assertEqual(matrices[name].shape, (5, 5))
+            np.testing.assert_allclose(np.diagonal(matrices[name]), 1.0, atol=1e-6)
+        np.testing.assert_allclose(matrices['color'], matrices['color'].T, atol=1e-6)
+    
+    def test_palette_matrix_matches_per_color_distances(self):
+        """Test the palette matrix against explicit nearest-color distances."""
+        manager = self.manager
+        palettes = np.random.default_rng(1).integers(0, 255, (7, 5, 3)).astype(np.float32)
+        matrix = palette_similarity_matrix(palettes, chunk_size=3)
+        
+        max_distance = np.sqrt(3 * 255 ** 2)
+        for i in range(7):
+            for j in range(7):
+                nearest = [min(manager._color_distance(c1, c2) for c2 in palettes[j]) for c1 in palettes[i]]
+                self.assertAlmostEqual(matrix[i, j], 1.0 - np.mean(nearest) / max_distance, places=4)
+    
+    def test_features_cached_by_content_hash(self):
+        """Test unchanged images are decoded only once."""
+        with patch.object(ImageFeatures, 'from_image', wraps=ImageFeatures.from_image) as extract:
+            self.manager.validate_consistency(self.paths)
+            self.manager.validate_consistency(self.paths)
+            self.assertEqual(extract.call_count, 5)
+            
+            # Same content under another name is a cache hit too
+            copy_path = Path(self.temp_dir) / "copy.png"
+            copy_path.write_bytes(self.paths[0].read_bytes())
+            self.manager.extract_features(copy_path)
+            self.assertEqual(extract.call_count, 5)
+    
+    def test_feature_cache_dir_persists_between_managers(self):
+        """Test features written to disk are reused by a new manager."""
+        cache_dir = Path(self.temp_dir) / "features"
+        first = StyleConsistencyManager(
+            style_library_dir=Path(self.temp_dir) / "styles", device="cpu", feature_cache_dir=cache_dir
+        )
+        expected = first.validate_consistency(self.paths)
+        self.assertEqual(len(list(cache_dir.glob("*.npz"))), 5)
+        
+        second = StyleConsistencyManager(
+            style_library_dir=Path(self.temp_dir) / "styles", device="cpu", feature_cache_dir=cache_dir
+        )
+        with patch.object(ImageFeatures, 'from_image') as extract:
+            metrics = second.validate_consistency(self.paths)
+            extract.assert_not_called()
+        self.assertAlmostEqual(metrics.overall_score, expected.overall_score)
+    
+    def test_frame_scores_flag_outlier(self):
+        """Test the frame that differs from the rest gets the lowest score."""
+        paths = []
+        for i, color in enumerate(['red', 'red', 'blue', 'red']):
+            img_path = Path(self.temp_dir) / f"solid_{i}.png"
+            Image.new('RGB', (64, 64), color=color).save(img_path)
+            paths.append(img_path)
+        
+        metrics = self.manager.validate_consistency(paths)
+        
+        self.assertEqual(int(np.argmin(metrics.frame_scores)), 2)
+        self.assertEqual(len(metrics.frame_scores), 4)
+
+
 class TestStyleConsistencyIntegration(unittest.TestCase):
     """Integration tests for style consistency workflow."""
     
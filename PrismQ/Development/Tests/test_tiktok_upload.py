@@ -0,0 +1,173 @@
+"""
+Tests for chunked, resumable TikTok uploads against a local fake upload server.
+"""
+
+import json
+import os
+
+import pytest
+
+from mocks.fake_tiktok_server import FakeTikTokServer
+from PrismQ.Providers.tiktok_provider import TikTokUploader, UploadState
+from PrismQ.Shared.interfaces.platform_provider import VideoMetadata
+
+CHUNK = 64 * 1024
+
+
+@pytest.fixture
+def server():
+    with FakeTikTokServer() as server:
+        yield server
+
+
+@pytest.fixture
+def video(tmp_path):
+    # Three full chunks plus a remainder the last chunk absorbs
+    data = os.urandom(3 * CHUNK + 1234)
+    path = tmp_path / "video.mp4"
+    path.write_bytes(data)
+    return path, data
+
+
+@pytest.fixture
+def metadata():
+    return VideoMetadata(title="Test", description="Chunked upload", hashtags=["test"])
+
+
+def make_uploader(server, **kwargs):
+    uploader = TikTokUploader(
+        access_token="token",
+        chunk_size=CHUNK,
+        retry_backoff=0,
+        status_poll_interval=0,
+        api_base_url=server.base_url,
+        **kwargs,
+    )
+    uploader.MIN_CHUNK_SIZE = CHUNK
+    return uploader
+
+
+def test_plan_chunks():
+    uploader = TikTokUploader(access_token="token", chunk_size=10 * 1024 * 1024)
+    mb = 1024 * 1024
+
+    assert uploader.plan_chunks(3 * mb) == (3 * mb, 1)
+    # Above the API minimum but below the configured chunk size
+    assert uploader.plan_chunks(7 * mb) == (7 * mb, 1)
+    assert uploader.plan_chunks(25 * mb) == (10 * mb, 2)
+    # Requested sizes are clamped to the API limits
+    uploader.chunk_size = 1 * mb
+    assert uploader.plan_chunks(20 * mb) == (5 * mb, 4)
+
+
+def test_video_smaller_than_chunk_uploads_in_one_chunk(server, tmp_path, metadata):
+    data = os.urandom(CHUNK // 2)
+    path = tmp_path / "short.mp4"
+    path.write_bytes(data)
+    uploader = make_uploader(server)
+    uploader.MIN_CHUNK_SIZE = CHUNK // 4
+
+    result = uploader.upload_video(str(path), metadata)
+
+    assert result.success, result.error_message
+    assert server.video_bytes(server.last_publish_id) == data
+    (init,) = server.init_requests
+    assert init["source_info"]["chunk_size"] == len(data)
+    assert init["source_info"]["total_chunk_count"] == 1
+
+
+def test_chunks_stream_with_content_range(server, video, metadata):
+    path, data = video
+
+    result = make_uploader(server).upload_video(str(path), metadata)
+
+    assert result.success, result.error_message
+    assert server.video_bytes(server.last_publish_id) == data
+    (init,) = server.init_requests
+    assert init["source_info"]["chunk_size"] == CHUNK
+    assert init["source_info"]["total_chunk_count"] == 3
+    assert [content_range for _, content_range in server.chunk_requests] == [
+        f"bytes 0-{CHUNK - 1}/{len(data)}",
+        f"bytes {CHUNK}-{2 * CHUNK - 1}/{len(data)}",
+        f"bytes {2 * CHUNK}-{len(data) - 1}/{len(data)}",
+    ]
+    # Progress file is removed once the upload is published
+    assert not os.path.exists(f"{path}.tiktok_upload.json")
+
+
+def test_failed_chunk_is_retried_alone(server, video, metadata):
+    path, data = video
+    server.fail_chunks[1] = [503, 500]
+
+    result = make_uploader(server).upload_video(str(path), metadata)
+
+    assert result.success
+    assert server.video_bytes(server.last_publish_id) == data
+    ranges = [content_range for _, content_range in server.chunk_requests]
+    assert len(ranges) == 5
+    assert ranges.count(f"bytes {CHUNK}-{2 * CHUNK - 1}/{len(data)}") == 3
+
+
+def test_interrupted_upload_resumes_remaining_chunks(server, video, metadata, tmp_path):
+    path, data = video
+    state_dir = tmp_path / "state"
+    server.fail_chunks[2] = [500, 500]
+
+    first = make_uploader(server, chunk_retries=2, state_dir=str(state_dir)).upload_video(str(path), metadata)
+
+    assert not first.success
+    state = UploadState.load(str(state_dir / "video.mp4.tiktok_upload.json"))
+    assert state.completed == [0, 1]
+
+    server.chunk_requests.clear()
+    second = make_uploader(server, state_dir=str(state_dir)).upload_video(str(path), metadata)
+
+    assert second.success
+    assert len(server.init_requests) == 1
+    assert server.chunk_requests == [("pub_1", f"bytes {2 * CHUNK}-{len(data) - 1}/{len(data)}")]
+    assert server.video_bytes("pub_1") == data
+
+
+def test_stale_progress_starts_a_new_upload(server, video, metadata):
+    path, data = video
+    state_path = f"{path}.tiktok_upload.json"
+    with open(state_path, "w") as f:
+        json.dump({"publish_id": "old", "upload_url": "http://invalid", "video_size": 1,
+                   "mtime": 0, "chunk_size": CHUNK, "chunk_count": 1, "completed_chunks": []}, f)
+
+    result = make_uploader(server).upload_video(str(path), metadata)
+
+    assert result.success
+    assert server.video_bytes(server.last_publish_id) == data
+
+
+def test_parallel_chunks(server, video, metadata):
+    path, data = video
+    server.chunk_delay = 0.1
+
+    result = make_uploader(server, max_parallel_chunks=3).upload_video(str(path), metadata)
+
+    assert result.success
+    assert server.max_active_puts > 1
+    assert server.video_bytes(server.last_publish_id) == data
+
+
+def test_client_errors_are_not_retried(server, video, metadata):
+    path, _ = video
+    server.fail_chunks[0] = [403]
+
+    result = make_uploader(server).upload_video(str(path), metadata)
+
+    assert not result.success
+    assert len(server.chunk_requests) == 1
+
+
+def test_chunks_sliced_from_shared_buffer(server, video, metadata):
+    path, data = video
+    buffer = memoryview(data)
+    path.write_bytes(b"")  # Disk contents are not read when a buffer is given
+
+    result = make_uploader(server).upload_video(str(path), metadata, video_buffer=buffer)
+
+    assert result.success
+    assert server.video_bytes(server.last_publish_id) == data
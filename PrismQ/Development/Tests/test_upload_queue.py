@@ -0,0 +1,278 @@
+"""
+Tests for the durable SQLite upload queue and publishing scheduler.
+"""
+
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from PrismQ.Shared.interfaces.platform_provider import PlatformType
+from PrismQ.Shared.interfaces.platform_provider import UploadResult as ProviderResult
+from PrismQ.Tools.MultiPlatformPublisher import (
+    MultiPlatformPublisher,
+    Platform,
+    PlatformMetadata,
+    UploadStatus,
+)
+from PrismQ.Tools.UploadQueue import PublishScheduler, UploadQueue
+
+
+class FakeClient:
+    """Provider double that fails a set number of times before succeeding."""
+
+    def __init__(self, platform, failures=0, delay=0.0):
+        self.platform = platform
+        self.failures = failures
+        self.delay = delay
+        self.calls = 0
+        self.call_times = []
+
+    def authenticate(self):
+        return True
+
+    def upload_video(self, video_path, metadata):
+        self.calls += 1
+        self.call_times.append(time.time())
+        time.sleep(self.delay)
+        if self.calls <= self.failures:
+            return ProviderResult(success=False, platform=PlatformType(self.platform.value),
+                                  error_message="service unavailable")
+        return ProviderResult(success=True, platform=PlatformType(self.platform.value),
+                              video_id=f"{self.platform.value}_{self.calls}")
+
+
+@pytest.fixture
+def video(tmp_path):
+    path = tmp_path / "video.mp4"
+    path.write_bytes(b"video")
+    return str(path)
+
+
+def make_publisher(tmp_path, clients, **queue_options):
+    publisher = MultiPlatformPublisher(output_dir=str(tmp_path / "out"))
+    for platform, client in clients.items():
+        publisher.available_platforms[platform] = True
+        setattr(publisher, f"_{platform.value}", client)
+    publisher._queue = UploadQueue(publisher.queue_db, **queue_options)
+    return publisher
+
+
+def metadata_for(platforms):
+    return {p.value: PlatformMetadata(title="Title", tags=["a"]) for p in platforms}
+
+
+def test_scheduled_uploads_survive_restart(tmp_path, video):
+    platforms = [Platform.YOUTUBE, Platform.TIKTOK]
+    publisher = MultiPlatformPublisher(output_dir=str(tmp_path / "out"))
+    later = datetime.now() + timedelta(hours=1)
+    task = publisher.schedule_upload(video, metadata_for(platforms), platforms, later)
+
+    restarted = MultiPlatformPublisher(output_dir=str(tmp_path / "out"))
+    (queued,) = restarted.upload_queue
+
+    assert queued.task_id == task.task_id
+    assert queued.status == UploadStatus.SCHEDULED
+    assert queued.platforms == platforms
+    assert queued.metadata[Platform.TIKTOK].tags == ["a"]
+    assert abs((queued.scheduled_time - later).total_seconds()) < 0.001
+
+
+def test_due_lookup_uses_status_time_index(tmp_path):
+    queue = UploadQueue(tmp_path / "queue.db")
+    plan = queue._connect().execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM upload_tasks "
+        "WHERE status IN ('pending', 'scheduled') AND scheduled_time <= ? ORDER BY scheduled_time LIMIT 1",
+        (time.time(),)
+    ).fetchall()
+    assert any("idx_upload_tasks_due" in row["detail"] for row in plan)
+
+
+def test_process_queue_runs_only_due_tasks(tmp_path, video):
+    youtube = FakeClient(Platform.YOUTUBE)
+    publisher = make_publisher(tmp_path, {Platform.YOUTUBE: youtube})
+    metadata = metadata_for([Platform.YOUTUBE])
+    publisher.schedule_upload(video, metadata, [Platform.YOUTUBE], datetime.now() - timedelta(minutes=1))
+    future = publisher.schedule_upload(video, metadata, [Platform.YOUTUBE], datetime.now() + timedelta(hours=1))
+
+    (processed,) = publisher.process_queue()
+
+    assert processed.status == UploadStatus.SUCCESS
+    assert processed.results[0]["video_id"] == "youtube_1"
+    assert [t.task_id for t in publisher.upload_queue] == [future.task_id]
+    assert youtube.calls == 1
+
+
+def test_failed_platform_is_retried_alone_with_backoff(tmp_path, video):
+    youtube = FakeClient(Platform.YOUTUBE)
+    tiktok = FakeClient(Platform.TIKTOK, failures=1)
+    publisher = make_publisher(tmp_path, {Platform.YOUTUBE: youtube, Platform.TIKTOK: tiktok}, retry_backoff=30)
+    platforms = [Platform.YOUTUBE, Platform.TIKTOK]
+    task = publisher.schedule_upload(video, metadata_for(platforms), platforms, datetime.now())
+
+    (first,) = publisher.process_queue()
+    assert first.status == UploadStatus.SCHEDULED
+    assert "tiktok: service unavailable" in first.error
+    assert (first.scheduled_time - datetime.now()).total_seconds() == pytest.approx(30, abs=2)
+    assert publisher.process_queue() == []
+
+    # Make the retry due now
+    publisher.queue._connect().execute("UPDATE upload_tasks SET scheduled_time = 0 WHERE id = ?", (task.task_id,))
+    (second,) = publisher.process_queue()
+
+    assert second.status == UploadStatus.SUCCESS
+    assert (youtube.calls, tiktok.calls) == (1, 2)
+
+
+def test_task_fails_after_max_attempts(tmp_path, video):
+    tiktok = FakeClient(Platform.TIKTOK, failures=5)
+    publisher = make_publisher(tmp_path, {Platform.TIKTOK: tiktok}, max_attempts=2, retry_backoff=0)
+    publisher.schedule_upload(video, metadata_for([Platform.TIKTOK]), [Platform.TIKTOK], datetime.now())
+
+    processed = publisher.process_queue()
+
+    assert [t.status for t in processed] == [UploadStatus.SCHEDULED, UploadStatus.FAILED]
+    assert tiktok.calls == 2
+    (failed,) = publisher.get_upload_history()
+    assert failed.completed_at is not None
+
+
+def test_platform_without_metadata_fails_without_retry(tmp_path, video):
+    youtube = FakeClient(Platform.YOUTUBE)
+    publisher = make_publisher(tmp_path, {Platform.YOUTUBE: youtube}, max_attempts=3, retry_backoff=0)
+    publisher.schedule_upload(
+        video, metadata_for([Platform.YOUTUBE]), [Platform.YOUTUBE, Platform.TIKTOK], datetime.now()
+    )
+
+    (failed,) = publisher.process_queue()
+
+    assert failed.status == UploadStatus.FAILED
+    assert failed.error == "tiktok: No metadata for platform"
+    assert youtube.calls == 1
+
+
+def test_history_filters_by_platform_with_limit(tmp_path, video):
+    clients = {p: FakeClient(p) for p in (Platform.YOUTUBE, Platform.TIKTOK)}
+    publisher = make_publisher(tmp_path, clients)
+    ids = []
+    for platforms in ([Platform.YOUTUBE], [Platform.TIKTOK], [Platform.YOUTUBE, Platform.TIKTOK], [Platform.YOUTUBE]):
+        ids.append(publisher.schedule_upload(video, metadata_for(platforms), platforms, datetime.now()).task_id)
+    publisher.process_queue()
+
+    assert [t.task_id for t in publisher.get_upload_history()] == ids
+    assert [t.task_id for t in publisher.get_upload_history(Platform.TIKTOK)] == [ids[1], ids[2]]
+    assert [t.task_id for t in publisher.get_upload_history(Platform.YOUTUBE, limit=2)] == [ids[2], ids[3]]
+
+
+def test_concurrent_workers_never_claim_the_same_task(tmp_path, video):
+    queue = UploadQueue(tmp_path / "queue.db")
+    for _ in range(40):
+        queue.add(video, metadata_for([Platform.YOUTUBE]), [Platform.YOUTUBE])
+    claimed = []
+
+    def worker():
+        while True:
+            task = queue.claim_due()
+            if task is None:
+                return
+            claimed.append(task.task_id)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert sorted(claimed) == list(range(1, 41))
+
+
+def test_abandoned_tasks_are_requeued(tmp_path, video):
+    queue = UploadQueue(tmp_path / "queue.db", lease_seconds=0)
+    task = queue.add(video, metadata_for([Platform.YOUTUBE]), [Platform.YOUTUBE])
+    queue.claim_due()
+    time.sleep(0.01)
+
+    assert queue.recover_abandoned() == 1
+    assert queue.get(task.task_id).status == UploadStatus.PENDING
+
+
+def test_scheduler_sleeps_until_task_is_due(tmp_path, video):
+    youtube = FakeClient(Platform.YOUTUBE)
+    publisher = make_publisher(tmp_path, {Platform.YOUTUBE: youtube})
+
+    with PublishScheduler(publisher, workers=2, max_sleep=30) as scheduler:
+        publish_at = datetime.now() + timedelta(seconds=0.5)
+        scheduler.schedule(video, metadata_for([Platform.YOUTUBE]), [Platform.YOUTUBE], publish_at)
+        deadline = time.time() + 5
+        while not publisher.get_upload_history() and time.time() < deadline:
+            time.sleep(0.05)
+
+    (done,) = publisher.get_upload_history()
+    assert done.status == UploadStatus.SUCCESS
+    # Woken by the schedule call, then slept only until the task was due
+    assert publish_at.timestamp() <= youtube.call_times[0] < publish_at.timestamp() + 1.0
+
+
+def test_scheduler_requeues_abandoned_tasks_while_running(tmp_path, video):
+    publisher = make_publisher(tmp_path, {Platform.YOUTUBE: FakeClient(Platform.YOUTUBE)})
+
+    with PublishScheduler(publisher, max_sleep=0.05, recover_interval=0.1):
+        # A task claimed by a worker that died after the scheduler started
+        task = publisher.queue.add(
+            video, metadata_for([Platform.YOUTUBE]), [Platform.YOUTUBE],
+            datetime.now() + timedelta(hours=1)
+        )
+        publisher.queue._connect().execute(
+            "UPDATE upload_tasks SET status = ?, started_at = 0 WHERE id = ?",
+            (UploadStatus.IN_PROGRESS.value, task.task_id)
+        )
+        deadline = time.time() + 5
+        while publisher.queue.get(task.task_id).status == UploadStatus.IN_PROGRESS and time.time() < deadline:
+            time.sleep(0.05)
+
+    assert publisher.queue.get(task.task_id).status == UploadStatus.PENDING
+
+
+def test_long_upload_keeps_its_lease(tmp_path, video):
+    youtube = FakeClient(Platform.YOUTUBE, delay=1.0)
+    publisher = make_publisher(tmp_path, {Platform.YOUTUBE: youtube}, lease_seconds=0.3)
+
+    with PublishScheduler(publisher, workers=2, max_sleep=0.05, recover_interval=0.05) as scheduler:
+        scheduler.schedule(video, metadata_for([Platform.YOUTUBE]), [Platform.YOUTUBE])
+        deadline = time.time() + 5
+        while not publisher.get_upload_history() and time.time() < deadline:
+            time.sleep(0.05)
+
+    (done,) = publisher.get_upload_history()
+    assert done.status == UploadStatus.SUCCESS
+    # The heartbeat kept the running upload from being requeued and re-claimed
+    assert youtube.calls == 1
+
+
+def test_scheduler_survives_database_errors(tmp_path, video):
+    publisher = make_publisher(tmp_path, {Platform.YOUTUBE: FakeClient(Platform.YOUTUBE)})
+    claim_due = publisher.queue.claim_due
+    errors = []
+
+    def flaky_claim_due(*args, **kwargs):
+        if not errors:
+            errors.append(1)
+            raise sqlite3.OperationalError("database is locked")
+        return claim_due(*args, **kwargs)
+
+    publisher.queue.claim_due = flaky_claim_due
+    scheduler = PublishScheduler(publisher, workers=1, max_sleep=0.05)
+    scheduler.ERROR_BACKOFF = 0.05
+    with scheduler:
+        scheduler.schedule(video, metadata_for([Platform.YOUTUBE]), [Platform.YOUTUBE])
+        deadline = time.time() + 5
+        while not publisher.get_upload_history() and time.time() < deadline:
+            time.sleep(0.05)
+
+    assert errors
+    (done,) = publisher.get_upload_history()
+    assert done.status == UploadStatus.SUCCESS
+    # The worker slot held when the error was raised was given back
+    assert scheduler._free_workers.acquire(blocking=False)
@@ -0,0 +1,280 @@
+"""
+Tests for frame-level video analysis and variant selection on decoded frames.
+"""
+
+import shutil
+import subprocess
+
+import numpy as np
+import pytest
+
+from PrismQ.Shared.media_probe import MediaInfo
+from PrismQ.Shared.video_frames import (
+    AudioLevels,
+    FrameStats,
+    analyze_video_frames,
+    find_segments,
+    laplacian_variance,
+    scan_media,
+)
+
+W, H = 32, 56
+requires_ffmpeg = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+
+
+def _texture(seed=0):
+    """Smooth pattern with fine grain, periodic over the frame width."""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:H, 0:W]
+    phase = rng.uniform(0, 2 * np.pi, size=2)
+    pattern = 40 * np.sin(2 * np.pi * x / W + phase[0]) + 20 * np.sin(2 * np.pi * y / 14 + phase[1])
+    return 128 + pattern + rng.uniform(-6, 6, size=(H, W))
+
+
+def _pan(frames, step=1, seed=0, offset=0):
+    """Texture panning sideways by `step` pixels per frame."""
+    base = np.tile(_texture(seed) + offset, (1, 3))
+    return np.stack([base[:, i * step:i * step + W] for i in range(frames)]).astype(np.uint8)
+
+
+def _blur(frames):
+    f = frames.astype(np.float32)
+    return ((f + np.roll(f, 1, 1) + np.roll(f, -1, 1) + np.roll(f, 1, 2) + np.roll(f, -1, 2)) / 5).astype(np.uint8)
+
+
+def _stats(frames, chunk=7):
+    stats = FrameStats()
+    for i in range(0, len(frames), chunk):
+        stats.update(frames[i:i + chunk])
+    return stats.summary()
+
+
+class TestFrameStats:
+    def test_chunking_does_not_change_results(self):
+        frames = _pan(40)
+        assert _stats(frames, chunk=3) == _stats(frames, chunk=64)
+
+    def test_smooth_motion_beats_stutter(self):
+        smooth = _pan(40, step=1)
+        # Same total motion delivered as freeze-then-jump pairs
+        stutter = np.repeat(_pan(20, step=2), 2, axis=0)
+
+        assert _stats(smooth)['motion_smoothness'] > 0.9
+        assert _stats(stutter)['motion_smoothness'] < 0.6
+
+    def test_scene_cut_detected(self):
+        frames = np.concatenate([_pan(20, seed=0), _pan(20, seed=1, offset=-70)])
+        metrics = _stats(frames)
+        assert metrics['scene_cuts'] == 1
+
+    def test_flicker_detected(self):
+        frames = _pan(40).astype(np.int16)
+        frames[::2] += 20
+        metrics = _stats(np.clip(frames, 0, 255).astype(np.uint8))
+        assert metrics['flicker_ratio'] > 0.8
+        assert _stats(_pan(40))['flicker_ratio'] == 0.0
+
+    def test_blur_lowers_laplacian_variance(self):
+        frames = _pan(5)
+        assert (laplacian_variance(_blur(frames)) < 0.5 * laplacian_variance(frames)).all()
+
+        mixed = frames.copy()
+        mixed[2] = _blur(_blur(frames[2:3]))[0]
+        assert _stats(mixed)['blurry_ratio'] == pytest.approx(0.2)
+
+
+class TestContentDefects:
+    def test_find_segments(self):
+        mask = np.array([0, 1, 1, 1, 0, 1, 0, 1, 1], dtype=bool)
+        assert find_segments(mask, fps=2, min_seconds=1.0) == [(0.5, 2.0), (3.5, 4.5)]
+        assert find_segments(mask, fps=2, min_seconds=1.5) == [(0.5, 2.0)]
+        assert find_segments(np.zeros(0, dtype=bool), fps=2, min_seconds=0) == []
+
+    def test_black_and_frozen_frames(self):
+        black = np.full((4, H, W), 8, dtype=np.uint8)
+        still = np.repeat(_pan(1, seed=3), 5, axis=0)
+        stats = FrameStats()
+        for chunk in (_pan(6), black, _pan(4, seed=1), still):
+            stats.update(chunk)
+
+        assert find_segments(stats.black_mask(), fps=1, min_seconds=2) == [(6.0, 10.0)]
+        # Black frames are not also reported as frozen
+        assert find_segments(stats.freeze_mask(), fps=1, min_seconds=2) == [(15.0, 19.0)]
+
+    def test_audio_levels_find_silence_gaps(self):
+        rate = 1000
+        tone = 0.5 * np.sin(np.linspace(0, 400 * np.pi, 2 * rate)).astype(np.float32)
+        samples = np.concatenate([tone, np.zeros(3 * rate, dtype=np.float32), tone])
+        levels = AudioLevels(sample_rate=rate, window_seconds=0.5)
+        for i in range(0, len(samples), 333):
+            levels.update(samples[i:i + 333])
+
+        assert levels.gaps(threshold_db=-50, min_seconds=1.0) == [(2.0, 5.0)]
+        assert levels.levels()[0] > -10
+
+
+def _encode(path, frames):
+    cmd = [
+        'ffmpeg', '-y', '-v', 'error', '-f', 'rawvideo', '-pix_fmt', 'gray',
+        '-s', f'{W}x{H}', '-r', '30', '-i', '-',
+        '-c:v', 'libx264', '-crf', '1', '-pix_fmt', 'yuv444p', str(path),
+    ]
+    subprocess.run(cmd, input=frames.tobytes(), check=True)
+
+
+def _encode_with_audio(path, frames, silence=None, seconds=None):
+    """Encode frames at 10 fps with a tone track, optionally silenced between `silence` seconds."""
+    seconds = seconds or len(frames) / 10
+    volume = f",volume=enable='between(t,{silence[0]},{silence[1]})':volume=0" if silence else ""
+    cmd = [
+        'ffmpeg', '-y', '-v', 'error', '-f', 'rawvideo', '-pix_fmt', 'gray',
+        '-s', f'{W}x{H}', '-r', '10', '-i', '-',
+        '-f', 'lavfi', '-i', f'sine=frequency=440:duration={seconds}',
+        '-af', f'anull{volume}', '-c:v', 'libx264', '-crf', '1', '-pix_fmt', 'yuv444p',
+        '-c:a', 'aac', '-shortest', str(path),
+    ]
+    subprocess.run(cmd, input=frames.tobytes(), check=True)
+
+
+class _StaticProbe:
+    """Probe double returning fixed metadata (ffprobe may be unavailable)."""
+
+    def __init__(self, has_audio=True):
+        self.has_audio = has_audio
+
+    def probe(self, path):
+        return MediaInfo(
+            path=str(path), size_bytes=2_000_000, mtime=0.0, format_name='mov,mp4',
+            duration=6.0, bit_rate=8_000_000, width=1080, height=1920, fps=30.0,
+            video_codec='h264', audio_codec='aac' if self.has_audio else '',
+            format={'format_name': 'mov,mp4', 'duration': '6.0', 'bit_rate': '8000000'},
+            video_stream={'codec_name': 'h264', 'width': 1080, 'height': 1920, 'bit_rate': '8000000'},
+            audio_stream={'codec_name': 'aac', 'bit_rate': '192000'} if self.has_audio else None,
+        )
+
+    def probe_many(self, paths):
+        return {str(p): self.probe(p) for p in paths}
+
+
+@requires_ffmpeg
+class TestDecodedAnalysis:
+    def test_analyze_video_frames_decodes_once(self, tmp_path):
+        path = tmp_path / "clip.mp4"
+        _encode(path, _pan(30))
+
+        metrics = analyze_video_frames(path, width=W, height=H)
+
+        assert metrics['frames'] == 30
+        assert metrics['scene_cuts'] == 0
+
+    def test_undecodable_file_reports_error(self, tmp_path):
+        path = tmp_path / "fake.mp4"
+        path.write_bytes(b"not a video")
+        metrics = analyze_video_frames(path, width=W, height=H)
+        assert metrics['frames'] == 0 and 'error' in metrics
+
+    def test_selector_prefers_clean_variant(self, tmp_path):
+        from PrismQ.Tools.VideoVariantSelector import VideoVariantSelector
+
+        clean = _pan(30)
+        flicker = clean.astype(np.int16)
+        flicker[::2] += 25
+        variants = {
+            'flicker': np.clip(flicker, 0, 255).astype(np.uint8),
+            'blurry': _blur(_blur(clean)),
+            'clean': clean,
+            'stutter': np.repeat(_pan(15, step=2), 2, axis=0),
+        }
+        paths = []
+        for name, frames in variants.items():
+            paths.append(str(tmp_path / f"{name}.mp4"))
+            _encode(paths[-1], frames)
+
+        selector = VideoVariantSelector(max_workers=2, analysis_width=W)
+        selected, report = selector.select_best_variant(paths, shot_id="shot", save_report=False)
+
+        assert selected.endswith("clean.mp4")
+        scores = {s['video_path'].rsplit('/', 1)[-1]: s for s in report['all_scores']}
+        assert scores['flicker.mp4']['temporal_consistency'] < scores['clean.mp4']['temporal_consistency']
+        assert scores['blurry.mp4']['artifact_ratio'] > scores['clean.mp4']['artifact_ratio']
+        assert scores['stutter.mp4']['motion_smoothness'] < scores['clean.mp4']['motion_smoothness']
+        assert report['analysis_seconds'] > 0
+
+    def test_scan_media_reads_video_and_audio_in_one_pass(self, tmp_path):
+        path = tmp_path / "clip.mp4"
+        _encode_with_audio(path, _pan(40), silence=(1.5, 3.5))
+
+        scan = scan_media(path, sample_fps=5, width=W, height=H)
+
+        assert scan.error is None and not scan.truncated
+        assert scan.frames.frames == 20
+        gaps = scan.audio.gaps(threshold_db=-50, min_seconds=1.0)
+        assert len(gaps) == 1
+        assert gaps[0][0] == pytest.approx(1.5, abs=0.5) and gaps[0][1] == pytest.approx(3.5, abs=0.5)
+
+    def test_scan_media_without_audio_stream(self, tmp_path):
+        path = tmp_path / "silent.mp4"
+        _encode(path, _pan(30))
+
+        scan = scan_media(path, sample_fps=10, width=W, height=H)
+
+        assert scan.error is None and scan.audio is None
+        assert scan.frames.frames == 10
+
+    def test_scan_media_stops_at_time_budget(self, tmp_path):
+        path = tmp_path / "clip.mp4"
+        _encode(path, _pan(60))
+
+        scan = scan_media(path, width=W, height=H, sample_fps=30, time_budget=0, chunk_frames=4)
+
+        assert scan.truncated
+        assert 0 < scan.frames.frames < 60
+
+    def test_deep_quality_check_flags_defects(self, tmp_path):
+        from PrismQ.Tools.VideoQualityChecker import VideoQualityChecker
+
+        clean = _pan(60)
+        defective = np.concatenate([
+            _pan(15), np.full((15, H, W), 5, dtype=np.uint8),
+            np.repeat(_pan(1, seed=2), 30, axis=0),
+        ])
+        _encode_with_audio(tmp_path / "clean.mp4", clean)
+        _encode_with_audio(tmp_path / "defective.mp4", defective, silence=(0.5, 3.0))
+        for name in ("clean.mp4", "defective.mp4"):
+            (tmp_path / name).write_bytes((tmp_path / name).read_bytes() + b"\0" * 2_000_000)
+
+        checker = VideoQualityChecker(probe=_StaticProbe(), deep=True, sample_fps=5)
+        results = checker.check_videos(
+            [tmp_path / "clean.mp4", tmp_path / "defective.mp4"], max_workers=2, save_reports=False
+        )
+        reports = {path.rsplit('/', 1)[-1]: (passed, report) for path, passed, report in results}
+
+        passed, report = reports['clean.mp4']
+        assert passed, report['issues']
+        assert report['deep_scan']['frames'] == 30
+
+        passed, report = reports['defective.mp4']
+        checks = report['checks']
+        assert not passed
+        # Black from 1.5s to 3.0s, frozen from 3.0s to the end (within about one 0.2s sample)
+        (black_start, black_end), = checks['black_frames']['details']['segments']
+        (freeze_start, freeze_end), = checks['frozen_frames']['details']['segments']
+        assert black_start == pytest.approx(1.5, abs=0.25) and black_end == pytest.approx(3.0, abs=0.25)
+        assert freeze_start == pytest.approx(3.0, abs=0.25) and freeze_end == pytest.approx(6.0, abs=0.25)
+        assert len(checks['audio_gaps']['details']['segments']) == 1
+        assert any('Audio Gaps' in warning for warning in report['warnings'])
+        assert any('Frozen Frames' in warning for warning in report['warnings'])
+        assert not any('Frozen Frames' in issue for issue in report['issues'])
+
+    def test_static_video_passes_with_freeze_warning(self, tmp_path):
+        from PrismQ.Tools.VideoQualityChecker import VideoQualityChecker
+
+        path = tmp_path / "slide.mp4"
+        _encode_with_audio(path, np.repeat(_pan(1, seed=3), 60, axis=0))
+        path.write_bytes(path.read_bytes() + b"\0" * 2_000_000)
+
+        checker = VideoQualityChecker(probe=_StaticProbe(), deep=True, sample_fps=5)
+        ((_, passed, report),) = checker.check_videos([path], save_reports=False)
+
+        assert report['checks']['frozen_frames']['details']['segments']
+        assert passed, report['issues']
@@ -12,6 +12,7 @@ Tests cover:
 
 import json
 import tempfile
+from collections.abc import Mapping
 import unittest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -133,7 +134,7 @@ class TestVoiceCloner(unittest.TestCase):
         
         self.assertEqual(cloner.model_name, "tts_models/multilingual/multi-dataset/xtts_v2")
         self.assertEqual(cloner.voice_profiles_dir, self.profiles_dir)
-        self.assertIsInstance(cloner.voice_profiles, dict)
+        self.assertIsInstance(cloner.voice_profiles, Mapping)
         mock_load.assert_called_once()
     
     @patch('core.pipeline.voice_cloning.VoiceCloner._extract_embedding')
@@ -171,6 +172,7 @@ class TestVoiceCloner(unittest.TestCase):
         
         # Verify profile stored
         self.assertIn("test_voice", cloner.voice_profiles)
+        mock_save.assert_called_once_with(profile)
     
     @patch('core.pipeline.voice_cloning.VoiceCloner._load_existing_profiles')
     def test_clone_voice_file_not_found(self, mock_load):
@@ -203,14 +205,13 @@ class TestVoiceCloner(unittest.TestCase):
         # Save profile
         cloner._save_profile(profile)
         
-        # Verify file created
-        profile_file = self.profiles_dir / "saved_voice_profile.json"
-        self.assertTrue(profile_file.exists())
+        # Verify store files created
+        self.assertTrue((self.profiles_dir / "voice_index.json").exists())
+        self.assertTrue((self.profiles_dir / "voice_embeddings.f32").exists())
         
         # Verify content
-        with open(profile_file, 'r') as f:
-            data = json.load(f)
-            self.assertEqual(data['name'], 'saved_voice')
+        with open(self.profiles_dir / "voice_index.json", 'r') as f:
+            data = json.load(f)['voices']['saved_voice']
             self.assertEqual(data['gender'], 'Female')
     
     @patch('core.pipeline.voice_cloning.VoiceCloner.tts')
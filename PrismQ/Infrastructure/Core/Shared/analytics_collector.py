@@ -0,0 +1,138 @@
+"""
+Bulk analytics collection across platforms.
+
+Collects the latest metrics for every video recorded in ``PlatformDatabase``
+and writes them back in bulk. Each platform runs in its own worker thread;
+providers with a batched API (``iter_video_analytics``, e.g. the Graph API
+batch requests of Instagram and Facebook) are used in batches, others fall
+back to one ``get_video_analytics`` call per video. Completed batches are
+streamed to the calling thread, which owns the SQLite connection, and saved
+with ``save_analytics_bulk``.
+
+Usage:
+    from PrismQ.Shared.analytics_collector import AnalyticsCollector
+    from PrismQ.Shared.database import PlatformDatabase
+
+    db = PlatformDatabase("data/platform_analytics.db")
+    db.initialize()
+
+    collector = AnalyticsCollector(db, {
+        "instagram": InstagramAnalytics(),
+        "facebook": FacebookAnalytics(),
+    })
+    saved = collector.collect()  # {"instagram": 812, "facebook": 640}
+"""
+
+import logging
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+
+from PrismQ.Shared.database import PlatformDatabase
+from PrismQ.Shared.interfaces.platform_provider import VideoAnalytics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 50
+
+_DONE = object()
+
+
+class AnalyticsCollector:
+    """
+    Collects analytics for all stored videos, platforms in parallel.
+    """
+
+    def __init__(
+        self,
+        db: PlatformDatabase,
+        providers: Dict[str, Any],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Initialize the collector.
+
+        Args:
+            db: Initialized platform database
+            providers: Analytics provider per platform name (e.g. "instagram")
+            batch_size: Videos per bulk insert for providers without a batched API
+            max_workers: Platforms collected at once (default: all)
+        """
+        self.db = db
+        self.providers = providers
+        self.batch_size = batch_size
+        self.max_workers = max_workers or max(1, len(providers))
+
+    def _iter_batches(self, platform: str, video_ids: List[str]) -> Iterator[List[VideoAnalytics]]:
+        """Yield analytics batches from a provider, batched API first."""
+        provider = self.providers[platform]
+        if hasattr(provider, "iter_video_analytics"):
+            # Providers pick their own maximal batch size
+            yield from provider.iter_video_analytics(video_ids)
+            return
+
+        batch: List[VideoAnalytics] = []
+        for video_id in video_ids:
+            analytics = provider.get_video_analytics(video_id)
+            if analytics is not None:
+                batch.append(analytics)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _collect_platform(self, platform: str, video_ids: List[str], results: "queue.Queue") -> None:
+        try:
+            for batch in self._iter_batches(platform, video_ids):
+                if batch:
+                    results.put((platform, batch))
+        except Exception as e:
+            logger.error(f"Analytics collection failed for {platform}: {e}")
+        finally:
+            results.put((platform, _DONE))
+
+    def collect(self, platforms: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        Collect and store analytics for every video of the given platforms.
+
+        Must be called from the thread that uses ``db``; provider calls run in
+        worker threads and only the inserts happen here.
+
+        Args:
+            platforms: Platform names to collect (default: all providers)
+
+        Returns:
+            Number of analytics records saved per platform
+        """
+        platforms = [p for p in (platforms or list(self.providers)) if p in self.providers]
+        video_ids = {platform: self.db.get_platform_video_ids(platform) for platform in platforms}
+        saved = {platform: 0 for platform in platforms}
+        active = [platform for platform in platforms if video_ids[platform]]
+        if not active:
+            return saved
+
+        start = time.perf_counter()
+        results: "queue.Queue" = queue.Queue()
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(active)),
+            thread_name_prefix="analytics",
+        ) as executor:
+            for platform in active:
+                executor.submit(self._collect_platform, platform, video_ids[platform], results)
+
+            remaining = len(active)
+            while remaining:
+                platform, batch = results.get()
+                if batch is _DONE:
+                    remaining -= 1
+                    continue
+                saved[platform] += self.db.save_analytics_bulk(batch)
+
+        logger.info(
+            f"Collected analytics for {sum(saved.values())} videos "
+            f"across {len(active)} platforms in {time.perf_counter() - start:.1f}s: {saved}"
+        )
+        return saved
@@ -5,6 +5,10 @@ This module provides centralized, type-safe configuration management for the
 application. It loads settings from environment variables and .env files with
 automatic validation and type conversion.
 
+Settings are built lazily: nothing is read from the environment or ``.env``
+(and no directories are created) until the first attribute access on
+``settings`` or the first ``get_settings()`` call. The instance is then cached.
+
 Example:
     >>> from PrismQ.Shared.config import settings
     >>> print(settings.openai_api_key)
@@ -13,8 +17,9 @@ Example:
 
 import logging
 import os
+import threading
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal, Optional
 
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -181,13 +186,13 @@ class Settings(BaseSettings):
         return self.environment == "test"
 
 
-# Singleton instance - import this to access settings throughout the application
-settings = Settings()
+_settings: Optional[Settings] = None
+_settings_lock = threading.Lock()
 
 
 def get_settings() -> Settings:
     """
-    Get the global settings instance.
+    Get the global settings instance, building it on first use.
 
     This function is useful for dependency injection and testing,
     allowing you to override settings in tests.
@@ -195,12 +200,42 @@ def get_settings() -> Settings:
     Returns:
         Settings: The global settings instance
     """
-    return settings
+    global _settings
+    if _settings is None:
+        with _settings_lock:
+            if _settings is None:
+                _settings = Settings()
+                # Log the configuration (excluding sensitive data)
+                logger.info(f"Configuration loaded - Environment: {_settings.environment}")
+                logger.debug(f"Log level: {_settings.log_level}")
+                logger.debug(f"Story root: {_settings.story_root}")
+                logger.debug(f"Data root: {_settings.data_root}")
+    return _settings
+
+
+def reset_settings() -> None:
+    """
+    Drop the cached settings so the next access reloads them.
+
+    Useful for testing after changing environment variables.
+    """
+    global _settings
+    with _settings_lock:
+        _settings = None
+
+
+class _LazySettings:
+    """Module-level stand-in that forwards attribute access to get_settings()."""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(get_settings(), name, value)
+
+    def __repr__(self) -> str:
+        return repr(get_settings())
 
 
-# Log the configuration on module import (excluding sensitive data)
-if __name__ != "__main__":
-    logger.info(f"Configuration loaded - Environment: {settings.environment}")
-    logger.debug(f"Log level: {settings.log_level}")
-    logger.debug(f"Story root: {settings.story_root}")
-    logger.debug(f"Data root: {settings.data_root}")
+# Singleton - import this to access settings throughout the application
+settings = _LazySettings()
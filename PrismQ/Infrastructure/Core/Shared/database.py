@@ -17,6 +17,7 @@ Usage:
     
     # Store analytics
     db.save_analytics(analytics_data)
+    db.save_analytics_bulk(analytics_list)
     
     # Query comparisons
     comparison = db.get_cross_platform_comparison(title_id="story_123")
@@ -26,7 +27,7 @@ import sqlite3
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from PrismQ.Shared.interfaces.platform_provider import (
     PlatformType,
@@ -45,6 +46,9 @@ class PlatformDatabase:
     - Cross-platform performance metrics
     """
 
+    # Stay under SQLite's default limit on bound variables per statement
+    SQL_VARIABLE_CHUNK = 500
+
     def __init__(self, db_path: str = "data/platform_analytics.db"):
         """
         Initialize database connection.
@@ -263,6 +267,76 @@ class PlatformDatabase:
         conn.commit()
         return cursor.lastrowid
 
+    def save_analytics_bulk(self, analytics_list: Iterable[VideoAnalytics]) -> int:
+        """
+        Save many analytics records in one transaction.
+        
+        Video row IDs are resolved with one query per platform and chunk of
+        IDs instead of one per record. Records for videos that have no upload
+        row are skipped rather than failing the whole batch.
+        
+        Args:
+            analytics_list: Video analytics from platform providers.
+            
+        Returns:
+            int: Number of records saved.
+        """
+        by_platform: Dict[str, List[VideoAnalytics]] = {}
+        for analytics in analytics_list:
+            by_platform.setdefault(analytics.platform.value, []).append(analytics)
+        if not by_platform:
+            return 0
+
+        conn = self.connect()
+        rows = []
+        with conn:
+            for platform, items in by_platform.items():
+                video_ids = list({a.video_id for a in items})
+                db_ids: Dict[str, int] = {}
+                for start in range(0, len(video_ids), self.SQL_VARIABLE_CHUNK):
+                    chunk = video_ids[start:start + self.SQL_VARIABLE_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    db_ids.update(
+                        (row["video_id"], row["id"])
+                        for row in conn.execute(
+                            f"SELECT id, video_id FROM videos WHERE platform = ? AND video_id IN ({placeholders})",
+                            (platform, *chunk),
+                        )
+                    )
+
+                for analytics in items:
+                    video_db_id = db_ids.get(analytics.video_id)
+                    if video_db_id is None:
+                        continue
+                    rows.append((
+                        video_db_id,
+                        platform,
+                        analytics.video_id,
+                        analytics.collected_at,
+                        analytics.views,
+                        analytics.likes,
+                        analytics.comments,
+                        analytics.shares,
+                        analytics.saves,
+                        analytics.watch_time_seconds,
+                        analytics.average_view_duration,
+                        analytics.completion_rate,
+                        analytics.impressions,
+                        analytics.ctr,
+                        analytics.engagement_rate,
+                    ))
+
+            conn.executemany("""
+                INSERT OR REPLACE INTO analytics (
+                    video_id, platform, platform_video_id, collected_at,
+                    views, likes, comments, shares, saves,
+                    watch_time_seconds, average_view_duration, completion_rate,
+                    impressions, ctr, engagement_rate
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+
+        return len(rows)
+
     def get_video_by_title_id(self, title_id: str, platform: str) -> Optional[Dict[str, Any]]:
         """
         Get video information by title ID and platform.
@@ -314,6 +388,66 @@ class PlatformDatabase:
         row = cursor.fetchone()
         return dict(row) if row else None
 
+    def get_latest_analytics_for_platform(
+        self,
+        platform: str,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the most recent analytics of a platform's latest videos in one query.
+        
+        Args:
+            platform: Platform name.
+            limit: Number of most recently uploaded videos.
+            
+        Returns:
+            List of analytics rows, one per video that has analytics.
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT * FROM (
+                SELECT
+                    a.*,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY a.video_id
+                        ORDER BY a.collected_at DESC
+                    ) AS rn
+                FROM (
+                    SELECT id FROM videos
+                    WHERE platform = ?
+                    ORDER BY upload_time DESC
+                    LIMIT ?
+                ) v
+                JOIN analytics a ON a.video_id = v.id
+            )
+            WHERE rn = 1
+        """, (platform, limit))
+
+        return [dict(row) for row in cursor.fetchall()]
+
+    def get_platform_video_ids(self, platform: str) -> List[str]:
+        """
+        Get every platform video ID recorded for a platform.
+        
+        Args:
+            platform: Platform name.
+            
+        Returns:
+            List of platform-specific video IDs, newest upload first.
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT video_id FROM videos
+            WHERE platform = ?
+            ORDER BY upload_time DESC
+        """, (platform,))
+
+        return [row[0] for row in cursor.fetchall()]
+
     def get_cross_platform_comparison(
         self,
         title_id: str,
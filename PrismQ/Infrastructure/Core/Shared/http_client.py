@@ -0,0 +1,285 @@
+"""
+Shared HTTP client layer with pooled keep-alive sessions.
+
+Platform providers and scripts send requests through one process-wide
+``HttpClientPool`` instead of module-level ``requests.get``/``requests.post``.
+The pool keeps one ``requests.Session`` per host (scheme + host + port), so
+repeated calls to the same API reuse TCP and TLS connections. Pool sizes and
+timeouts can be set globally or per host, and per-host metrics report how many
+requests reused a connection. Every request acquires from the shared
+``RateLimiter`` under its host key and reports 429/503 responses back to it,
+so host limits configured there apply to all providers.
+
+Example:
+    >>> http = get_http_pool()
+    >>> http.configure_host("https://graph.facebook.com", pool_maxsize=20)
+    >>> response = http.get("https://graph.facebook.com/v18.0/me", params={...})
+    >>> http.get_stats()["https://graph.facebook.com"]["reuse_ratio"]
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from PrismQ.Shared.rate_limit import RateLimiter, get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+Timeout = Union[float, Tuple[float, float]]
+
+DEFAULT_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "10"))
+DEFAULT_TIMEOUT: Tuple[float, float] = (
+    float(os.getenv("HTTP_CONNECT_TIMEOUT", "10")),
+    float(os.getenv("HTTP_READ_TIMEOUT", "60")),
+)
+
+
+def host_key(url: str) -> str:
+    """
+    Normalize a URL to the scheme://host[:port] it connects to.
+
+    Args:
+        url: Any absolute URL
+
+    Returns:
+        Host key, e.g. 'https://graph.facebook.com'
+    """
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.netloc:
+        raise ValueError(f"Absolute URL required: {url!r}")
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+class _HostClient:
+    """Session, settings and counters for one host."""
+
+    def __init__(self, key: str, pool_maxsize: int, timeout: Timeout, headers: Dict[str, str]):
+        self.key = key
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        # Connections opened by adapters that were replaced by resize()
+        self._retired_connections = 0
+        self._mount(pool_maxsize)
+
+    def _mount(self, pool_maxsize: int) -> None:
+        self.pool_maxsize = pool_maxsize
+        self.adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, pool_block=False)
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+
+    def resize(self, pool_maxsize: int) -> None:
+        """Replace the connection pool with one of a different size."""
+        old = self.adapter
+        self._retired_connections += self._opened(old)
+        self._mount(pool_maxsize)
+        old.close()
+
+    @staticmethod
+    def _opened(adapter: HTTPAdapter) -> int:
+        pools = adapter.poolmanager.pools
+        with pools.lock:
+            return sum(getattr(pool, "num_connections", 0) for pool in pools._container.values())
+
+    def new_connections(self) -> int:
+        """Connections opened for this host."""
+        return self._retired_connections + self._opened(self.adapter)
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            requests_sent, errors, seconds = self.requests, self.errors, self.total_seconds
+        opened = self.new_connections()
+        reused = max(0, requests_sent - opened)
+        return {
+            "requests": requests_sent,
+            "errors": errors,
+            "new_connections": opened,
+            "reused_connections": reused,
+            "reuse_ratio": reused / requests_sent if requests_sent else 0.0,
+            "avg_seconds": seconds / requests_sent if requests_sent else 0.0,
+            "pool_maxsize": self.pool_maxsize,
+        }
+
+
+class HttpClientPool:
+    """
+    Per-host pooled HTTP sessions with default timeouts and reuse metrics.
+
+    Thread-safe: sessions are shared by all threads, and each host's
+    connection pool holds up to ``pool_maxsize`` idle keep-alive connections.
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        headers: Optional[Dict[str, str]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            pool_maxsize: Keep-alive connections kept per host
+            timeout: Default (connect, read) timeout in seconds, or one value for both
+            headers: Headers sent with every request (e.g. User-Agent)
+            rate_limiter: Limiter requests acquire from (default: shared limiter)
+        """
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self._hosts: Dict[str, _HostClient] = {}
+        self._host_settings: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def configure_host(
+        self,
+        url: str,
+        pool_maxsize: Optional[int] = None,
+        timeout: Optional[Timeout] = None,
+    ) -> None:
+        """
+        Override pool size or timeout for one host.
+
+        Resizing a host that already has a session replaces its connection
+        pool, so configure hosts before their first request where possible.
+
+        Args:
+            url: Any URL on the host
+            pool_maxsize: Keep-alive connections kept for this host
+            timeout: Default timeout for this host
+        """
+        key = host_key(url)
+        with self._lock:
+            settings = self._host_settings.setdefault(key, {})
+            if pool_maxsize is not None:
+                settings["pool_maxsize"] = pool_maxsize
+            if timeout is not None:
+                settings["timeout"] = timeout
+            client = self._hosts.get(key)
+            if client is not None:
+                if timeout is not None:
+                    client.timeout = timeout
+                if pool_maxsize is not None and pool_maxsize != client.pool_maxsize:
+                    client.resize(pool_maxsize)
+
+    def _client(self, url: str) -> _HostClient:
+        key = host_key(url)
+        with self._lock:
+            client = self._hosts.get(key)
+            if client is None:
+                settings = self._host_settings.get(key, {})
+                client = _HostClient(
+                    key,
+                    pool_maxsize=settings.get("pool_maxsize", self.pool_maxsize),
+                    timeout=settings.get("timeout", self.timeout),
+                    headers=self.headers,
+                )
+                self._hosts[key] = client
+            return client
+
+    def session(self, url: str) -> requests.Session:
+        """
+        Get the pooled session for a URL's host.
+
+        Requests sent directly on the session skip the default timeout and
+        metrics; prefer request()/get()/post() where possible.
+        """
+        return self._client(url).session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a request on the host's pooled session.
+
+        Accepts the same keyword arguments as ``requests.request``. A default
+        timeout is applied when none is given. The request waits for the
+        host's rate limit, and throttling responses are reported back to it.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            rate_key: Limiter key to acquire from instead of the host key
+                (e.g. ``rate_key(url, api_key)`` for per-token quotas)
+
+        Raises:
+            requests.RequestException: On connection errors and timeouts
+        """
+        client = self._client(url)
+        limiter_key = kwargs.pop("rate_key", None) or client.key
+        kwargs.setdefault("timeout", client.timeout)
+        with self.rate_limiter.limit(limiter_key):
+            start = time.perf_counter()
+            try:
+                response = client.session.request(method, url, **kwargs)
+            except requests.RequestException:
+                with client.lock:
+                    client.requests += 1
+                    client.errors += 1
+                    client.total_seconds += time.perf_counter() - start
+                raise
+        self.rate_limiter.observe(limiter_key, response)
+        with client.lock:
+            client.requests += 1
+            client.total_seconds += time.perf_counter() - start
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Connection reuse metrics per host.
+
+        Returns:
+            Mapping of host key to requests, errors, new_connections,
+            reused_connections, reuse_ratio, avg_seconds and pool_maxsize
+        """
+        with self._lock:
+            clients = list(self._hosts.values())
+        return {client.key: client.stats() for client in clients}
+
+    def close(self) -> None:
+        """Close every session and drop their connections."""
+        with self._lock:
+            clients, self._hosts = list(self._hosts.values()), {}
+        for client in clients:
+            client.session.close()
+
+
+_shared_pool: Optional[HttpClientPool] = None
+_shared_lock = threading.Lock()
+
+
+def get_http_pool() -> HttpClientPool:
+    """
+    Get the process-wide HTTP client pool.
+
+    Returns:
+        Shared HttpClientPool instance
+    """
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = HttpClientPool()
+        return _shared_pool
@@ -6,9 +6,14 @@ This module provides enhanced logging with:
 - Console and file output with configurable formats
 - JSON formatting for production
 - Request ID tracking for distributed tracing
-- Context managers for contextual logging
+- Context managers for contextual logging, isolated per thread and asyncio task
+- Queued file output: a QueueHandler on the hot path, with formatting and
+  disk I/O done by a background QueueListener thread
 - Integration with PrismQ.Shared.config for configuration
 
+Importing the module configures nothing and does not load settings; logging
+is set up by setup_logging() or on the first get_logger() call.
+
 Example:
     >>> from PrismQ.Shared.logging import setup_logging, get_logger
     >>> setup_logging()
@@ -17,12 +22,18 @@ Example:
     >>> logger.warning("Low memory", extra={"memory_mb": 100})
 """
 
+import atexit
+import contextvars
+import copy
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
 import uuid
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 try:
     from pythonjsonlogger import jsonlogger
@@ -32,11 +43,93 @@ except ImportError:
     JSON_LOGGER_AVAILABLE = False
     jsonlogger = None
 
-from PrismQ.Shared.config import settings
-
 # Global logger instance tracking
 _logging_configured = False
 
+# Background thread writing queued records to the file handlers
+_listener: Optional[logging.handlers.QueueListener] = None
+
+# Fields added to every record logged in the current thread / asyncio task
+_log_context: contextvars.ContextVar[Mapping[str, Any]] = contextvars.ContextVar(
+    "log_context", default={}
+)
+
+
+def _install_record_factory() -> None:
+    """
+    Install the record factory that copies the current log context onto records.
+
+    Installed once at import; log_context() only swaps the context variable,
+    so concurrent threads and tasks never see each other's fields.
+    """
+    base_factory = logging.getLogRecordFactory()
+
+    def record_factory(*args, **kwargs):
+        record = base_factory(*args, **kwargs)
+        context = _log_context.get()
+        if context:
+            record.__dict__.update(context)
+        return record
+
+    logging.setLogRecordFactory(record_factory)
+
+
+_install_record_factory()
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that keeps extra fields and exception text for the listener.
+
+    The stock handler formats the record into a plain message on the calling
+    thread; this one only merges the message arguments and renders the
+    traceback, leaving the final (e.g. JSON) formatting to the file handlers.
+    Records go on a ``queue.SimpleQueue``, whose put() takes no Python-level
+    lock.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Make a picklable, thread-independent copy of a record.
+
+        Args:
+            record: Record being logged
+
+        Returns:
+            logging.LogRecord: Copy with message merged and exc_info rendered
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_exception_formatter = logging.Formatter()
+
+
+class _FlushMarker:
+    """Queue item that signals when everything queued before it is written."""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class ContextQueueListener(logging.handlers.QueueListener):
+    """QueueListener that also answers flush_logging() markers."""
+
+    def handle(self, record) -> None:
+        if isinstance(record, _FlushMarker):
+            for handler in self.handlers:
+                handler.flush()
+            record.done.set()
+            return
+        super().handle(record)
+
 
 class CustomJsonFormatter(jsonlogger.JsonFormatter if JSON_LOGGER_AVAILABLE else object):
     """Custom JSON formatter with additional context fields."""
@@ -108,6 +201,7 @@ def setup_logging(
     json_format: Optional[bool] = None,
     request_id: Optional[str] = None,
     force_reconfigure: bool = False,
+    queue_output: bool = True,
 ) -> logging.Logger:
     """
     Set up structured logging with console and file handlers.
@@ -125,6 +219,9 @@ def setup_logging(
                     True if settings.log_format == "json"
         request_id: Optional request ID for tracking
         force_reconfigure: Force reconfiguration even if already configured
+        queue_output: Write files from a background thread through a
+                      QueueHandler/QueueListener pipeline (default: True).
+                      Call flush_logging() to wait for queued records.
 
     Returns:
         logging.Logger: Configured root logger
@@ -141,7 +238,12 @@ def setup_logging(
     if _logging_configured and not force_reconfigure:
         return logging.getLogger()
 
-    # Use settings defaults if not provided
+    # Use settings defaults if not provided; settings (and pydantic) are only
+    # loaded when a default is actually needed
+    if None in (level, log_dir, file_output, json_format):
+        from PrismQ.Shared.config import get_settings
+
+        settings = get_settings()
     if level is None:
         level = settings.log_level
     if log_dir is None:
@@ -156,6 +258,7 @@ def setup_logging(
     root_logger.setLevel(level.upper())
 
     # Remove existing handlers to avoid duplicates
+    _stop_listener()
     root_logger.handlers = []
 
     # Create request ID filter if provided
@@ -206,7 +309,10 @@ def setup_logging(
             file_formatter = logging.Formatter(file_format, datefmt="%Y-%m-%d %H:%M:%S")
 
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        if queue_output:
+            _start_listener(root_logger, [file_handler], request_id_filter)
+        else:
+            root_logger.addHandler(file_handler)
 
     _logging_configured = True
     root_logger.info(
@@ -216,6 +322,73 @@ def setup_logging(
     return root_logger
 
 
+def _start_listener(
+    root_logger: logging.Logger,
+    handlers: List[logging.Handler],
+    request_id_filter: Optional[logging.Filter],
+) -> None:
+    """Route records to handlers through a queue drained by a listener thread."""
+    global _listener
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = ContextQueueHandler(log_queue)
+    if request_id_filter:
+        # Runs on the calling thread, before the record is queued
+        queue_handler.addFilter(request_id_filter)
+    root_logger.addHandler(queue_handler)
+
+    _listener = ContextQueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def _stop_listener() -> None:
+    """Write out queued records, stop the listener and close its handlers."""
+    global _listener
+
+    listener, _listener = _listener, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(_stop_listener)
+
+
+def get_log_listener() -> Optional[logging.handlers.QueueListener]:
+    """
+    Get the listener writing queued log records, if queued output is active.
+
+    Returns:
+        Optional[logging.handlers.QueueListener]: Listener, whose ``handlers``
+        are the file handlers
+    """
+    return _listener
+
+
+def flush_logging(timeout: Optional[float] = None) -> bool:
+    """
+    Wait until every log record queued so far has been written.
+
+    Args:
+        timeout: Maximum seconds to wait (default: no limit)
+
+    Returns:
+        bool: True if the queue was drained (or output is not queued)
+
+    Example:
+        >>> logger.info("Batch finished")
+        >>> flush_logging()  # app.log now contains the line
+    """
+    listener = _listener
+    if listener is None or listener._thread is None:
+        return True
+    marker = _FlushMarker()
+    listener.queue.put_nowait(marker)
+    return marker.done.wait(timeout)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance with the specified name.
@@ -243,11 +416,25 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+def get_log_context() -> Dict[str, Any]:
+    """
+    Get the fields log_context() currently adds to records.
+
+    Returns:
+        Dict[str, Any]: Copy of the active context
+    """
+    return dict(_log_context.get())
+
+
 @contextmanager
 def log_context(**context):
     """
     Context manager for adding contextual information to all logs.
 
+    The context is stored in a ``contextvars.ContextVar``, so it only applies
+    to the current thread or asyncio task (tasks inherit the context they are
+    created in), and nested contexts merge with the enclosing one.
+
     Args:
         **context: Context key-value pairs to add to all logs
 
@@ -260,19 +447,11 @@ def log_context(**context):
         ...     logger.info("Processing request")
         ...     logger.info("Request completed")
     """
-    old_factory = logging.getLogRecordFactory()
-
-    def record_factory(*args, **kwargs):
-        record = old_factory(*args, **kwargs)
-        for key, value in context.items():
-            setattr(record, key, value)
-        return record
-
-    logging.setLogRecordFactory(record_factory)
+    token = _log_context.set({**_log_context.get(), **context})
     try:
         yield
     finally:
-        logging.setLogRecordFactory(old_factory)
+        _log_context.reset(token)
 
 
 class LoggerContext:
@@ -298,25 +477,18 @@ class LoggerContext:
         """
         self.logger = logger
         self.context = context
-        self.old_factory = None
+        self._token: Optional[contextvars.Token] = None
 
     def __enter__(self):
-        """Enter context and set up context injection."""
-        self.old_factory = logging.getLogRecordFactory()
-
-        def record_factory(*args, **kwargs):
-            record = self.old_factory(*args, **kwargs)
-            for key, value in self.context.items():
-                setattr(record, key, value)
-            return record
-
-        logging.setLogRecordFactory(record_factory)
+        """Enter context and add the fields to the current log context."""
+        self._token = _log_context.set({**_log_context.get(), **self.context})
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Exit context and restore original factory."""
-        if self.old_factory:
-            logging.setLogRecordFactory(self.old_factory)
+        """Exit context and restore the previous log context."""
+        if self._token is not None:
+            _log_context.reset(self._token)
+            self._token = None
 
 
 def reset_logging():
@@ -327,13 +499,9 @@ def reset_logging():
     """
     global _logging_configured
     _logging_configured = False
+    _stop_listener()
 
     # Clear all handlers
     root_logger = logging.getLogger()
     root_logger.handlers = []
     root_logger.filters = []
-
-
-# Auto-configure logging on module import if not in test mode
-if not settings.is_test():
-    setup_logging()
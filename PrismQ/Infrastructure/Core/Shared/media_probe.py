@@ -0,0 +1,361 @@
+"""
+Shared media probing service.
+
+Wraps ``ffprobe`` behind one normalized metadata object (``MediaInfo``) used by
+the QC tools, the variant selector and TTS generation. Probes for many files run
+concurrently in a thread pool, and results are cached on (path, size, mtime) so
+unchanged files are never probed twice - in memory, and optionally in a JSON
+cache file that survives between runs. The cache keeps one entry per path and
+at most ``max_entries`` paths, dropping the least recently used.
+
+Example:
+    >>> probe = get_media_probe()
+    >>> infos = probe.probe_many(["a.mp4", "b.mp4"])
+    >>> infos["a.mp4"].width, infos["a.mp4"].duration
+"""
+
+import json
+import logging
+import os
+import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+
+@lru_cache(maxsize=None)
+def find_ffprobe() -> str:
+    """
+    Find the ffprobe executable.
+
+    Returns:
+        Command that runs ffprobe (falls back to 'ffprobe' so failures surface later)
+    """
+    for cmd in ['ffprobe', '/usr/bin/ffprobe', '/usr/local/bin/ffprobe']:
+        try:
+            result = subprocess.run([cmd, '-version'], capture_output=True, timeout=5)
+            if result.returncode == 0:
+                return cmd
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            continue
+    return 'ffprobe'
+
+
+def _parse_rate(rate: Optional[str], default: float = 0.0) -> float:
+    """Parse an ffprobe rational such as '30000/1001'."""
+    try:
+        numerator, _, denominator = str(rate).partition('/')
+        value = float(numerator) / float(denominator or 1)
+        return value if value > 0 else default
+    except (ValueError, ZeroDivisionError):
+        return default
+
+
+def _to_int(value: Any) -> int:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+@dataclass
+class MediaInfo:
+    """Normalized ffprobe result for one media file."""
+
+    path: str
+    size_bytes: int
+    mtime: float
+    format_name: str = ""
+    duration: float = 0.0
+    bit_rate: int = 0
+    width: int = 0
+    height: int = 0
+    fps: float = 0.0
+    video_codec: str = ""
+    video_bit_rate: int = 0
+    nb_frames: int = 0
+    audio_codec: str = ""
+    audio_bit_rate: int = 0
+    sample_rate: int = 0
+    channels: int = 0
+    format: Dict[str, Any] = field(default_factory=dict)
+    video_stream: Optional[Dict[str, Any]] = None
+    audio_stream: Optional[Dict[str, Any]] = None
+
+    @property
+    def has_video(self) -> bool:
+        return self.video_stream is not None
+
+    @property
+    def has_audio(self) -> bool:
+        return self.audio_stream is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MediaInfo":
+        """Create MediaInfo from dictionary."""
+        return cls(**data)
+
+    @classmethod
+    def from_ffprobe(cls, path: str, size_bytes: int, mtime: float, data: Dict[str, Any]) -> "MediaInfo":
+        """
+        Build a MediaInfo from ``ffprobe -show_format -show_streams`` JSON.
+
+        Args:
+            path: Probed file path
+            size_bytes: File size at probe time
+            mtime: File modification time at probe time
+            data: Parsed ffprobe output
+        """
+        streams = data.get('streams', [])
+        video = next((s for s in streams if s.get('codec_type') == 'video'), None)
+        audio = next((s for s in streams if s.get('codec_type') == 'audio'), None)
+        fmt = data.get('format', {})
+
+        return cls(
+            path=path,
+            size_bytes=size_bytes,
+            mtime=mtime,
+            format_name=fmt.get('format_name', ''),
+            duration=_to_float(fmt.get('duration')),
+            bit_rate=_to_int(fmt.get('bit_rate')),
+            width=_to_int((video or {}).get('width')),
+            height=_to_int((video or {}).get('height')),
+            fps=_parse_rate((video or {}).get('r_frame_rate')),
+            video_codec=(video or {}).get('codec_name', ''),
+            video_bit_rate=_to_int((video or {}).get('bit_rate')),
+            nb_frames=_to_int((video or {}).get('nb_frames')),
+            audio_codec=(audio or {}).get('codec_name', ''),
+            audio_bit_rate=_to_int((audio or {}).get('bit_rate')),
+            sample_rate=_to_int((audio or {}).get('sample_rate')),
+            channels=_to_int((audio or {}).get('channels')),
+            format=fmt,
+            video_stream=video,
+            audio_stream=audio,
+        )
+
+
+class MediaProbe:
+    """
+    Concurrent, cached ffprobe front end.
+
+    Cache entries are keyed on the resolved path plus file size and mtime, so
+    an edited or replaced file is probed again (replacing its old entry) while
+    unchanged files are served from the cache. Failed probes are not cached.
+    """
+
+    def __init__(
+        self,
+        ffprobe_cmd: Optional[str] = None,
+        max_workers: int = 8,
+        timeout: float = 30,
+        cache_path: Optional[PathLike] = None,
+        max_entries: int = 10000,
+    ):
+        """
+        Initialize media probe.
+
+        Args:
+            ffprobe_cmd: ffprobe executable (default: auto-detected)
+            max_workers: Concurrent ffprobe processes for probe_many
+            timeout: Seconds before a single ffprobe call is abandoned
+            cache_path: Optional JSON file persisting the cache between runs
+            max_entries: Most files kept in the cache (least recently used dropped)
+        """
+        self._ffprobe_cmd = ffprobe_cmd
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.max_entries = max_entries
+        # Oldest first; a hit moves the entry to the end
+        self._cache: "OrderedDict[str, MediaInfo]" = OrderedDict()
+        self._path_keys: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._stats = {"hits": 0, "misses": 0, "errors": 0}
+
+        if self.cache_path and self.cache_path.exists():
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    entries = json.load(f)
+                for key, value in entries.items():
+                    self._store(key, MediaInfo.from_dict(value))
+                logger.debug(f"Loaded {len(self._cache)} media probe cache entries")
+            except (OSError, ValueError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable media probe cache {self.cache_path}: {e}")
+
+    @property
+    def ffprobe_cmd(self) -> str:
+        if self._ffprobe_cmd is None:
+            self._ffprobe_cmd = find_ffprobe()
+        return self._ffprobe_cmd
+
+    @staticmethod
+    def _file_key(path: Path) -> Optional[Tuple[str, int, float]]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return str(path.resolve()), stat.st_size, stat.st_mtime
+
+    def _store(self, cache_key: str, info: MediaInfo) -> None:
+        """Cache a result, replacing the path's stale entry and enforcing the cap."""
+        path = json.loads(cache_key)[0]
+        old_key = self._path_keys.get(path)
+        if old_key is not None and old_key != cache_key:
+            self._cache.pop(old_key, None)
+        self._path_keys[path] = cache_key
+        self._cache[cache_key] = info
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > self.max_entries:
+            evicted, _ = self._cache.popitem(last=False)
+            self._path_keys.pop(json.loads(evicted)[0], None)
+
+    def _run_ffprobe(self, path: Path, key: Tuple[str, int, float]) -> Optional[MediaInfo]:
+        cmd = [
+            self.ffprobe_cmd,
+            '-v', 'quiet',
+            '-print_format', 'json',
+            '-show_format',
+            '-show_streams',
+            str(path),
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=self.timeout)
+            if result.returncode != 0:
+                return None
+            return MediaInfo.from_ffprobe(str(path), key[1], key[2], json.loads(result.stdout))
+        except (subprocess.TimeoutExpired, FileNotFoundError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"ffprobe failed for {path}: {e}")
+            return None
+
+    def probe(self, path: PathLike) -> Optional[MediaInfo]:
+        """
+        Probe one file.
+
+        Args:
+            path: Media file path
+
+        Returns:
+            MediaInfo, or None if the file is missing or cannot be probed
+        """
+        path = Path(path)
+        key = self._file_key(path)
+        if key is None:
+            return None
+
+        cache_key = json.dumps(key)
+        with self._lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._stats["hits"] += 1
+                self._cache.move_to_end(cache_key)
+                return cached
+            self._stats["misses"] += 1
+
+        info = self._run_ffprobe(path, key)
+
+        with self._lock:
+            if info is None:
+                self._stats["errors"] += 1
+            else:
+                self._store(cache_key, info)
+                self._dirty = True
+        return info
+
+    def probe_many(
+        self,
+        paths: Iterable[PathLike],
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Optional[MediaInfo]]:
+        """
+        Probe many files concurrently.
+
+        Args:
+            paths: Media file paths
+            max_workers: Override the pool size for this call
+
+        Returns:
+            Dictionary mapping each given path (as str) to its MediaInfo or None
+        """
+        paths = list(dict.fromkeys(str(p) for p in paths))
+        workers = max(1, min(max_workers or self.max_workers, len(paths) or 1))
+
+        if workers == 1:
+            results = {p: self.probe(p) for p in paths}
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = dict(zip(paths, pool.map(self.probe, paths)))
+
+        self.save_cache()
+        return results
+
+    def save_cache(self) -> None:
+        """Write the cache file if anything changed."""
+        if not self.cache_path or not self._dirty:
+            return
+        with self._lock:
+            entries = {key: info.to_dict() for key, info in self._cache.items()}
+            self._dirty = False
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, self.cache_path)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, errors and cached entry count
+        """
+        with self._lock:
+            return dict(self._stats, entries=len(self._cache))
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._cache.clear()
+            self._path_keys.clear()
+            self._dirty = True
+
+
+_shared_probe: Optional[MediaProbe] = None
+_shared_lock = threading.Lock()
+
+
+def get_media_probe(cache_path: Optional[PathLike] = None) -> MediaProbe:
+    """
+    Get the process-wide media probe.
+
+    Args:
+        cache_path: Persistent cache file; only used when the shared probe is
+            first created
+
+    Returns:
+        Shared MediaProbe instance
+    """
+    global _shared_probe
+    with _shared_lock:
+        if _shared_probe is None:
+            _shared_probe = MediaProbe(cache_path=cache_path)
+        return _shared_probe
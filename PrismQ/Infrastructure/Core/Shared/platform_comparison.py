@@ -311,16 +311,15 @@ class PlatformComparator:
         total_engagement = 0
         video_count = 0
         
-        for video in videos:
-            analytics = self.db.get_latest_analytics(video["video_id"], platform)
-            if analytics:
-                total_views += analytics.get("views", 0)
-                total_engagement += (
-                    analytics.get("likes", 0) +
-                    analytics.get("comments", 0) +
-                    analytics.get("shares", 0)
-                )
-                video_count += 1
+        # One query for the latest analytics of every video
+        for analytics in self.db.get_latest_analytics_for_platform(platform, limit):
+            total_views += analytics.get("views", 0)
+            total_engagement += (
+                analytics.get("likes", 0) +
+                analytics.get("comments", 0) +
+                analytics.get("shares", 0)
+            )
+            video_count += 1
         
         avg_views = total_views / video_count if video_count > 0 else 0
         avg_engagement = total_engagement / video_count if video_count > 0 else 0
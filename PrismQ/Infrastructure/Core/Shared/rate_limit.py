@@ -0,0 +1,702 @@
+"""
+Rate limiting for external APIs.
+
+``TokenBucket`` is a thread-safe token bucket for a single quota: it refills
+at a steady rate up to a burst capacity, and callers take tokens before each
+request, blocking while the bucket is empty. The clock and sleep functions can
+be injected so quota behaviour is testable without waiting.
+
+``RateLimiter`` is the shared service every provider acquires from. Limits are
+configured per key - an API host such as ``https://graph.facebook.com``,
+optionally narrowed to one API key (see ``rate_key``) - and combine a token
+bucket with a cap on concurrent requests. Responses are fed back with
+``observe``/``feedback``: a 429/503 or ``Retry-After`` pauses the key and halves its rate,
+which then recovers step by step on successful responses. Acquire is
+available for threads (``acquire``/``limit``) and asyncio (``acquire_async``/
+``limit_async``), and per-key wait-time metrics are kept.
+
+Limiter state lives in a store: in memory by default, or in SQLite or Redis so
+several worker processes (e.g. parallel ``run_step.py`` runs) share one quota.
+``get_rate_limiter()`` picks the store from ``RATE_LIMIT_BACKEND``
+(``memory``, ``sqlite:///path/to/limits.db`` or ``redis://host:6379/0``).
+
+Example:
+    >>> bucket = TokenBucket(rate=1.0, capacity=5)  # 1 query/s, bursts of 5
+    >>> bucket.acquire()  # Returns seconds spent waiting
+    0.0
+
+    >>> limiter = get_rate_limiter()
+    >>> limiter.configure("https://open.tiktokapis.com", rate=5, burst=10, max_concurrency=4)
+    >>> with limiter.limit(rate_key("https://open.tiktokapis.com/v2/video/list/")):
+    ...     response = session.post(...)
+    >>> limiter.get_metrics()
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional, Union
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held, i.e. the burst size (default: max(1, rate))
+            clock: Monotonic time source
+            sleep: Function used to wait for tokens
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+        self.total_wait = 0.0
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        Take tokens if available, without waiting.
+
+        Returns:
+            True if the tokens were taken
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> float:
+        """
+        Take tokens, waiting until they are available.
+
+        Args:
+            tokens: Tokens to take (at most the bucket capacity)
+            timeout: Maximum seconds to wait (default: no limit)
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            ValueError: If more tokens are requested than the bucket holds
+            TimeoutError: If the tokens would not be available within timeout
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket of {self.capacity}")
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    self.total_wait += waited
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            if timeout is not None and waited + delay > timeout:
+                raise TimeoutError(f"Rate limit: {tokens} tokens not available within {timeout}s")
+            self._sleep(delay)
+            waited += delay
+
+
+# --- Shared rate limiter -------------------------------------------------
+
+# Status codes that mean "slow down"
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Limits for one key."""
+    rate: Optional[float] = None  # Requests per second; None for no token bucket
+    burst: Optional[float] = None  # Bucket capacity (default: max(1, rate))
+    max_concurrency: Optional[int] = None  # Requests in flight; None for no cap
+    min_rate_factor: float = 0.1  # Lowest fraction of rate after repeated throttling
+    recovery_step: float = 0.1  # Rate fraction regained per successful response
+    throttle_backoff: float = 1.0  # Pause after a 429 without Retry-After (seconds)
+    lease_seconds: float = 300.0  # Concurrency slots of crashed holders expire
+
+    @property
+    def capacity(self) -> float:
+        return self.burst if self.burst is not None else max(1.0, self.rate or 1.0)
+
+
+# State for keys without a configured limit: no bucket or cap, but a
+# throttling response still pauses the key
+_UNLIMITED = RateLimit()
+
+
+def rate_key(url_or_host: str, api_key: Optional[str] = None) -> str:
+    """
+    Build a limiter key for an API host, optionally per API key.
+
+    The API key is hashed so secrets never appear in metrics or shared stores.
+
+    Args:
+        url_or_host: Request URL, 'scheme://host' or a plain service name
+        api_key: API key or token the quota belongs to
+
+    Returns:
+        Key such as 'https://graph.facebook.com' or 'https://api.openai.com|3f2a9c1b0d4e'
+    """
+    parts = urlsplit(url_or_host)
+    key = f"{parts.scheme.lower()}://{parts.netloc.lower()}" if parts.scheme and parts.netloc else url_or_host
+    if api_key:
+        key += "|" + hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+    return key
+
+
+def _new_state(limit: RateLimit, now: float) -> Dict[str, Any]:
+    return {"tokens": limit.capacity, "updated": now, "blocked_until": 0.0, "factor": 1.0, "holders": {}}
+
+
+def _take(state: Dict[str, Any], limit: RateLimit, tokens: float, now: float) -> float:
+    """Take tokens if possible; returns 0 or the seconds to wait before retrying."""
+    if now < state["blocked_until"]:
+        return state["blocked_until"] - now
+    if not limit.rate:
+        return 0.0
+    rate = limit.rate * state["factor"]
+    capacity = limit.capacity
+    state["tokens"] = min(capacity, state["tokens"] + max(0.0, now - state["updated"]) * rate)
+    state["updated"] = now
+    if state["tokens"] >= tokens:
+        state["tokens"] -= tokens
+        return 0.0
+    return (tokens - state["tokens"]) / rate
+
+
+def _enter(state: Dict[str, Any], limit: RateLimit, slot_id: str, now: float) -> bool:
+    """Claim a concurrency slot, dropping expired ones."""
+    holders = {k: v for k, v in state["holders"].items() if v > now}
+    state["holders"] = holders
+    if limit.max_concurrency is None or len(holders) < limit.max_concurrency:
+        holders[slot_id] = now + limit.lease_seconds
+        return True
+    return False
+
+
+def _leave(state: Dict[str, Any], slot_id: str) -> None:
+    state["holders"].pop(slot_id, None)
+
+
+def _throttle(state: Dict[str, Any], limit: RateLimit, now: float, retry_after: Optional[float]) -> None:
+    """Pause the key and halve its rate after a throttling response."""
+    pause = retry_after if retry_after is not None else limit.throttle_backoff
+    state["blocked_until"] = max(state["blocked_until"], now + pause)
+    state["factor"] = max(limit.min_rate_factor, state["factor"] * 0.5)
+    state["tokens"] = 0.0
+    state["updated"] = max(state["updated"], now + pause)
+
+
+def _recover(state: Dict[str, Any], limit: RateLimit) -> None:
+    state["factor"] = min(1.0, state["factor"] + limit.recovery_step)
+
+
+class MemoryStateStore:
+    """Limiter state for one process."""
+
+    def __init__(self):
+        self._states: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def update(self, key: str, limit: RateLimit, fn: Callable[[Dict[str, Any], float], Any]) -> Any:
+        """Apply fn(state, now) to a key's state atomically and return its result."""
+        with self._lock:
+            now = time.time()
+            state = self._states.get(key)
+            if state is None:
+                state = self._states[key] = _new_state(limit, now)
+            return fn(state, now)
+
+
+class SQLiteStateStore:
+    """
+    Limiter state shared by processes on one machine through a SQLite file.
+
+    Each update runs in a ``BEGIN IMMEDIATE`` transaction, so concurrent
+    processes serialize on the write lock.
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._connect().execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_state (key TEXT PRIMARY KEY, state TEXT NOT NULL)"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "connection", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = conn
+        return conn
+
+    def update(self, key: str, limit: RateLimit, fn: Callable[[Dict[str, Any], float], Any]) -> Any:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            row = conn.execute("SELECT state FROM rate_limit_state WHERE key = ?", (key,)).fetchone()
+            state = json.loads(row[0]) if row else _new_state(limit, now)
+            result = fn(state, now)
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limit_state (key, state) VALUES (?, ?)",
+                (key, json.dumps(state)),
+            )
+            conn.execute("COMMIT")
+            return result
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+
+class RedisStateStore:
+    """
+    Limiter state shared by processes on many machines through Redis.
+
+    Updates use optimistic WATCH/MULTI transactions and are retried when
+    another process changed the key in between.
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefix: str = "prismq:ratelimit:", ttl: int = 86400):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def update(self, key: str, limit: RateLimit, fn: Callable[[Dict[str, Any], float], Any]) -> Any:
+        redis_key = self.prefix + key
+        result = []
+
+        def transaction(pipe):
+            raw = pipe.get(redis_key)
+            now = time.time()
+            state = json.loads(raw) if raw else _new_state(limit, now)
+            value = fn(state, now)
+            pipe.multi()
+            pipe.set(redis_key, json.dumps(state), ex=self.ttl)
+            result[:] = [value]
+
+        self.client.transaction(transaction, redis_key)
+        return result[0]
+
+
+def create_state_store(backend: Optional[str] = None):
+    """
+    Create a limiter state store from a backend spec.
+
+    Args:
+        backend: 'memory', 'sqlite:///path/to/limits.db' or 'redis://host:6379/0'
+            (default: RATE_LIMIT_BACKEND environment variable, else memory)
+
+    Returns:
+        State store instance
+
+    Raises:
+        ValueError: If the backend spec is not recognized
+    """
+    backend = backend or os.getenv("RATE_LIMIT_BACKEND", "memory")
+    if backend == "memory":
+        return MemoryStateStore()
+    if backend.startswith("sqlite:///"):
+        return SQLiteStateStore(backend[len("sqlite:///"):])
+    if backend.startswith(("redis://", "rediss://", "unix://")):
+        return RedisStateStore(backend)
+    raise ValueError(f"Unknown rate limit backend: {backend!r}")
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Delay in seconds or an HTTP-date
+
+    Returns:
+        Seconds to wait, or None if the value is missing or malformed
+    """
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class _KeyMetrics:
+    __slots__ = ("acquired", "total_wait", "max_wait", "throttled", "in_flight")
+
+    def __init__(self):
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.throttled = 0
+        self.in_flight = 0
+
+
+class RateLimiter:
+    """
+    Token bucket and concurrency limits per API key and host.
+
+    Thread-safe and usable from asyncio. Keys without a configured limit (and
+    no default) pass straight through, except while paused by a throttling
+    response, and still count in the metrics.
+    """
+
+    def __init__(
+        self,
+        store: Optional[Any] = None,
+        default_limit: Optional[RateLimit] = None,
+        poll_interval: float = 0.05,
+        max_wait_step: float = 1.0,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            store: State store (default: in-memory)
+            default_limit: Limit for keys with no configured limit
+            poll_interval: Seconds between checks while waiting for a concurrency slot
+            max_wait_step: Longest single sleep before re-checking shared state
+        """
+        self.store = store or MemoryStateStore()
+        self.default_limit = default_limit
+        self.poll_interval = poll_interval
+        self.max_wait_step = max_wait_step
+        self._limits: Dict[str, RateLimit] = {}
+        self._metrics: Dict[str, _KeyMetrics] = {}
+        self._lock = threading.Lock()
+
+    def configure(
+        self, key: str, limit: Optional[RateLimit] = None, replace: bool = True, **settings: Any
+    ) -> RateLimit:
+        """
+        Set the limit for a key.
+
+        A limit set for a host also applies to the per-API-key keys on that
+        host that have no limit of their own.
+
+        Args:
+            key: Host URL, rate_key() result or service name
+            limit: RateLimit to use, or pass its fields as keyword arguments
+            replace: Overwrite an existing limit; if False, keep it
+
+        Returns:
+            The limit in effect for the key
+        """
+        limit = limit or RateLimit(**settings)
+        key = rate_key(key)
+        with self._lock:
+            if replace or key not in self._limits:
+                self._limits[key] = limit
+            return self._limits[key]
+
+    def get_limit(self, key: str) -> Optional[RateLimit]:
+        """Get the limit that applies to a key, if any."""
+        key = rate_key(key)
+        with self._lock:
+            limit = self._limits.get(key)
+            if limit is None and "|" in key:
+                limit = self._limits.get(key.split("|", 1)[0])
+            return limit or self.default_limit
+
+    def _key_metrics(self, key: str) -> _KeyMetrics:
+        with self._lock:
+            metrics = self._metrics.get(key)
+            if metrics is None:
+                metrics = self._metrics[key] = _KeyMetrics()
+            return metrics
+
+    def _record_wait(self, key: str, waited: float) -> None:
+        metrics = self._key_metrics(key)
+        with self._lock:
+            metrics.acquired += 1
+            metrics.total_wait += waited
+            metrics.max_wait = max(metrics.max_wait, waited)
+
+    def _next_delay(
+        self, key: str, limit: Optional[RateLimit], tokens: float, slot_id: Optional[str]
+    ) -> float:
+        """Try to claim the slot (if any) and tokens; returns 0 or seconds to wait."""
+        limit = limit or _UNLIMITED
+
+        def claim(state: Dict[str, Any], now: float) -> float:
+            if slot_id is not None and slot_id not in state["holders"]:
+                if not _enter(state, limit, slot_id, now):
+                    return self.poll_interval
+            return _take(state, limit, tokens, now)
+
+        return min(self.store.update(key, limit, claim), self.max_wait_step)
+
+    def _release(self, key: str, limit: Optional[RateLimit], slot_id: str) -> None:
+        if limit is not None and limit.max_concurrency is not None:
+            self.store.update(key, limit, lambda state, now: _leave(state, slot_id))
+
+    def _wait_error(self, key: str, timeout: float) -> TimeoutError:
+        return TimeoutError(f"Rate limit for {key}: no capacity within {timeout}s")
+
+    def _wait(self, key: str, limit: Optional[RateLimit], tokens: float, timeout: Optional[float],
+              slot_id: Optional[str] = None) -> float:
+        waited = 0.0
+        while True:
+            delay = self._next_delay(key, limit, tokens, slot_id)
+            if delay <= 0:
+                self._record_wait(key, waited)
+                return waited
+            if timeout is not None and waited + delay > timeout:
+                if slot_id:
+                    self._release(key, limit, slot_id)
+                raise self._wait_error(key, timeout)
+            time.sleep(delay)
+            waited += delay
+
+    async def _wait_async(self, key: str, limit: Optional[RateLimit], tokens: float,
+                          timeout: Optional[float], slot_id: Optional[str] = None) -> float:
+        # Imported here: asyncio is slow to import and only async callers need it
+        import asyncio
+
+        waited = 0.0
+        while True:
+            delay = self._next_delay(key, limit, tokens, slot_id)
+            if delay <= 0:
+                self._record_wait(key, waited)
+                return waited
+            if timeout is not None and waited + delay > timeout:
+                if slot_id:
+                    self._release(key, limit, slot_id)
+                raise self._wait_error(key, timeout)
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def acquire(self, key: str, tokens: float = 1.0, timeout: Optional[float] = None) -> float:
+        """
+        Take tokens for a key, blocking the thread until they are available.
+
+        Only the token bucket applies; use limit() to also hold a concurrency slot.
+
+        Args:
+            key: Host URL, rate_key() result or service name
+            tokens: Tokens to take (requests this call counts as)
+            timeout: Maximum seconds to wait (default: no limit)
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            TimeoutError: If the tokens are not available within timeout
+        """
+        key = rate_key(key)
+        return self._wait(key, self.get_limit(key), tokens, timeout)
+
+    async def acquire_async(self, key: str, tokens: float = 1.0, timeout: Optional[float] = None) -> float:
+        """Async version of acquire(): waits with asyncio.sleep."""
+        key = rate_key(key)
+        return await self._wait_async(key, self.get_limit(key), tokens, timeout)
+
+    def _slot_id(self, limit: Optional[RateLimit]) -> Optional[str]:
+        if limit is None or limit.max_concurrency is None:
+            return None
+        return uuid.uuid4().hex
+
+    @contextlib.contextmanager
+    def limit(self, key: str, tokens: float = 1.0, timeout: Optional[float] = None) -> Iterator[float]:
+        """
+        Hold a concurrency slot and take tokens for the duration of a request.
+
+        Example:
+            with limiter.limit("https://graph.facebook.com"):
+                response = session.get(url)
+
+        Yields:
+            Seconds spent waiting
+
+        Raises:
+            TimeoutError: If no capacity is available within timeout
+        """
+        key = rate_key(key)
+        limit = self.get_limit(key)
+        slot_id = self._slot_id(limit)
+        waited = self._wait(key, limit, tokens, timeout, slot_id)
+        with self._in_flight(key):
+            try:
+                yield waited
+            finally:
+                if slot_id:
+                    self._release(key, limit, slot_id)
+
+    @contextlib.asynccontextmanager
+    async def limit_async(self, key: str, tokens: float = 1.0, timeout: Optional[float] = None) -> AsyncIterator[float]:
+        """Async version of limit(): waits with asyncio.sleep."""
+        key = rate_key(key)
+        limit = self.get_limit(key)
+        slot_id = self._slot_id(limit)
+        waited = await self._wait_async(key, limit, tokens, timeout, slot_id)
+        with self._in_flight(key):
+            try:
+                yield waited
+            finally:
+                if slot_id:
+                    self._release(key, limit, slot_id)
+
+    @contextlib.contextmanager
+    def _in_flight(self, key: str) -> Iterator[None]:
+        metrics = self._key_metrics(key)
+        with self._lock:
+            metrics.in_flight += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                metrics.in_flight -= 1
+
+    def feedback(self, key: str, status_code: Optional[int] = None, retry_after: Optional[float] = None) -> bool:
+        """
+        Adapt a key's rate to a response.
+
+        A throttling status (429/503) or an explicit Retry-After pauses the key
+        for that long (or ``throttle_backoff``) and halves its rate; other
+        responses let the rate recover step by step.
+
+        Args:
+            key: Host URL, rate_key() result or service name
+            status_code: HTTP status of the response
+            retry_after: Server-requested delay in seconds
+
+        Returns:
+            True if the response was treated as throttling
+        """
+        key = rate_key(key)
+        limit = self.get_limit(key)
+        throttled = status_code in THROTTLE_STATUS_CODES or (status_code is None and retry_after is not None)
+        if limit is None:
+            limit = _UNLIMITED
+            if not throttled:
+                return False
+        if throttled:
+            self.store.update(key, limit, lambda state, now: _throttle(state, limit, now, retry_after))
+            metrics = self._key_metrics(key)
+            with self._lock:
+                metrics.throttled += 1
+            pause = retry_after if retry_after is not None else limit.throttle_backoff
+            logger.warning(f"Throttled by {key} (status {status_code}), pausing for {pause:.1f}s")
+        elif limit.rate:
+            self.store.update(key, limit, lambda state, now: _recover(state, limit))
+        return throttled
+
+    def observe(self, key: str, response: Any) -> bool:
+        """
+        Feed an HTTP response (requests or httpx) back into the limiter.
+
+        Returns:
+            True if the response was treated as throttling
+        """
+        headers = getattr(response, "headers", None) or {}
+        return self.feedback(key, getattr(response, "status_code", None), parse_retry_after(headers.get("Retry-After")))
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Wait-time and throttling metrics per key.
+
+        Returns:
+            Mapping of key to acquired, total_wait, max_wait, avg_wait,
+            throttled, in_flight, rate_factor and blocked_for
+        """
+        with self._lock:
+            snapshot = {
+                key: (m.acquired, m.total_wait, m.max_wait, m.throttled, m.in_flight)
+                for key, m in self._metrics.items()
+            }
+        metrics = {}
+        for key, (acquired, total_wait, max_wait, throttled, in_flight) in snapshot.items():
+            limit = self.get_limit(key) or _UNLIMITED
+            factor, blocked_for = self.store.update(
+                key, limit, lambda state, now: (state["factor"], max(0.0, state["blocked_until"] - now))
+            )
+            metrics[key] = {
+                "acquired": acquired,
+                "total_wait": total_wait,
+                "max_wait": max_wait,
+                "avg_wait": total_wait / acquired if acquired else 0.0,
+                "throttled": throttled,
+                "in_flight": in_flight,
+                "rate_factor": factor,
+                "blocked_for": blocked_for,
+            }
+        return metrics
+
+
+_shared_limiter: Optional[RateLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Get the process-wide rate limiter.
+
+    The state store is chosen by the RATE_LIMIT_BACKEND environment variable;
+    point every worker process at the same SQLite file or Redis server to
+    share quotas between them.
+
+    Returns:
+        Shared RateLimiter instance
+    """
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter(create_state_store())
+        return _shared_limiter
@@ -3,16 +3,108 @@ Retry logic with exponential backoff and circuit breaker patterns.
 
 This module provides decorators and utilities for handling transient failures
 in API calls and external services.
+
+The decorators work on both regular functions and coroutine functions: async
+functions are retried with ``asyncio.sleep`` so the event loop keeps running.
+Backoff delays can be jittered ("full" or "decorrelated") so parallel workers
+hitting the same rate-limited API do not retry in lockstep, and a server's
+``Retry-After`` (from ``RateLimitError``/``APIError.retry_after`` or an HTTP
+response header) is always honored. ``CircuitBreaker`` state is lock-protected,
+so one breaker can be shared by threads and tasks, and reports metrics.
 """
 
 import functools
+import inspect
+import logging
+import random
+import threading
 import time
-from typing import Any, Callable, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
 
 from PrismQ.Shared.errors import APIError, RateLimitError, TimeoutError
-from PrismQ.Shared.logging import get_logger
+from PrismQ.Shared.rate_limit import parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+JITTER_MODES = (None, "full", "decorrelated")
+
+
+def compute_backoff(
+    attempt: int,
+    initial_delay: float = 1.0,
+    max_delay: float = 60.0,
+    exponential_base: float = 2.0,
+    jitter: Optional[str] = None,
+    previous_delay: Optional[float] = None,
+    rng: Optional[random.Random] = None,
+) -> float:
+    """Calculate the delay before the next attempt.
+    
+    Args:
+        attempt: Number of the attempt that just failed (1-based)
+        initial_delay: Initial delay in seconds
+        max_delay: Maximum delay in seconds
+        exponential_base: Base for exponential backoff calculation
+        jitter: None for plain exponential backoff, "full" for a uniform
+            delay between 0 and the exponential delay, or "decorrelated" for
+            a uniform delay between initial_delay and 3x the previous delay
+        previous_delay: Delay used before the previous attempt ("decorrelated")
+        rng: Random source (default: module random)
+        
+    Returns:
+        Delay in seconds
+    """
+    if jitter not in JITTER_MODES:
+        raise ValueError(f"Unknown jitter mode: {jitter!r}")
+    rng = rng or random
+    
+    if jitter == "decorrelated":
+        upper = max(initial_delay, (previous_delay or initial_delay) * 3)
+        return min(max_delay, rng.uniform(initial_delay, upper))
+    
+    delay = min(initial_delay * (exponential_base ** (attempt - 1)), max_delay)
+    if jitter == "full":
+        return rng.uniform(0, delay)
+    return delay
+
+
+def get_retry_after(exc: BaseException) -> Optional[float]:
+    """Extract a server-requested retry delay from an exception.
+    
+    Checks a ``retry_after`` attribute (``APIError``/``RateLimitError``),
+    then a ``Retry-After`` header on an attached HTTP response (requests and
+    httpx errors), in delta-seconds or HTTP-date form.
+    
+    Args:
+        exc: Exception raised by the failed attempt
+        
+    Returns:
+        Seconds to wait, or None if the exception carries no hint
+    """
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except (TypeError, ValueError):
+            pass
+    
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    return parse_retry_after(headers.get("Retry-After"))
 
-logger = get_logger(__name__)
+
+class CircuitBreakerOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open.
+    
+    Attributes:
+        retry_after: Seconds until the circuit half-opens
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class CircuitBreaker:
@@ -27,17 +119,24 @@ class CircuitBreaker:
     - OPEN: Service is failing, calls fail immediately
     - HALF_OPEN: Testing if service has recovered
     
+    State changes are lock-protected, so one breaker can guard a service for
+    many threads and asyncio tasks. While half-open, only
+    ``half_open_max_calls`` trial calls run at once; others are rejected.
+    
     Attributes:
         failure_threshold: Number of failures before opening circuit
         recovery_timeout: Seconds to wait before half-opening
         expected_exception: Exception type(s) that count as failures
+        name: Name used in logs and metrics
     """
 
     def __init__(
         self,
         failure_threshold: int = 5,
-        recovery_timeout: int = 60,
+        recovery_timeout: float = 60,
         expected_exception: Union[Type[Exception], Tuple[Type[Exception], ...]] = Exception,
+        half_open_max_calls: int = 1,
+        name: Optional[str] = None,
     ):
         """Initialize CircuitBreaker.
         
@@ -45,14 +144,78 @@ class CircuitBreaker:
             failure_threshold: Number of failures before opening circuit
             recovery_timeout: Seconds to wait before half-opening
             expected_exception: Exception type(s) that count as failures
+            half_open_max_calls: Trial calls allowed at once while half-open
+            name: Name used in logs and metrics
         """
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.expected_exception = expected_exception
+        self.half_open_max_calls = half_open_max_calls
+        self.name = name
         
         self.failure_count = 0
         self.last_failure_time: Optional[float] = None
         self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
+        
+        self._lock = threading.Lock()
+        self._half_open_calls = 0
+        self._state_changed_at = time.monotonic()
+        self._metrics = {
+            "calls": 0,
+            "successes": 0,
+            "failures": 0,
+            "rejected": 0,
+            "opened": 0,
+        }
+
+    def _set_state(self, state: str) -> None:
+        """Change state; caller holds the lock."""
+        if state != self.state:
+            self.state = state
+            self._state_changed_at = time.monotonic()
+            if state == "OPEN":
+                self._metrics["opened"] += 1
+
+    def _before_call(self, label: str) -> bool:
+        """Admit or reject a call; returns True if it is a half-open trial."""
+        with self._lock:
+            if self.state == "OPEN":
+                if self._should_attempt_reset():
+                    self._set_state("HALF_OPEN")
+                    self._half_open_calls = 0
+                    logger.info(f"Circuit breaker half-open for {label}")
+                else:
+                    self._metrics["rejected"] += 1
+                    raise CircuitBreakerOpenError(
+                        f"Circuit breaker is OPEN for {label}. "
+                        f"Will retry after {self.recovery_timeout}s",
+                        retry_after=self._remaining_timeout(),
+                    )
+            
+            if self.state == "HALF_OPEN":
+                if self._half_open_calls >= self.half_open_max_calls:
+                    self._metrics["rejected"] += 1
+                    raise CircuitBreakerOpenError(
+                        f"Circuit breaker is OPEN for {label}. "
+                        f"Recovery trial in progress",
+                        retry_after=self.recovery_timeout,
+                    )
+                self._half_open_calls += 1
+                self._metrics["calls"] += 1
+                return True
+            
+            self._metrics["calls"] += 1
+            return False
+
+    def _after_call(self, trial: bool, exc: Optional[BaseException]) -> None:
+        """Record the outcome of an admitted call."""
+        if exc is None:
+            self._on_success()
+        elif isinstance(exc, self.expected_exception):
+            self._on_failure()
+        if trial:
+            with self._lock:
+                self._half_open_calls = max(0, self._half_open_calls - 1)
 
     def call(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
         """Execute function with circuit breaker protection.
@@ -66,25 +229,41 @@ class CircuitBreaker:
             Result of func call
             
         Raises:
-            Exception: If circuit is OPEN or func raises
+            CircuitBreakerOpenError: If the circuit is OPEN
+            Exception: If func raises
         """
-        if self.state == "OPEN":
-            if self._should_attempt_reset():
-                self.state = "HALF_OPEN"
-                logger.info(f"Circuit breaker half-open for {func.__name__}")
-            else:
-                raise Exception(
-                    f"Circuit breaker is OPEN for {func.__name__}. "
-                    f"Will retry after {self.recovery_timeout}s"
-                )
-
+        trial = self._before_call(self.name or func.__name__)
         try:
             result = func(*args, **kwargs)
-            self._on_success()
-            return result
-        except self.expected_exception as e:
-            self._on_failure()
+        except BaseException as e:
+            self._after_call(trial, e)
+            raise
+        self._after_call(trial, None)
+        return result
+
+    async def call_async(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Await a coroutine function with circuit breaker protection.
+        
+        Args:
+            func: Coroutine function to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            Result of the awaited call
+            
+        Raises:
+            CircuitBreakerOpenError: If the circuit is OPEN
+            Exception: If func raises
+        """
+        trial = self._before_call(self.name or func.__name__)
+        try:
+            result = await func(*args, **kwargs)
+        except BaseException as e:
+            self._after_call(trial, e)
             raise
+        self._after_call(trial, None)
+        return result
 
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt reset."""
@@ -92,24 +271,92 @@ class CircuitBreaker:
             return False
         return time.time() - self.last_failure_time >= self.recovery_timeout
 
+    def _remaining_timeout(self) -> float:
+        if self.last_failure_time is None:
+            return 0.0
+        return max(0.0, self.recovery_timeout - (time.time() - self.last_failure_time))
+
     def _on_success(self) -> None:
         """Handle successful call."""
-        if self.state == "HALF_OPEN":
-            logger.info("Circuit breaker recovered, closing circuit")
-        self.failure_count = 0
-        self.state = "CLOSED"
+        with self._lock:
+            self._metrics["successes"] += 1
+            if self.state == "HALF_OPEN":
+                logger.info("Circuit breaker recovered, closing circuit")
+            self.failure_count = 0
+            self._set_state("CLOSED")
 
     def _on_failure(self) -> None:
         """Handle failed call."""
-        self.failure_count += 1
-        self.last_failure_time = time.time()
+        with self._lock:
+            self._metrics["failures"] += 1
+            self.failure_count += 1
+            self.last_failure_time = time.time()
+            
+            if self.state == "HALF_OPEN" or self.failure_count >= self.failure_threshold:
+                opening = self.state != "OPEN"
+                self._set_state("OPEN")
+                if opening:
+                    logger.warning(
+                        f"Circuit breaker opened after {self.failure_count} failures. "
+                        f"Will retry after {self.recovery_timeout}s"
+                    )
+
+    def reset(self) -> None:
+        """Close the circuit and clear the failure count."""
+        with self._lock:
+            self.failure_count = 0
+            self.last_failure_time = None
+            self._half_open_calls = 0
+            self._set_state("CLOSED")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get breaker state and call counters.
         
-        if self.failure_count >= self.failure_threshold:
-            self.state = "OPEN"
-            logger.warning(
-                f"Circuit breaker opened after {self.failure_count} failures. "
-                f"Will retry after {self.recovery_timeout}s"
-            )
+        Returns:
+            Dict with name, state, failure_count, seconds_in_state, calls,
+            successes, failures, rejected and opened (times the circuit opened)
+        """
+        with self._lock:
+            return {
+                "name": self.name,
+                "state": self.state,
+                "failure_count": self.failure_count,
+                "seconds_in_state": time.monotonic() - self._state_changed_at,
+                **self._metrics,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str, **kwargs: Any) -> CircuitBreaker:
+    """Get the process-wide circuit breaker for a service, creating it once.
+    
+    Args:
+        name: Service name, e.g. "tiktok"
+        **kwargs: CircuitBreaker settings used when the breaker is created
+        
+    Returns:
+        Shared CircuitBreaker instance
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name=name, **kwargs)
+            _breakers[name] = breaker
+        return breaker
+
+
+def get_circuit_breaker_metrics() -> Dict[str, Dict[str, Any]]:
+    """Get metrics of every named circuit breaker.
+    
+    Returns:
+        Mapping of breaker name to CircuitBreaker.get_metrics()
+    """
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.get_metrics() for breaker in breakers}
 
 
 def retry_with_backoff(
@@ -119,69 +366,103 @@ def retry_with_backoff(
     exponential_base: float = 2.0,
     exceptions: Tuple[Type[Exception], ...] = (APIError,),
     on_retry: Optional[Callable[[Exception, int], None]] = None,
+    jitter: Optional[str] = None,
+    respect_retry_after: bool = True,
 ) -> Callable:
     """Decorator for retrying functions with exponential backoff.
     
+    Works on regular and ``async def`` functions; coroutines wait with
+    ``asyncio.sleep`` instead of blocking the event loop.
+    
     Args:
         max_attempts: Maximum number of retry attempts
         initial_delay: Initial delay in seconds
         max_delay: Maximum delay in seconds
         exponential_base: Base for exponential backoff calculation
         exceptions: Tuple of exception types to retry on
-        on_retry: Optional callback called on each retry (exc, attempt)
+        on_retry: Optional callback called on each retry (exc, attempt);
+            may be a coroutine function when decorating async functions
+        jitter: None, "full" or "decorrelated" (see compute_backoff)
+        respect_retry_after: Wait at least the server's Retry-After delay
         
     Returns:
         Decorator function
         
     Example:
-        @retry_with_backoff(max_attempts=5, initial_delay=2.0)
+        @retry_with_backoff(max_attempts=5, initial_delay=2.0, jitter="full")
         def call_api():
             response = requests.get("https://api.example.com")
             return response.json()
+        
+        @retry_with_backoff(max_attempts=5, jitter="decorrelated")
+        async def call_api_async(client):
+            response = await client.get("https://api.example.com")
+            return response.json()
     """
+    if jitter not in JITTER_MODES:
+        raise ValueError(f"Unknown jitter mode: {jitter!r}")
+
+    def next_delay(func: Callable, e: Exception, attempt: int, previous: Optional[float]) -> float:
+        """Delay before the next attempt, logged; raises once attempts run out."""
+        if attempt == max_attempts:
+            logger.error(
+                f"Failed after {max_attempts} attempts: {func.__name__}",
+                extra={"error": str(e), "attempts": attempt},
+            )
+            raise e
+        
+        delay = compute_backoff(
+            attempt, initial_delay, max_delay, exponential_base, jitter, previous
+        )
+        
+        # Handle rate limit retry_after if available
+        if respect_retry_after:
+            retry_after = get_retry_after(e)
+            if retry_after:
+                delay = max(delay, retry_after)
+        
+        logger.warning(
+            f"Attempt {attempt}/{max_attempts} failed for {func.__name__}, "
+            f"retrying in {delay:.1f}s",
+            extra={"error": str(e), "delay": delay, "attempt": attempt},
+        )
+        return delay
 
     def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                delay = None
+                for attempt in range(1, max_attempts + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        delay = next_delay(func, e, attempt, delay)
+                        if on_retry:
+                            result = on_retry(e, attempt)
+                            if inspect.isawaitable(result):
+                                await result
+                        # Imported here: asyncio is slow to import and only async callers need it
+                        import asyncio
+
+                        await asyncio.sleep(delay)
+                raise Exception("Unexpected state in retry logic")
+            
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            last_exception = None
-            
+            delay = None
             for attempt in range(1, max_attempts + 1):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-                    
-                    if attempt == max_attempts:
-                        logger.error(
-                            f"Failed after {max_attempts} attempts: {func.__name__}",
-                            extra={"error": str(e), "attempts": attempt},
-                        )
-                        raise
-                    
-                    # Calculate delay with exponential backoff
-                    delay = min(
-                        initial_delay * (exponential_base ** (attempt - 1)),
-                        max_delay,
-                    )
-                    
-                    # Handle rate limit retry_after if available
-                    if isinstance(e, RateLimitError) and e.retry_after:
-                        delay = max(delay, e.retry_after)
-                    
-                    logger.warning(
-                        f"Attempt {attempt}/{max_attempts} failed for {func.__name__}, "
-                        f"retrying in {delay:.1f}s",
-                        extra={"error": str(e), "delay": delay, "attempt": attempt},
-                    )
-                    
+                    delay = next_delay(func, e, attempt, delay)
                     if on_retry:
                         on_retry(e, attempt)
-                    
                     time.sleep(delay)
             
             # This should never be reached, but just in case
-            if last_exception:
-                raise last_exception
             raise Exception("Unexpected state in retry logic")
         
         return wrapper
@@ -191,15 +472,22 @@ def retry_with_backoff(
 
 def with_circuit_breaker(
     failure_threshold: int = 5,
-    recovery_timeout: int = 60,
+    recovery_timeout: float = 60,
     expected_exception: Union[Type[Exception], Tuple[Type[Exception], ...]] = APIError,
+    circuit_breaker: Optional[CircuitBreaker] = None,
+    name: Optional[str] = None,
 ) -> Callable:
     """Decorator for applying circuit breaker pattern.
     
+    Works on regular and ``async def`` functions.
+    
     Args:
         failure_threshold: Number of failures before opening circuit
         recovery_timeout: Seconds to wait before half-opening
         expected_exception: Exception type(s) that count as failures
+        circuit_breaker: Existing breaker to use, e.g. one shared by every
+            function that calls the same service (settings above are ignored)
+        name: Use the process-wide named breaker from get_circuit_breaker()
         
     Returns:
         Decorator function
@@ -210,18 +498,29 @@ def with_circuit_breaker(
             response = requests.get("https://service.example.com")
             return response.json()
     """
-    # Create circuit breaker instance (shared across calls)
-    circuit_breaker = CircuitBreaker(
-        failure_threshold=failure_threshold,
-        recovery_timeout=recovery_timeout,
-        expected_exception=expected_exception,
-    )
+    if circuit_breaker is None:
+        settings = dict(
+            failure_threshold=failure_threshold,
+            recovery_timeout=recovery_timeout,
+            expected_exception=expected_exception,
+        )
+        # Create circuit breaker instance (shared across calls)
+        circuit_breaker = get_circuit_breaker(name, **settings) if name else CircuitBreaker(**settings)
     
     def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                return await circuit_breaker.call_async(func, *args, **kwargs)
+            
+            async_wrapper.circuit_breaker = circuit_breaker
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             return circuit_breaker.call(func, *args, **kwargs)
         
+        wrapper.circuit_breaker = circuit_breaker
         return wrapper
     
     return decorator
@@ -231,16 +530,19 @@ def retry_api_call(
     max_attempts: int = 3,
     initial_delay: float = 1.0,
     max_delay: float = 10.0,
+    jitter: Optional[str] = "full",
 ) -> Callable:
     """Convenience decorator for API calls with standard retry logic.
     
     Combines retry with backoff for common API error scenarios.
-    Retries on APIError, RateLimitError, and TimeoutError.
+    Retries on APIError, RateLimitError, and TimeoutError, with full jitter
+    by default so parallel callers spread their retries out.
     
     Args:
         max_attempts: Maximum number of retry attempts
         initial_delay: Initial delay in seconds
         max_delay: Maximum delay in seconds
+        jitter: None, "full" or "decorrelated" (see compute_backoff)
         
     Returns:
         Decorator function
@@ -259,6 +561,7 @@ def retry_api_call(
         max_delay=max_delay,
         exponential_base=2.0,
         exceptions=(APIError, RateLimitError, TimeoutError),
+        jitter=jitter,
     )
 
 
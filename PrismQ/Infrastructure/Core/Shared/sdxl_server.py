@@ -0,0 +1,604 @@
+"""
+Persistent SDXL image-generation server.
+
+Keeps one Stable Diffusion XL pipeline (plus IP-Adapter) loaded for the life of
+the process and serves generation requests from a queue on a single worker
+thread:
+
+- Requests that arrive together are drained into a micro-batch (up to
+  ``max_batch`` within ``batch_wait`` seconds) and grouped by style and
+  generation settings, so prompts sharing a style run in one forward pass.
+- Style reference images are encoded to IP-Adapter embeddings once and cached
+  by style name and image content hash.
+
+Python callers use ``SDXLPipelineServer`` directly (or the process-wide
+``get_sdxl_server``); the ML scripts expose the same server over the JSONL
+protocol through ``make_jsonl_handler``:
+
+    Request:  {"id": "<id>", "op": "<command>", "args": {...}}
+    Response: {"id": "<id>", "ok": true, "data": {...}, "error": null}
+
+The pipeline is created by a backend factory. ``DiffusersSDXLBackend`` is the
+default; any object with ``embed_style(image)`` and ``generate(prompts, seeds,
+...)`` works, which is how tests run without model weights.
+
+Example:
+    >>> server = get_sdxl_server(device="cuda")
+    >>> server.register_style("noir", "styles/noir.png", ip_adapter_scale=0.8)
+    >>> futures = [server.submit(p, style="noir", out_path=f"kf_{i}.png") for i, p in enumerate(prompts)]
+    >>> results = [f.result() for f in futures]
+"""
+
+import hashlib
+import importlib
+import logging
+import queue
+import random
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+DEFAULT_MODEL = "stabilityai/stable-diffusion-xl-base-1.0"
+
+# Tiny randomly initialized SDXL pipeline used by diffusers' own test suite;
+# produces noise but exercises the full pipeline on CPU in seconds
+TINY_TEST_MODEL = "hf-internal-testing/tiny-stable-diffusion-xl-pipe"
+
+IP_ADAPTER_REPO = "h94/IP-Adapter"
+IP_ADAPTER_SUBFOLDER = "sdxl_models"
+IP_ADAPTER_WEIGHTS = "ip-adapter-plus_sdxl_vit-h.bin"
+
+
+class DiffusersSDXLBackend:
+    """SDXL pipeline backed by diffusers and torch."""
+
+    def __init__(self, model_id: str = DEFAULT_MODEL, device: str = "cuda", ip_adapter: bool = True):
+        """
+        Load the pipeline.
+
+        Args:
+            model_id: Hugging Face model ID or local path
+            device: Device to run on ('cuda', 'cpu', or 'mps')
+            ip_adapter: Try to load the IP-Adapter for style references
+        """
+        try:
+            import torch
+            from diffusers import StableDiffusionXLPipeline
+        except ImportError as e:
+            raise ImportError(
+                f"Required dependencies not installed: {e}\n"
+                "Install with: pip install diffusers>=0.25.0 torch>=2.0.0"
+            )
+
+        self._torch = torch
+        self.device = device
+        dtype = torch.float16 if device in ["cuda", "mps"] else torch.float32
+
+        logger.info(f"Loading SDXL model: {model_id} ({device})")
+        self.pipe = StableDiffusionXLPipeline.from_pretrained(
+            model_id,
+            torch_dtype=dtype,
+            variant="fp16" if device == "cuda" else None
+        )
+        if device != "cpu":
+            self.pipe.to(device)
+
+        self.has_ip_adapter = False
+        if ip_adapter:
+            try:
+                self.pipe.load_ip_adapter(
+                    IP_ADAPTER_REPO,
+                    subfolder=IP_ADAPTER_SUBFOLDER,
+                    weight_name=IP_ADAPTER_WEIGHTS
+                )
+                self.has_ip_adapter = True
+                logger.info("IP-Adapter loaded successfully")
+            except Exception as e:
+                logger.warning(f"IP-Adapter not available: {e}")
+
+        self._neutral_embeds = None
+
+    def embed_style(self, image):
+        """
+        Encode a style reference image to IP-Adapter embeddings.
+
+        Args:
+            image: PIL image
+
+        Returns:
+            Embeddings (negative and positive halves), or None without IP-Adapter
+        """
+        if not self.has_ip_adapter:
+            return None
+        with self._torch.inference_mode():
+            return self.pipe.prepare_ip_adapter_image_embeds(
+                ip_adapter_image=image,
+                ip_adapter_image_embeds=None,
+                device=self.device,
+                num_images_per_prompt=1,
+                do_classifier_free_guidance=True
+            )
+
+    def _expand_embeds(self, embeds, batch_size: int, guidance: bool):
+        """Repeat cached (negative, positive) embeddings for a batch."""
+        expanded = []
+        for tensor in embeds:
+            negative, positive = tensor.chunk(2)
+            ones = [1] * (positive.dim() - 1)
+            parts = [positive.repeat(batch_size, *ones)]
+            if guidance:
+                parts.insert(0, negative.repeat(batch_size, *ones))
+            expanded.append(self._torch.cat(parts))
+        return expanded
+
+    def generate(
+        self,
+        prompts: List[str],
+        seeds: List[int],
+        style_embeds=None,
+        ip_adapter_scale: float = 0.0,
+        negative_prompt: Optional[str] = None,
+        width: int = 1024,
+        height: int = 1024,
+        num_inference_steps: int = 30,
+        guidance_scale: float = 7.5
+    ) -> List[Any]:
+        """
+        Generate one image per prompt in a single forward pass.
+
+        Returns:
+            List of PIL images, in prompt order
+        """
+        torch = self._torch
+        generator_device = "cpu" if self.device == "mps" else self.device
+        kwargs = dict(
+            prompt=prompts,
+            negative_prompt=[negative_prompt] * len(prompts) if negative_prompt else None,
+            generator=[torch.Generator(device=generator_device).manual_seed(seed) for seed in seeds],
+            width=width,
+            height=height,
+            num_inference_steps=num_inference_steps,
+            guidance_scale=guidance_scale
+        )
+
+        if self.has_ip_adapter:
+            if style_embeds is None:
+                # The adapter's cross-attention always expects image embeddings
+                if self._neutral_embeds is None:
+                    from PIL import Image
+                    self._neutral_embeds = self.embed_style(Image.new("RGB", (224, 224)))
+                style_embeds, ip_adapter_scale = self._neutral_embeds, 0.0
+            self.pipe.set_ip_adapter_scale(ip_adapter_scale)
+            kwargs["ip_adapter_image_embeds"] = self._expand_embeds(
+                style_embeds, len(prompts), guidance_scale > 1.0
+            )
+
+        with torch.inference_mode():
+            return self.pipe(**kwargs).images
+
+
+@dataclass
+class GenerationResult:
+    """Result of one generated image."""
+    prompt: str
+    seed: int
+    style: Optional[str]
+    batch_size: int
+    image: Any = None
+    out_path: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary (without the image)."""
+        return {
+            "prompt": self.prompt,
+            "seed": self.seed,
+            "style": self.style,
+            "batch_size": self.batch_size,
+            "out_path": self.out_path
+        }
+
+
+@dataclass
+class _Request:
+    prompt: str
+    seed: int
+    style: Optional[str]
+    settings: Tuple
+    out_path: Optional[str]
+    future: Future = field(default_factory=Future)
+
+
+@dataclass
+class _Style:
+    digest: str
+    embeds: Any
+    ip_adapter_scale: float
+
+
+class SDXLPipelineServer:
+    """
+    Long-lived SDXL generation worker with micro-batching and style caching.
+
+    All pipeline calls happen on one worker thread (or under the pipeline
+    lock), so a single server can be shared by every caller in the process.
+    """
+
+    SETTING_NAMES = ("negative_prompt", "width", "height", "num_inference_steps", "guidance_scale")
+
+    def __init__(
+        self,
+        model_id: str = DEFAULT_MODEL,
+        device: str = "cuda",
+        max_batch: int = 4,
+        batch_wait: float = 0.05,
+        ip_adapter: bool = True,
+        backend_factory: Optional[Callable[..., Any]] = None
+    ):
+        """
+        Initialize the server (the model loads on first use).
+
+        Args:
+            model_id: SDXL model ID or local path
+            device: Device to run on ('cuda', 'cpu', or 'mps')
+            max_batch: Most prompts generated in one forward pass
+            batch_wait: Seconds to wait for more requests before running a batch
+            ip_adapter: Load the IP-Adapter for style references
+            backend_factory: Callable (model_id, device, ip_adapter) -> backend
+                (default: DiffusersSDXLBackend)
+        """
+        self.model_id = model_id
+        self.device = device
+        self.max_batch = max(1, max_batch)
+        self.batch_wait = batch_wait
+        self.ip_adapter = ip_adapter
+        self.backend_factory = backend_factory or DiffusersSDXLBackend
+
+        self._backend = None
+        self._pipe_lock = threading.RLock()
+        self._styles: Dict[str, _Style] = {}
+        self._queue: "queue.Queue[Optional[_Request]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "batches": 0,
+            "images": 0,
+            "largest_batch": 0,
+            "style_cache_hits": 0,
+            "style_cache_misses": 0,
+            "load_seconds": 0.0
+        }
+
+    @property
+    def backend(self):
+        """Lazily created pipeline backend."""
+        with self._pipe_lock:
+            if self._backend is None:
+                start = time.perf_counter()
+                self._backend = self.backend_factory(self.model_id, self.device, self.ip_adapter)
+                self._stats["load_seconds"] = round(time.perf_counter() - start, 3)
+            return self._backend
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._backend is not None
+
+    def start(self) -> "SDXLPipelineServer":
+        """Start the worker thread (idempotent)."""
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="sdxl-server", daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Finish queued requests and stop the worker thread."""
+        with self._start_lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+
+    def __enter__(self) -> "SDXLPipelineServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def register_style(
+        self,
+        name: str,
+        reference_image: PathLike,
+        ip_adapter_scale: float = 0.8
+    ) -> bool:
+        """
+        Encode a style reference image and cache its embeddings.
+
+        Registering the same name with an unchanged image is a cache hit.
+
+        Args:
+            name: Style name used in ``submit``
+            reference_image: Path to the style reference image
+            ip_adapter_scale: IP-Adapter strength for this style
+
+        Returns:
+            True if embeddings were computed, False if served from cache
+        """
+        data = Path(reference_image).read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+
+        with self._pipe_lock:
+            cached = self._styles.get(name)
+            if cached is not None and cached.digest == digest:
+                cached.ip_adapter_scale = ip_adapter_scale
+                self._stats["style_cache_hits"] += 1
+                return False
+
+            from io import BytesIO
+            from PIL import Image
+
+            with Image.open(BytesIO(data)) as image:
+                embeds = self.backend.embed_style(image.convert("RGB"))
+            self._styles[name] = _Style(digest, embeds, ip_adapter_scale)
+            self._stats["style_cache_misses"] += 1
+            return True
+
+    def has_style(self, name: str) -> bool:
+        return name in self._styles
+
+    def submit(
+        self,
+        prompt: str,
+        style: Optional[str] = None,
+        seed: Optional[int] = None,
+        out_path: Optional[PathLike] = None,
+        negative_prompt: Optional[str] = None,
+        width: int = 1024,
+        height: int = 1024,
+        num_inference_steps: int = 30,
+        guidance_scale: float = 7.5
+    ) -> Future:
+        """
+        Queue a generation request.
+
+        Args:
+            prompt: Text prompt
+            style: Registered style name (None = no style reference)
+            seed: Random seed (chosen and reported if omitted)
+            out_path: Save the image here (the result keeps the image either way)
+            negative_prompt: Negative prompt
+            width: Image width
+            height: Image height
+            num_inference_steps: Number of denoising steps
+            guidance_scale: Classifier-free guidance scale
+
+        Returns:
+            Future resolving to a GenerationResult
+
+        Raises:
+            ValueError: If the style has not been registered
+        """
+        if style is not None and style not in self._styles:
+            raise ValueError(f"Style '{style}' is not registered")
+
+        request = _Request(
+            prompt=prompt,
+            seed=seed if seed is not None else random.randrange(2 ** 32),
+            style=style,
+            settings=(negative_prompt, width, height, num_inference_steps, guidance_scale),
+            out_path=str(out_path) if out_path else None
+        )
+        self.start()
+        self._queue.put(request)
+        return request.future
+
+    def generate(self, prompt: str, **kwargs) -> GenerationResult:
+        """Generate one image and wait for it (see ``submit`` for arguments)."""
+        return self.submit(prompt, **kwargs).result()
+
+    def generate_many(self, prompts: List[str], **kwargs) -> List[GenerationResult]:
+        """
+        Generate images for many prompts, batched together.
+
+        Args:
+            prompts: Text prompts
+            **kwargs: Shared ``submit`` arguments; ``seeds`` and ``out_paths``
+                may be given as per-prompt lists
+
+        Returns:
+            Results in prompt order
+        """
+        seeds = kwargs.pop("seeds", None) or [None] * len(prompts)
+        out_paths = kwargs.pop("out_paths", None) or [None] * len(prompts)
+        futures = [
+            self.submit(prompt, seed=seed, out_path=out_path, **kwargs)
+            for prompt, seed, out_path in zip(prompts, seeds, out_paths)
+        ]
+        return [future.result() for future in futures]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get server statistics.
+
+        Returns:
+            Dictionary with request, batch and style cache counters
+        """
+        return dict(
+            self._stats,
+            model_id=self.model_id,
+            device=self.device,
+            loaded=self.is_loaded,
+            styles=sorted(self._styles),
+            queued=self._queue.qsize()
+        )
+
+    def _run(self) -> None:
+        """Worker loop: drain micro-batches and run them group by group."""
+        while True:
+            request = self._queue.get()
+            if request is None:
+                return
+
+            batch = [request]
+            deadline = time.monotonic() + self.batch_wait
+            stopping = False
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            groups: Dict[Tuple, List[_Request]] = {}
+            for item in batch:
+                groups.setdefault((item.style, item.settings), []).append(item)
+            for (style, settings), items in groups.items():
+                self._run_group(style, settings, items)
+
+            if stopping:
+                return
+
+    def _run_group(self, style: Optional[str], settings: Tuple, items: List[_Request]) -> None:
+        """Generate one group of same-style, same-settings prompts in one call."""
+        try:
+            with self._pipe_lock:
+                cached = self._styles.get(style) if style else None
+                images = self.backend.generate(
+                    [item.prompt for item in items],
+                    [item.seed for item in items],
+                    style_embeds=cached.embeds if cached else None,
+                    ip_adapter_scale=cached.ip_adapter_scale if cached else 0.0,
+                    **dict(zip(self.SETTING_NAMES, settings))
+                )
+            self._stats["requests"] += len(items)
+            self._stats["batches"] += 1
+            self._stats["images"] += len(images)
+            self._stats["largest_batch"] = max(self._stats["largest_batch"], len(items))
+        except Exception as e:
+            logger.error(f"SDXL batch of {len(items)} failed: {e}")
+            for item in items:
+                item.future.set_exception(e)
+            return
+
+        for item, image in zip(items, images):
+            try:
+                if item.out_path:
+                    Path(item.out_path).parent.mkdir(parents=True, exist_ok=True)
+                    image.save(item.out_path)
+                item.future.set_result(GenerationResult(
+                    prompt=item.prompt,
+                    seed=item.seed,
+                    style=item.style,
+                    batch_size=len(items),
+                    image=image,
+                    out_path=item.out_path
+                ))
+            except Exception as e:
+                item.future.set_exception(e)
+
+
+def resolve_backend_factory(spec: Optional[str]) -> Callable[..., Any]:
+    """
+    Resolve a 'module:callable' backend factory spec.
+
+    Args:
+        spec: Factory spec, or None for DiffusersSDXLBackend
+
+    Returns:
+        Backend factory callable
+    """
+    if not spec:
+        return DiffusersSDXLBackend
+    module_name, _, attr = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def make_jsonl_handler(server: SDXLPipelineServer) -> Callable[[str, str, dict], Any]:
+    """
+    Build a JSONL request handler for ``run_jsonl_loop``.
+
+    Operations:
+        - ping: Model, device and registered styles
+        - style.register: Cache a style reference (name, reference_image_path, ip_adapter_scale)
+        - img.generate: One image (prompt, out_path, style, seed, and generation settings)
+        - img.generate_batch: Many images batched together (prompts, out_paths, seeds, ...)
+        - stats: Server statistics
+
+    Args:
+        server: Server to dispatch to
+
+    Returns:
+        Handler taking (request_id, op, args)
+    """
+    settings = ("style", "negative_prompt", "width", "height", "num_inference_steps", "guidance_scale")
+
+    def handle_request(request_id: str, op: str, args: dict):
+        if op == "ping":
+            return {
+                "model_id": server.model_id,
+                "device": server.device,
+                "loaded": server.is_loaded,
+                "styles": server.get_stats()["styles"]
+            }
+        elif op == "style.register":
+            computed = server.register_style(
+                args["name"],
+                args["reference_image_path"],
+                ip_adapter_scale=args.get("ip_adapter_scale", 0.8)
+            )
+            return {"name": args["name"], "cached": not computed}
+        elif op == "img.generate":
+            result = server.generate(
+                args["prompt"],
+                seed=args.get("seed"),
+                out_path=args.get("out_path", "output.png"),
+                **{key: args[key] for key in settings if key in args}
+            )
+            return result.to_dict()
+        elif op == "img.generate_batch":
+            results = server.generate_many(
+                args["prompts"],
+                seeds=args.get("seeds"),
+                out_paths=args.get("out_paths"),
+                **{key: args[key] for key in settings if key in args}
+            )
+            return {"images": [result.to_dict() for result in results]}
+        elif op == "stats":
+            return server.get_stats()
+        else:
+            raise ValueError(f"Unknown operation: {op}")
+
+    return handle_request
+
+
+_shared_servers: Dict[Tuple[str, str], SDXLPipelineServer] = {}
+_shared_lock = threading.Lock()
+
+
+def get_sdxl_server(model_id: str = DEFAULT_MODEL, device: str = "cuda", **kwargs) -> SDXLPipelineServer:
+    """
+    Get the process-wide server for a model and device.
+
+    Args:
+        model_id: SDXL model ID or local path
+        device: Device to run on
+        **kwargs: SDXLPipelineServer options, used only when the server is created
+
+    Returns:
+        Shared SDXLPipelineServer
+    """
+    with _shared_lock:
+        key = (model_id, device)
+        if key not in _shared_servers:
+            _shared_servers[key] = SDXLPipelineServer(model_id=model_id, device=device, **kwargs)
+        return _shared_servers[key]
@@ -0,0 +1,471 @@
+"""
+Frame-level video analysis.
+
+Decodes a video once with ffmpeg into a stream of small grayscale NumPy frames
+and computes frame-content metrics in a single vectorized pass:
+
+- Motion: mean absolute difference between consecutive frames, and how evenly
+  that motion is distributed (jerky or stuttering clips score low)
+- Scene cuts: frame differences far above the clip's typical motion
+- Flicker: frame-to-frame brightness that oscillates up and down
+- Blur: variance of the Laplacian per frame (low variance = soft frame)
+- Black and frozen frames, reported as time segments
+
+``scan_media`` additionally decodes the audio track in the same ffmpeg run and
+measures short-term levels for silence-gap detection.
+
+Frames are processed in chunks, so memory stays bounded regardless of length.
+
+Example:
+    >>> metrics = analyze_video_frames("variant.mp4", width=160, height=284)
+    >>> metrics["motion_smoothness"], metrics["scene_cuts"], metrics["blur_mean"]
+"""
+
+import logging
+import os
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+# Default analysis resolution (9:16 vertical)
+ANALYSIS_WIDTH = 160
+ANALYSIS_HEIGHT = 284
+
+# A frame difference above both of these is a scene cut
+CUT_MIN_DIFF = 40.0        # mean absolute luma difference (0-255)
+CUT_MEDIAN_FACTOR = 4.0    # multiple of the clip's median frame difference
+
+# Brightness changes smaller than this (luma levels) are not flicker
+FLICKER_MIN_DELTA = 2.0
+
+# Frames whose Laplacian variance is below this fraction of the clip median are blurry
+BLUR_RELATIVE = 0.35
+
+# A frame is black when this share of its pixels is darker than BLACK_PIXEL_MAX
+BLACK_PIXEL_MAX = 26
+BLACK_PIXEL_RATIO = 0.98
+
+# Consecutive frames differing less than this (mean absolute luma) are frozen
+FREEZE_MAX_DIFF = 0.5
+
+# Audio level windows
+AUDIO_SAMPLE_RATE = 8000
+AUDIO_WINDOW_SECONDS = 0.4
+
+
+def analysis_size(width: int, height: int, target_width: int = ANALYSIS_WIDTH) -> tuple:
+    """
+    Reduced analysis resolution preserving aspect ratio (even dimensions).
+
+    Args:
+        width: Source width (0 if unknown)
+        height: Source height (0 if unknown)
+        target_width: Analysis width
+
+    Returns:
+        Tuple of (width, height)
+    """
+    if width <= 0 or height <= 0:
+        return target_width, round(target_width * ANALYSIS_HEIGHT / ANALYSIS_WIDTH / 2) * 2
+    return target_width, max(2, round(target_width * height / width / 2) * 2)
+
+
+def iter_frames(
+    video_path: PathLike,
+    width: int = ANALYSIS_WIDTH,
+    height: int = ANALYSIS_HEIGHT,
+    sample_fps: Optional[float] = None,
+    max_seconds: Optional[float] = None,
+    chunk_frames: int = 64,
+    ffmpeg_cmd: str = 'ffmpeg',
+) -> Iterator[np.ndarray]:
+    """
+    Decode a video into chunks of grayscale frames.
+
+    Args:
+        video_path: Path to video file
+        width: Output frame width
+        height: Output frame height
+        sample_fps: Decode only this many frames per second (default: every frame)
+        max_seconds: Stop after this much video
+        chunk_frames: Frames per yielded chunk
+        ffmpeg_cmd: ffmpeg executable
+
+    Yields:
+        uint8 arrays of shape (n, height, width)
+
+    Raises:
+        RuntimeError: If ffmpeg fails before producing any frames
+    """
+    filters = f"scale={width}:{height},format=gray"
+    if sample_fps:
+        filters = f"fps={sample_fps}," + filters
+
+    cmd = [ffmpeg_cmd, '-v', 'error', '-nostdin', '-i', str(video_path)]
+    if max_seconds:
+        cmd += ['-t', str(max_seconds)]
+    cmd += ['-an', '-vf', filters, '-f', 'rawvideo', '-pix_fmt', 'gray', '-']
+
+    frame_bytes = width * height
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    produced = 0
+    try:
+        while True:
+            data = process.stdout.read(frame_bytes * chunk_frames)
+            count = len(data) // frame_bytes
+            if count:
+                produced += count
+                yield np.frombuffer(data[:count * frame_bytes], dtype=np.uint8).reshape(count, height, width)
+            if len(data) < frame_bytes * chunk_frames:
+                break
+    finally:
+        process.stdout.close()
+        if process.poll() is None:
+            process.kill()
+        stderr = process.stderr.read().decode(errors='replace')
+        process.stderr.close()
+        returncode = process.wait()
+
+    if not produced and returncode != 0:
+        raise RuntimeError(f"ffmpeg could not decode {video_path}: {stderr.strip()[-300:]}")
+
+
+def laplacian_variance(frames: np.ndarray) -> np.ndarray:
+    """
+    Variance of the 4-neighbour Laplacian for each frame.
+
+    Args:
+        frames: Array of shape (n, h, w)
+
+    Returns:
+        Array of shape (n,)
+    """
+    f = frames.astype(np.float32)
+    lap = (
+        4.0 * f[:, 1:-1, 1:-1]
+        - f[:, :-2, 1:-1] - f[:, 2:, 1:-1]
+        - f[:, 1:-1, :-2] - f[:, 1:-1, 2:]
+    )
+    return lap.reshape(len(frames), -1).var(axis=1)
+
+
+class FrameStats:
+    """
+    Streaming accumulator of per-frame statistics.
+
+    Feed decoded chunks with ``update`` (consecutive chunks are stitched so
+    differences span chunk boundaries), then call ``summary``.
+    """
+
+    def __init__(self):
+        self.luma: List[np.ndarray] = []
+        self.diffs: List[np.ndarray] = []
+        self.blur: List[np.ndarray] = []
+        self.black: List[np.ndarray] = []
+        self._previous: Optional[np.ndarray] = None
+
+    @property
+    def frames(self) -> int:
+        return sum(len(chunk) for chunk in self.luma)
+
+    def update(self, chunk: np.ndarray) -> None:
+        """Add a chunk of frames of shape (n, h, w)."""
+        f = chunk.astype(np.float32)
+        self.luma.append(f.mean(axis=(1, 2)))
+        self.blur.append(laplacian_variance(chunk))
+        self.black.append((chunk < BLACK_PIXEL_MAX).mean(axis=(1, 2)) >= BLACK_PIXEL_RATIO)
+
+        stitched = f if self._previous is None else np.concatenate([self._previous[None], f])
+        if len(stitched) > 1:
+            self.diffs.append(np.abs(np.diff(stitched, axis=0)).mean(axis=(1, 2)))
+        self._previous = f[-1]
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Compute clip-level metrics.
+
+        Returns:
+            Dictionary of frame metrics (all JSON-serializable)
+        """
+        frames = self.frames
+        if frames == 0:
+            return {'frames': 0}
+
+        luma = np.concatenate(self.luma)
+        blur = np.concatenate(self.blur)
+        diffs = np.concatenate(self.diffs) if self.diffs else np.zeros(0, dtype=np.float32)
+
+        # Scene cuts: differences far above typical motion
+        median_diff = float(np.median(diffs)) if diffs.size else 0.0
+        cut_mask = diffs > max(CUT_MIN_DIFF, CUT_MEDIAN_FACTOR * median_diff)
+        motion = diffs[~cut_mask]
+
+        # Smoothness: how much the motion magnitude jumps between frames
+        if motion.size >= 2:
+            jerk = float(np.abs(np.diff(motion)).mean())
+            motion_smoothness = 1.0 / (1.0 + jerk / (float(motion.mean()) + 1.0))
+        else:
+            motion_smoothness = 1.0
+
+        # Flicker: brightness alternating direction by more than the threshold
+        delta = np.diff(luma)
+        if delta.size >= 2:
+            strong = np.abs(delta) > FLICKER_MIN_DELTA
+            flips = strong[1:] & strong[:-1] & (np.sign(delta[1:]) != np.sign(delta[:-1]))
+            flips &= ~cut_mask[1:] & ~cut_mask[:-1]
+            flicker_ratio = float(flips.sum()) / delta.size
+        else:
+            flicker_ratio = 0.0
+
+        # Blur: frames much softer than the clip's own median sharpness
+        median_blur = float(np.median(blur))
+        blurry_ratio = float((blur < BLUR_RELATIVE * median_blur).mean()) if median_blur > 0 else 0.0
+
+        return {
+            'frames': frames,
+            'motion_mean': round(float(motion.mean()) if motion.size else 0.0, 3),
+            'motion_smoothness': round(motion_smoothness, 4),
+            'scene_cuts': int(cut_mask.sum()),
+            'flicker_ratio': round(flicker_ratio, 4),
+            'blur_mean': round(float(blur.mean()), 2),
+            'blurry_ratio': round(blurry_ratio, 4),
+            'luma_mean': round(float(luma.mean()), 2),
+        }
+
+    def black_mask(self) -> np.ndarray:
+        """Per-frame flags for black frames."""
+        return np.concatenate(self.black) if self.black else np.zeros(0, dtype=bool)
+
+    def freeze_mask(self) -> np.ndarray:
+        """Per-frame flags for frames identical to the previous (non-black) frame."""
+        diffs = np.concatenate(self.diffs) if self.diffs else np.zeros(0, dtype=np.float32)
+        frozen = np.concatenate([[False], diffs < FREEZE_MAX_DIFF])
+        return frozen & ~self.black_mask()
+
+
+def find_segments(mask: np.ndarray, fps: float, min_seconds: float) -> List[Tuple[float, float]]:
+    """
+    Find runs of True in a per-frame mask that last at least ``min_seconds``.
+
+    Args:
+        mask: Boolean array, one entry per sampled frame
+        fps: Sampled frames per second
+        min_seconds: Minimum run duration to report
+
+    Returns:
+        List of (start_seconds, end_seconds) tuples
+    """
+    if not mask.size or fps <= 0:
+        return []
+    padded = np.concatenate([[False], mask, [False]]).astype(np.int8)
+    edges = np.diff(padded)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return [
+        (round(float(start) / fps, 3), round(float(end) / fps, 3))
+        for start, end in zip(starts, ends)
+        if (end - start) / fps >= min_seconds
+    ]
+
+
+class AudioLevels:
+    """Streaming short-term RMS levels of mono float32 audio."""
+
+    def __init__(self, sample_rate: int = AUDIO_SAMPLE_RATE, window_seconds: float = AUDIO_WINDOW_SECONDS):
+        self.sample_rate = sample_rate
+        self.window = max(1, int(sample_rate * window_seconds))
+        self.levels_db: List[np.ndarray] = []
+        self._pending = np.zeros(0, dtype=np.float32)
+
+    def update(self, samples: np.ndarray) -> None:
+        """Add decoded samples."""
+        data = np.concatenate([self._pending, samples])
+        usable = len(data) // self.window * self.window
+        if usable:
+            windows = data[:usable].reshape(-1, self.window)
+            rms = np.sqrt(np.mean(windows.astype(np.float64) ** 2, axis=1))
+            self.levels_db.append(20 * np.log10(np.maximum(rms, 1e-10)))
+        self._pending = data[usable:]
+
+    def levels(self) -> np.ndarray:
+        """Level per window in dBFS."""
+        return np.concatenate(self.levels_db) if self.levels_db else np.zeros(0)
+
+    def gaps(self, threshold_db: float, min_seconds: float) -> List[Tuple[float, float]]:
+        """Segments quieter than ``threshold_db`` lasting at least ``min_seconds``."""
+        return find_segments(self.levels() < threshold_db, self.sample_rate / self.window, min_seconds)
+
+
+@dataclass
+class MediaScan:
+    """Result of a single-pass frame and audio scan."""
+
+    frames: FrameStats
+    audio: Optional[AudioLevels]
+    sample_fps: float
+    analyzed_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+    truncated: bool = False
+    error: Optional[str] = None
+    notes: List[str] = field(default_factory=list)
+
+
+def scan_media(
+    video_path: PathLike,
+    sample_fps: float = 2.0,
+    width: int = ANALYSIS_WIDTH,
+    height: int = ANALYSIS_HEIGHT,
+    with_audio: bool = True,
+    time_budget: Optional[float] = None,
+    chunk_frames: int = 32,
+    ffmpeg_cmd: str = 'ffmpeg',
+) -> MediaScan:
+    """
+    Decode sampled video frames and the audio track in one ffmpeg run.
+
+    Video goes to stdout and audio to a second pipe read on a thread, so the
+    file is demuxed once. Decoding stops when ``time_budget`` seconds of wall
+    time have passed and the scan is marked as truncated.
+
+    Args:
+        video_path: Path to video file
+        sample_fps: Frames per second to sample
+        width: Analysis width
+        height: Analysis height
+        with_audio: Also decode the first audio stream
+        time_budget: Wall-clock limit in seconds (None = unlimited)
+        chunk_frames: Frames per processing chunk
+        ffmpeg_cmd: ffmpeg executable
+
+    Returns:
+        MediaScan with frame statistics and audio levels
+    """
+    scan = MediaScan(FrameStats(), AudioLevels() if with_audio else None, sample_fps)
+    start = time.monotonic()
+
+    cmd = [
+        ffmpeg_cmd, '-v', 'error', '-nostdin', '-i', str(video_path),
+        '-map', '0:v:0', '-vf', f"fps={sample_fps},scale={width}:{height},format=gray",
+        '-f', 'rawvideo', '-pix_fmt', 'gray', 'pipe:1',
+    ]
+    read_fd = write_fd = None
+    if with_audio:
+        read_fd, write_fd = os.pipe()
+        cmd += [
+            '-map', '0:a:0', '-ac', '1', '-ar', str(AUDIO_SAMPLE_RATE),
+            '-f', 'f32le', f'pipe:{write_fd}',
+        ]
+
+    try:
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            pass_fds=(write_fd,) if write_fd is not None else (),
+        )
+    except OSError as e:
+        for fd in (read_fd, write_fd):
+            if fd is not None:
+                os.close(fd)
+        scan.error = str(e)
+        return scan
+
+    audio_thread = None
+    if write_fd is not None:
+        os.close(write_fd)
+
+        def read_audio():
+            with os.fdopen(read_fd, 'rb') as audio_pipe:
+                while data := audio_pipe.read(AUDIO_SAMPLE_RATE * 4):
+                    usable = len(data) // 4 * 4
+                    scan.audio.update(np.frombuffer(data[:usable], dtype=np.float32))
+
+        audio_thread = threading.Thread(target=read_audio, daemon=True)
+        audio_thread.start()
+
+    frame_bytes = width * height
+    try:
+        while True:
+            data = process.stdout.read(frame_bytes * chunk_frames)
+            count = len(data) // frame_bytes
+            if count:
+                scan.frames.update(
+                    np.frombuffer(data[:count * frame_bytes], dtype=np.uint8).reshape(count, height, width)
+                )
+            if len(data) < frame_bytes * chunk_frames:
+                break
+            if time_budget is not None and time.monotonic() - start > time_budget:
+                scan.truncated = True
+                break
+    finally:
+        if process.poll() is None and scan.truncated:
+            process.kill()
+        process.stdout.close()
+        stderr = process.stderr.read().decode(errors='replace')
+        process.stderr.close()
+        returncode = process.wait()
+        if audio_thread is not None:
+            audio_thread.join()
+
+    if returncode != 0 and not scan.truncated:
+        if scan.frames.frames == 0 and with_audio:
+            # Most often a file without an audio stream; scan the video alone
+            retry = scan_media(
+                video_path, sample_fps, width, height, False,
+                None if time_budget is None else max(0.0, time_budget - (time.monotonic() - start)),
+                chunk_frames, ffmpeg_cmd,
+            )
+            retry.notes.insert(0, 'audio not decoded')
+            return retry
+        if scan.frames.frames == 0:
+            scan.error = stderr.strip()[-300:] or f"ffmpeg exited with {returncode}"
+        else:
+            scan.notes.append(stderr.strip()[-300:])
+
+    scan.analyzed_seconds = round(scan.frames.frames / sample_fps, 3)
+    scan.elapsed_seconds = round(time.monotonic() - start, 3)
+    return scan
+
+
+def analyze_video_frames(
+    video_path: PathLike,
+    width: int = ANALYSIS_WIDTH,
+    height: int = ANALYSIS_HEIGHT,
+    sample_fps: Optional[float] = None,
+    max_seconds: Optional[float] = None,
+    ffmpeg_cmd: str = 'ffmpeg',
+) -> Dict[str, Any]:
+    """
+    Decode a video once and compute its frame metrics.
+
+    Module-level so it can run in a process pool.
+
+    Args:
+        video_path: Path to video file
+        width: Analysis width
+        height: Analysis height
+        sample_fps: Optional sampling rate
+        max_seconds: Optional limit on analyzed duration
+        ffmpeg_cmd: ffmpeg executable
+
+    Returns:
+        Frame metrics from FrameStats.summary, or {'frames': 0, 'error': ...}
+        if the video could not be decoded
+    """
+    stats = FrameStats()
+    try:
+        for chunk in iter_frames(video_path, width, height, sample_fps, max_seconds, ffmpeg_cmd=ffmpeg_cmd):
+            stats.update(chunk)
+    except (OSError, RuntimeError) as e:
+        logger.warning(f"Frame analysis failed for {video_path}: {e}")
+        return {'frames': 0, 'error': str(e)}
+    return stats.summary()
@@ -4,109 +4,53 @@ Providers package for external service integrations.
 This package contains concrete implementations of various service providers
 including LLM providers (OpenAI), voice synthesis (ElevenLabs), platform
 integrations (YouTube, TikTok, Instagram), and storage.
-"""
-
-from .mock_provider import MockLLMProvider, AsyncMockLLMProvider
-
-# Conditionally import OpenAI provider to avoid hard dependency
-try:
-    from .openai_provider import OpenAIProvider, AsyncOpenAIProvider
-    _has_openai = True
-except ImportError:
-    _has_openai = False
-    OpenAIProvider = None
-    AsyncOpenAIProvider = None
 
-# Conditionally import optimized OpenAI provider
-try:
-    from .openai_optimized import OptimizedOpenAIProvider
-    _has_openai_optimized = True
-except ImportError:
-    _has_openai_optimized = False
-    OptimizedOpenAIProvider = None
-
-# Conditionally import platform providers
-try:
-    from .youtube_provider import YouTubeUploader, YouTubeAnalytics
-    _has_youtube = True
-except ImportError:
-    _has_youtube = False
-    YouTubeUploader = None
-    YouTubeAnalytics = None
+Providers are imported on first access, so importing the package does not
+pull in openai, tiktoken, tenacity or requests. A provider whose optional
+dependency is missing resolves to None, as before.
+"""
 
-try:
-    from .tiktok_provider import TikTokUploader, TikTokAnalytics
-    _has_tiktok = True
-except ImportError:
-    _has_tiktok = False
-    TikTokUploader = None
-    TikTokAnalytics = None
+import importlib
+from typing import Any, Dict
 
-try:
-    from .instagram_provider import InstagramUploader, InstagramAnalytics
-    _has_instagram = True
-except ImportError:
-    _has_instagram = False
-    InstagramUploader = None
-    InstagramAnalytics = None
+from .mock_provider import MockLLMProvider, AsyncMockLLMProvider
 
-try:
-    from .facebook_provider import FacebookUploader, FacebookAnalytics
-    _has_facebook = True
-except ImportError:
-    _has_facebook = False
-    FacebookUploader = None
-    FacebookAnalytics = None
+# Provider name -> submodule that defines it
+_LAZY_PROVIDERS: Dict[str, str] = {
+    "OpenAIProvider": "openai_provider",
+    "AsyncOpenAIProvider": "openai_provider",
+    "OptimizedOpenAIProvider": "openai_optimized",
+    "YouTubeUploader": "youtube_provider",
+    "YouTubeAnalytics": "youtube_provider",
+    "TikTokUploader": "tiktok_provider",
+    "TikTokAnalytics": "tiktok_provider",
+    "InstagramUploader": "instagram_provider",
+    "InstagramAnalytics": "instagram_provider",
+    "FacebookUploader": "facebook_provider",
+    "FacebookAnalytics": "facebook_provider",
+    "WordPressProvider": "wordpress_provider",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_PROVIDERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    except ImportError:
+        # Optional dependency not installed
+        value = None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_PROVIDERS))
 
-try:
-    from .wordpress_provider import WordPressProvider
-    _has_wordpress = True
-except ImportError:
-    _has_wordpress = False
-    WordPressProvider = None
 
 __all__ = [
     "MockLLMProvider",
     "AsyncMockLLMProvider",
+    *_LAZY_PROVIDERS,
 ]
-
-if _has_openai:
-    __all__.extend([
-        "OpenAIProvider",
-        "AsyncOpenAIProvider",
-    ])
-
-if _has_openai_optimized:
-    __all__.extend([
-        "OptimizedOpenAIProvider",
-    ])
-
-if _has_youtube:
-    __all__.extend([
-        "YouTubeUploader",
-        "YouTubeAnalytics",
-    ])
-
-if _has_tiktok:
-    __all__.extend([
-        "TikTokUploader",
-        "TikTokAnalytics",
-    ])
-
-if _has_instagram:
-    __all__.extend([
-        "InstagramUploader",
-        "InstagramAnalytics",
-    ])
-
-if _has_facebook:
-    __all__.extend([
-        "FacebookUploader",
-        "FacebookAnalytics",
-    ])
-
-if _has_wordpress:
-    __all__.extend([
-        "WordPressProvider",
-    ])
-
@@ -9,7 +9,7 @@ import logging
 import os
 import time
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import requests
 from tenacity import (
@@ -19,6 +19,7 @@ from tenacity import (
     retry_if_exception_type,
 )
 
+from PrismQ.Shared.http_client import HttpClientPool, get_http_pool
 from PrismQ.Shared.interfaces.platform_provider import (
     IPlatformUploader,
     IPlatformAnalytics,
@@ -29,6 +30,8 @@ from PrismQ.Shared.interfaces.platform_provider import (
     PrivacyStatus,
 )
 
+from .graph_batch import GRAPH_BATCH_LIMIT, iter_graph_batches
+
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +62,7 @@ class FacebookUploader(IPlatformUploader):
         self,
         access_token: Optional[str] = None,
         page_id: Optional[str] = None,
+        http_pool: Optional[HttpClientPool] = None,
     ):
         """
         Initialize Facebook uploader.
@@ -66,7 +70,9 @@ class FacebookUploader(IPlatformUploader):
         Args:
             access_token: Facebook Page access token.
             page_id: Facebook Page ID.
+            http_pool: Shared HTTP client pool (default: process-wide pool).
         """
+        self.http = http_pool or get_http_pool()
         self.access_token = access_token or os.getenv("FACEBOOK_ACCESS_TOKEN")
         self.page_id = page_id or os.getenv("FACEBOOK_PAGE_ID")
         
@@ -97,6 +103,7 @@ class FacebookUploader(IPlatformUploader):
         self,
         video_path: str,
         metadata: VideoMetadata,
+        video_buffer: Optional[memoryview] = None,
     ) -> UploadResult:
         """
         Upload a video to Facebook Page.
@@ -104,6 +111,8 @@ class FacebookUploader(IPlatformUploader):
         Args:
             video_path: Path to the video file (must be publicly accessible URL or local file).
             metadata: Video metadata including title, description.
+            video_buffer: Contents of the local file already in memory (e.g. a
+                shared memory map); sent instead of reading the file again.
             
         Returns:
             UploadResult: Result of the upload operation.
@@ -142,7 +151,7 @@ class FacebookUploader(IPlatformUploader):
                     "published": published,
                 }
 
-                response = requests.post(upload_url, data=upload_params)
+                response = self.http.post(upload_url, data=upload_params)
                 response.raise_for_status()
                 
             else:
@@ -158,17 +167,22 @@ class FacebookUploader(IPlatformUploader):
                 
                 upload_url = f"{self.API_BASE_URL}/{self.page_id}/videos"
                 
-                with open(video_path, "rb") as video_file:
-                    files = {"source": video_file}
-                    data = {
-                        "access_token": self.access_token,
-                        "title": metadata.title[:65],
-                        "description": caption[:5000],
-                        "published": published,
-                    }
-                    
-                    response = requests.post(upload_url, data=data, files=files)
+                data = {
+                    "access_token": self.access_token,
+                    "title": metadata.title[:65],
+                    "description": caption[:5000],
+                    "published": published,
+                }
+
+                if video_buffer is not None:
+                    files = {"source": (os.path.basename(video_path), video_buffer)}
+                    response = self.http.post(upload_url, data=data, files=files)
                     response.raise_for_status()
+                else:
+                    with open(video_path, "rb") as video_file:
+                        files = {"source": video_file}
+                        response = self.http.post(upload_url, data=data, files=files)
+                        response.raise_for_status()
 
             result_data = response.json()
             
@@ -233,11 +247,13 @@ class FacebookAnalytics(IPlatformAnalytics):
     """
 
     API_BASE_URL = "https://graph.facebook.com/v18.0"
+    BULK_VIDEO_FIELDS = "views,likes.summary(true).limit(0),comments.summary(true).limit(0),shares"
 
     def __init__(
         self,
         access_token: Optional[str] = None,
         page_id: Optional[str] = None,
+        http_pool: Optional[HttpClientPool] = None,
     ):
         """
         Initialize Facebook analytics provider.
@@ -245,7 +261,9 @@ class FacebookAnalytics(IPlatformAnalytics):
         Args:
             access_token: Facebook Page access token.
             page_id: Facebook Page ID.
+            http_pool: Shared HTTP client pool (default: process-wide pool).
         """
+        self.http = http_pool or get_http_pool()
         self.access_token = access_token or os.getenv("FACEBOOK_ACCESS_TOKEN")
         self.page_id = page_id or os.getenv("FACEBOOK_PAGE_ID")
         
@@ -301,7 +319,7 @@ class FacebookAnalytics(IPlatformAnalytics):
                 "access_token": self.access_token,
             }
 
-            response = requests.get(url, params=params)
+            response = self.http.get(url, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -309,37 +327,95 @@ class FacebookAnalytics(IPlatformAnalytics):
                 logger.error(f"Facebook API error: {data['error']}")
                 return None
 
-            # Parse metrics
-            views = data.get("views", 0)
-            
-            likes_data = data.get("likes", {})
-            likes = likes_data.get("summary", {}).get("total_count", 0) if isinstance(likes_data, dict) else 0
-            
-            comments_data = data.get("comments", {})
-            comments = comments_data.get("summary", {}).get("total_count", 0) if isinstance(comments_data, dict) else 0
-            
-            shares = data.get("shares", {}).get("count", 0) if isinstance(data.get("shares"), dict) else 0
-
-            # Calculate engagement rate
-            total_engagement = likes + comments + shares
-            engagement_rate = (total_engagement / max(views, 1)) * 100 if views > 0 else 0.0
-
-            return VideoAnalytics(
-                platform=PlatformType.FACEBOOK,
-                video_id=video_id,
-                title_id="",  # Set externally
-                collected_at=datetime.now(),
-                views=views,
-                likes=likes,
-                comments=comments,
-                shares=shares,
-                engagement_rate=engagement_rate,
-            )
+            return self._parse_video(video_id, data)
 
         except requests.RequestException as e:
             logger.error(f"Failed to fetch Facebook analytics: {str(e)}")
             return None
 
+    def _parse_video(self, video_id: str, data: Dict[str, Any]) -> VideoAnalytics:
+        """Build VideoAnalytics from a video node with expanded fields."""
+        views = data.get("views", 0)
+        
+        likes_data = data.get("likes", {})
+        likes = likes_data.get("summary", {}).get("total_count", 0) if isinstance(likes_data, dict) else 0
+        
+        comments_data = data.get("comments", {})
+        comments = comments_data.get("summary", {}).get("total_count", 0) if isinstance(comments_data, dict) else 0
+        
+        shares = data.get("shares", {}).get("count", 0) if isinstance(data.get("shares"), dict) else 0
+
+        # Calculate engagement rate
+        total_engagement = likes + comments + shares
+        engagement_rate = (total_engagement / max(views, 1)) * 100 if views > 0 else 0.0
+
+        return VideoAnalytics(
+            platform=PlatformType.FACEBOOK,
+            video_id=video_id,
+            title_id="",  # Set externally
+            collected_at=datetime.now(),
+            views=views,
+            likes=likes,
+            comments=comments,
+            shares=shares,
+            engagement_rate=engagement_rate,
+        )
+
+    def iter_video_analytics(
+        self,
+        video_ids: List[str],
+        batch_size: int = GRAPH_BATCH_LIMIT,
+    ) -> Iterator[List[VideoAnalytics]]:
+        """
+        Retrieve analytics for many videos using Graph API batch requests.
+        
+        Each batch call carries up to 50 video lookups. Like and comment
+        counts come from expanded ``summary(true).limit(0)`` fields, so no
+        edge items are transferred. Videos whose lookup failed are left out.
+        
+        Args:
+            video_ids: Facebook video IDs.
+            batch_size: Video IDs per batch call (max 50).
+            
+        Yields:
+            List[VideoAnalytics]: Analytics for each completed batch.
+        """
+        if not self._authenticated:
+            if not self.authenticate():
+                return
+
+        relative_urls = {
+            video_id: f"{video_id}?fields={self.BULK_VIDEO_FIELDS}"
+            for video_id in dict.fromkeys(video_ids)
+        }
+        for batch in iter_graph_batches(
+            self.http, self.API_BASE_URL, self.access_token, relative_urls, batch_size
+        ):
+            yield [self._parse_video(video_id, body) for video_id, body in batch if body is not None]
+
+    def get_bulk_video_analytics(
+        self,
+        video_ids: List[str],
+        batch_size: int = GRAPH_BATCH_LIMIT,
+    ) -> Dict[str, VideoAnalytics]:
+        """
+        Retrieve analytics for many videos in batched calls.
+        
+        Args:
+            video_ids: Facebook video IDs.
+            batch_size: Video IDs per batch call (max 50).
+            
+        Returns:
+            Dict[str, VideoAnalytics]: Analytics keyed by video ID.
+        """
+        results = {}
+        try:
+            for batch in self.iter_video_analytics(video_ids, batch_size):
+                results.update((analytics.video_id, analytics) for analytics in batch)
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch Facebook analytics batch: {str(e)}")
+        return results
+
     def get_channel_analytics(
         self,
         start_date: Optional[datetime] = None,
@@ -367,7 +443,7 @@ class FacebookAnalytics(IPlatformAnalytics):
                 "access_token": self.access_token,
             }
 
-            response = requests.get(url, params=params)
+            response = self.http.get(url, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -0,0 +1,121 @@
+"""
+Graph API batch request helper shared by the Instagram and Facebook providers.
+
+A batch call packs up to 50 GET sub-requests into one HTTP POST, so fetching
+metrics for hundreds of media IDs costs a handful of round trips instead of
+one (or more) per video. Combined with field expansion
+(``insights.metric(...)``, ``likes.summary(true).limit(0)``) each sub-request
+returns everything needed for one video.
+
+Graph API Batch Requests Documentation:
+https://developers.facebook.com/docs/graph-api/batch-requests
+"""
+
+import json
+import logging
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import requests
+from tenacity import (
+    retry,
+    stop_after_attempt,
+    wait_exponential,
+    retry_if_exception_type,
+)
+
+from PrismQ.Shared.http_client import HttpClientPool
+
+logger = logging.getLogger(__name__)
+
+GRAPH_BATCH_LIMIT = 50
+
+
+@retry(
+    retry=retry_if_exception_type((requests.RequestException, ConnectionError)),
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=4, max=10),
+)
+def _post_batch(
+    http: HttpClientPool,
+    api_base_url: str,
+    access_token: str,
+    relative_urls: Sequence[str],
+) -> List[Optional[Dict[str, Any]]]:
+    batch = [{"method": "GET", "relative_url": url} for url in relative_urls]
+    response = http.post(
+        api_base_url,
+        data={
+            "access_token": access_token,
+            "batch": json.dumps(batch),
+            "include_headers": "false",
+        },
+    )
+    response.raise_for_status()
+    data = response.json()
+    if isinstance(data, dict) and "error" in data:
+        raise requests.HTTPError(f"Graph API batch error: {data['error']}", response=response)
+    return data
+
+
+def iter_graph_batches(
+    http: HttpClientPool,
+    api_base_url: str,
+    access_token: str,
+    requests_by_key: Dict[str, str],
+    batch_size: int = GRAPH_BATCH_LIMIT,
+) -> Iterator[List[Tuple[str, Optional[Dict[str, Any]]]]]:
+    """
+    Run GET sub-requests through Graph API batch calls.
+
+    Sub-requests the API did not complete (a null entry, which Graph API
+    returns when the batch ran out of time) are retried once in a later
+    batch. Each yielded batch pairs keys with parsed response bodies; the
+    body is None when the sub-request failed.
+
+    Args:
+        http: HTTP client pool to send the batch POSTs through
+        api_base_url: Versioned Graph API base URL
+        access_token: Access token applied to every sub-request
+        requests_by_key: Mapping of caller key (e.g. media ID) to relative URL
+        batch_size: Sub-requests per call (capped at 50)
+
+    Yields:
+        List of (key, body) pairs for each completed batch
+
+    Raises:
+        requests.RequestException: If a batch call keeps failing
+    """
+    batch_size = max(1, min(batch_size, GRAPH_BATCH_LIMIT))
+    pending = list(requests_by_key.items())
+    retried = set()
+
+    while pending:
+        chunk, pending = pending[:batch_size], pending[batch_size:]
+        responses = _post_batch(http, api_base_url, access_token, [url for _, url in chunk])
+
+        results = []
+        for (key, url), item in zip(chunk, responses):
+            if item is None:
+                if key not in retried:
+                    retried.add(key)
+                    pending.append((key, url))
+                    continue
+                logger.warning(f"Graph API batch sub-request timed out: {url}")
+                results.append((key, None))
+                continue
+
+            try:
+                body = json.loads(item.get("body") or "{}")
+            except ValueError:
+                body = {}
+            if item.get("code") != 200 or "error" in body:
+                logger.warning(
+                    f"Graph API batch sub-request failed ({item.get('code')}): "
+                    f"{body.get('error', body)}"
+                )
+                results.append((key, None))
+            else:
+                results.append((key, body))
+
+        if results:
+            yield results
@@ -9,7 +9,7 @@ import logging
 import os
 import time
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import requests
 from tenacity import (
@@ -19,6 +19,7 @@ from tenacity import (
     retry_if_exception_type,
 )
 
+from PrismQ.Shared.http_client import HttpClientPool, get_http_pool
 from PrismQ.Shared.interfaces.platform_provider import (
     IPlatformUploader,
     IPlatformAnalytics,
@@ -29,6 +30,8 @@ from PrismQ.Shared.interfaces.platform_provider import (
     PrivacyStatus,
 )
 
+from .graph_batch import GRAPH_BATCH_LIMIT, iter_graph_batches
+
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +61,7 @@ class InstagramUploader(IPlatformUploader):
         self,
         access_token: Optional[str] = None,
         instagram_user_id: Optional[str] = None,
+        http_pool: Optional[HttpClientPool] = None,
     ):
         """
         Initialize Instagram uploader.
@@ -65,7 +69,9 @@ class InstagramUploader(IPlatformUploader):
         Args:
             access_token: Facebook Graph API access token.
             instagram_user_id: Instagram Business/Creator account ID.
+            http_pool: Shared HTTP client pool (default: process-wide pool).
         """
+        self.http = http_pool or get_http_pool()
         self.access_token = access_token or os.getenv("INSTAGRAM_ACCESS_TOKEN")
         self.instagram_user_id = instagram_user_id or os.getenv("INSTAGRAM_USER_ID")
         
@@ -160,7 +166,7 @@ class InstagramUploader(IPlatformUploader):
         try:
             # Create container
             container_url = f"{self.API_BASE_URL}/{self.instagram_user_id}/media"
-            container_response = requests.post(container_url, params=container_params)
+            container_response = self.http.post(container_url, params=container_params)
             container_response.raise_for_status()
             container_data = container_response.json()
 
@@ -182,7 +188,7 @@ class InstagramUploader(IPlatformUploader):
                 time.sleep(5)  # Wait 5 seconds between checks
 
                 status_url = f"{self.API_BASE_URL}/{creation_id}"
-                status_response = requests.get(
+                status_response = self.http.get(
                     status_url,
                     params={
                         "fields": "status_code",
@@ -223,7 +229,7 @@ class InstagramUploader(IPlatformUploader):
                 "access_token": self.access_token,
             }
 
-            publish_response = requests.post(publish_url, params=publish_params)
+            publish_response = self.http.post(publish_url, params=publish_params)
             publish_response.raise_for_status()
             publish_data = publish_response.json()
 
@@ -288,11 +294,13 @@ class InstagramAnalytics(IPlatformAnalytics):
     """
 
     API_BASE_URL = "https://graph.facebook.com/v18.0"
+    MEDIA_METRICS = "plays,likes,comments,shares,saves,reach,total_interactions"
 
     def __init__(
         self,
         access_token: Optional[str] = None,
         instagram_user_id: Optional[str] = None,
+        http_pool: Optional[HttpClientPool] = None,
     ):
         """
         Initialize Instagram analytics provider.
@@ -300,7 +308,9 @@ class InstagramAnalytics(IPlatformAnalytics):
         Args:
             access_token: Facebook Graph API access token.
             instagram_user_id: Instagram Business/Creator account ID.
+            http_pool: Shared HTTP client pool (default: process-wide pool).
         """
+        self.http = http_pool or get_http_pool()
         self.access_token = access_token or os.getenv("INSTAGRAM_ACCESS_TOKEN")
         self.instagram_user_id = instagram_user_id or os.getenv("INSTAGRAM_USER_ID")
         
@@ -352,11 +362,11 @@ class InstagramAnalytics(IPlatformAnalytics):
             # Get insights for the media
             url = f"{self.API_BASE_URL}/{video_id}/insights"
             params = {
-                "metric": "plays,likes,comments,shares,saves,reach,total_interactions",
+                "metric": self.MEDIA_METRICS,
                 "access_token": self.access_token,
             }
 
-            response = requests.get(url, params=params)
+            response = self.http.get(url, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -364,40 +374,102 @@ class InstagramAnalytics(IPlatformAnalytics):
                 logger.error(f"Instagram API error: {data['error']}")
                 return None
 
-            # Parse metrics
-            metrics = {}
-            for item in data.get("data", []):
-                metric_name = item.get("name")
-                metric_value = item.get("values", [{}])[0].get("value", 0)
-                metrics[metric_name] = metric_value
+            return self._parse_insights(video_id, data.get("data", []))
 
-            views = metrics.get("plays", 0)
-            likes = metrics.get("likes", 0)
-            comments = metrics.get("comments", 0)
-            shares = metrics.get("shares", 0)
-            saves = metrics.get("saves", 0)
-            reach = metrics.get("reach", 0)
-            interactions = metrics.get("total_interactions", 0)
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch Instagram analytics: {str(e)}")
+            return None
 
-            engagement_rate = (interactions / max(reach, 1)) * 100 if reach > 0 else 0.0
+    def _parse_insights(self, video_id: str, insights: List[Dict[str, Any]]) -> VideoAnalytics:
+        """Build VideoAnalytics from an insights ``data`` list."""
+        metrics = {}
+        for item in insights:
+            metric_name = item.get("name")
+            metric_value = item.get("values", [{}])[0].get("value", 0)
+            metrics[metric_name] = metric_value
+
+        views = metrics.get("plays", 0)
+        likes = metrics.get("likes", 0)
+        comments = metrics.get("comments", 0)
+        shares = metrics.get("shares", 0)
+        saves = metrics.get("saves", 0)
+        reach = metrics.get("reach", 0)
+        interactions = metrics.get("total_interactions", 0)
+
+        engagement_rate = (interactions / max(reach, 1)) * 100 if reach > 0 else 0.0
+
+        return VideoAnalytics(
+            platform=PlatformType.INSTAGRAM,
+            video_id=video_id,
+            title_id="",  # Set externally
+            collected_at=datetime.now(),
+            views=views,
+            likes=likes,
+            comments=comments,
+            shares=shares,
+            saves=saves,
+            impressions=reach,
+            engagement_rate=engagement_rate,
+        )
 
-            return VideoAnalytics(
-                platform=PlatformType.INSTAGRAM,
-                video_id=video_id,
-                title_id="",  # Set externally
-                collected_at=datetime.now(),
-                views=views,
-                likes=likes,
-                comments=comments,
-                shares=shares,
-                saves=saves,
-                impressions=reach,
-                engagement_rate=engagement_rate,
-            )
+    def iter_video_analytics(
+        self,
+        video_ids: List[str],
+        batch_size: int = GRAPH_BATCH_LIMIT,
+    ) -> Iterator[List[VideoAnalytics]]:
+        """
+        Retrieve analytics for many Reels using Graph API batch requests.
+        
+        Each batch call carries up to 50 media lookups, and each lookup
+        expands the ``insights`` edge, so one HTTP round trip covers 50 videos.
+        Media whose lookup failed are left out of the results.
+        
+        Args:
+            video_ids: Instagram media IDs.
+            batch_size: Media IDs per batch call (max 50).
+            
+        Yields:
+            List[VideoAnalytics]: Analytics for each completed batch.
+        """
+        if not self._authenticated:
+            if not self.authenticate():
+                return
 
+        relative_urls = {
+            video_id: f"{video_id}?fields=insights.metric({self.MEDIA_METRICS})"
+            for video_id in dict.fromkeys(video_ids)
+        }
+        for batch in iter_graph_batches(
+            self.http, self.API_BASE_URL, self.access_token, relative_urls, batch_size
+        ):
+            yield [
+                self._parse_insights(video_id, body.get("insights", {}).get("data", []))
+                for video_id, body in batch
+                if body is not None
+            ]
+
+    def get_bulk_video_analytics(
+        self,
+        video_ids: List[str],
+        batch_size: int = GRAPH_BATCH_LIMIT,
+    ) -> Dict[str, VideoAnalytics]:
+        """
+        Retrieve analytics for many Reels in batched calls.
+        
+        Args:
+            video_ids: Instagram media IDs.
+            batch_size: Media IDs per batch call (max 50).
+            
+        Returns:
+            Dict[str, VideoAnalytics]: Analytics keyed by media ID.
+        """
+        results = {}
+        try:
+            for batch in self.iter_video_analytics(video_ids, batch_size):
+                results.update((analytics.video_id, analytics) for analytics in batch)
         except requests.RequestException as e:
-            logger.error(f"Failed to fetch Instagram analytics: {str(e)}")
-            return None
+            logger.error(f"Failed to fetch Instagram analytics batch: {str(e)}")
+        return results
 
     def get_channel_analytics(
         self,
@@ -437,7 +509,7 @@ class InstagramAnalytics(IPlatformAnalytics):
                 "access_token": self.access_token,
             }
 
-            response = requests.get(url, params=params)
+            response = self.http.get(url, params=params)
             response.raise_for_status()
             data = response.json()
 
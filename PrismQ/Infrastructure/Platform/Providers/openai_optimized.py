@@ -24,6 +24,8 @@ from tenacity import (
 
 from PrismQ.Shared.cache import CacheManager
 from PrismQ.Shared.interfaces.llm_provider import ILLMProvider, IAsyncLLMProvider, ChatMessage
+from PrismQ.Shared.rate_limit import get_rate_limiter, rate_key
+from PrismQ.Providers.openai_provider import OPENAI_API_URL
 
 logger = logging.getLogger(__name__)
 
@@ -108,14 +110,10 @@ class OptimizedOpenAIProvider(ILLMProvider):
         self.pricing_tier = pricing_tier
         
         self.client = OpenAI(api_key=self.api_key)
+        self.rate_key = rate_key(OPENAI_API_URL, self.api_key)
         
-        # Initialize token encoder
-        try:
-            self.encoding = tiktoken.encoding_for_model(model)
-        except KeyError:
-            # Fallback to cl100k_base for newer models
-            logger.warning(f"Model {model} not found in tiktoken, using cl100k_base encoding")
-            self.encoding = tiktoken.get_encoding("cl100k_base")
+        # Token encoder, loaded on first count_tokens() call
+        self._encoding = None
         
         # Cache setup
         self.enable_cache = enable_cache
@@ -140,6 +138,18 @@ class OptimizedOpenAIProvider(ILLMProvider):
         """Get the name of the model being used."""
         return self.model
 
+    @property
+    def encoding(self):
+        """Token encoder for the model (loading the BPE ranks is slow, so it is deferred)."""
+        if self._encoding is None:
+            try:
+                self._encoding = tiktoken.encoding_for_model(self.model)
+            except KeyError:
+                # Fallback to cl100k_base for newer models
+                logger.warning(f"Model {self.model} not found in tiktoken, using cl100k_base encoding")
+                self._encoding = tiktoken.get_encoding("cl100k_base")
+        return self._encoding
+
     def count_tokens(self, text: str) -> int:
         """
         Count tokens in text.
@@ -308,19 +318,23 @@ class OptimizedOpenAIProvider(ILLMProvider):
         Returns:
             Generated text content
         """
+        limiter = get_rate_limiter()
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                **kwargs,
-            )
+            with limiter.limit(self.rate_key):
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **kwargs,
+                )
             
             content = response.choices[0].message.content
             return content
 
         except RateLimitError as e:
+            # Pause every caller sharing this API key for the Retry-After delay
+            limiter.observe(self.rate_key, getattr(e, "response", None))
             logger.warning(f"Rate limit hit: {e}. Retrying...")
             raise
 
@@ -18,9 +18,13 @@ from tenacity import (
 )
 
 from PrismQ.Shared.interfaces.llm_provider import ILLMProvider, IAsyncLLMProvider, ChatMessage
+from PrismQ.Shared.rate_limit import get_rate_limiter, rate_key
 
 logger = logging.getLogger(__name__)
 
+# Host whose quota is tracked on the shared rate limiter (per API key)
+OPENAI_API_URL = "https://api.openai.com"
+
 
 class OpenAIProvider(ILLMProvider):
     """
@@ -58,6 +62,7 @@ class OpenAIProvider(ILLMProvider):
 
         self.model = model
         self.client = OpenAI(api_key=self.api_key)
+        self.rate_key = rate_key(OPENAI_API_URL, self.api_key)
         logger.info(f"Initialized OpenAI provider with model: {model}")
 
     @property
@@ -145,25 +150,29 @@ class OpenAIProvider(ILLMProvider):
             APIError: If API returns an error
             OpenAIError: For other OpenAI-related errors
         """
+        limiter = get_rate_limiter()
         try:
             logger.debug(
                 f"Calling OpenAI API: model={self.model}, "
                 f"temperature={temperature}, messages={len(messages)}"
             )
 
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                **kwargs,
-            )
+            with limiter.limit(self.rate_key):
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **kwargs,
+                )
 
             content = response.choices[0].message.content
             logger.debug(f"OpenAI API response received: {len(content)} characters")
             return content
 
         except RateLimitError as e:
+            # Pause every caller sharing this API key for the Retry-After delay
+            limiter.observe(self.rate_key, getattr(e, "response", None))
             logger.warning(f"Rate limit hit: {e}. Retrying...")
             raise  # Will be retried by tenacity
 
@@ -245,6 +254,7 @@ class AsyncOpenAIProvider(IAsyncLLMProvider):
 
         self.model = model
         self.client = AsyncOpenAI(api_key=self.api_key)
+        self.rate_key = rate_key(OPENAI_API_URL, self.api_key)
         logger.info(f"Initialized async OpenAI provider with model: {model}")
 
     @property
@@ -332,25 +342,29 @@ class AsyncOpenAIProvider(IAsyncLLMProvider):
             APIError: If API returns an error
             OpenAIError: For other OpenAI-related errors
         """
+        limiter = get_rate_limiter()
         try:
             logger.debug(
                 f"Calling async OpenAI API: model={self.model}, "
                 f"temperature={temperature}, messages={len(messages)}"
             )
 
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                **kwargs,
-            )
+            async with limiter.limit_async(self.rate_key):
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **kwargs,
+                )
 
             content = response.choices[0].message.content
             logger.debug(f"Async OpenAI API response received: {len(content)} characters")
             return content
 
         except RateLimitError as e:
+            # Pause every caller sharing this API key for the Retry-After delay
+            limiter.observe(self.rate_key, getattr(e, "response", None))
             logger.warning(f"Rate limit hit: {e}. Retrying...")
             raise  # Will be retried by tenacity
 
@@ -3,13 +3,20 @@ TikTok Platform Provider for video uploads and analytics.
 
 This module implements TikTok's Content Posting API for direct video uploads
 and the TikTok Business API for analytics retrieval.
+
+Videos are uploaded in fixed-size chunks streamed from disk. Each chunk is
+retried on its own, and upload progress is saved to a small JSON state file so
+an interrupted upload resumes with the remaining chunks.
 """
 
+import json
 import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 from tenacity import (
@@ -19,6 +26,7 @@ from tenacity import (
     retry_if_exception_type,
 )
 
+from PrismQ.Shared.http_client import HttpClientPool, get_http_pool
 from PrismQ.Shared.interfaces.platform_provider import (
     IPlatformUploader,
     IPlatformAnalytics,
@@ -33,12 +41,103 @@ from PrismQ.Shared.interfaces.platform_provider import (
 logger = logging.getLogger(__name__)
 
 
+class _ChunkReader:
+    """File-like view of one byte range, streamed by requests in small reads."""
+
+    def __init__(self, path: str, offset: int, length: int, buffer: Optional[memoryview] = None):
+        # Read from a shared in-memory buffer when given, otherwise from disk
+        self._buffer = buffer
+        self._position = offset
+        self._file = None
+        if buffer is None:
+            self._file = open(path, "rb")
+            self._file.seek(offset)
+        self._remaining = length
+        self.len = length
+
+    def __len__(self) -> int:
+        return self.len
+
+    def read(self, size: int = -1) -> bytes:
+        if self._remaining <= 0:
+            return b""
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        if self._buffer is not None:
+            data = bytes(self._buffer[self._position:self._position + size])
+            self._position += len(data)
+        else:
+            data = self._file.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+class UploadState:
+    """
+    Persisted progress of one chunked upload.
+
+    Stored as JSON next to the video (or in a state directory) and only reused
+    while the file's size and modification time are unchanged and the upload
+    URL has not expired.
+    """
+
+    def __init__(self, path: str, data: Dict[str, Any]):
+        self.path = path
+        self.data = data
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str) -> Optional["UploadState"]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return cls(path, json.load(f))
+        except (OSError, ValueError):
+            return None
+
+    def matches(self, video_size: int, mtime: float, chunk_size: int, max_age: float) -> bool:
+        return (
+            self.data.get("video_size") == video_size
+            and self.data.get("mtime") == mtime
+            and self.data.get("chunk_size") == chunk_size
+            and time.time() - self.data.get("created_at", 0) < max_age
+        )
+
+    @property
+    def completed(self) -> List[int]:
+        return self.data.setdefault("completed_chunks", [])
+
+    def mark_completed(self, index: int) -> None:
+        with self._lock:
+            if index not in self.completed:
+                self.completed.append(index)
+                self.completed.sort()
+            self.save()
+
+    def save(self) -> None:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f)
+        os.replace(tmp_path, self.path)
+
+    def delete(self) -> None:
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
 class TikTokUploader(IPlatformUploader):
     """
     TikTok video upload provider using Content Posting API.
     
     Requires TikTok app registration and OAuth bearer token.
-    Two-phase upload: initiate upload, then PUT video bytes.
+    Two-phase upload: initiate upload, then PUT the video in chunks with
+    Content-Range headers. Chunks are retried individually and progress is
+    persisted, so calling upload_video again after a crash resumes the upload.
     
     Example:
         >>> uploader = TikTokUploader(access_token="YOUR_TOKEN")
@@ -53,17 +152,55 @@ class TikTokUploader(IPlatformUploader):
 
     API_BASE_URL = "https://open.tiktokapis.com/v2"
 
-    def __init__(self, access_token: Optional[str] = None):
+    # Content Posting API chunk limits (the final chunk absorbs the remainder)
+    MIN_CHUNK_SIZE = 5 * 1024 * 1024
+    MAX_CHUNK_SIZE = 64 * 1024 * 1024
+    DEFAULT_CHUNK_SIZE = 10 * 1024 * 1024
+
+    # Upload URLs are valid for one hour
+    UPLOAD_URL_TTL = 3600
+
+    RETRYABLE_STATUS_CODES = (408, 429, 500, 502, 503, 504)
+
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_parallel_chunks: int = 1,
+        chunk_retries: int = 3,
+        retry_backoff: float = 1.0,
+        state_dir: Optional[str] = None,
+        status_poll_interval: float = 3.0,
+        api_base_url: Optional[str] = None,
+        http_pool: Optional[HttpClientPool] = None,
+    ):
         """
         Initialize TikTok uploader.
         
         Args:
             access_token: OAuth access token for TikTok API.
+            chunk_size: Bytes per upload chunk (clamped to the API limits).
+            max_parallel_chunks: Chunks uploaded concurrently (1 = in order).
+            chunk_retries: Attempts per chunk before the upload is paused.
+            retry_backoff: Base delay in seconds between chunk attempts (doubles).
+            state_dir: Directory for upload progress files (default: next to the video).
+            status_poll_interval: Seconds between publish status checks.
+            api_base_url: Override the API base URL (e.g. a local test server).
+            http_pool: Shared HTTP client pool (default: process-wide pool).
         """
+        self.http = http_pool or get_http_pool()
         self.access_token = access_token or os.getenv("TIKTOK_ACCESS_TOKEN")
         if not self.access_token:
             logger.warning("No TikTok access token provided")
         self._authenticated = bool(self.access_token)
+        self.chunk_size = chunk_size
+        self.max_parallel_chunks = max(1, max_parallel_chunks)
+        self.chunk_retries = max(1, chunk_retries)
+        self.retry_backoff = retry_backoff
+        self.state_dir = state_dir
+        self.status_poll_interval = status_poll_interval
+        if api_base_url:
+            self.API_BASE_URL = api_base_url.rstrip("/")
 
     def authenticate(self) -> bool:
         """
@@ -85,6 +222,114 @@ class TikTokUploader(IPlatformUploader):
             "Content-Type": "application/json",
         }
 
+    def plan_chunks(self, video_size: int) -> Tuple[int, int]:
+        """
+        Choose the chunk size and count for a video.
+        
+        The configured size is clamped to the API limits; videos no larger than
+        that go up in one chunk, otherwise the last chunk takes the remainder.
+        
+        Args:
+            video_size: Video size in bytes.
+            
+        Returns:
+            Tuple of (chunk_size, total_chunk_count).
+        """
+        chunk_size = min(max(self.chunk_size, self.MIN_CHUNK_SIZE), self.MAX_CHUNK_SIZE)
+        if video_size <= chunk_size:
+            return video_size, 1
+        return chunk_size, video_size // chunk_size
+
+    @staticmethod
+    def _chunk_range(index: int, chunk_size: int, chunk_count: int, video_size: int) -> Tuple[int, int]:
+        """First and last byte of a chunk (inclusive)."""
+        first = index * chunk_size
+        last = video_size - 1 if index == chunk_count - 1 else first + chunk_size - 1
+        return first, last
+
+    def _state_path(self, video_path: str) -> str:
+        """Path of the progress file for a video."""
+        if self.state_dir:
+            os.makedirs(self.state_dir, exist_ok=True)
+            name = os.path.basename(os.path.abspath(video_path))
+            return os.path.join(self.state_dir, f"{name}.tiktok_upload.json")
+        return f"{video_path}.tiktok_upload.json"
+
+    def _upload_chunk(
+        self,
+        upload_url: str,
+        video_path: str,
+        index: int,
+        chunk_size: int,
+        chunk_count: int,
+        video_size: int,
+        video_buffer: Optional[memoryview] = None,
+    ) -> None:
+        """
+        PUT one chunk, retrying transient failures with exponential backoff.
+        
+        Raises:
+            requests.RequestException: If the chunk still fails after all attempts.
+        """
+        first, last = self._chunk_range(index, chunk_size, chunk_count, video_size)
+        headers = {
+            "Content-Type": "video/mp4",
+            "Content-Length": str(last - first + 1),
+            "Content-Range": f"bytes {first}-{last}/{video_size}",
+        }
+
+        for attempt in range(1, self.chunk_retries + 1):
+            reader = _ChunkReader(video_path, first, last - first + 1, video_buffer)
+            try:
+                response = self.http.put(upload_url, headers=headers, data=reader)
+                if response.status_code in self.RETRYABLE_STATUS_CODES and attempt < self.chunk_retries:
+                    raise requests.HTTPError(f"HTTP {response.status_code}", response=response)
+                response.raise_for_status()
+                return
+            except requests.RequestException as e:
+                status = getattr(e.response, "status_code", None)
+                if status is not None and status not in self.RETRYABLE_STATUS_CODES:
+                    raise
+                if attempt == self.chunk_retries:
+                    raise
+                delay = self.retry_backoff * (2 ** (attempt - 1))
+                logger.warning(
+                    f"TikTok chunk {index + 1}/{chunk_count} failed ({e}); "
+                    f"retrying in {delay:.1f}s (attempt {attempt}/{self.chunk_retries})"
+                )
+                time.sleep(delay)
+            finally:
+                reader.close()
+
+    def _upload_chunks(
+        self,
+        state: UploadState,
+        video_path: str,
+        video_buffer: Optional[memoryview] = None,
+    ) -> None:
+        """Upload every chunk not yet recorded as completed."""
+        data = state.data
+        chunk_size, chunk_count, video_size = data["chunk_size"], data["chunk_count"], data["video_size"]
+        pending = [i for i in range(chunk_count) if i not in state.completed]
+        if len(pending) < chunk_count:
+            logger.info(f"Resuming TikTok upload: {len(pending)}/{chunk_count} chunks left")
+
+        def upload(index: int) -> None:
+            self._upload_chunk(
+                data["upload_url"], video_path, index, chunk_size, chunk_count, video_size, video_buffer
+            )
+            state.mark_completed(index)
+            logger.debug(f"Uploaded TikTok chunk {index + 1}/{chunk_count}")
+
+        if self.max_parallel_chunks == 1 or len(pending) == 1:
+            for index in pending:
+                upload(index)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_parallel_chunks) as pool:
+            for future in [pool.submit(upload, index) for index in pending]:
+                future.result()
+
     @retry(
         retry=retry_if_exception_type((requests.RequestException, ConnectionError)),
         stop=stop_after_attempt(3),
@@ -94,6 +339,7 @@ class TikTokUploader(IPlatformUploader):
         self,
         video_path: str,
         metadata: VideoMetadata,
+        video_buffer: Optional[memoryview] = None,
     ) -> UploadResult:
         """
         Upload a video to TikTok using Content Posting API.
@@ -101,6 +347,8 @@ class TikTokUploader(IPlatformUploader):
         Args:
             video_path: Path to the video file.
             metadata: Video metadata including caption and hashtags.
+            video_buffer: Contents of the file already in memory (e.g. a shared
+                memory map); chunks are sliced from it instead of read from disk.
             
         Returns:
             UploadResult: Result of the upload operation.
@@ -120,8 +368,15 @@ class TikTokUploader(IPlatformUploader):
                 error_message=f"Video file not found: {video_path}",
             )
 
-        # Get video file size
-        video_size = os.path.getsize(video_path)
+        # Get video file size and chunk layout
+        video_size = len(video_buffer) if video_buffer is not None else os.path.getsize(video_path)
+        chunk_size, chunk_count = self.plan_chunks(video_size)
+        mtime = os.path.getmtime(video_path)
+        state_path = self._state_path(video_path)
+        state = UploadState.load(state_path)
+        if state and not state.matches(video_size, mtime, chunk_size, self.UPLOAD_URL_TTL):
+            state.delete()
+            state = None
 
         # Map privacy status
         privacy_level_map = {
@@ -151,50 +406,50 @@ class TikTokUploader(IPlatformUploader):
             "source_info": {
                 "source": "FILE_UPLOAD",
                 "video_size": video_size,
-                "chunk_size": video_size,  # Single chunk upload
-                "total_chunk_count": 1,
+                "chunk_size": chunk_size,
+                "total_chunk_count": chunk_count,
             },
         }
 
         try:
-            # Initiate upload
-            response = requests.post(
-                f"{self.API_BASE_URL}/post/publish/video/init/",
-                headers=self._get_headers(),
-                json=init_payload,
-            )
-            response.raise_for_status()
-            init_data = response.json()
-
-            if init_data.get("error"):
-                error_msg = init_data["error"].get("message", "Unknown error")
-                logger.error(f"TikTok upload init failed: {error_msg}")
-                return UploadResult(
-                    success=False,
-                    platform=PlatformType.TIKTOK,
-                    error_message=error_msg,
+            if state is None:
+                # Initiate upload
+                response = self.http.post(
+                    f"{self.API_BASE_URL}/post/publish/video/init/",
+                    headers=self._get_headers(),
+                    json=init_payload,
                 )
+                response.raise_for_status()
+                init_data = response.json()
 
-            publish_id = init_data["data"]["publish_id"]
-            upload_url = init_data["data"]["upload_url"]
-
-            # Phase 2: Upload video file
-            logger.info(f"Uploading video to TikTok (publish_id: {publish_id})")
-
-            with open(video_path, "rb") as video_file:
-                video_bytes = video_file.read()
-
-            upload_headers = {
-                "Content-Type": "video/mp4",
-                "Content-Range": f"bytes 0-{video_size - 1}/{video_size}",
-            }
+                if init_data.get("error") and init_data["error"].get("code", "error") != "ok":
+                    error_msg = init_data["error"].get("message", "Unknown error")
+                    logger.error(f"TikTok upload init failed: {error_msg}")
+                    return UploadResult(
+                        success=False,
+                        platform=PlatformType.TIKTOK,
+                        error_message=error_msg,
+                    )
 
-            upload_response = requests.put(
-                upload_url,
-                headers=upload_headers,
-                data=video_bytes,
+                state = UploadState(state_path, {
+                    "publish_id": init_data["data"]["publish_id"],
+                    "upload_url": init_data["data"]["upload_url"],
+                    "video_size": video_size,
+                    "mtime": mtime,
+                    "chunk_size": chunk_size,
+                    "chunk_count": chunk_count,
+                    "created_at": time.time(),
+                    "completed_chunks": [],
+                })
+                state.save()
+
+            publish_id = state.data["publish_id"]
+
+            # Phase 2: Upload video file in chunks
+            logger.info(
+                f"Uploading video to TikTok in {chunk_count} chunk(s) (publish_id: {publish_id})"
             )
-            upload_response.raise_for_status()
+            self._upload_chunks(state, video_path, video_buffer)
 
             # Phase 3: Check upload status
             logger.info("Checking TikTok upload status...")
@@ -202,9 +457,9 @@ class TikTokUploader(IPlatformUploader):
             
             max_attempts = 10
             for attempt in range(max_attempts):
-                time.sleep(3)  # Wait before checking status
+                time.sleep(self.status_poll_interval)  # Wait before checking status
                 
-                status_response = requests.post(
+                status_response = self.http.post(
                     status_url,
                     headers=self._get_headers(),
                     json={"publish_id": publish_id},
@@ -215,6 +470,7 @@ class TikTokUploader(IPlatformUploader):
                 status = status_data["data"]["status"]
                 
                 if status == "PUBLISH_COMPLETE":
+                    state.delete()
                     video_id = status_data["data"].get("video_id")
                     logger.info(f"TikTok upload successful: {video_id}")
                     
@@ -226,6 +482,7 @@ class TikTokUploader(IPlatformUploader):
                         upload_time=datetime.now(),
                     )
                 elif status == "FAILED":
+                    state.delete()
                     error_msg = status_data["data"].get("fail_reason", "Upload failed")
                     logger.error(f"TikTok upload failed: {error_msg}")
                     return UploadResult(
@@ -246,6 +503,8 @@ class TikTokUploader(IPlatformUploader):
 
         except requests.RequestException as e:
             logger.error(f"TikTok upload request failed: {str(e)}")
+            if state is not None:
+                logger.info(f"TikTok upload progress saved to {state.path}; upload again to resume")
             return UploadResult(
                 success=False,
                 platform=PlatformType.TIKTOK,
@@ -281,13 +540,15 @@ class TikTokAnalytics(IPlatformAnalytics):
 
     API_BASE_URL = "https://open.tiktokapis.com/v2"
 
-    def __init__(self, access_token: Optional[str] = None):
+    def __init__(self, access_token: Optional[str] = None, http_pool: Optional[HttpClientPool] = None):
         """
         Initialize TikTok analytics provider.
         
         Args:
             access_token: OAuth access token for TikTok API.
+            http_pool: Shared HTTP client pool (default: process-wide pool).
         """
+        self.http = http_pool or get_http_pool()
         self.access_token = access_token or os.getenv("TIKTOK_ACCESS_TOKEN")
         if not self.access_token:
             logger.warning("No TikTok access token provided")
@@ -357,7 +618,7 @@ class TikTokAnalytics(IPlatformAnalytics):
                 ],
             }
 
-            response = requests.post(
+            response = self.http.post(
                 url,
                 headers=self._get_headers(),
                 json=payload,
@@ -431,7 +692,7 @@ class TikTokAnalytics(IPlatformAnalytics):
                 ],
             }
 
-            response = requests.post(
+            response = self.http.post(
                 url,
                 headers=self._get_headers(),
                 json=payload,
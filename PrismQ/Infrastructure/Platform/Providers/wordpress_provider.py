@@ -17,6 +17,8 @@ import requests
 from tenacity import (retry, retry_if_exception_type, stop_after_attempt,
                       wait_exponential)
 
+from PrismQ.Shared.http_client import HttpClientPool, get_http_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -49,6 +51,7 @@ class WordPressProvider:
         username: Optional[str] = None,
         app_password: Optional[str] = None,
         oauth_token: Optional[str] = None,
+        http_pool: Optional[HttpClientPool] = None,
     ):
         """
         Initialize WordPress provider.
@@ -58,7 +61,9 @@ class WordPressProvider:
             username: WordPress username (for Application Password auth)
             app_password: WordPress Application Password
             oauth_token: OAuth token (alternative to username/password)
+            http_pool: Shared HTTP client pool (default: process-wide pool)
         """
+        self.http = http_pool or get_http_pool()
         self.site_url = (site_url or os.getenv("WORDPRESS_SITE_URL", "")).rstrip("/")
         self.username = username or os.getenv("WORDPRESS_USERNAME")
         self.app_password = app_password or os.getenv("WORDPRESS_APP_PASSWORD")
@@ -109,7 +114,7 @@ class WordPressProvider:
         try:
             # Test authentication with a simple request
             headers = self._get_auth_headers()
-            response = requests.get(
+            response = self.http.get(
                 (
                     f"{self.api_base_url}/users/me"
                     if "wordpress.com" in self.site_url
@@ -226,7 +231,7 @@ class WordPressProvider:
 
             logger.info(f"Creating WordPress draft post: {title}")
 
-            response = requests.post(endpoint, json=post_data, headers=headers, timeout=30)
+            response = self.http.post(endpoint, json=post_data, headers=headers, timeout=30)
 
             if response.status_code in (200, 201):
                 data = response.json()
@@ -337,7 +342,7 @@ class WordPressProvider:
 
             logger.info(f"Updating WordPress post: {post_id}")
 
-            response = requests.post(endpoint, json=update_data, headers=headers, timeout=30)
+            response = self.http.post(endpoint, json=update_data, headers=headers, timeout=30)
 
             if response.status_code == 200:
                 data = response.json()
@@ -380,7 +385,7 @@ class WordPressProvider:
             headers = self._get_auth_headers()
             endpoint = f"{self.api_base_url}/posts/{post_id}"
 
-            response = requests.get(endpoint, headers=headers, timeout=10)
+            response = self.http.get(endpoint, headers=headers, timeout=10)
 
             if response.status_code == 200:
                 return response.json()
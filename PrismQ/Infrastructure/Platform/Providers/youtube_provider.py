@@ -9,7 +9,7 @@ import logging
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from tenacity import (
     retry,
@@ -27,6 +27,7 @@ from PrismQ.Shared.interfaces.platform_provider import (
     VideoAnalytics,
     PrivacyStatus,
 )
+from PrismQ.Shared.rate_limit import TokenBucket, get_rate_limiter
 
 
 logger = logging.getLogger(__name__)
@@ -267,12 +268,24 @@ class YouTubeAnalytics(IPlatformAnalytics):
         >>> analytics = YouTubeAnalytics(credentials_path="client_secret.json")
         >>> data = analytics.get_video_analytics("VIDEO_ID")
         >>> print(f"Views: {data.views}, Likes: {data.likes}")
+        >>> bulk = analytics.get_bulk_video_analytics(["ID1", "ID2", "ID3"])
     """
 
+    VIDEO_METRICS = "views,likes,comments,shares,estimatedMinutesWatched,averageViewDuration"
+    # Video IDs accepted in one 'video==' filter
+    MAX_FILTER_VIDEOS = 500
+    # Rows per page of a dimensions=video report
+    MAX_RESULTS = 200
+    # Shared rate limiter key of the Analytics API host
+    RATE_KEY = "https://youtubeanalytics.googleapis.com"
+
     def __init__(
         self,
         credentials_path: Optional[str] = None,
         token_path: Optional[str] = None,
+        queries_per_second: float = 1.0,
+        quota_burst: int = 5,
+        analytics_service: Optional[Any] = None,
     ):
         """
         Initialize YouTube analytics provider.
@@ -280,6 +293,10 @@ class YouTubeAnalytics(IPlatformAnalytics):
         Args:
             credentials_path: Path to OAuth 2.0 client secret JSON file.
             token_path: Path to save/load OAuth tokens.
+            queries_per_second: Sustained Analytics API report queries per second.
+            quota_burst: Report queries allowed back to back before throttling.
+            analytics_service: Pre-built youtubeAnalytics v2 service (skips OAuth,
+                e.g. a recorded-response fake in tests).
         """
         self.credentials_path = credentials_path or os.getenv(
             "YOUTUBE_CREDENTIALS_PATH", "credentials/youtube_client_secret.json"
@@ -287,9 +304,10 @@ class YouTubeAnalytics(IPlatformAnalytics):
         self.token_path = token_path or os.getenv(
             "YOUTUBE_TOKEN_PATH", "credentials/youtube_token.json"
         )
-        self.youtube_analytics = None
+        self.youtube_analytics = analytics_service
         self.youtube_data = None
-        self._authenticated = False
+        self._authenticated = analytics_service is not None
+        self.quota = TokenBucket(rate=queries_per_second, capacity=quota_burst)
 
     def authenticate(self) -> bool:
         """
@@ -414,6 +432,132 @@ class YouTubeAnalytics(IPlatformAnalytics):
             logger.error(f"Failed to fetch YouTube analytics: {str(e)}")
             return None
 
+    @retry(
+        retry=retry_if_exception_type(Exception),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+    )
+    def _query_report(self, **params: Any) -> Dict[str, Any]:
+        """Run one Analytics API report query, waiting for quota first."""
+        self.quota.acquire()
+        limiter = get_rate_limiter()
+        with limiter.limit(self.RATE_KEY):
+            try:
+                return self.youtube_analytics.reports().query(**params).execute()
+            except Exception as e:
+                # googleapiclient HttpError carries the HTTP response as .resp
+                limiter.feedback(self.RATE_KEY, getattr(getattr(e, "resp", None), "status", None))
+                raise
+
+    def _row_to_analytics(self, row: Dict[str, Any], collected_at: datetime) -> VideoAnalytics:
+        """Build VideoAnalytics from a report row keyed by column name."""
+        views = int(row.get("views", 0))
+        likes = int(row.get("likes", 0))
+        comments = int(row.get("comments", 0))
+        shares = int(row.get("shares", 0))
+
+        return VideoAnalytics(
+            platform=PlatformType.YOUTUBE,
+            video_id=row["video"],
+            title_id="",  # Set externally
+            collected_at=collected_at,
+            views=views,
+            likes=likes,
+            comments=comments,
+            shares=shares,
+            watch_time_seconds=float(row.get("estimatedMinutesWatched", 0.0)) * 60,
+            average_view_duration=float(row.get("averageViewDuration", 0.0)),
+            engagement_rate=(likes + comments + shares) / max(views, 1) * 100,
+        )
+
+    def iter_video_analytics(
+        self,
+        video_ids: List[str],
+        batch_size: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Iterator[List[VideoAnalytics]]:
+        """
+        Retrieve analytics for many videos with dimensions=video reports.
+        
+        Video IDs are grouped into 'video==id1,id2,...' filters of up to
+        MAX_FILTER_VIDEOS IDs, and each report is paged MAX_RESULTS rows at
+        a time. Every query takes a token from the quota bucket first.
+        Videos with no activity in the date range have no report row and are
+        left out of the results.
+        
+        Args:
+            video_ids: YouTube video IDs.
+            batch_size: Video IDs per filter (default and max: MAX_FILTER_VIDEOS).
+            start_date: Start date for analytics (default: 7 days ago).
+            end_date: End date for analytics (default: today).
+            
+        Yields:
+            List[VideoAnalytics]: Analytics for each page of report rows.
+        """
+        if not self._authenticated:
+            self.authenticate()
+
+        from datetime import timedelta
+
+        if not end_date:
+            end_date = datetime.now()
+        if not start_date:
+            start_date = end_date - timedelta(days=7)
+
+        batch_size = min(batch_size or self.MAX_FILTER_VIDEOS, self.MAX_FILTER_VIDEOS)
+        unique_ids = list(dict.fromkeys(video_ids))
+
+        for batch_start in range(0, len(unique_ids), batch_size):
+            batch = unique_ids[batch_start:batch_start + batch_size]
+            start_index = 1
+            while True:
+                response = self._query_report(
+                    ids="channel==MINE",
+                    startDate=start_date.strftime("%Y-%m-%d"),
+                    endDate=end_date.strftime("%Y-%m-%d"),
+                    metrics=self.VIDEO_METRICS,
+                    dimensions="video",
+                    filters=f"video=={','.join(batch)}",
+                    sort="-views",
+                    maxResults=self.MAX_RESULTS,
+                    startIndex=start_index,
+                )
+                columns = [header["name"] for header in response.get("columnHeaders", [])]
+                rows = response.get("rows") or []
+                collected_at = datetime.now()
+                if rows:
+                    yield [self._row_to_analytics(dict(zip(columns, row)), collected_at) for row in rows]
+                if len(rows) < self.MAX_RESULTS:
+                    break
+                start_index += len(rows)
+
+    def get_bulk_video_analytics(
+        self,
+        video_ids: List[str],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Dict[str, VideoAnalytics]:
+        """
+        Retrieve analytics for many videos in as few report queries as possible.
+        
+        Args:
+            video_ids: YouTube video IDs.
+            start_date: Start date for analytics (default: 7 days ago).
+            end_date: End date for analytics (default: today).
+            
+        Returns:
+            Dict[str, VideoAnalytics]: Analytics keyed by video ID; videos
+            without data are missing.
+        """
+        results = {}
+        try:
+            for page in self.iter_video_analytics(video_ids, start_date=start_date, end_date=end_date):
+                results.update((analytics.video_id, analytics) for analytics in page)
+        except Exception as e:
+            logger.error(f"Failed to fetch YouTube bulk analytics: {str(e)}")
+        return results
+
     def get_channel_analytics(
         self,
         start_date: Optional[datetime] = None,
@@ -17,10 +17,17 @@ Usage:
 
     # Check without saving report
     python scripts/check_video_quality.py /path/to/video.mp4 --no-save
+
+    # Re-use probe results for unchanged files between runs
+    python scripts/check_video_quality.py /path/to/directory/ --probe-cache cache/media_probe.json
+
+    # Also scan frame content (black frames, freezes, silence) with 4 worker processes
+    python scripts/check_video_quality.py /path/to/directory/ --deep --workers 4 --time-budget 30
 """
 
 import os
 import sys
+import time
 import argparse
 from pathlib import Path
 from glob import glob
@@ -31,10 +38,15 @@ sys.path.insert(
 )
 
 from Tools.VideoQualityChecker import VideoQualityChecker
+from PrismQ.Shared.media_probe import get_media_probe
 
 
 def check_single_video(
-    video_path: str, title_id: str = None, save_report: bool = True, output_dir: str = None
+    video_path: str,
+    title_id: str = None,
+    save_report: bool = True,
+    output_dir: str = None,
+    checker: VideoQualityChecker = None,
 ):
     """
     Check quality of a single video file.
@@ -44,6 +56,7 @@ def check_single_video(
         title_id: Optional title ID for the report
         save_report: Whether to save QC report
         output_dir: Directory to save report (defaults to video directory)
+        checker: Configured checker (defaults to metadata-only checks)
     """
     print(f"\n{'='*70}")
     print(f"Checking: {video_path}")
@@ -53,7 +66,7 @@ def check_single_video(
         print(f"❌ Error: Video file not found: {video_path}")
         return False
 
-    checker = VideoQualityChecker()
+    checker = checker or VideoQualityChecker()
 
     passed, report = checker.check_video_quality(
         video_path, title_id=title_id, save_report=save_report, output_dir=output_dir
@@ -94,7 +107,13 @@ def check_single_video(
     return passed
 
 
-def check_directory(directory_path: str, pattern: str = "*.mp4", save_reports: bool = True):
+def check_directory(
+    directory_path: str,
+    pattern: str = "*.mp4",
+    save_reports: bool = True,
+    checker: VideoQualityChecker = None,
+    workers: int = None,
+):
     """
     Check quality of all videos in a directory.
 
@@ -102,6 +121,8 @@ def check_directory(directory_path: str, pattern: str = "*.mp4", save_reports: b
         directory_path: Path to directory
         pattern: File pattern to match (default: *.mp4)
         save_reports: Whether to save QC reports
+        checker: Configured checker (defaults to metadata-only checks)
+        workers: Worker processes for deep scans (default: CPU count)
     """
     print(f"\n{'='*70}")
     print(f"Batch Quality Check: {directory_path}")
@@ -117,18 +138,53 @@ def check_directory(directory_path: str, pattern: str = "*.mp4", save_reports: b
 
     print(f"\nFound {len(video_files)} video file(s)")
 
+    checker = checker or VideoQualityChecker()
+    if checker.deep:
+        # Frame scans run in a process pool; only summaries are printed
+        start = time.perf_counter()
+        results = []
+        for video_path, passed, report in checker.check_videos(
+            video_files, max_workers=workers, save_reports=save_reports
+        ):
+            scan = report.get("deep_scan", {})
+            truncated = " (time budget reached)" if scan.get("truncated") else ""
+            print(
+                f"{'✅' if passed else '❌'} {os.path.basename(video_path)}: "
+                f"score {report['quality_score']}, "
+                f"{scan.get('analyzed_seconds', 0)}s scanned{truncated}"
+            )
+            for issue in report.get("issues", []) + report.get("warnings", []):
+                print(f"   └─ {issue}")
+            results.append((video_path, passed))
+        print(f"\nDeep-checked {len(results)} video(s) in {time.perf_counter() - start:.1f}s")
+        _print_summary(results)
+        return
+
+    # Probe all files concurrently up front; per-video checks then hit the cache
+    start = time.perf_counter()
+    checker.prefetch_metadata(video_files)
+    stats = get_media_probe().get_stats()
+    print(
+        f"Probed metadata in {time.perf_counter() - start:.1f}s "
+        f"({stats['hits']} cached, {stats['misses']} probed)"
+    )
+
     results = []
     for i, video_path in enumerate(video_files, 1):
         print(f"\n[{i}/{len(video_files)}] Processing: {os.path.basename(video_path)}")
 
         try:
-            passed = check_single_video(video_path, save_report=save_reports)
+            passed = check_single_video(video_path, save_report=save_reports, checker=checker)
             results.append((video_path, passed))
         except Exception as e:
             print(f"❌ Error checking {video_path}: {e}")
             results.append((video_path, False))
 
-    # Print summary
+    _print_summary(results)
+
+
+def _print_summary(results):
+    """Print pass/fail summary for (video_path, passed) results."""
     print(f"\n{'='*70}")
     print("Batch Summary")
     print(f"{'='*70}")
@@ -190,9 +246,47 @@ Examples:
         "--pattern", default="*.mp4", help="File pattern for batch processing (default: *.mp4)"
     )
 
+    parser.add_argument(
+        "--probe-cache",
+        dest="probe_cache",
+        help="JSON file caching ffprobe results between runs (keyed on path, size, mtime)",
+    )
+
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="Also scan frame content for black frames, freezes and silence gaps",
+    )
+
+    parser.add_argument(
+        "--sample-fps",
+        dest="sample_fps",
+        type=float,
+        default=VideoQualityChecker.DEEP_SAMPLE_FPS,
+        help="Frames per second sampled in deep mode (default: %(default)s)",
+    )
+
+    parser.add_argument(
+        "--time-budget",
+        dest="time_budget",
+        type=float,
+        default=VideoQualityChecker.DEEP_TIME_BUDGET,
+        help="Seconds of deep scanning allowed per video (default: %(default)s)",
+    )
+
+    parser.add_argument(
+        "--workers", type=int, help="Worker processes for deep directory scans (default: CPU count)"
+    )
+
     args = parser.parse_args()
 
+    if args.probe_cache:
+        get_media_probe(cache_path=args.probe_cache)
+
     path = os.path.abspath(args.path)
+    checker = VideoQualityChecker(
+        deep=args.deep, sample_fps=args.sample_fps, time_budget=args.time_budget
+    )
 
     if not os.path.exists(path):
         print(f"❌ Error: Path does not exist: {path}")
@@ -206,11 +300,18 @@ Examples:
                 title_id=args.title_id,
                 save_report=args.save_report,
                 output_dir=args.output_dir,
+                checker=checker,
             )
             return 0 if passed else 1
         elif os.path.isdir(path):
             # Check directory
-            check_directory(path, pattern=args.pattern, save_reports=args.save_report)
+            check_directory(
+                path,
+                pattern=args.pattern,
+                save_reports=args.save_report,
+                checker=checker,
+                workers=args.workers,
+            )
             return 0
         else:
             print(f"❌ Error: Invalid path type: {path}")
@@ -13,12 +13,20 @@ For each segment/age:
 
 import os
 import json
+import heapq
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional
 import sys
 
+import numpy as np
+
+# Add scripts directory to path to import segment_executor
+sys.path.insert(0, str(Path(__file__).parent))
+from segment_executor import add_jobs_argument, print_segment_summary, run_segments
+
 
 # Default scoring configuration (fallback if scoring.yaml is not found)
 DEFAULT_SCORING_CONFIG = {
@@ -37,6 +45,24 @@ DEFAULT_SCORING_CONFIG = {
     },
 }
 
+# Accepted spellings for each viral metric, in lookup priority order
+SCORE_FIELDS = {
+    "novelty": ["novelty", "novelty_score"],
+    "emotional": ["emotional_impact", "emotional", "emotional_score"],
+    "clarity": ["clarity", "clarity_score"],
+    "replay": ["replay_value", "replay", "replay_score"],
+    "share": ["shareability", "share", "share_score"],
+}
+
+# Precomputed scores that take precedence over the weighted components
+OVERRIDE_SCORE_FIELDS = ["final_score", "overall_score"]
+
+# Scores used when the weighted components sum to zero
+FALLBACK_SCORE_FIELDS = ["quality_score", "viral_score", "score"]
+
+# Content ID spellings used to match items against the dedup report
+ID_FIELDS = ["id", "content_id", "_id"]
+
 
 def load_config(config_path: str = None) -> Dict:
     """
@@ -234,15 +260,7 @@ def calculate_final_score(item: Dict, config: Dict) -> float:
     final_score = 0.0
 
     # Try different possible score field names
-    score_fields = {
-        "novelty": ["novelty", "novelty_score"],
-        "emotional": ["emotional_impact", "emotional", "emotional_score"],
-        "clarity": ["clarity", "clarity_score"],
-        "replay": ["replay_value", "replay", "replay_score"],
-        "share": ["shareability", "share", "share_score"],
-    }
-
-    for metric, possible_fields in score_fields.items():
+    for metric, possible_fields in SCORE_FIELDS.items():
         value = None
         for field in possible_fields:
             if field in item:
@@ -265,6 +283,182 @@ def calculate_final_score(item: Dict, config: Dict) -> float:
     return final_score
 
 
+def detect_score_schema(content: List[Dict]) -> Dict:
+    """
+    Detect which score field spellings a content file actually uses.
+
+    One pass collects the keys present across all items, so the per-item
+    work later only touches spellings that exist in this file.
+
+    Args:
+        content: List of scored content items
+
+    Returns:
+        Dictionary with present 'overrides', 'components' (per metric),
+        'fallbacks' and 'ids' field names, each in priority order
+    """
+    present = set()
+    for item in content:
+        present.update(item.keys())
+
+    return {
+        "overrides": [f for f in OVERRIDE_SCORE_FIELDS if f in present],
+        "components": {
+            metric: [f for f in fields if f in present] for metric, fields in SCORE_FIELDS.items()
+        },
+        "fallbacks": [f for f in FALLBACK_SCORE_FIELDS if f in present],
+        "ids": [f for f in ID_FIELDS if f in present],
+    }
+
+
+def _first_present(content: List[Dict], fields: List[str]) -> List:
+    """Return, per item, the value of the first field it contains (None if none)."""
+    if not fields:
+        return [None] * len(content)
+    if len(fields) == 1:
+        field = fields[0]
+        return [item.get(field) for item in content]
+
+    values = []
+    for item in content:
+        value = None
+        for field in fields:
+            if field in item:
+                value = item[field]
+                break
+        values.append(value)
+    return values
+
+
+def _to_float_column(values: List) -> np.ndarray:
+    """Convert raw values to a float column with NaN for missing values."""
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+
+def compute_final_scores(
+    content: List[Dict], config: Dict, schema: Optional[Dict] = None
+) -> np.ndarray:
+    """
+    Calculate final ranking scores for all items at once.
+
+    Vectorized equivalent of calling calculate_final_score() per item.
+
+    Args:
+        content: List of scored content items
+        config: Configuration dictionary
+        schema: Result of detect_score_schema() (detected if not provided)
+
+    Returns:
+        Float array of final scores, one per item
+    """
+    if schema is None:
+        schema = detect_score_schema(content)
+
+    scoring_config = config.get("viral", {})
+    default_weights = DEFAULT_SCORING_CONFIG["viral"]
+
+    # Accumulate metric by metric, in the same order as calculate_final_score
+    totals = np.zeros(len(content), dtype=np.float64)
+    for metric, fields in schema["components"].items():
+        if not fields:
+            continue
+        column = _to_float_column(_first_present(content, fields))
+        weight = scoring_config.get(metric, default_weights[metric])
+        totals += np.where(np.isnan(column), 0.0, column * weight)
+
+    fallback = _to_float_column(_first_present(content, schema["fallbacks"]))
+    totals = np.where((totals == 0) & ~np.isnan(fallback), fallback, totals)
+
+    override = _to_float_column(_first_present(content, schema["overrides"]))
+    return np.where(np.isnan(override), totals, override)
+
+
+@lru_cache(maxsize=128)
+def _parse_duplicate_ids(dedup_file: str, mtime_ns: int, size: int) -> FrozenSet[str]:
+    """Parse a dedup report once per (path, mtime, size)."""
+    with open(dedup_file, "r", encoding="utf-8") as f:
+        return frozenset(get_duplicate_ids(json.load(f)))
+
+
+def load_duplicate_ids(scores_path: Path, gender: str, age: str) -> FrozenSet[str]:
+    """
+    Load the duplicate ID set for a segment, cached per dedup report file.
+
+    Args:
+        scores_path: Base path to scores directory
+        gender: Target gender (men/women)
+        age: Target age range
+
+    Returns:
+        Frozen set of duplicate content IDs (empty if no report exists)
+    """
+    dedup_file = find_latest_file(scores_path / gender / age, "dedup_report_*.json")
+    if not dedup_file:
+        return frozenset()
+
+    stat = dedup_file.stat()
+    try:
+        return _parse_duplicate_ids(str(dedup_file), stat.st_mtime_ns, stat.st_size)
+    except Exception as e:
+        print(f"❌ Error loading dedup report: {e}")
+        return frozenset()
+
+
+def rank_top_content(
+    content: List[Dict],
+    duplicate_ids: FrozenSet[str],
+    config: Dict,
+    top_k: Optional[int] = None,
+) -> List[Dict]:
+    """
+    Rank content and return only the top-K items.
+
+    Scores are computed once for the whole file, duplicates are masked out,
+    and a heap selects the best K indices; only the selected items are
+    copied into ranked dicts.
+
+    Args:
+        content: List of scored content items
+        duplicate_ids: IDs to exclude
+        config: Configuration dictionary
+        top_k: Number of items to return (all unique items if None)
+
+    Returns:
+        Ranked items (best first) with 'final_score' and 'rank' added
+    """
+    schema = detect_score_schema(content)
+    scores = compute_final_scores(content, config, schema)
+
+    ids = _first_present(content, schema["ids"]) if len(schema["ids"]) == 1 else [
+        item.get("id") or item.get("content_id") or item.get("_id") for item in content
+    ]
+    candidates = [
+        i for i, content_id in enumerate(ids) if not (content_id and content_id in duplicate_ids)
+    ]
+
+    # nlargest is stable, so ties keep their input order like list.sort(reverse=True)
+    if top_k is None:
+        selected = sorted(candidates, key=scores.__getitem__, reverse=True)
+    else:
+        selected = heapq.nlargest(top_k, candidates, key=scores.__getitem__)
+
+    override_values = _first_present(content, schema["overrides"])
+    fallback_values = _first_present(content, schema["fallbacks"])
+
+    ranked_items = []
+    for rank, i in enumerate(selected, start=1):
+        # Keep the item's own value (and type) when the score came straight from it
+        if override_values[i] is not None:
+            final_score = override_values[i]
+        elif scores[i] == fallback_values[i]:
+            final_score = fallback_values[i]
+        else:
+            final_score = float(scores[i])
+        ranked_items.append({**content[i], "final_score": final_score, "rank": rank})
+
+    return ranked_items
+
+
 def rank_content(content: List[Dict], dedup_report: Dict, config: Dict) -> List[Dict]:
     """
     Rank content by final score, filtering out duplicates.
@@ -283,36 +477,12 @@ def rank_content(content: List[Dict], dedup_report: Dict, config: Dict) -> List[
     duplicate_ids = get_duplicate_ids(dedup_report)
     print(f"   Found {len(duplicate_ids)} duplicates to filter out")
 
-    # Filter out duplicates and calculate final scores
-    ranked_items = []
-    filtered_count = 0
-
-    for item in content:
-        # Get content ID (try different possible field names)
-        content_id = item.get("id") or item.get("content_id") or item.get("_id")
-
-        # Skip duplicates
-        if content_id and content_id in duplicate_ids:
-            filtered_count += 1
-            continue
-
-        # Calculate final score
-        final_score = calculate_final_score(item, config)
-
-        # Create ranked item
-        ranked_item = {**item, "final_score": final_score}  # Keep all original fields
-
-        ranked_items.append(ranked_item)
+    # Filter out duplicates, score and sort in one pass over the file
+    ranked_items = rank_top_content(content, frozenset(duplicate_ids), config)
+    filtered_count = len(content) - len(ranked_items)
 
     print(f"   Filtered out {filtered_count} duplicates")
-    print(f"   Ranking {len(ranked_items)} unique items...")
-
-    # Sort by final score (descending)
-    ranked_items.sort(key=lambda x: x["final_score"], reverse=True)
-
-    # Add rank field
-    for i, item in enumerate(ranked_items, start=1):
-        item["rank"] = i
+    print(f"   Ranked {len(ranked_items)} unique items")
 
     return ranked_items
 
@@ -356,7 +526,9 @@ def save_ranked_content(
     return output_file
 
 
-def rank_content_for_segment(base_path: Path, gender: str, age: str, config: Dict) -> bool:
+def rank_content_for_segment(
+    base_path: Path, gender: str, age: str, config: Dict, top_k: Optional[int] = None
+) -> bool:
     """
     Rank content for a specific segment.
 
@@ -365,6 +537,7 @@ def rank_content_for_segment(base_path: Path, gender: str, age: str, config: Dic
         gender: Target gender
         age: Target age range
         config: Configuration dictionary
+        top_k: Only keep the best K items (all items if None)
 
     Returns:
         True if successful, False otherwise
@@ -381,11 +554,13 @@ def rank_content_for_segment(base_path: Path, gender: str, age: str, config: Dic
         print(f"❌ No scored content found for {gender}/{age}")
         return False
 
-    # Load dedup report
-    dedup_report = load_dedup_report(scores_path, gender, age)
+    # Load duplicate IDs (parsed reports are cached by path, mtime and size)
+    duplicate_ids = load_duplicate_ids(scores_path, gender, age)
 
     # Rank content
-    ranked_content = rank_content(content, dedup_report, config)
+    print(f"\n🔄 Ranking {len(content)} content items...")
+    print(f"   Found {len(duplicate_ids)} duplicates to filter out")
+    ranked_content = rank_top_content(content, duplicate_ids, config, top_k)
 
     if not ranked_content:
         print(f"⚠️  No content to rank after filtering for {gender}/{age}")
@@ -410,13 +585,17 @@ def rank_content_for_segment(base_path: Path, gender: str, age: str, config: Dic
     return True
 
 
-def process_all_segments(base_path: Path = None, config: Dict = None) -> None:
+def process_all_segments(
+    base_path: Path = None, config: Dict = None, top_k: Optional[int] = None, jobs: int = 1
+) -> None:
     """
     Process ranking for all segments.
 
     Args:
         base_path: Base Generator path
         config: Configuration dictionary
+        top_k: Only keep the best K items per segment (all items if None)
+        jobs: Number of segments to rank in parallel worker processes
     """
     if base_path is None:
         base_path = Path.cwd() / "Generator"
@@ -431,17 +610,20 @@ def process_all_segments(base_path: Path = None, config: Dict = None) -> None:
     print(f"\n🚀 Starting content ranking for all segments...")
     print(f"   Base path: {base_path}")
 
-    success_count = 0
-    total_count = 0
-
-    for gender in genders:
-        for age in age_buckets:
-            total_count += 1
-            if rank_content_for_segment(base_path, gender, age, config):
-                success_count += 1
-
+    segments = [(gender, age) for gender in genders for age in age_buckets]
+    runs = run_segments(
+        rank_content_for_segment,
+        segments,
+        {"base_path": base_path, "config": config, "top_k": top_k},
+        jobs=jobs,
+    )
+    success_count = sum(1 for run in runs if run["result"])
+
+    print_segment_summary(
+        runs, "Ranking Summary", lambda ranked: "ranked" if ranked else "nothing to rank"
+    )
     print(f"\n{'='*60}")
-    print(f"✅ Ranking complete: {success_count}/{total_count} segments processed")
+    print(f"✅ Ranking complete: {success_count}/{len(segments)} segments processed")
     print(f"{'='*60}")
 
 
@@ -454,6 +636,8 @@ def main():
     parser.add_argument("age", nargs="?", help="Target age bucket (10-13, 14-17, 18-23)")
     parser.add_argument("--base-path", help="Base Generator directory path")
     parser.add_argument("--config", help="Path to config file")
+    parser.add_argument("--top-k", type=int, help="Only keep the best K items per segment")
+    add_jobs_argument(parser)
 
     args = parser.parse_args()
 
@@ -469,11 +653,11 @@ def main():
     if args.gender and args.age:
         # Process specific segment
         print(f"Processing segment: {args.gender}/{args.age}")
-        success = rank_content_for_segment(base_path, args.gender, args.age, config)
+        success = rank_content_for_segment(base_path, args.gender, args.age, config, args.top_k)
         sys.exit(0 if success else 1)
     else:
         # Process all segments
-        process_all_segments(base_path, config)
+        process_all_segments(base_path, config, args.top_k, args.jobs)
 
 
 if __name__ == "__main__":
@@ -9,9 +9,16 @@ Low-scoring items are moved back to previous pipeline stages with underscore pre
 import os
 import json
 import shutil
+import hashlib
+import argparse
 import yaml
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+# Incremental mode bookkeeping files (underscore prefix keeps them out of scoring)
+MANIFEST_FILENAME = "_quality_manifest.json"
+SCORES_INDEX_FILENAME = "_scores_index.json"
 
 
 def load_config():
@@ -454,13 +461,14 @@ def calculate_score(content_data, scoring_config=None):
     return score
 
 
-def mark_for_reprocessing(file_path, prefix="_"):
+def mark_for_reprocessing(file_path, prefix="_", verbose=True):
     """
     Rename file with underscore prefix to mark for reprocessing.
 
     Args:
         file_path: Path to file
         prefix: Prefix to add (default: "_")
+        verbose: Print a line for the renamed file
 
     Returns:
         New file path
@@ -479,14 +487,17 @@ def mark_for_reprocessing(file_path, prefix="_"):
     # Rename the file
     try:
         file_path.rename(new_path)
-        print(f"  ✓ Marked for reprocessing: {name} → {new_name}")
+        if verbose:
+            print(f"  ✓ Marked for reprocessing: {name} → {new_name}")
         return new_path
     except Exception as e:
         print(f"  ❌ Error renaming {name}: {e}")
         return file_path
 
 
-def move_to_previous_stage(file_path, current_stage, previous_stage, base_path="Generator"):
+def move_to_previous_stage(
+    file_path, current_stage, previous_stage, base_path="Generator", verbose=True
+):
     """
     Move low-scoring content back to previous pipeline stage.
 
@@ -495,6 +506,7 @@ def move_to_previous_stage(file_path, current_stage, previous_stage, base_path="
         current_stage: Current pipeline stage (e.g., "topics")
         previous_stage: Previous pipeline stage (e.g., "ideas")
         base_path: Base path for generator folders
+        verbose: Print a line for the moved file
 
     Returns:
         New file path or None if failed
@@ -530,7 +542,8 @@ def move_to_previous_stage(file_path, current_stage, previous_stage, base_path="
         # Move file
         dest_path = dest_dir / file_path.name
         shutil.move(str(file_path), str(dest_path))
-        print(f"  ✓ Moved to {previous_stage}: {file_path.name}")
+        if verbose:
+            print(f"  ✓ Moved to {previous_stage}: {file_path.name}")
         return dest_path
 
     except Exception as e:
@@ -538,94 +551,333 @@ def move_to_previous_stage(file_path, current_stage, previous_stage, base_path="
         return None
 
 
-def process_content_folder(folder_path, stage_name, previous_stage=None, config=None):
+def file_fingerprint(file_path):
     """
-    Process all content in a folder, scoring and handling low-quality items.
+    Return the cheap change-detection fingerprint of a file.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        Tuple of (mtime_ns, size)
+    """
+    stat = Path(file_path).stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def scoring_config_hash(scoring_config):
+    """
+    Return a stable hash of a scoring configuration.
+
+    Args:
+        scoring_config: Scoring configuration (viral weights, thresholds)
+
+    Returns:
+        Hex SHA-256 of the configuration serialized with sorted keys
+    """
+    serialized = json.dumps(scoring_config, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def load_manifest(manifest_path, scoring_config=None):
+    """
+    Load the incremental scoring manifest.
+
+    Cached scores are only valid for the scoring configuration they were
+    computed with; if one is given and differs from the manifest's, every
+    entry is dropped so all files are re-scored.
+
+    Args:
+        manifest_path: Path to manifest JSON file
+        scoring_config: Current scoring configuration, if scores will be reused
+
+    Returns:
+        Dictionary mapping relative file path to fingerprint and score
+    """
+    manifest_path = Path(manifest_path)
+    if not manifest_path.exists():
+        return {}
+
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (json.JSONDecodeError, OSError) as e:
+        print(f"⚠️  Ignoring unreadable manifest {manifest_path}: {e}")
+        return {}
+
+    if scoring_config is not None and manifest.get("scoring_config") != scoring_config_hash(
+        scoring_config
+    ):
+        print(f"ℹ️  Scoring config changed since {manifest_path} was written, re-scoring all files")
+        return {}
+    return manifest.get("files", {})
+
+
+def save_manifest(manifest_path, entries, scoring_config=None):
+    """
+    Atomically write the incremental scoring manifest.
+
+    Args:
+        manifest_path: Path to manifest JSON file
+        entries: Dictionary mapping relative file path to fingerprint and score
+        scoring_config: Scoring configuration the scores were computed with
+    """
+    manifest_path = Path(manifest_path)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = manifest_path.with_suffix(".tmp")
+
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "updated_at": datetime.now().isoformat(),
+                "scoring_config": scoring_config_hash(scoring_config)
+                if scoring_config is not None
+                else None,
+                "files": dict(sorted(entries.items())),
+            },
+            f,
+            indent=2,
+        )
+    os.replace(tmp_path, manifest_path)
+
+
+def score_content_file(json_file, scoring_config, cached=None):
+    """
+    Score one JSON content file, reusing a cached score when unchanged.
+
+    A file is unchanged when its (mtime, size) match the cached entry, in
+    which case it is not read at all. If the stat differs but the content
+    hash matches, the cached score is reused and the fingerprint refreshed.
+
+    Args:
+        json_file: Path to JSON content file
+        scoring_config: Scoring configuration (viral weights, thresholds)
+        cached: Previous manifest entry for this file, if any
+
+    Returns:
+        Tuple of (score, manifest_entry, from_cache)
+    """
+    mtime_ns, size = file_fingerprint(json_file)
+
+    if cached and cached.get("mtime_ns") == mtime_ns and cached.get("size") == size:
+        return cached["score"], cached, True
+
+    raw = Path(json_file).read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    entry = {"mtime_ns": mtime_ns, "size": size, "sha256": digest}
+
+    if cached and cached.get("sha256") == digest:
+        entry["score"] = cached["score"]
+        return entry["score"], entry, True
+
+    content_data = json.loads(raw)
+    score = content_data.get("score")
+    if score is None:
+        score = calculate_score(content_data, scoring_config)
+
+    entry["score"] = score
+    return score, entry, False
+
+
+def score_folder(
+    folder_path,
+    stage_name,
+    previous_stage=None,
+    config=None,
+    scoring_config=None,
+    manifest_entries=None,
+    root=None,
+    verbose=True,
+):
+    """
+    Score every JSON file in a folder and apply the quality thresholds.
 
     Args:
         folder_path: Path to folder to process
         stage_name: Current stage name
         previous_stage: Previous stage to move low-scoring items to
         config: Configuration dictionary
+        scoring_config: Scoring configuration (loaded if not provided)
+        manifest_entries: Previous manifest entries keyed by path relative to root;
+            enables incremental scoring when provided
+        root: Root that manifest paths are relative to (default: folder_path)
+        verbose: Print per-file lines
+
+    Returns:
+        Dictionary with per-file records, counts and refreshed manifest entries
     """
     if config is None:
         config = load_config()
-
-    # Load scoring configuration
-    scoring_config = load_scoring_config()
+    if scoring_config is None:
+        scoring_config = load_scoring_config()
 
     thresholds = config.get("quality_thresholds", {})
     min_score = thresholds.get("min_score", 70)
     reprocess_score = thresholds.get("reprocess_score", 50)
     prefix = thresholds.get("underscore_prefix", "_")
 
-    print(f"\nProcessing {stage_name} folder: {folder_path}")
-    print(f"  - Minimum Score: {min_score}")
-    print(f"  - Reprocess Score: {reprocess_score}")
-    print()
-
     folder_path = Path(folder_path)
-    if not folder_path.exists():
-        print(f"  ⚠️ Folder does not exist: {folder_path}")
-        return
-
-    processed_count = 0
-    reprocessed_count = 0
-    moved_count = 0
-
-    # Process all JSON files in folder
-    for json_file in folder_path.glob("*.json"):
+    root = Path(root) if root is not None else folder_path
+
+    result = {
+        "folder": str(folder_path),
+        "records": [],
+        "manifest": {},
+        "counts": {"processed": 0, "reprocessed": 0, "moved": 0, "cached": 0, "errors": 0},
+    }
+    counts = result["counts"]
+
+    # Sorted for deterministic output ordering
+    for json_file in sorted(folder_path.glob("*.json")):
         # Skip underscored files (already marked for reprocessing)
         if json_file.name.startswith(prefix):
             continue
 
-        try:
-            with open(json_file, "r") as f:
-                content_data = json.load(f)
+        rel_path = json_file.relative_to(root).as_posix()
+        cached = manifest_entries.get(rel_path) if manifest_entries is not None else None
 
-            # Calculate score
-            score = content_data.get("score", calculate_score(content_data, scoring_config))
+        try:
+            score, entry, from_cache = score_content_file(json_file, scoring_config, cached)
+            if from_cache:
+                counts["cached"] += 1
 
-            print(f"  {json_file.name}: Score {score:.1f}")
+            if verbose:
+                print(f"  {json_file.name}: Score {score:.1f}")
 
             # Handle based on score
             if score >= min_score:
                 # Good quality, keep as is
-                processed_count += 1
+                action = "kept"
+                result["manifest"][rel_path] = entry
+                counts["processed"] += 1
             elif score >= reprocess_score:
                 # Moderate quality, mark for reprocessing
-                mark_for_reprocessing(json_file, prefix)
-                reprocessed_count += 1
+                action = "reprocess"
+                mark_for_reprocessing(json_file, prefix, verbose=verbose)
+                counts["reprocessed"] += 1
             else:
                 # Low quality, move back to previous stage
                 if previous_stage:
-                    new_path = move_to_previous_stage(json_file, stage_name, previous_stage)
+                    action = "error"
+                    new_path = move_to_previous_stage(
+                        json_file, stage_name, previous_stage, verbose=verbose
+                    )
                     if new_path:
                         # Mark it in the previous stage
-                        mark_for_reprocessing(new_path, prefix)
-                        moved_count += 1
+                        mark_for_reprocessing(new_path, prefix, verbose=verbose)
+                        action = "moved"
+                        counts["moved"] += 1
                 else:
                     # No previous stage, just mark for reprocessing
-                    mark_for_reprocessing(json_file, prefix)
-                    reprocessed_count += 1
+                    action = "reprocess"
+                    mark_for_reprocessing(json_file, prefix, verbose=verbose)
+                    counts["reprocessed"] += 1
+
+            result["records"].append(
+                {"file": rel_path, "score": round(score, 2), "action": action, "cached": from_cache}
+            )
 
         except Exception as e:
+            counts["errors"] += 1
             print(f"  ❌ Error processing {json_file.name}: {e}")
 
+    return result
+
+
+def process_content_folder(folder_path, stage_name, previous_stage=None, config=None):
+    """
+    Process all content in a folder, scoring and handling low-quality items.
+
+    Args:
+        folder_path: Path to folder to process
+        stage_name: Current stage name
+        previous_stage: Previous stage to move low-scoring items to
+        config: Configuration dictionary
+    """
+    if config is None:
+        config = load_config()
+
+    thresholds = config.get("quality_thresholds", {})
+    min_score = thresholds.get("min_score", 70)
+    reprocess_score = thresholds.get("reprocess_score", 50)
+
+    print(f"\nProcessing {stage_name} folder: {folder_path}")
+    print(f"  - Minimum Score: {min_score}")
+    print(f"  - Reprocess Score: {reprocess_score}")
+    print()
+
+    folder_path = Path(folder_path)
+    if not folder_path.exists():
+        print(f"  ⚠️ Folder does not exist: {folder_path}")
+        return
+
+    result = score_folder(folder_path, stage_name, previous_stage, config)
+    counts = result["counts"]
+
     print()
     print(f"📊 Processing Summary:")
-    print(f"  - Processed: {processed_count}")
-    print(f"  - Marked for reprocessing: {reprocessed_count}")
-    print(f"  - Moved to previous stage: {moved_count}")
+    print(f"  - Processed: {counts['processed']}")
+    print(f"  - Marked for reprocessing: {counts['reprocessed']}")
+    print(f"  - Moved to previous stage: {counts['moved']}")
 
 
-def batch_process_pipeline(base_path="Generator", config=None):
+def _score_folder_task(task):
+    """Process-pool entry point: score one folder without per-file output."""
+    return score_folder(**task, verbose=False)
+
+
+def write_scores_index(stage_dir, stage_name, results, config):
+    """
+    Write the consolidated scores index for one pipeline stage.
+
+    Args:
+        stage_dir: Stage directory (index is written inside it)
+        stage_name: Stage name
+        results: score_folder results for every folder of the stage
+        config: Configuration dictionary
+
+    Returns:
+        Path to the written index
+    """
+    totals = {"processed": 0, "reprocessed": 0, "moved": 0, "cached": 0, "errors": 0}
+    files = []
+    for result in results:
+        files.extend(result["records"])
+        for key, value in result["counts"].items():
+            totals[key] += value
+
+    index_path = Path(stage_dir) / SCORES_INDEX_FILENAME
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "stage": stage_name,
+                "generated_at": datetime.now().isoformat(),
+                "quality_thresholds": config.get("quality_thresholds", {}),
+                "summary": {"total_files": len(files), **totals},
+                "files": files,
+            },
+            f,
+            indent=2,
+            ensure_ascii=False,
+        )
+    return index_path
+
+
+def batch_process_pipeline(base_path="Generator", config=None, incremental=False, jobs=1):
     """
     Process entire pipeline, scoring and handling quality iteratively.
 
+    With ``incremental`` or ``jobs > 1`` the folders of each stage are scored
+    in a process pool, one consolidated scores index is written per stage
+    instead of per-file output, and (when incremental) unchanged files are
+    served from the manifest instead of being re-read and re-scored.
+
     Args:
         base_path: Base path for generator folders
         config: Configuration dictionary
+        incremental: Reuse scores of files unchanged since the last run
+        jobs: Number of worker processes for folder scoring
     """
     if config is None:
         config = load_config()
@@ -656,35 +908,141 @@ def batch_process_pipeline(base_path="Generator", config=None):
     genders = [g["name"] for g in audience.get("genders", [])]
     age_groups = [a["range"] for a in audience.get("age_groups", [])]
 
-    # Process each stage for each audience segment
-    for stage_name, previous_stage in pipeline_stages:
-        for gender in genders:
-            for age_group in age_groups:
-                folder_path = generator_root / stage_name / gender / age_group
-                if folder_path.exists():
-                    process_content_folder(folder_path, stage_name, previous_stage, config)
+    if not incremental and jobs <= 1:
+        # Process each stage for each audience segment
+        for stage_name, previous_stage in pipeline_stages:
+            for gender in genders:
+                for age_group in age_groups:
+                    folder_path = generator_root / stage_name / gender / age_group
+                    if folder_path.exists():
+                        process_content_folder(folder_path, stage_name, previous_stage, config)
+    else:
+        process_stages_parallel(
+            generator_root, pipeline_stages, genders, age_groups, config, incremental, jobs
+        )
 
     print("\n" + "=" * 60)
     print("✅ Pipeline processing complete!")
     print("=" * 60)
 
 
+def process_stages_parallel(
+    generator_root, pipeline_stages, genders, age_groups, config, incremental=True, jobs=1
+):
+    """
+    Score pipeline stages with a process pool and write per-stage indexes.
+
+    Stages run in pipeline order so items moved back to a previous stage are
+    never picked up mid-run; the segment folders within a stage are
+    independent and are scored concurrently.
+
+    Args:
+        generator_root: Root of the generator folders
+        pipeline_stages: List of (stage_name, previous_stage) tuples
+        genders: Audience genders
+        age_groups: Audience age ranges
+        config: Configuration dictionary
+        incremental: Reuse scores of files unchanged since the last run
+        jobs: Number of worker processes
+
+    Returns:
+        Dictionary mapping stage name to scores index path
+    """
+    generator_root = Path(generator_root)
+    scoring_config = load_scoring_config()
+    manifest_path = generator_root / MANIFEST_FILENAME
+    manifest = load_manifest(manifest_path, scoring_config) if incremental else {}
+
+    indexes = {}
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        for stage_name, previous_stage in pipeline_stages:
+            tasks = []
+            for gender in genders:
+                for age_group in age_groups:
+                    folder_path = generator_root / stage_name / gender / age_group
+                    if not folder_path.exists():
+                        continue
+                    folder_prefix = folder_path.relative_to(generator_root).as_posix() + "/"
+                    tasks.append(
+                        {
+                            "folder_path": folder_path,
+                            "stage_name": stage_name,
+                            "previous_stage": previous_stage,
+                            "config": config,
+                            "scoring_config": scoring_config,
+                            "manifest_entries": {
+                                key: entry
+                                for key, entry in manifest.items()
+                                if key.startswith(folder_prefix)
+                            }
+                            if incremental
+                            else None,
+                            "root": generator_root,
+                        }
+                    )
+
+            if not tasks:
+                continue
+
+            if executor is not None:
+                # map() yields in submission order, keeping output deterministic
+                results = list(executor.map(_score_folder_task, tasks))
+            else:
+                results = [_score_folder_task(task) for task in tasks]
+
+            for task, result in zip(tasks, results):
+                folder_prefix = task["folder_path"].relative_to(generator_root).as_posix() + "/"
+                for key in [k for k in manifest if k.startswith(folder_prefix)]:
+                    del manifest[key]
+                manifest.update(result["manifest"])
+
+            index_path = write_scores_index(
+                generator_root / stage_name, stage_name, results, config
+            )
+            indexes[stage_name] = index_path
+
+            scored = sum(len(r["records"]) for r in results)
+            cached = sum(r["counts"]["cached"] for r in results)
+            print(
+                f"  {stage_name}: {scored} file(s) in {len(tasks)} folder(s), "
+                f"{cached} unchanged → {index_path}"
+            )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if incremental:
+        save_manifest(manifest_path, manifest, scoring_config)
+
+    return indexes
+
+
 def main():
     """Main entry point."""
-    import sys
+    parser = argparse.ArgumentParser(description="Iterative quality processor")
+    parser.add_argument("folder", nargs="?", help="Process a single folder")
+    parser.add_argument("stage", nargs="?", default="content", help="Stage name of the folder")
+    parser.add_argument("previous_stage", nargs="?", help="Stage to move low scores back to")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only score files that are new or changed since the last run",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=1, help="Worker processes for pipeline processing"
+    )
+    args = parser.parse_args()
 
     config = load_config()
 
-    if len(sys.argv) > 1:
+    if args.folder:
         # Process specific folder
-        folder_path = sys.argv[1]
-        stage_name = sys.argv[2] if len(sys.argv) > 2 else "content"
-        previous_stage = sys.argv[3] if len(sys.argv) > 3 else None
-        process_content_folder(folder_path, stage_name, previous_stage, config)
+        process_content_folder(args.folder, args.stage, args.previous_stage, config)
     else:
         # Process entire pipeline
         base_path = config.get("folder_structure", {}).get("base_path", "Generator")
-        batch_process_pipeline(base_path, config)
+        batch_process_pipeline(base_path, config, incremental=args.incremental, jobs=args.jobs)
 
 
 if __name__ == "__main__":
@@ -7,10 +7,12 @@ Processes Google Trends CSV files to extract trending topics for content generat
 import os
 import csv
 import json
-import sys
+import heapq
+import argparse
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
 
 def load_csv_file(file_path):
@@ -24,6 +26,60 @@ def load_csv_file(file_path):
         return []
 
 
+def iter_csv_rows(file_path):
+    """
+    Stream rows from a CSV file one at a time.
+
+    Args:
+        file_path: Path to CSV file
+
+    Yields:
+        Row dictionaries
+    """
+    try:
+        with open(file_path, "r", encoding="utf-8", newline="") as f:
+            yield from csv.DictReader(f)
+    except Exception as e:
+        print(f"❌ Error loading {file_path}: {e}")
+
+
+def parse_trend_row(row, data_type="trending"):
+    """
+    Convert one CSV row into a trend item.
+
+    Args:
+        row: Dictionary from CSV
+        data_type: Type of data (trending, entities, queries)
+
+    Returns:
+        Trend item dictionary, or None for unknown data types
+    """
+    if data_type == "trending":
+        return {
+            "query": row.get("query", ""),
+            "value": int(row.get("value", 0)),
+            "link": row.get("link", ""),
+            "time": row.get("time", ""),
+            "geo": row.get("geo", ""),
+            "property": row.get("property", ""),
+        }
+    elif data_type == "entities":
+        return {
+            "entity": row.get("entity", ""),
+            "value": int(row.get("value", 0)) if row.get("value") else 0,
+            "link": row.get("link", ""),
+            "property": row.get("property", ""),
+        }
+    elif data_type == "queries":
+        return {
+            "query": row.get("query", ""),
+            "value": int(row.get("value", 0)) if row.get("value") else 0,
+            "link": row.get("link", ""),
+            "property": row.get("property", ""),
+        }
+    return None
+
+
 def process_trending_data(csv_data, data_type="trending"):
     """
     Process trending data from CSV.
@@ -38,33 +94,9 @@ def process_trending_data(csv_data, data_type="trending"):
     trends = []
 
     for row in csv_data:
-        if data_type == "trending":
-            trend = {
-                "query": row.get("query", ""),
-                "value": int(row.get("value", 0)),
-                "link": row.get("link", ""),
-                "time": row.get("time", ""),
-                "geo": row.get("geo", ""),
-                "property": row.get("property", ""),
-            }
-        elif data_type == "entities":
-            trend = {
-                "entity": row.get("entity", ""),
-                "value": int(row.get("value", 0)) if row.get("value") else 0,
-                "link": row.get("link", ""),
-                "property": row.get("property", ""),
-            }
-        elif data_type == "queries":
-            trend = {
-                "query": row.get("query", ""),
-                "value": int(row.get("value", 0)) if row.get("value") else 0,
-                "link": row.get("link", ""),
-                "property": row.get("property", ""),
-            }
-        else:
-            continue
-
-        trends.append(trend)
+        trend = parse_trend_row(row, data_type)
+        if trend is not None:
+            trends.append(trend)
 
     return trends
 
@@ -322,23 +354,11 @@ def process_trends_directory(trends_dir, output_dir, min_value=50):
         if not csv_data:
             continue
 
-        # Determine data type from filename
-        filename = csv_file.stem.lower()
-        if "entity" in filename or "entities" in filename:
-            data_type = "entities"
-        elif "query" in filename or "queries" in filename:
-            data_type = "queries"
-        else:
-            data_type = "trending"
-
-        # Extract country from filename (e.g., trending_US_7d.csv -> US)
-        parts = filename.split("_")
-        country = "global"
-        for part in parts:
-            if len(part) == 2 and part.isupper():
-                country = part
-                countries.add(country)
-                break
+        # Determine data type and country from filename
+        data_type = detect_data_type(csv_file)
+        country = detect_country(csv_file)
+        if country != "global":
+            countries.add(country)
 
         trends = process_trending_data(csv_data, data_type)
         all_trends.extend(trends)
@@ -389,22 +409,299 @@ def process_trends_directory(trends_dir, output_dir, min_value=50):
     print("=" * 60)
 
 
+def detect_data_type(csv_file):
+    """Determine the trend data type from a CSV filename."""
+    filename = Path(csv_file).stem.lower()
+    if "entity" in filename or "entities" in filename:
+        return "entities"
+    elif "query" in filename or "queries" in filename:
+        return "queries"
+    return "trending"
+
+
+def detect_country(csv_file):
+    """Extract the country code from a CSV filename (trending_US_7d.csv -> US)."""
+    for part in Path(csv_file).stem.split("_"):
+        if len(part) == 2 and part.isupper():
+            return part
+    return "global"
+
+
+class TrendAccumulator:
+    """
+    Bounded-memory running aggregation of trend items.
+
+    Keeps a running sum and count per topic, the set of geos a topic was seen
+    in, and only the ``top_k`` highest-value rows as exemplars (min-heap), so
+    memory grows with the number of distinct topics, not with input rows.
+    """
+
+    def __init__(self, top_k=5):
+        self.top_k = top_k
+        self.topics = {}
+        self.rows = 0
+        self._seq = 0
+
+    def add(self, trend):
+        """Add one trend item."""
+        key = trend.get("query") or trend.get("entity", "")
+        if not key:
+            return
+        self.rows += 1
+        value = trend.get("value", 0)
+
+        state = self.topics.get(key)
+        if state is None:
+            state = self.topics[key] = {"value": 0, "count": 0, "geos": set(), "exemplars": []}
+        state["value"] += value
+        state["count"] += 1
+        if trend.get("geo"):
+            state["geos"].add(trend["geo"])
+        self._push_exemplar(state["exemplars"], value, trend)
+
+    def _push_exemplar(self, heap, value, trend):
+        # (value, -seq) keeps the earliest row on ties, matching input order
+        self._seq += 1
+        item = (value, -self._seq, trend)
+        if len(heap) < self.top_k:
+            heapq.heappush(heap, item)
+        elif item[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, item)
+
+    def merge(self, other):
+        """Fold another accumulator (e.g. from a worker process) into this one."""
+        self.rows += other.rows
+        for key, other_state in other.topics.items():
+            state = self.topics.get(key)
+            if state is None:
+                state = self.topics[key] = {"value": 0, "count": 0, "geos": set(), "exemplars": []}
+            state["value"] += other_state["value"]
+            state["count"] += other_state["count"]
+            state["geos"] |= other_state["geos"]
+            for value, _, trend in sorted(other_state["exemplars"], key=lambda i: (-i[0], -i[1])):
+                self._push_exemplar(state["exemplars"], value, trend)
+        return self
+
+    def results(self, min_value=50):
+        """
+        Build aggregated trends, in the same shape as aggregate_trends().
+
+        ``details`` holds only the top-K exemplar rows and ``geos`` lists every
+        geo the topic appeared in.
+
+        Args:
+            min_value: Minimum average trend value to include
+
+        Returns:
+            Sorted list of aggregated trends
+        """
+        result = []
+        for key, state in self.topics.items():
+            avg_value = state["value"] / state["count"]
+            if avg_value >= min_value:
+                exemplars = sorted(state["exemplars"], key=lambda i: (-i[0], -i[1]))
+                result.append(
+                    {
+                        "topic": key,
+                        "average_value": round(avg_value, 2),
+                        "occurrences": state["count"],
+                        "total_value": state["value"],
+                        "geos": sorted(state["geos"]),
+                        "details": [trend for _, _, trend in exemplars],
+                    }
+                )
+
+        # Sort by average value
+        result.sort(key=lambda x: x["average_value"], reverse=True)
+        return result
+
+
+def accumulate_csv_files(csv_files, top_k=5):
+    """
+    Stream CSV files into a TrendAccumulator.
+
+    Args:
+        csv_files: CSV file paths
+        top_k: Exemplar rows to keep per topic
+
+    Returns:
+        TrendAccumulator with the aggregated rows
+    """
+    accumulator = TrendAccumulator(top_k)
+    for csv_file in csv_files:
+        data_type = detect_data_type(csv_file)
+        for row in iter_csv_rows(csv_file):
+            trend = parse_trend_row(row, data_type)
+            if trend is not None:
+                accumulator.add(trend)
+    return accumulator
+
+
+def save_trends_columnar(trends, output_path, fmt="parquet"):
+    """
+    Save aggregated trends in a columnar format for downstream ranking.
+
+    Requires pyarrow.
+
+    Args:
+        trends: Aggregated trends (details are not included)
+        output_path: Destination file path
+        fmt: "parquet" or "arrow" (Arrow IPC / Feather v2)
+
+    Returns:
+        Path to the written file
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.feather as feather
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Columnar trend output requires pyarrow. Install with: pip install pyarrow"
+        ) from e
+
+    table = pa.table(
+        {
+            "topic": pa.array([t["topic"] for t in trends], pa.string()),
+            "average_value": pa.array([t["average_value"] for t in trends], pa.float64()),
+            "occurrences": pa.array([t["occurrences"] for t in trends], pa.int64()),
+            "total_value": pa.array([t["total_value"] for t in trends], pa.int64()),
+            "geos": pa.array([t.get("geos", []) for t in trends], pa.list_(pa.string())),
+        }
+    )
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if fmt == "parquet":
+        pq.write_table(table, output_path)
+    elif fmt == "arrow":
+        feather.write_feather(table, output_path)
+    else:
+        raise ValueError(f"Unsupported columnar format: {fmt}")
+
+    print(f"✓ Saved columnar trends: {output_path}")
+    return output_path
+
+
+def process_trends_streaming(
+    trends_dir, output_dir, min_value=50, top_k=5, jobs=1, columnar=None
+):
+    """
+    Process all CSV files with bounded memory, one worker per country.
+
+    CSV rows are streamed and folded into running per-topic sums and counts;
+    only the top-K exemplar rows per topic are kept. Files are grouped by the
+    country in their filename and each group is aggregated in a separate
+    process, then merged.
+
+    Args:
+        trends_dir: Directory containing CSV files
+        output_dir: Directory to save processed files
+        min_value: Minimum trend value to include
+        top_k: Exemplar rows to keep per topic
+        jobs: Number of worker processes
+        columnar: Also write a columnar file ("parquet" or "arrow")
+
+    Returns:
+        Aggregated global trends
+    """
+    print("=" * 60)
+    print("Google Trends Processor (streaming)")
+    print("=" * 60)
+    print()
+
+    csv_files = sorted(Path(trends_dir).glob("*.csv"))
+    if not csv_files:
+        print(f"⚠️  No CSV files found in {trends_dir}")
+        print(f"Please add Google Trends CSV files to process.")
+        return []
+
+    files_by_country = defaultdict(list)
+    for csv_file in csv_files:
+        files_by_country[detect_country(csv_file)].append(csv_file)
+    countries = sorted(files_by_country)
+
+    print(f"Found {len(csv_files)} CSV file(s) across {len(countries)} country group(s)")
+
+    groups = [files_by_country[country] for country in countries]
+    if jobs > 1 and len(groups) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            partials = list(executor.map(accumulate_csv_files, groups, [top_k] * len(groups)))
+    else:
+        partials = [accumulate_csv_files(group, top_k) for group in groups]
+
+    accumulator = TrendAccumulator(top_k)
+    for partial in partials:
+        accumulator.merge(partial)
+
+    aggregated = accumulator.results(min_value)
+    print(f"Total trends streamed: {accumulator.rows}")
+    print(f"Aggregated trends (≥{min_value}): {len(aggregated)}")
+    print()
+
+    suggestions = generate_content_suggestions(aggregated, max_suggestions=20)
+
+    # Save results for each country
+    for country in countries:
+        if country == "global":
+            continue
+        country_trends = [t for t in aggregated if country in t["geos"]]
+        if country_trends:
+            country_suggestions = generate_content_suggestions(country_trends, max_suggestions=20)
+            save_processed_trends(country_trends, country_suggestions, output_dir, country)
+
+    # Save global results
+    trends_file, _ = save_processed_trends(aggregated, suggestions, output_dir, "global")
+    if columnar:
+        extension = "parquet" if columnar == "parquet" else "arrow"
+        save_trends_columnar(
+            aggregated, Path(trends_file).with_suffix(f".{extension}"), fmt=columnar
+        )
+
+    print()
+    print("=" * 60)
+    print("✅ Trends processing complete!")
+    print("=" * 60)
+    return aggregated
+
+
 def main():
     """Main entry point."""
     # Default paths
     root_dir = Path(__file__).parent.absolute()
-    trends_dir = root_dir / "trends" / "raw"
-    output_dir = root_dir / "trends" / "processed"
 
-    # Check for command-line arguments
-    if len(sys.argv) > 1:
-        trends_dir = Path(sys.argv[1])
-
-    if len(sys.argv) > 2:
-        output_dir = Path(sys.argv[2])
+    parser = argparse.ArgumentParser(description="Process Google Trends CSV exports")
+    parser.add_argument("trends_dir", nargs="?", default=root_dir / "trends" / "raw", type=Path)
+    parser.add_argument(
+        "output_dir", nargs="?", default=root_dir / "trends" / "processed", type=Path
+    )
+    parser.add_argument("--min-value", type=int, default=50, help="Minimum average trend value")
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Stream CSVs with bounded memory (keeps only top-K rows per topic)",
+    )
+    parser.add_argument("--top-k", type=int, default=5, help="Exemplar rows kept per topic")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes (one per country)")
+    parser.add_argument(
+        "--columnar",
+        choices=["parquet", "arrow"],
+        help="Also write aggregated trends in a columnar format (requires pyarrow)",
+    )
+    args = parser.parse_args()
 
     # Process trends
-    process_trends_directory(trends_dir, output_dir)
+    if args.streaming or args.columnar or args.jobs > 1:
+        process_trends_streaming(
+            args.trends_dir,
+            args.output_dir,
+            min_value=args.min_value,
+            top_k=args.top_k,
+            jobs=args.jobs,
+            columnar=args.columnar,
+        )
+    else:
+        process_trends_directory(args.trends_dir, args.output_dir, args.min_value)
 
 
 if __name__ == "__main__":
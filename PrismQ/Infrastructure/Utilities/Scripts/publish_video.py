@@ -25,12 +25,22 @@ Usage:
     python scripts/publish_video.py video.mp4 \\
         --platforms youtube instagram \\
         --metadata-file metadata.json
+
+    # Run the scheduler daemon, publishing queued uploads when they are due
+    python scripts/publish_video.py --daemon --workers 2
+
+    # Upload to all platforms at the same time, giving up after 10 minutes
+    python scripts/publish_video.py video.mp4 \\
+        --platforms youtube tiktok facebook \\
+        --title "Amazing Story" \\
+        --concurrent --timeout 600
 """
 
 import os
 import sys
 import json
 import argparse
+import time
 from pathlib import Path
 from datetime import datetime
 
@@ -65,7 +75,9 @@ def publish_single_video(
     metadata_file: str = None,
     output_dir: str = None,
     credentials_dir: str = None,
-    schedule: str = None
+    schedule: str = None,
+    concurrent: bool = False,
+    timeout: float = None
 ):
     """
     Publish a single video to selected platforms.
@@ -82,6 +94,8 @@ def publish_single_video(
         output_dir: Directory to save reports
         credentials_dir: Directory with credentials
         schedule: Scheduled time (format: YYYY-MM-DD HH:MM:SS)
+        concurrent: Upload to all platforms at the same time
+        timeout: Seconds to wait for concurrent uploads
     """
     print(f"\n{'='*70}")
     print(f"Multi-Platform Video Publisher")
@@ -141,9 +155,9 @@ def publish_single_video(
                 scheduled_time=scheduled_time
             )
             
-            print(f"✓ Upload scheduled successfully")
-            print(f"\nTo process scheduled uploads, run:")
-            print(f"  python scripts/publish_video.py --process-queue")
+            print(f"✓ Upload scheduled successfully (task {task.task_id})")
+            print(f"\nTo publish scheduled uploads when they are due, run:")
+            print(f"  python scripts/publish_video.py --daemon")
             
             return
             
@@ -161,8 +175,11 @@ def publish_single_video(
         video_path=video_path,
         metadata=metadata,
         platforms=platform_enums,
-        save_report=True
+        save_report=True,
+        concurrent=concurrent,
+        timeout=timeout
     )
+    publisher.close()
     
     # Display results
     print(f"\n{'='*70}")
@@ -180,6 +197,8 @@ def publish_single_video(
                 print(f"   Message: {result.message}")
         else:
             print(f"   ❌ Error: {result.error}")
+        if result.elapsed_seconds is not None:
+            print(f"   Time: {result.elapsed_seconds:.1f}s")
         print()
     
     # Summary
@@ -225,6 +244,31 @@ def process_upload_queue(output_dir: str = None, credentials_dir: str = None, dr
         print()
 
 
+def run_scheduler_daemon(output_dir: str = None, credentials_dir: str = None, workers: int = 2):
+    """Publish queued uploads as they become due until interrupted."""
+    print(f"\n{'='*70}")
+    print(f"Upload Scheduler")
+    print(f"{'='*70}\n")
+    
+    publisher = MultiPlatformPublisher(
+        output_dir=output_dir,
+        credentials_dir=credentials_dir
+    )
+    
+    print(f"Queue: {publisher.queue_db}")
+    print(f"Queued uploads: {len(publisher.upload_queue)}")
+    print("Press Ctrl+C to stop\n")
+    
+    scheduler = publisher.start_scheduler(workers=workers)
+    try:
+        while True:
+            time.sleep(1)
+    finally:
+        print("\nStopping scheduler (waiting for running uploads)...")
+        scheduler.stop()
+        publisher.close()
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -285,6 +329,18 @@ def main():
         help='Schedule upload for later (format: YYYY-MM-DD HH:MM:SS)'
     )
     
+    parser.add_argument(
+        '--concurrent',
+        action='store_true',
+        help='Upload to all platforms at the same time'
+    )
+    
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        help='Seconds to wait for concurrent uploads'
+    )
+    
     # Queue processing
     parser.add_argument(
         '--process-queue',
@@ -298,6 +354,19 @@ def main():
         help='Simulate queue processing without uploading'
     )
     
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help='Run the scheduler, publishing queued uploads when they are due'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=2,
+        help='Uploads the scheduler runs at the same time (default: 2)'
+    )
+    
     # Configuration
     parser.add_argument(
         '--output-dir',
@@ -312,6 +381,15 @@ def main():
     args = parser.parse_args()
     
     try:
+        # Check if running the scheduler
+        if args.daemon:
+            run_scheduler_daemon(
+                output_dir=args.output_dir,
+                credentials_dir=args.credentials_dir,
+                workers=args.workers
+            )
+            return 0
+        
         # Check if processing queue
         if args.process_queue:
             process_upload_queue(
@@ -348,7 +426,9 @@ def main():
             metadata_file=args.metadata_file,
             output_dir=args.output_dir,
             credentials_dir=args.credentials_dir,
-            schedule=args.schedule
+            schedule=args.schedule,
+            concurrent=args.concurrent,
+            timeout=args.timeout
         )
         
         return 0 if success else 1
@@ -29,6 +29,10 @@ SUBREDDIT_MAP: dict[str, list[str]] = {
     "men/18-23": ["r/relationships", "r/AskMen", "r/confession"],
 }
 
+# Shared rate limiter key and request rate for Reddit (one subreddit fetch every 2s)
+REDDIT_RATE_KEY = "reddit"
+REDDIT_REQUESTS_PER_SECOND = 0.5
+
 # Default quality thresholds by age bucket (can be overridden in config)
 QUALITY_THRESHOLDS = {
     "10-13": {"min_upvotes": 300, "min_comments": 20, "min_text_length": 100},
@@ -152,6 +156,9 @@ def rate_limit_with_backoff(max_retries: int = 3, base_delay: int = 5):
                 except PRAWException as e:
                     error_str = str(e).lower()
                     if "rate limit" in error_str or "429" in error_str:
+                        from PrismQ.Shared.rate_limit import get_rate_limiter
+
+                        get_rate_limiter().feedback(REDDIT_RATE_KEY, 429)
                         if attempt < max_retries - 1:
                             delay = base_delay * (2 ** attempt)
                             print(f"⚠️  Rate limited. Waiting {delay}s before retry (attempt {attempt + 1}/{max_retries})...")
@@ -337,12 +344,20 @@ def scrape_segment(
         "total_duplicates": 0
     }
     
+    # Space subreddit fetches through the shared limiter, so parallel scraper
+    # processes using one RATE_LIMIT_BACKEND share Reddit's quota
+    from PrismQ.Shared.rate_limit import get_rate_limiter
+
+    limiter = get_rate_limiter()
+    limiter.configure(REDDIT_RATE_KEY, rate=REDDIT_REQUESTS_PER_SECOND, burst=1)
+    
     for subreddit in subreddits:
         print(f"📥 Scraping {subreddit} for {segment_key}...")
         
         last_scrape_time = scraper_state.get_last_scrape_time(subreddit) if scraper_state else 0
         
         try:
+            limiter.acquire(REDDIT_RATE_KEY)
             stories = scrape_subreddit(
                 reddit, 
                 subreddit, 
@@ -358,9 +373,6 @@ def scrape_segment(
                 newest_timestamp = max(s["created_utc_timestamp"] for s in stories)
                 scraper_state.update_scrape_time(subreddit, newest_timestamp)
             
-            # Respect rate limits
-            time.sleep(2)
-            
         except Exception as e:
             print(f"⚠️  Error scraping {subreddit}: {e}")
             continue
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Segment Executor for StoryGenerator
+
+Runs a per-segment worker (gender × age) for the title scoring, title
+improvement and content ranking scripts, optionally in a process pool.
+
+- Segments are processed in a pool of ``--jobs`` worker processes
+- Each segment's console output is captured and replayed in segment order,
+  so output is deterministic regardless of which worker finishes first
+- A consolidated per-segment summary is printed at the end
+"""
+
+import io
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+def add_jobs_argument(parser) -> None:
+    """
+    Add the shared ``--jobs`` option to an argparse parser.
+
+    Args:
+        parser: argparse.ArgumentParser to extend
+    """
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of segments to process in parallel worker processes (default: 1)",
+    )
+
+
+def _run_segment(worker: Callable, gender: str, age: str, kwargs: Dict, capture: bool) -> Dict:
+    """Run one segment, capturing its output and timing."""
+    buffer = io.StringIO()
+    start = time.perf_counter()
+    result = None
+    error = None
+
+    try:
+        if capture:
+            with redirect_stdout(buffer):
+                result = worker(gender=gender, age=age, **kwargs)
+        else:
+            result = worker(gender=gender, age=age, **kwargs)
+    except Exception:
+        error = traceback.format_exc()
+
+    return {
+        "segment": (gender, age),
+        "result": result,
+        "error": error,
+        "elapsed": time.perf_counter() - start,
+        "output": buffer.getvalue(),
+    }
+
+
+def run_segments(
+    worker: Callable,
+    segments: List[Tuple[str, str]],
+    kwargs: Optional[Dict] = None,
+    jobs: int = 1,
+) -> List[Dict]:
+    """
+    Run a worker for every (gender, age) segment.
+
+    The worker is called as ``worker(gender=..., age=..., **kwargs)`` and must
+    be a module-level function so it can be sent to worker processes. With
+    ``jobs > 1`` segments run in a process pool and each segment's output is
+    printed as one block, in the order of ``segments``.
+
+    Args:
+        worker: Per-segment function
+        segments: List of (gender, age) tuples
+        kwargs: Extra keyword arguments passed to every worker call
+        jobs: Number of worker processes (1 runs inline with live output)
+
+    Returns:
+        One run record per segment, in input order, with 'segment', 'result',
+        'error', 'elapsed' and 'output' keys
+    """
+    kwargs = kwargs or {}
+
+    if jobs <= 1 or len(segments) <= 1:
+        runs = []
+        for gender, age in segments:
+            run = _run_segment(worker, gender, age, kwargs, capture=False)
+            if run["error"]:
+                print(run["error"])
+            runs.append(run)
+        return runs
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(segments))) as executor:
+        futures = [
+            executor.submit(_run_segment, worker, gender, age, kwargs, True)
+            for gender, age in segments
+        ]
+        runs = []
+        # Collect in submission order so output is deterministic
+        for future in futures:
+            run = future.result()
+            print(run["output"], end="")
+            if run["error"]:
+                print(run["error"])
+            runs.append(run)
+
+    return runs
+
+
+def print_segment_summary(
+    runs: List[Dict], title: str, describe: Callable[[object], str]
+) -> None:
+    """
+    Print a consolidated summary of segment runs.
+
+    Args:
+        runs: Run records from run_segments
+        title: Summary heading
+        describe: Turns a segment result into a short status string
+    """
+    print("\n" + "=" * 60)
+    print(f"📊 {title}")
+    print("=" * 60)
+
+    total_elapsed = 0.0
+    failed = 0
+    for run in runs:
+        gender, age = run["segment"]
+        total_elapsed += run["elapsed"]
+        if run["error"]:
+            failed += 1
+            status = "❌ failed"
+        else:
+            status = describe(run["result"])
+        print(f"  {gender}/{age}: {status} ({run['elapsed']:.1f}s)")
+
+    print(f"Segments processed: {len(runs) - failed}/{len(runs)}")
+    print(f"Total segment time: {total_elapsed:.1f}s")
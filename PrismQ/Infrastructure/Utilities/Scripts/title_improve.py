@@ -8,8 +8,11 @@ Generates improved title variants using GPT or local LLM:
 - Selects and saves the best variant
 - Outputs to /titles/{segment}/{age}/{title_id}_improved.json
 - Updates title registry if changed
+- Segments run in parallel worker processes (--jobs); LLM calls within a
+  segment run concurrently (--llm-concurrency)
 """
 
+import asyncio
 import os
 import json
 import yaml
@@ -21,6 +24,7 @@ import sys
 # Add scripts directory to path to import title_score
 sys.path.insert(0, str(Path(__file__).parent))
 import title_score
+from segment_executor import add_jobs_argument, print_segment_summary, run_segments
 
 
 def load_llm_config(config_path: str = None) -> Dict:
@@ -82,7 +86,7 @@ def generate_title_variants_ollama(
         List of title variants
     """
     try:
-        import requests
+        from PrismQ.Shared.http_client import get_http_pool
 
         ollama_host = config.get("ollama_host", "http://localhost:11434")
         model = config.get("model", "qwen2.5:14b-instruct")
@@ -101,7 +105,8 @@ Requirements:
 
 Generate exactly {count} title variants, one per line, numbered 1-{count}."""
 
-        response = requests.post(
+        # Pooled session: repeated calls reuse the keep-alive connection to Ollama
+        response = get_http_pool().post(
             f"{ollama_host}/api/generate",
             json={
                 "model": model,
@@ -363,6 +368,7 @@ def improve_title(
     llm_config: Dict,
     scoring_config: Dict,
     variant_count: int = 5,
+    variants: Optional[List[str]] = None,
 ) -> Optional[Dict]:
     """
     Improve a single title by generating and scoring variants.
@@ -375,6 +381,7 @@ def improve_title(
         llm_config: LLM configuration
         scoring_config: Scoring configuration
         variant_count: Number of variants to generate
+        variants: Pre-generated variants (skips LLM generation when given)
 
     Returns:
         Dictionary with improvement results or None if failed
@@ -396,8 +403,11 @@ def improve_title(
     print(f"{'='*60}")
 
     # Generate variants
-    print(f"\nGenerating {variant_count} title variants...")
-    variants = generate_title_variants(original_title, segment, age, llm_config, variant_count)
+    if variants is None:
+        print(f"\nGenerating {variant_count} title variants...")
+        variants = generate_title_variants(
+            original_title, segment, age, llm_config, variant_count
+        )
 
     if not variants:
         print("⚠️  Failed to generate variants")
@@ -466,6 +476,118 @@ def improve_title(
     return result
 
 
+async def _generate_variants_concurrently(
+    original_titles: List[str],
+    segment: str,
+    age: str,
+    llm_config: Dict,
+    variant_count: int,
+    concurrency: int,
+) -> List[List[str]]:
+    """
+    Generate variants for several titles with bounded concurrency.
+
+    The blocking LLM calls run in threads; a semaphore caps how many are in
+    flight at once. Results are returned in the order of ``original_titles``.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def generate(original_title: str) -> List[str]:
+        async with semaphore:
+            return await asyncio.to_thread(
+                generate_title_variants,
+                original_title,
+                segment,
+                age,
+                llm_config,
+                variant_count,
+            )
+
+    return await asyncio.gather(*(generate(title) for title in original_titles))
+
+
+def improve_segment(
+    gender: str,
+    age: str,
+    titles_path: Path,
+    output_path: Path,
+    llm_config: Dict,
+    scoring_config: Dict,
+    variant_count: int = 5,
+    title_id: Optional[str] = None,
+    llm_concurrency: int = 4,
+) -> List[Dict]:
+    """
+    Improve all titles of one segment.
+
+    Variants for every title are generated concurrently first, then scored
+    and saved one title at a time so the printed output stays in file order.
+
+    Args:
+        gender: Target gender (men/women)
+        age: Target age range
+        titles_path: Titles directory
+        output_path: Output directory for improved titles
+        llm_config: LLM configuration
+        scoring_config: Scoring configuration
+        variant_count: Number of variants to generate per title
+        title_id: Only improve titles whose path contains this ID
+        llm_concurrency: Maximum number of concurrent LLM requests
+
+    Returns:
+        List of improvement results for the segment
+    """
+    print(f"\n{'='*60}")
+    print(f"Processing Segment: {gender} / {age}")
+    print(f"{'='*60}")
+
+    # Find title files
+    title_files = title_score.find_title_files(titles_path, gender, age)
+
+    if not title_files:
+        print(f"⚠️  No title files found for {gender}/{age}")
+        return []
+
+    # Filter by title_id if specified
+    if title_id:
+        title_files = [f for f in title_files if title_id in str(f)]
+        if not title_files:
+            print(f"⚠️  No files found matching title_id: {title_id}")
+            return []
+
+    print(f"Found {len(title_files)} title file(s)")
+
+    originals = [title_score.extract_title_from_file(f) for f in title_files]
+    pending = [title for title in originals if title]
+
+    print(f"Generating {variant_count} variants for {len(pending)} title(s)...")
+    generated = asyncio.run(
+        _generate_variants_concurrently(
+            pending, gender, age, llm_config, variant_count, llm_concurrency
+        )
+    )
+    generated_iter = iter(generated)
+
+    # Improve each title
+    results = []
+    for title_file, original_title in zip(title_files, originals):
+        result = improve_title(
+            title_file,
+            gender,
+            age,
+            output_path,
+            llm_config,
+            scoring_config,
+            variant_count,
+            variants=next(generated_iter) if original_title else None,
+        )
+
+        if result:
+            results.append(result)
+
+    return results
+
+
 def update_title_registry(improved_results: List[Dict], registry_path: Path) -> None:
     """
     Update title registry with improved titles.
@@ -547,6 +669,13 @@ def main():
     )
     parser.add_argument("--titles-dir", help="Custom titles directory path")
     parser.add_argument("--output-dir", help="Custom output directory path")
+    parser.add_argument(
+        "--llm-concurrency",
+        type=int,
+        default=4,
+        help="Maximum concurrent LLM requests per segment (default: 4)",
+    )
+    add_jobs_argument(parser)
 
     args = parser.parse_args()
 
@@ -578,43 +707,25 @@ def main():
                 segments_to_process.append((segment, age))
 
     # Process titles
-    all_results = []
-
-    for segment, age in segments_to_process:
-        print(f"\n{'='*60}")
-        print(f"Processing Segment: {segment} / {age}")
-        print(f"{'='*60}")
-
-        # Find title files
-        title_files = title_score.find_title_files(titles_path, segment, age)
-
-        if not title_files:
-            print(f"⚠️  No title files found for {segment}/{age}")
-            continue
-
-        # Filter by title_id if specified
-        if args.title_id:
-            title_files = [f for f in title_files if args.title_id in str(f)]
-            if not title_files:
-                print(f"⚠️  No files found matching title_id: {args.title_id}")
-                continue
-
-        print(f"Found {len(title_files)} title file(s)")
-
-        # Improve each title
-        for title_file in title_files:
-            result = improve_title(
-                title_file,
-                segment,
-                age,
-                output_path,
-                llm_config,
-                scoring_config,
-                args.variant_count,
-            )
+    runs = run_segments(
+        improve_segment,
+        segments_to_process,
+        {
+            "titles_path": titles_path,
+            "output_path": output_path,
+            "llm_config": llm_config,
+            "scoring_config": scoring_config,
+            "variant_count": args.variant_count,
+            "title_id": args.title_id,
+            "llm_concurrency": args.llm_concurrency,
+        },
+        jobs=args.jobs,
+    )
+    all_results = [result for run in runs if run["result"] for result in run["result"]]
 
-            if result:
-                all_results.append(result)
+    print_segment_summary(
+        runs, "Segment Summary", lambda results: f"{len(results or [])} title(s) improved"
+    )
 
     # Update registry
     if all_results:
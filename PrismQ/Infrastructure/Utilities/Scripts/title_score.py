@@ -17,6 +17,11 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 import re
+import sys
+
+# Add scripts directory to path to import segment_executor
+sys.path.insert(0, str(Path(__file__).parent))
+from segment_executor import add_jobs_argument, print_segment_summary, run_segments
 
 
 def load_scoring_config(config_path: str = None) -> Dict:
@@ -432,8 +437,9 @@ def score_titles_for_segment(
 
     print(f"Found {len(title_files)} title file(s)")
 
-    # Score each title
+    # Score each title (one timestamp for the whole segment run)
     results = []
+    scored_at = datetime.now().isoformat()
 
     for file_path in title_files:
         title_text = extract_title_from_file(file_path)
@@ -452,7 +458,7 @@ def score_titles_for_segment(
             "title": title_text,
             "source_file": str(file_path.name),
             "target_audience": {"gender": gender, "age": age},
-            "scored_at": datetime.now().isoformat(),
+            "scored_at": scored_at,
             **score_result,
         }
 
@@ -582,7 +588,10 @@ def save_voice_notes(voices_path: Path, gender: str, age: str, top_titles: List[
 
 
 def process_all_segments(
-    base_path: str = None, audience_config: Dict = None, scoring_config: Dict = None
+    base_path: str = None,
+    audience_config: Dict = None,
+    scoring_config: Dict = None,
+    jobs: int = 1,
 ) -> None:
     """
     Process all audience segments and score titles.
@@ -591,6 +600,7 @@ def process_all_segments(
         base_path: Base path for Generator folders (default: "Generator")
         audience_config: Audience configuration (default: load from file)
         scoring_config: Scoring configuration (default: load from file)
+        jobs: Number of segments to score in parallel worker processes
     """
     # Load configurations if not provided
     if audience_config is None:
@@ -629,39 +639,50 @@ def process_all_segments(
     print(f"Age groups: {len(age_groups)}")
     print()
 
-    total_scored = 0
-    total_top = 0
-
     # Process each segment
-    for gender in genders:
-        for age_group in age_groups:
-            scored, top = score_titles_for_segment(
-                titles_path, scores_path, voices_path, gender, age_group, scoring_config
-            )
-            total_scored += scored
-            total_top += top
+    segments = [(gender, age_group) for gender in genders for age_group in age_groups]
+    runs = run_segments(
+        score_titles_for_segment,
+        segments,
+        {
+            "titles_path": titles_path,
+            "scores_path": scores_path,
+            "voices_path": voices_path,
+            "config": scoring_config,
+        },
+        jobs=jobs,
+    )
+
+    results = [run["result"] for run in runs if run["result"]]
+    total_scored = sum(scored for scored, _ in results)
+    total_top = sum(top for _, top in results)
 
     # Print summary
-    print("\n" + "=" * 60)
-    print("📊 SUMMARY")
-    print("=" * 60)
+    print_segment_summary(
+        runs, "SUMMARY", lambda result: f"{result[0]} scored, {result[1]} top"
+    )
     print(f"Total titles scored: {total_scored}")
     print(f"Total top titles selected: {total_top}")
-    print(f"Segments processed: {len(genders) * len(age_groups)}")
     print()
     print("✅ Title scoring complete!")
 
 
 def main():
     """Main entry point."""
-    import sys
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Score titles for viral potential")
+    parser.add_argument("gender", nargs="?", help="Target gender (women/men)")
+    parser.add_argument("age", nargs="?", help="Target age range (e.g., 18-23)")
+    add_jobs_argument(parser)
+    args = parser.parse_args()
 
     # Parse command line arguments
-    if len(sys.argv) > 1:
+    if args.gender:
         # Process specific segment
-        if len(sys.argv) >= 3:
-            gender = sys.argv[1]
-            age = sys.argv[2]
+        if args.age:
+            gender = args.gender
+            age = args.age
 
             print(f"Processing single segment: {gender}/{age}")
 
@@ -690,7 +711,7 @@ def main():
             sys.exit(1)
     else:
         # Process all segments
-        process_all_segments()
+        process_all_segments(jobs=args.jobs)
 
 
 if __name__ == "__main__":
@@ -5,12 +5,22 @@ Multi-Platform Publisher for StoryGenerator
 Orchestrates video uploads across multiple platforms including YouTube, TikTok,
 Instagram, and Facebook. Provides unified interface for publishing videos with
 platform-specific optimizations, scheduling, error handling, and tracking.
+
+Platforms can be published to one after another or concurrently, with one
+worker pool per platform and a shared memory-mapped copy of the video for
+providers that send the file bytes themselves. Scheduled uploads and upload
+history are kept in a SQLite queue (see UploadQueue).
 """
 
 import os
 import json
+import inspect
+import mmap
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
 from enum import Enum
 from dataclasses import dataclass, asdict
@@ -70,6 +80,7 @@ class UploadTask:
     error: Optional[str] = None
     created_at: datetime = None
     completed_at: Optional[datetime] = None
+    task_id: Optional[int] = None
     
     def __post_init__(self):
         if self.created_at is None:
@@ -86,6 +97,7 @@ class UploadResult:
     message: Optional[str] = None
     error: Optional[str] = None
     uploaded_at: datetime = None
+    elapsed_seconds: Optional[float] = None
     
     def __post_init__(self):
         if self.uploaded_at is None and self.status == UploadStatus.SUCCESS:
@@ -101,6 +113,44 @@ class UploadResult:
         return result
 
 
+class SharedVideoBuffer:
+    """
+    Read-only memory map of a video shared by concurrent platform uploads.
+    
+    The file is read from disk once; providers that send the bytes themselves
+    get zero-copy views of the mapping instead of opening the file again.
+    """
+    
+    def __init__(self, video_path: Union[str, Path]):
+        self.path = str(video_path)
+        self._file = open(self.path, 'rb')
+        self.size = os.fstat(self._file.fileno()).st_size
+        # Empty files cannot be mapped
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        self._view = memoryview(self._mmap) if self._mmap is not None else memoryview(b'')
+    
+    def view(self) -> memoryview:
+        """Zero-copy view of the whole file."""
+        return self._view
+    
+    def close(self):
+        """Unmap the file once no uploads hold views of it."""
+        self._view.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # A provider still holds a slice; the mapping is freed with it
+                logger.warning(f"Video buffer still in use, deferring unmap: {self.path}")
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
 class MultiPlatformPublisher:
     """
     Multi-platform video publisher.
@@ -112,13 +162,28 @@ class MultiPlatformPublisher:
     - Scheduling and queue management
     - Error handling and retry logic
     - Upload tracking and reporting
+    - Concurrent fan-out with per-platform concurrency caps
     """
     
+    # Simultaneous uploads allowed per platform (across all publish calls)
+    DEFAULT_PLATFORM_CONCURRENCY = {
+        Platform.YOUTUBE: 1,
+        Platform.TIKTOK: 2,
+        Platform.INSTAGRAM: 2,
+        Platform.FACEBOOK: 2,
+    }
+    
+    # Providers that upload the file bytes themselves and accept a shared buffer
+    BUFFERED_PLATFORMS = (Platform.TIKTOK, Platform.FACEBOOK)
+    
     def __init__(
         self,
         output_dir: Optional[str] = None,
         credentials_dir: Optional[str] = None,
-        enable_platforms: Optional[List[Platform]] = None
+        enable_platforms: Optional[List[Platform]] = None,
+        platform_concurrency: Optional[Dict[Platform, int]] = None,
+        upload_timeout: Optional[float] = None,
+        queue_db: Optional[str] = None
     ):
         """
         Initialize multi-platform publisher.
@@ -127,16 +192,26 @@ class MultiPlatformPublisher:
             output_dir: Directory to save upload logs and reports
             credentials_dir: Directory containing platform credentials
             enable_platforms: List of platforms to enable (default: all)
+            platform_concurrency: Max simultaneous uploads per platform
+            upload_timeout: Default seconds to wait for concurrent uploads
+            queue_db: SQLite file for the upload queue (default: output_dir/upload_queue.db)
         """
         self.output_dir = Path(output_dir) if output_dir else Path("data/distribution")
         self.credentials_dir = Path(credentials_dir) if credentials_dir else Path("credentials")
         self.enable_platforms = enable_platforms or list(Platform)
+        self.platform_concurrency = dict(self.DEFAULT_PLATFORM_CONCURRENCY)
+        self.platform_concurrency.update(platform_concurrency or {})
+        self.upload_timeout = upload_timeout
+        
+        # One worker pool per platform, created on first concurrent publish
+        self._executors: Dict[Platform, ThreadPoolExecutor] = {}
+        self._executor_lock = threading.Lock()
         
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Upload queue and history
-        self.upload_queue: List[UploadTask] = []
-        self.upload_history: List[UploadTask] = []
+        # Durable upload queue and history (opened on first use)
+        self.queue_db = Path(queue_db) if queue_db else self.output_dir / "upload_queue.db"
+        self._queue = None
         
         # Platform clients (lazy initialization)
         self._youtube = None
@@ -147,6 +222,24 @@ class MultiPlatformPublisher:
         # Initialize platform availability
         self._check_platform_availability()
     
+    @property
+    def queue(self):
+        """SQLite-backed upload queue."""
+        if self._queue is None:
+            from PrismQ.Tools.UploadQueue import UploadQueue
+            self._queue = UploadQueue(self.queue_db)
+        return self._queue
+    
+    @property
+    def upload_queue(self) -> List[UploadTask]:
+        """Uploads waiting to run, earliest first."""
+        return self.queue.queued()
+    
+    @property
+    def upload_history(self) -> List[UploadTask]:
+        """Finished uploads, oldest first."""
+        return self.queue.history()
+    
     def _check_platform_availability(self):
         """Check which platforms are available based on dependencies."""
         self.available_platforms = {}
@@ -257,7 +350,8 @@ class MultiPlatformPublisher:
         self,
         platform: Platform,
         video_path: str,
-        metadata: PlatformMetadata
+        metadata: PlatformMetadata,
+        video_buffer: Optional[memoryview] = None
     ) -> UploadResult:
         """
         Upload video to a specific platform.
@@ -266,6 +360,7 @@ class MultiPlatformPublisher:
             platform: Target platform
             video_path: Path to video file
             metadata: Platform-specific metadata
+            video_buffer: Shared file contents for providers that send bytes
         
         Returns:
             UploadResult with upload status and details
@@ -297,11 +392,11 @@ class MultiPlatformPublisher:
             if platform == Platform.YOUTUBE:
                 return self._upload_to_youtube(video_path, metadata)
             elif platform == Platform.TIKTOK:
-                return self._upload_to_tiktok(video_path, metadata)
+                return self._upload_to_tiktok(video_path, metadata, video_buffer)
             elif platform == Platform.INSTAGRAM:
                 return self._upload_to_instagram(video_path, metadata)
             elif platform == Platform.FACEBOOK:
-                return self._upload_to_facebook(video_path, metadata)
+                return self._upload_to_facebook(video_path, metadata, video_buffer)
             else:
                 return UploadResult(
                     platform=platform,
@@ -372,14 +467,15 @@ class MultiPlatformPublisher:
             status=UploadStatus.SUCCESS if result.success else UploadStatus.FAILED,
             video_id=result.video_id,
             url=result.url,
-            message=result.message,
-            error=result.error if not result.success else None
+            message=getattr(result, 'message', None),
+            error=result.error_message if not result.success else None
         )
     
     def _upload_to_tiktok(
         self,
         video_path: Path,
-        metadata: PlatformMetadata
+        metadata: PlatformMetadata,
+        video_buffer: Optional[memoryview] = None
     ) -> UploadResult:
         """Upload video to TikTok."""
         client = self._get_tiktok_client()
@@ -416,15 +512,15 @@ class MultiPlatformPublisher:
         )
         
         # Upload video
-        result = client.upload_video(str(video_path), video_metadata)
+        result = self._call_upload(client, video_path, video_metadata, video_buffer)
         
         return UploadResult(
             platform=Platform.TIKTOK,
             status=UploadStatus.SUCCESS if result.success else UploadStatus.FAILED,
             video_id=result.video_id,
             url=result.url,
-            message=result.message,
-            error=result.error if not result.success else None
+            message=getattr(result, 'message', None),
+            error=result.error_message if not result.success else None
         )
     
     def _upload_to_instagram(
@@ -467,14 +563,15 @@ class MultiPlatformPublisher:
             status=UploadStatus.SUCCESS if result.success else UploadStatus.FAILED,
             video_id=result.video_id,
             url=result.url,
-            message=result.message,
-            error=result.error if not result.success else None
+            message=getattr(result, 'message', None),
+            error=result.error_message if not result.success else None
         )
     
     def _upload_to_facebook(
         self,
         video_path: Path,
-        metadata: PlatformMetadata
+        metadata: PlatformMetadata,
+        video_buffer: Optional[memoryview] = None
     ) -> UploadResult:
         """Upload video to Facebook."""
         client = self._get_facebook_client()
@@ -511,39 +608,202 @@ class MultiPlatformPublisher:
         )
         
         # Upload video
-        result = client.upload_video(str(video_path), video_metadata)
+        result = self._call_upload(client, video_path, video_metadata, video_buffer)
         
         return UploadResult(
             platform=Platform.FACEBOOK,
             status=UploadStatus.SUCCESS if result.success else UploadStatus.FAILED,
             video_id=result.video_id,
             url=result.url,
-            message=result.message,
-            error=result.error if not result.success else None
+            message=getattr(result, 'message', None),
+            error=result.error_message if not result.success else None
         )
     
+    @staticmethod
+    def _call_upload(client, video_path: Path, video_metadata, video_buffer: Optional[memoryview]):
+        """Call a provider's upload_video, passing the shared buffer if it accepts one."""
+        if video_buffer is not None:
+            parameters = inspect.signature(client.upload_video).parameters
+            if 'video_buffer' in parameters:
+                return client.upload_video(str(video_path), video_metadata, video_buffer=video_buffer)
+        return client.upload_video(str(video_path), video_metadata)
+    
+    def _get_executor(self, platform: Platform) -> ThreadPoolExecutor:
+        """Get or create the worker pool for a platform."""
+        with self._executor_lock:
+            if platform not in self._executors:
+                self._executors[platform] = ThreadPoolExecutor(
+                    max_workers=max(1, self.platform_concurrency.get(platform, 1)),
+                    thread_name_prefix=f"publish-{platform.value}"
+                )
+            return self._executors[platform]
+    
+    def close(self):
+        """Shut down the per-platform worker pools."""
+        with self._executor_lock:
+            executors, self._executors = self._executors, {}
+        for executor in executors.values():
+            executor.shutdown(wait=False)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def _timed_publish(
+        self,
+        platform: Platform,
+        video_path: str,
+        metadata: PlatformMetadata,
+        video_buffer: Optional[memoryview] = None
+    ) -> UploadResult:
+        """Publish to one platform and record how long it took."""
+        start = time.monotonic()
+        result = self.publish_to_platform(platform, video_path, metadata, video_buffer)
+        result.elapsed_seconds = round(time.monotonic() - start, 3)
+        
+        # Log result
+        if result.status == UploadStatus.SUCCESS:
+            logger.info(f"✓ Uploaded to {platform.value}: {result.url}")
+        else:
+            logger.error(f"✗ Failed to upload to {platform.value}: {result.error}")
+        
+        return result
+    
+    def _publish_concurrently(
+        self,
+        video_path: str,
+        jobs: List[Tuple[Platform, PlatformMetadata]],
+        timeout: Optional[float]
+    ) -> Tuple[List[UploadResult], List[Platform]]:
+        """
+        Fan a video out to every platform at once.
+        
+        Each upload runs on its platform's worker pool. The video is mapped
+        once and shared with providers that send bytes. Uploads still running
+        when the timeout expires are reported as failed; the mapping is
+        released when they finish.
+        
+        Returns:
+            Tuple of (results in job order, platforms that timed out)
+        """
+        buffer = None
+        if Path(video_path).is_file() and any(p in self.BUFFERED_PLATFORMS for p, _ in jobs):
+            buffer = SharedVideoBuffer(video_path)
+        
+        futures = []
+        for platform, platform_metadata in jobs:
+            video_buffer = buffer.view() if buffer and platform in self.BUFFERED_PLATFORMS else None
+            futures.append(self._get_executor(platform).submit(
+                self._timed_publish, platform, video_path, platform_metadata, video_buffer
+            ))
+        
+        done, not_done = wait(futures, timeout=timeout)
+        
+        results = []
+        timed_out = []
+        for (platform, _), future in zip(jobs, futures):
+            if future in done:
+                results.append(future.result())
+                continue
+            future.cancel()
+            timed_out.append(platform)
+            logger.error(f"✗ Upload to {platform.value} did not finish within {timeout}s")
+            results.append(UploadResult(
+                platform=platform,
+                status=UploadStatus.FAILED,
+                error=f"Timed out after {timeout}s",
+                elapsed_seconds=timeout
+            ))
+        
+        if buffer is not None:
+            if not_done:
+                self._close_when_done(buffer, not_done)
+            else:
+                buffer.close()
+        
+        return results, timed_out
+    
+    @staticmethod
+    def _close_when_done(buffer: SharedVideoBuffer, futures):
+        """Close a shared buffer after the last of some running uploads ends."""
+        remaining = [len(futures)]
+        lock = threading.Lock()
+        
+        def release(_):
+            with lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last:
+                buffer.close()
+        
+        for future in futures:
+            future.add_done_callback(release)
+    
     def publish_to_all(
         self,
         video_path: str,
         metadata: Dict[str, Union[PlatformMetadata, Dict[str, Any]]],
         platforms: Optional[List[Platform]] = None,
-        save_report: bool = True
+        save_report: bool = True,
+        concurrent: bool = False,
+        timeout: Optional[float] = None
     ) -> List[UploadResult]:
         """
         Publish video to multiple platforms.
         
+        Sequential mode uploads one platform after another. Concurrent mode
+        uploads to all platforms at once, so total time is that of the slowest
+        platform rather than the sum.
+        
         Args:
             video_path: Path to video file
             metadata: Dictionary mapping platform names to PlatformMetadata objects
                      or dictionaries with metadata
             platforms: List of platforms to publish to (default: all enabled)
             save_report: Whether to save upload report
+            concurrent: Upload to all platforms at the same time
+            timeout: Seconds to wait for concurrent uploads (default: upload_timeout)
         
         Returns:
             List of UploadResult objects for each platform
         """
         platforms = platforms or self.enable_platforms
-        results = []
+        jobs = self._resolve_metadata(metadata, platforms)
+        start = time.monotonic()
+        timed_out = []
+        
+        if concurrent:
+            timeout = timeout if timeout is not None else self.upload_timeout
+            results, timed_out = self._publish_concurrently(video_path, jobs, timeout)
+        else:
+            results = [
+                self._timed_publish(platform, video_path, platform_metadata)
+                for platform, platform_metadata in jobs
+            ]
+        
+        elapsed = round(time.monotonic() - start, 3)
+        
+        # Save report if requested
+        if save_report:
+            self._save_upload_report(
+                video_path,
+                results,
+                mode='concurrent' if concurrent else 'sequential',
+                elapsed_seconds=elapsed,
+                timed_out=timed_out
+            )
+        
+        return results
+    
+    def _resolve_metadata(
+        self,
+        metadata: Dict[str, Union[PlatformMetadata, Dict[str, Any]]],
+        platforms: List[Platform]
+    ) -> List[Tuple[Platform, PlatformMetadata]]:
+        """Pair each platform with its metadata, skipping platforms without any."""
+        jobs = []
         
         for platform in platforms:
             # Get metadata for this platform
@@ -562,21 +822,9 @@ class MultiPlatformPublisher:
             if isinstance(platform_metadata, dict):
                 platform_metadata = PlatformMetadata(**platform_metadata)
             
-            # Upload to platform
-            result = self.publish_to_platform(platform, video_path, platform_metadata)
-            results.append(result)
-            
-            # Log result
-            if result.status == UploadStatus.SUCCESS:
-                logger.info(f"✓ Uploaded to {platform.value}: {result.url}")
-            else:
-                logger.error(f"✗ Failed to upload to {platform.value}: {result.error}")
+            jobs.append((platform, platform_metadata))
         
-        # Save report if requested
-        if save_report:
-            self._save_upload_report(video_path, results)
-        
-        return results
+        return jobs
     
     def schedule_upload(
         self,
@@ -597,22 +845,17 @@ class MultiPlatformPublisher:
         Returns:
             UploadTask object representing the scheduled upload
         """
-        task = UploadTask(
-            video_path=video_path,
-            platforms=platforms,
-            metadata=metadata,
-            scheduled_time=scheduled_time,
-            status=UploadStatus.SCHEDULED
-        )
-        
-        self.upload_queue.append(task)
+        task = self.queue.add(video_path, metadata, platforms, scheduled_time)
         logger.info(f"Scheduled upload for {scheduled_time}: {video_path}")
         
         return task
     
     def process_queue(self, dry_run: bool = False) -> List[UploadTask]:
         """
-        Process pending uploads in the queue.
+        Process uploads in the queue that are due now.
+        
+        Failed platforms are rescheduled with backoff rather than returned
+        to the caller as finished.
         
         Args:
             dry_run: If True, don't actually upload, just simulate
@@ -620,50 +863,32 @@ class MultiPlatformPublisher:
         Returns:
             List of processed UploadTask objects
         """
-        processed = []
-        now = datetime.now()
-        
-        for task in self.upload_queue[:]:
-            # Check if task is ready to process
-            if task.status == UploadStatus.SCHEDULED:
-                if task.scheduled_time and task.scheduled_time > now:
-                    continue  # Not yet time
-            
-            if task.status not in [UploadStatus.PENDING, UploadStatus.SCHEDULED]:
-                continue  # Already processed or in progress
-            
-            # Process task
-            task.status = UploadStatus.IN_PROGRESS
-            
-            if not dry_run:
-                results = self.publish_to_all(
-                    task.video_path,
-                    task.metadata,
-                    task.platforms
-                )
-                
-                # Update task
-                task.results = [r.to_dict() for r in results]
-                task.status = UploadStatus.SUCCESS if all(
-                    r.status == UploadStatus.SUCCESS for r in results
-                ) else UploadStatus.FAILED
-            else:
-                task.status = UploadStatus.SUCCESS
-                logger.info(f"[DRY RUN] Would upload: {task.video_path}")
-            
-            task.completed_at = datetime.now()
-            
-            # Move to history
-            self.upload_queue.remove(task)
-            self.upload_history.append(task)
-            processed.append(task)
+        from PrismQ.Tools.UploadQueue import PublishScheduler
+        
+        return PublishScheduler(self, concurrent=False, dry_run=dry_run).run_pending()
+    
+    def start_scheduler(self, workers: int = 2, max_sleep: float = 60.0):
+        """
+        Start a background scheduler that publishes queued uploads when due.
+        
+        Args:
+            workers: Tasks processed at the same time
+            max_sleep: Longest sleep between queue checks, in seconds
+        
+        Returns:
+            Running PublishScheduler (call stop() to shut it down)
+        """
+        from PrismQ.Tools.UploadQueue import PublishScheduler
         
-        return processed
+        return PublishScheduler(self, workers=workers, max_sleep=max_sleep).start()
     
     def _save_upload_report(
         self,
         video_path: str,
-        results: List[UploadResult]
+        results: List[UploadResult],
+        mode: str = 'sequential',
+        elapsed_seconds: Optional[float] = None,
+        timed_out: Optional[List[Platform]] = None
     ):
         """Save upload report to JSON file."""
         video_name = Path(video_path).stem
@@ -674,11 +899,14 @@ class MultiPlatformPublisher:
         report = {
             'video_path': str(video_path),
             'uploaded_at': datetime.now().isoformat(),
+            'mode': mode,
+            'elapsed_seconds': elapsed_seconds,
             'platforms': [r.to_dict() for r in results],
             'summary': {
                 'total': len(results),
                 'success': sum(1 for r in results if r.status == UploadStatus.SUCCESS),
-                'failed': sum(1 for r in results if r.status == UploadStatus.FAILED)
+                'failed': sum(1 for r in results if r.status == UploadStatus.FAILED),
+                'timed_out': [p.value for p in timed_out or []]
             }
         }
         
@@ -700,20 +928,9 @@ class MultiPlatformPublisher:
             limit: Maximum number of results
         
         Returns:
-            List of UploadTask objects from history
+            List of UploadTask objects from history, oldest first
         """
-        history = self.upload_history
-        
-        if platform:
-            history = [
-                task for task in history
-                if platform in task.platforms
-            ]
-        
-        if limit:
-            history = history[-limit:]
-        
-        return history
+        return self.queue.history(platform=platform, limit=limit)
 
 
 def main():
@@ -764,6 +981,16 @@ def main():
         '--credentials-dir',
         help='Directory containing platform credentials'
     )
+    parser.add_argument(
+        '--concurrent',
+        action='store_true',
+        help='Upload to all platforms at the same time'
+    )
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        help='Seconds to wait for concurrent uploads'
+    )
     
     args = parser.parse_args()
     
@@ -793,7 +1020,14 @@ def main():
     print(f"Platforms: {', '.join(p.value for p in platforms)}")
     print(f"{'='*70}\n")
     
-    results = publisher.publish_to_all(args.video_path, metadata, platforms)
+    results = publisher.publish_to_all(
+        args.video_path,
+        metadata,
+        platforms,
+        concurrent=args.concurrent,
+        timeout=args.timeout
+    )
+    publisher.close()
     
     # Print results
     print(f"\n{'='*70}")
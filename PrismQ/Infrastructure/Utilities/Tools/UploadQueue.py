@@ -0,0 +1,662 @@
+#!/usr/bin/env python3
+"""
+Durable Upload Queue and Scheduler for MultiPlatformPublisher
+
+Stores scheduled uploads in SQLite so they survive restarts, and runs them on
+time with a daemon thread that sleeps until the next task is due. Each task
+tracks its platforms separately: a platform that fails is retried with
+exponential backoff without re-uploading to platforms that already succeeded.
+Workers refresh a heartbeat while they upload, so only tasks whose worker has
+stopped responding are requeued, however long the upload takes.
+
+Tables:
+    upload_tasks           One row per queued video, indexed on
+                           (status, scheduled_time) for due-task lookups and
+                           (status, completed_at) for history
+    upload_task_platforms  Per-platform status, attempts and result, indexed
+                           on (platform, task_id) for platform history
+"""
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from PrismQ.Tools.MultiPlatformPublisher import (
+    Platform,
+    PlatformMetadata,
+    UploadResult,
+    UploadStatus,
+    UploadTask,
+)
+
+logger = logging.getLogger(__name__)
+
+QUEUED_STATUSES = (UploadStatus.PENDING.value, UploadStatus.SCHEDULED.value)
+FINISHED_STATUSES = (UploadStatus.SUCCESS.value, UploadStatus.FAILED.value)
+
+
+class UploadQueue:
+    """
+    SQLite-backed queue of upload tasks.
+    
+    Safe to share between threads (each thread gets its own connection) and
+    between processes (tasks are claimed inside an immediate transaction, so
+    two workers never take the same task).
+    """
+    
+    def __init__(
+        self,
+        db_path: Union[str, Path] = "data/distribution/upload_queue.db",
+        max_attempts: int = 3,
+        retry_backoff: float = 60.0,
+        lease_seconds: float = 3600.0
+    ):
+        """
+        Initialize upload queue.
+        
+        Args:
+            db_path: Path to SQLite database file
+            max_attempts: Upload attempts per platform before giving up
+            retry_backoff: Base delay in seconds before a retry (doubles each attempt)
+            lease_seconds: Time without a heartbeat after which an in-progress
+                task is assumed abandoned
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.lease_seconds = lease_seconds
+        self._local = threading.local()
+        self._initialize()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection."""
+        conn = getattr(self._local, 'connection', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.connection = conn
+        return conn
+    
+    def _initialize(self):
+        """Create tables and indexes."""
+        conn = self._connect()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS upload_tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                video_path TEXT NOT NULL,
+                metadata TEXT NOT NULL,
+                status TEXT NOT NULL,
+                scheduled_time REAL NOT NULL,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                heartbeat_at REAL,
+                completed_at REAL,
+                worker_id TEXT,
+                error TEXT
+            );
+            
+            CREATE TABLE IF NOT EXISTS upload_task_platforms (
+                task_id INTEGER NOT NULL REFERENCES upload_tasks(id) ON DELETE CASCADE,
+                platform TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                result TEXT,
+                PRIMARY KEY (task_id, platform)
+            );
+            
+            CREATE INDEX IF NOT EXISTS idx_upload_tasks_due
+            ON upload_tasks(status, scheduled_time);
+            
+            CREATE INDEX IF NOT EXISTS idx_upload_tasks_history
+            ON upload_tasks(status, completed_at);
+            
+            CREATE INDEX IF NOT EXISTS idx_upload_task_platforms_platform
+            ON upload_task_platforms(platform, task_id);
+        """)
+        columns = {row['name'] for row in conn.execute("PRAGMA table_info(upload_tasks)")}
+        if 'heartbeat_at' not in columns:
+            conn.execute("ALTER TABLE upload_tasks ADD COLUMN heartbeat_at REAL")
+    
+    def close(self):
+        """Close this thread's connection."""
+        conn = getattr(self._local, 'connection', None)
+        if conn is not None:
+            conn.close()
+            self._local.connection = None
+    
+    def add(
+        self,
+        video_path: str,
+        metadata: Dict[Any, Union[PlatformMetadata, Dict[str, Any]]],
+        platforms: List[Platform],
+        scheduled_time: Optional[datetime] = None
+    ) -> UploadTask:
+        """
+        Queue a video for upload.
+        
+        Args:
+            video_path: Path to video file
+            metadata: Platform-specific metadata keyed by Platform or platform name
+            platforms: Platforms to publish to
+            scheduled_time: When to publish (default: as soon as possible)
+        
+        Returns:
+            UploadTask with its queue id set
+        """
+        now = time.time()
+        status = UploadStatus.SCHEDULED if scheduled_time else UploadStatus.PENDING
+        due = scheduled_time.timestamp() if scheduled_time else now
+        stored_metadata = {}
+        for platform in platforms:
+            value = metadata.get(platform.value, metadata.get(platform))
+            if isinstance(value, PlatformMetadata):
+                value = value.to_dict()
+            if value is not None:
+                stored_metadata[platform.value] = value
+        
+        conn = self._connect()
+        with _transaction(conn):
+            cursor = conn.execute(
+                """
+                INSERT INTO upload_tasks (video_path, metadata, status, scheduled_time, created_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (str(video_path), json.dumps(stored_metadata), status.value, due, now)
+            )
+            task_id = cursor.lastrowid
+            conn.executemany(
+                "INSERT INTO upload_task_platforms (task_id, platform, status) VALUES (?, ?, ?)",
+                [(task_id, p.value, UploadStatus.PENDING.value) for p in platforms]
+            )
+        
+        return self.get(task_id)
+    
+    def get(self, task_id: int) -> Optional[UploadTask]:
+        """Load a task by id."""
+        row = self._connect().execute("SELECT * FROM upload_tasks WHERE id = ?", (task_id,)).fetchone()
+        return self._to_task(row) if row else None
+    
+    def next_due_time(self) -> Optional[float]:
+        """Epoch time of the earliest queued task, or None if the queue is empty."""
+        row = self._connect().execute(
+            f"""
+            SELECT MIN(scheduled_time) FROM upload_tasks
+            WHERE status IN ({_placeholders(QUEUED_STATUSES)})
+            """,
+            QUEUED_STATUSES
+        ).fetchone()
+        return row[0]
+    
+    def claim_due(self, worker_id: Optional[str] = None, now: Optional[float] = None) -> Optional[UploadTask]:
+        """
+        Atomically take the earliest due task and mark it in progress.
+        
+        Returns:
+            The claimed UploadTask, or None if nothing is due
+        """
+        now = time.time() if now is None else now
+        worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+        conn = self._connect()
+        with _transaction(conn):
+            row = conn.execute(
+                f"""
+                SELECT id FROM upload_tasks
+                WHERE status IN ({_placeholders(QUEUED_STATUSES)}) AND scheduled_time <= ?
+                ORDER BY scheduled_time
+                LIMIT 1
+                """,
+                (*QUEUED_STATUSES, now)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                """
+                UPDATE upload_tasks SET status = ?, started_at = ?, heartbeat_at = ?, worker_id = ?
+                WHERE id = ?
+                """,
+                (UploadStatus.IN_PROGRESS.value, now, now, worker_id, row['id'])
+            )
+        return self.get(row['id'])
+    
+    def complete(
+        self,
+        task_id: int,
+        results: List[UploadResult],
+        permanent: Optional[List[Platform]] = None
+    ) -> UploadTask:
+        """
+        Record upload results for a claimed task.
+        
+        Successful platforms are done. Failed platforms are retried with
+        exponential backoff until max_attempts, after which the task fails.
+        
+        Args:
+            task_id: Task id returned by claim_due
+            results: One result per platform attempted
+            permanent: Failed platforms that a retry cannot fix (e.g. no
+                metadata); they are given up on immediately
+        
+        Returns:
+            The updated UploadTask
+        """
+        now = time.time()
+        conn = self._connect()
+        with _transaction(conn):
+            for result in results:
+                conn.execute(
+                    """
+                    UPDATE upload_task_platforms
+                    SET status = ?, attempts = attempts + 1, result = ?
+                    WHERE task_id = ? AND platform = ?
+                    """,
+                    (result.status.value, json.dumps(result.to_dict(), default=str), task_id, result.platform.value)
+                )
+            for platform in permanent or ():
+                conn.execute(
+                    """
+                    UPDATE upload_task_platforms SET attempts = MAX(attempts, ?)
+                    WHERE task_id = ? AND platform = ?
+                    """,
+                    (self.max_attempts, task_id, platform.value)
+                )
+            
+            rows = conn.execute(
+                "SELECT status, attempts FROM upload_task_platforms WHERE task_id = ?", (task_id,)
+            ).fetchall()
+            retryable = [
+                r['attempts'] for r in rows
+                if r['status'] != UploadStatus.SUCCESS.value and r['attempts'] < self.max_attempts
+            ]
+            failed = [r for r in rows if r['status'] != UploadStatus.SUCCESS.value]
+            
+            if retryable:
+                delay = self.retry_backoff * (2 ** (max(retryable) - 1))
+                conn.execute(
+                    """
+                    UPDATE upload_tasks SET status = ?, scheduled_time = ?, error = ?, worker_id = NULL
+                    WHERE id = ?
+                    """,
+                    (UploadStatus.SCHEDULED.value, now + delay, _errors(results), task_id)
+                )
+                logger.warning(f"Upload task {task_id}: {len(retryable)} platform(s) failed, retrying in {delay:.0f}s")
+            else:
+                status = UploadStatus.FAILED if failed else UploadStatus.SUCCESS
+                conn.execute(
+                    "UPDATE upload_tasks SET status = ?, completed_at = ?, error = ? WHERE id = ?",
+                    (status.value, now, _errors(results) if failed else None, task_id)
+                )
+        
+        return self.get(task_id)
+    
+    def fail(self, task_id: int, error: str) -> UploadTask:
+        """Mark a claimed task as failed without retrying (e.g. missing video file)."""
+        conn = self._connect()
+        conn.execute(
+            "UPDATE upload_tasks SET status = ?, completed_at = ?, error = ? WHERE id = ?",
+            (UploadStatus.FAILED.value, time.time(), error, task_id)
+        )
+        return self.get(task_id)
+    
+    def heartbeat(self, task_id: int) -> bool:
+        """
+        Extend the lease of a claimed task while its upload is running.
+        
+        Returns:
+            False if the task is no longer in progress (e.g. it was requeued)
+        """
+        cursor = self._connect().execute(
+            "UPDATE upload_tasks SET heartbeat_at = ? WHERE id = ? AND status = ?",
+            (time.time(), task_id, UploadStatus.IN_PROGRESS.value)
+        )
+        return cursor.rowcount == 1
+    
+    def recover_abandoned(self) -> int:
+        """
+        Requeue in-progress tasks whose worker missed its heartbeat for longer
+        than the lease (e.g. crashed).
+        
+        Returns:
+            Number of tasks requeued
+        """
+        cutoff = time.time() - self.lease_seconds
+        cursor = self._connect().execute(
+            """
+            UPDATE upload_tasks SET status = ?, worker_id = NULL
+            WHERE status = ? AND COALESCE(heartbeat_at, started_at) < ?
+            """,
+            (UploadStatus.PENDING.value, UploadStatus.IN_PROGRESS.value, cutoff)
+        )
+        if cursor.rowcount:
+            logger.warning(f"Requeued {cursor.rowcount} abandoned upload task(s)")
+        return cursor.rowcount
+    
+    def pending_platforms(self, task_id: int) -> List[Platform]:
+        """Platforms of a task that still need uploading."""
+        rows = self._connect().execute(
+            "SELECT platform FROM upload_task_platforms WHERE task_id = ? AND status != ?",
+            (task_id, UploadStatus.SUCCESS.value)
+        ).fetchall()
+        return [Platform(r['platform']) for r in rows]
+    
+    def queued(self) -> List[UploadTask]:
+        """Tasks waiting to run, earliest first."""
+        rows = self._connect().execute(
+            f"""
+            SELECT * FROM upload_tasks
+            WHERE status IN ({_placeholders(QUEUED_STATUSES)})
+            ORDER BY scheduled_time
+            """,
+            QUEUED_STATUSES
+        ).fetchall()
+        return [self._to_task(r) for r in rows]
+    
+    def history(self, platform: Optional[Platform] = None, limit: Optional[int] = None) -> List[UploadTask]:
+        """
+        Finished tasks, oldest first.
+        
+        Args:
+            platform: Only tasks that published (or tried to) to this platform
+            limit: Return only the most recent tasks
+        
+        Returns:
+            List of finished UploadTask objects
+        """
+        query = f"""
+            SELECT t.* FROM upload_tasks t
+            WHERE t.status IN ({_placeholders(FINISHED_STATUSES)})
+        """
+        params: List[Any] = list(FINISHED_STATUSES)
+        if platform:
+            query += """
+                AND t.id IN (SELECT task_id FROM upload_task_platforms WHERE platform = ?)
+            """
+            params.append(platform.value)
+        query += " ORDER BY t.completed_at DESC, t.id DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        
+        rows = self._connect().execute(query, params).fetchall()
+        return [self._to_task(r) for r in reversed(rows)]
+    
+    def _to_task(self, row: sqlite3.Row) -> UploadTask:
+        """Build an UploadTask from a task row and its platform rows."""
+        platform_rows = self._connect().execute(
+            "SELECT platform, result FROM upload_task_platforms WHERE task_id = ? ORDER BY rowid",
+            (row['id'],)
+        ).fetchall()
+        metadata = {
+            Platform(name): PlatformMetadata(**value)
+            for name, value in json.loads(row['metadata']).items()
+        }
+        results = [json.loads(r['result']) for r in platform_rows if r['result']]
+        
+        return UploadTask(
+            video_path=row['video_path'],
+            platforms=[Platform(r['platform']) for r in platform_rows],
+            metadata=metadata,
+            scheduled_time=datetime.fromtimestamp(row['scheduled_time']),
+            status=UploadStatus(row['status']),
+            results=results or None,
+            error=row['error'],
+            created_at=datetime.fromtimestamp(row['created_at']),
+            completed_at=datetime.fromtimestamp(row['completed_at']) if row['completed_at'] else None,
+            task_id=row['id']
+        )
+
+
+class PublishScheduler:
+    """
+    Daemon that publishes queued uploads when they are due.
+    
+    A scheduler thread sleeps until the earliest scheduled_time (or until a
+    new task is added) and hands due tasks to a pool of workers. Tasks added by
+    other processes are picked up within max_sleep seconds, and tasks whose
+    worker died are requeued every recover_interval seconds. Database errors
+    (e.g. "database is locked") are logged and the loop retries after
+    ERROR_BACKOFF seconds.
+    
+    Example:
+        >>> scheduler = PublishScheduler(publisher, workers=2).start()
+        >>> scheduler.schedule("video.mp4", metadata, [Platform.YOUTUBE], publish_at)
+        >>> scheduler.stop()
+    """
+    
+    ERROR_BACKOFF = 5.0
+    
+    def __init__(
+        self,
+        publisher,
+        queue: Optional[UploadQueue] = None,
+        workers: int = 2,
+        max_sleep: float = 60.0,
+        concurrent: bool = True,
+        dry_run: bool = False,
+        recover_interval: float = 300.0
+    ):
+        """
+        Initialize scheduler.
+        
+        Args:
+            publisher: MultiPlatformPublisher used for uploads
+            queue: Upload queue (default: the publisher's queue)
+            workers: Tasks processed at the same time
+            max_sleep: Longest sleep between queue checks, in seconds
+            concurrent: Publish each task to its platforms concurrently
+            dry_run: Mark tasks done without uploading
+            recover_interval: Seconds between checks for abandoned tasks
+        """
+        self.publisher = publisher
+        self.queue = queue or publisher.queue
+        self.workers = max(1, workers)
+        self.max_sleep = max_sleep
+        self.concurrent = concurrent
+        self.dry_run = dry_run
+        self.recover_interval = recover_interval
+        self._next_recovery = 0.0
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._free_workers = threading.Semaphore(self.workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    def schedule(
+        self,
+        video_path: str,
+        metadata: Dict[Any, Union[PlatformMetadata, Dict[str, Any]]],
+        platforms: List[Platform],
+        scheduled_time: Optional[datetime] = None
+    ) -> UploadTask:
+        """Queue an upload and wake the scheduler so it can re-plan its sleep."""
+        task = self.queue.add(video_path, metadata, platforms, scheduled_time)
+        self._wakeup.set()
+        return task
+    
+    def start(self) -> "PublishScheduler":
+        """Start the scheduler thread and worker pool."""
+        if self._thread is None:
+            self._next_recovery = 0.0
+            self._stopping.clear()
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="upload-worker")
+            self._thread = threading.Thread(target=self._run, name="upload-scheduler", daemon=True)
+            self._thread.start()
+            logger.info(f"Upload scheduler started with {self.workers} worker(s)")
+        return self
+    
+    def stop(self, wait: bool = True):
+        """Stop scheduling new tasks and optionally wait for running ones."""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, *exc):
+        self.stop()
+    
+    def _run(self):
+        """Scheduler loop: dispatch due tasks, then sleep until the next one."""
+        while not self._stopping.is_set():
+            try:
+                timeout = self._dispatch()
+            except Exception as e:
+                logger.error(f"Upload scheduler error, retrying in {self.ERROR_BACKOFF:.0f}s: {e}")
+                timeout = self.ERROR_BACKOFF
+            self._wakeup.wait(timeout)
+            self._wakeup.clear()
+    
+    def _dispatch(self) -> float:
+        """Hand due tasks to free workers; returns how long to sleep."""
+        if time.time() >= self._next_recovery:
+            self.queue.recover_abandoned()
+            self._next_recovery = time.time() + self.recover_interval
+        
+        busy = False
+        while True:
+            if not self._free_workers.acquire(blocking=False):
+                busy = True
+                break
+            try:
+                task = self.queue.claim_due()
+                if task is not None:
+                    future = self._executor.submit(self.process_task, task)
+            except BaseException:
+                self._free_workers.release()
+                raise
+            if task is None:
+                self._free_workers.release()
+                break
+            future.add_done_callback(self._on_task_done)
+        
+        # With every worker busy, a finishing task wakes the loop
+        next_due = self.queue.next_due_time()
+        timeout = self.max_sleep
+        if next_due is not None and not busy:
+            timeout = min(max(0.0, next_due - time.time()), self.max_sleep)
+        return min(timeout, max(0.0, self._next_recovery - time.time()))
+    
+    def _on_task_done(self, future):
+        self._free_workers.release()
+        # A finished task may have been rescheduled for retry
+        self._wakeup.set()
+        if future.exception() is not None:
+            logger.error(f"Upload worker crashed: {future.exception()}")
+    
+    def run_pending(self) -> List[UploadTask]:
+        """
+        Process every task that is due now in the calling thread.
+        
+        Returns:
+            List of processed UploadTask objects
+        """
+        processed = []
+        while True:
+            task = self.queue.claim_due()
+            if task is None:
+                return processed
+            processed.append(self.process_task(task))
+    
+    def process_task(self, task: UploadTask) -> UploadTask:
+        """Upload a claimed task to its remaining platforms and record the results."""
+        platforms = self.queue.pending_platforms(task.task_id)
+        
+        if self.dry_run:
+            logger.info(f"[DRY RUN] Would upload: {task.video_path}")
+            results = [UploadResult(platform=p, status=UploadStatus.SUCCESS) for p in platforms]
+            return self.queue.complete(task.task_id, results)
+        
+        if not Path(task.video_path).exists():
+            return self.queue.fail(task.task_id, f"Video file not found: {task.video_path}")
+        
+        try:
+            with _Heartbeat(self.queue, task.task_id):
+                results = self.publisher.publish_to_all(
+                    task.video_path,
+                    task.metadata,
+                    platforms,
+                    concurrent=self.concurrent
+                )
+        except Exception as e:
+            logger.error(f"Upload task {task.task_id} failed: {e}")
+            results = [UploadResult(platform=p, status=UploadStatus.FAILED, error=str(e)) for p in platforms]
+        
+        # Platforms without metadata are skipped by the publisher; retrying
+        # cannot fix that, so they fail right away
+        attempted = {r.platform for r in results}
+        missing = [p for p in platforms if p not in attempted]
+        results += [
+            UploadResult(platform=p, status=UploadStatus.FAILED, error="No metadata for platform")
+            for p in missing
+        ]
+        return self.queue.complete(task.task_id, results, permanent=missing)
+
+
+class _transaction:
+    """BEGIN IMMEDIATE ... COMMIT on an autocommit connection, rolling back on error."""
+    
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+    
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+class _Heartbeat:
+    """Refresh a claimed task's heartbeat from a background thread until exit."""
+    
+    def __init__(self, queue: UploadQueue, task_id: int):
+        self.queue = queue
+        self.task_id = task_id
+        self.interval = max(queue.lease_seconds / 3, 0.01)
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._beat, name=f"upload-heartbeat-{task_id}", daemon=True)
+    
+    def __enter__(self):
+        self._thread.start()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self._done.set()
+        self._thread.join()
+    
+    def _beat(self):
+        try:
+            while not self._done.wait(self.interval):
+                try:
+                    if not self.queue.heartbeat(self.task_id):
+                        logger.warning(f"Upload task {self.task_id} lost its lease while uploading")
+                        return
+                except sqlite3.Error as e:
+                    logger.warning(f"Upload task {self.task_id} heartbeat failed: {e}")
+        finally:
+            self.queue.close()
+
+
+def _placeholders(values) -> str:
+    return ", ".join("?" for _ in values)
+
+
+def _errors(results: List[UploadResult]) -> Optional[str]:
+    errors = [f"{r.platform.value}: {r.error}" for r in results if r.status != UploadStatus.SUCCESS]
+    return "; ".join(errors) or None
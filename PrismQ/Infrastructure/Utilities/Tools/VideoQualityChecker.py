@@ -11,16 +11,81 @@ Performs comprehensive quality control checks on final video output including:
 - Audio-video synchronization
 - Duration validation
 
+Deep mode additionally decodes sampled frames and the audio track in one pass
+to catch black frames, frozen segments and silence gaps.
+
 Generates detailed QC reports with pass/fail status and quality scores.
 """
 
 import os
 import json
-import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, Iterable, List, Tuple, Optional, Any
 from datetime import datetime
 
+from PrismQ.Shared.media_probe import MediaInfo, MediaProbe, get_media_probe
+from PrismQ.Shared.video_frames import ANALYSIS_WIDTH, analysis_size, find_segments, scan_media
+
+
+def deep_scan_video(
+    video_path: str,
+    sample_fps: float = 2.0,
+    time_budget: Optional[float] = 60.0,
+    with_audio: bool = True,
+    width: int = 0,
+    height: int = 0,
+    min_black_seconds: float = 1.0,
+    min_freeze_seconds: float = 2.0,
+    silence_threshold_db: float = -50.0,
+    min_silence_seconds: float = 1.5,
+) -> Dict[str, Any]:
+    """
+    Scan sampled frames and audio of one video for content defects.
+    
+    Module-level so it can run in a process pool.
+    
+    Args:
+        video_path: Path to video file
+        sample_fps: Frames per second to sample
+        time_budget: Wall-clock seconds allowed for this video (None = unlimited)
+        with_audio: Also decode the audio track
+        width: Source width, used to keep the aspect ratio (0 if unknown)
+        height: Source height (0 if unknown)
+        min_black_seconds: Report black segments at least this long
+        min_freeze_seconds: Report frozen segments at least this long
+        silence_threshold_db: Audio windows below this level (dBFS) are silent
+        min_silence_seconds: Report silence gaps at least this long
+    
+    Returns:
+        Dictionary with black, frozen and silent segments (in seconds)
+    """
+    scan_width, scan_height = analysis_size(width, height, ANALYSIS_WIDTH)
+    scan = scan_media(
+        video_path,
+        sample_fps=sample_fps,
+        width=scan_width,
+        height=scan_height,
+        with_audio=with_audio,
+        time_budget=time_budget,
+    )
+    
+    return {
+        'frames': scan.frames.frames,
+        'sample_fps': sample_fps,
+        'analyzed_seconds': scan.analyzed_seconds,
+        'elapsed_seconds': scan.elapsed_seconds,
+        'truncated': scan.truncated,
+        'error': scan.error,
+        'has_audio': scan.audio is not None,
+        'black_segments': find_segments(scan.frames.black_mask(), sample_fps, min_black_seconds),
+        'freeze_segments': find_segments(scan.frames.freeze_mask(), sample_fps, min_freeze_seconds),
+        'silence_segments': (
+            scan.audio.gaps(silence_threshold_db, min_silence_seconds) if scan.audio else []
+        ),
+    }
+
 
 class VideoQualityChecker:
     """
@@ -64,6 +129,14 @@ class VideoQualityChecker:
     
     MAX_SYNC_OFFSET = 0.5              # seconds
     
+    # Deep (frame content) checks
+    DEEP_SAMPLE_FPS = 2.0              # sampled frames per second
+    DEEP_TIME_BUDGET = 60.0            # wall-clock seconds per video
+    MAX_BLACK_SECONDS = 1.0            # longest allowed black segment
+    MAX_FREEZE_SECONDS = 2.0           # longest allowed frozen segment
+    SILENCE_THRESHOLD_DB = -50.0       # dBFS
+    MAX_SILENCE_SECONDS = 1.5          # longest allowed silence gap
+    
     # Scoring weights for overall quality
     WEIGHTS = {
         'file_properties': 0.10,
@@ -75,34 +148,100 @@ class VideoQualityChecker:
         'duration': 0.10
     }
     
-    def __init__(self):
-        """Initialize the video quality checker."""
-        self.ffprobe_cmd = self._find_ffprobe()
-    
-    def _find_ffprobe(self) -> str:
-        """Find ffprobe executable."""
-        # Try common locations
-        for cmd in ['ffprobe', '/usr/bin/ffprobe', '/usr/local/bin/ffprobe']:
-            try:
-                result = subprocess.run(
-                    [cmd, '-version'],
-                    capture_output=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    return cmd
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                continue
-        
-        # Fallback to 'ffprobe' and let it fail later if not found
-        return 'ffprobe'
+    def __init__(
+        self,
+        probe: Optional[MediaProbe] = None,
+        deep: bool = False,
+        sample_fps: float = DEEP_SAMPLE_FPS,
+        time_budget: Optional[float] = DEEP_TIME_BUDGET
+    ):
+        """
+        Initialize the video quality checker.
+        
+        Args:
+            probe: Media probe to use (defaults to the shared, cached probe)
+            deep: Run frame-content checks by default
+            sample_fps: Frames per second decoded in deep mode
+            time_budget: Wall-clock seconds of deep scanning per video
+                (None = scan the whole video)
+        """
+        self.probe = probe or get_media_probe()
+        self.deep = deep
+        self.sample_fps = sample_fps
+        self.time_budget = time_budget
+        self._deep_results: Dict[str, Dict[str, Any]] = {}
+    
+    @property
+    def ffprobe_cmd(self) -> str:
+        """ffprobe executable used by the media probe."""
+        return self.probe.ffprobe_cmd
+    
+    def prefetch_metadata(self, video_paths: Iterable[str]) -> Dict[str, Optional[MediaInfo]]:
+        """
+        Probe many videos concurrently so later checks are served from cache.
+        
+        Args:
+            video_paths: Paths to video files
+        
+        Returns:
+            Dictionary mapping each path to its MediaInfo (None if unreadable)
+        """
+        return self.probe.probe_many(video_paths)
+    
+    def check_videos(
+        self,
+        video_paths: Iterable[str],
+        deep: Optional[bool] = None,
+        max_workers: Optional[int] = None,
+        save_reports: bool = True,
+        output_dir: Optional[str] = None
+    ) -> List[Tuple[str, bool, Dict[str, Any]]]:
+        """
+        Check many videos.
+        
+        Metadata is probed concurrently up front. In deep mode the frame scans
+        run in a process pool, one video per worker.
+        
+        Args:
+            video_paths: Paths to video files
+            deep: Run frame-content checks (defaults to the checker setting)
+            max_workers: Worker processes for deep scans (default: CPU count)
+            save_reports: Whether to save a QC report per video
+            output_dir: Directory to save reports (defaults to video directory)
+        
+        Returns:
+            List of (video_path, passed, report) in input order
+        """
+        video_paths = [str(p) for p in video_paths]
+        deep = self.deep if deep is None else deep
+        infos = self.prefetch_metadata(video_paths)
+        
+        if deep:
+            scannable = [p for p in video_paths if infos.get(p) is not None and infos[p].has_video]
+            if scannable:
+                with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                    futures = {path: pool.submit(self._deep_scan_job(infos[path]), path) for path in scannable}
+                    for path, future in futures.items():
+                        try:
+                            self._deep_results[path] = future.result()
+                        except Exception as e:
+                            self._deep_results[path] = {'frames': 0, 'error': str(e)}
+        
+        results = []
+        for path in video_paths:
+            passed, report = self.check_video_quality(
+                path, save_report=save_reports, output_dir=output_dir, deep=deep
+            )
+            results.append((path, passed, report))
+        return results
     
     def check_video_quality(
         self,
         video_path: str,
         title_id: Optional[str] = None,
         save_report: bool = True,
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        deep: Optional[bool] = None
     ) -> Tuple[bool, Dict[str, Any]]:
         """
         Perform comprehensive quality check on a video file.
@@ -112,6 +251,7 @@ class VideoQualityChecker:
             title_id: Optional title ID for the report
             save_report: Whether to save the QC report to a JSON file
             output_dir: Directory to save the report (defaults to video directory)
+            deep: Also check frame content (defaults to the checker setting)
         
         Returns:
             Tuple of (passed: bool, report: dict)
@@ -171,6 +311,19 @@ class VideoQualityChecker:
             report['checks']['av_sync'] = self._check_av_sync(metadata)
             report['checks']['duration'] = self._check_duration(metadata)
             
+            if self.deep if deep is None else deep:
+                scan = self._deep_results.pop(str(video_path), None)
+                if scan is None:
+                    scan = self._deep_scan_job(self.probe.probe(video_path))(str(video_path))
+                report['deep_scan'] = {
+                    key: scan.get(key)
+                    for key in ('frames', 'sample_fps', 'analyzed_seconds', 'elapsed_seconds', 'truncated', 'error')
+                }
+                if scan.get('error'):
+                    report['warnings'].append(f"Deep scan failed: {scan['error']}")
+                else:
+                    report['checks'].update(self._check_frame_content(scan))
+            
             # Calculate overall quality score
             quality_score = self._calculate_quality_score(report['checks'])
             report['quality_score'] = quality_score
@@ -185,7 +338,10 @@ class VideoQualityChecker:
             
             # Determine overall status
             # Pass if quality score >= 70 and no critical issues
-            critical_checks = ['file_properties', 'codec_format', 'resolution_legibility']
+            critical_checks = [
+                'file_properties', 'codec_format', 'resolution_legibility',
+                'black_frames'
+            ]
             critical_failed = any(
                 not report['checks'][check]['passed'] 
                 for check in critical_checks 
@@ -211,9 +367,67 @@ class VideoQualityChecker:
             
             return False, report
     
+    def _deep_scan_job(self, info: Optional[MediaInfo]):
+        """Build a picklable deep-scan callable for one video."""
+        return partial(
+            deep_scan_video,
+            sample_fps=self.sample_fps,
+            time_budget=self.time_budget,
+            with_audio=info.has_audio if info is not None else True,
+            width=info.width if info is not None else 0,
+            height=info.height if info is not None else 0,
+            min_black_seconds=self.MAX_BLACK_SECONDS,
+            min_freeze_seconds=self.MAX_FREEZE_SECONDS,
+            silence_threshold_db=self.SILENCE_THRESHOLD_DB,
+            min_silence_seconds=self.MAX_SILENCE_SECONDS
+        )
+    
+    def _check_frame_content(self, scan: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Turn a deep scan into black-frame, freeze and silence-gap checks."""
+        def describe(segments):
+            return ', '.join(f"{start:.1f}-{end:.1f}s" for start, end in segments[:5])
+        
+        black = scan['black_segments']
+        frozen = scan['freeze_segments']
+        silent = scan['silence_segments']
+        coverage = {'analyzed_seconds': scan['analyzed_seconds'], 'truncated': scan['truncated']}
+        
+        checks = {
+            'black_frames': {
+                'name': 'Black Frames',
+                'passed': not black,
+                'details': dict(coverage, segments=black, max_allowed_seconds=self.MAX_BLACK_SECONDS),
+                'message': f"Black frames at {describe(black)}" if black else 'No black segments'
+            },
+            'frozen_frames': {
+                'name': 'Frozen Frames',
+                'passed': not frozen,
+                'details': dict(coverage, segments=frozen, max_allowed_seconds=self.MAX_FREEZE_SECONDS),
+                'message': f"Frozen video at {describe(frozen)}" if frozen else 'No frozen segments',
+                # Static-image and slideshow videos freeze on purpose
+                'severity': 'warning' if frozen else 'ok'
+            }
+        }
+        
+        if scan['has_audio']:
+            checks['audio_gaps'] = {
+                'name': 'Audio Gaps',
+                'passed': not silent,
+                'details': dict(
+                    coverage,
+                    segments=silent,
+                    threshold_db=self.SILENCE_THRESHOLD_DB,
+                    max_allowed_seconds=self.MAX_SILENCE_SECONDS
+                ),
+                'message': f"Silence at {describe(silent)}" if silent else 'No silence gaps',
+                'severity': 'warning' if silent else 'ok'
+            }
+        
+        return checks
+    
     def _get_video_metadata(self, video_path: Path) -> Optional[Dict]:
         """
-        Extract video metadata using ffprobe.
+        Extract video metadata through the shared media probe.
         
         Args:
             video_path: Path to video file
@@ -221,43 +435,16 @@ class VideoQualityChecker:
         Returns:
             Dictionary with video metadata or None if extraction failed
         """
-        try:
-            cmd = [
-                self.ffprobe_cmd,
-                '-v', 'quiet',
-                '-print_format', 'json',
-                '-show_format',
-                '-show_streams',
-                str(video_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            if result.returncode != 0:
-                return None
-            
-            metadata = json.loads(result.stdout)
-            
-            # Extract video and audio streams
-            video_streams = [s for s in metadata.get('streams', []) if s.get('codec_type') == 'video']
-            audio_streams = [s for s in metadata.get('streams', []) if s.get('codec_type') == 'audio']
-            
-            if not video_streams:
-                return None
-            
-            return {
-                'format': metadata.get('format', {}),
-                'video_stream': video_streams[0],
-                'audio_stream': audio_streams[0] if audio_streams else None
-            }
-            
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, Exception):
+        info = self.probe.probe(video_path)
+        
+        if info is None or not info.has_video:
             return None
+        
+        return {
+            'format': info.format,
+            'video_stream': info.video_stream,
+            'audio_stream': info.audio_stream
+        }
     
     def _check_file_properties(self, video_path: Path) -> Dict[str, Any]:
         """Check basic file properties."""
@@ -606,10 +793,31 @@ def main():
         '--output-dir',
         help='Directory to save report'
     )
+    parser.add_argument(
+        '--deep',
+        action='store_true',
+        help='Also check frame content (black frames, freezes, silence gaps)'
+    )
+    parser.add_argument(
+        '--sample-fps',
+        type=float,
+        default=VideoQualityChecker.DEEP_SAMPLE_FPS,
+        help='Frames per second sampled in deep mode'
+    )
+    parser.add_argument(
+        '--time-budget',
+        type=float,
+        default=VideoQualityChecker.DEEP_TIME_BUDGET,
+        help='Seconds of deep scanning allowed per video'
+    )
     
     args = parser.parse_args()
     
-    checker = VideoQualityChecker()
+    checker = VideoQualityChecker(
+        deep=args.deep,
+        sample_fps=args.sample_fps,
+        time_budget=args.time_budget
+    )
     
     passed, report = checker.check_video_quality(
         video_path=args.video_path,
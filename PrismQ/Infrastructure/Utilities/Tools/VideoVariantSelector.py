@@ -4,15 +4,23 @@ Video Variant Selector for StoryGenerator
 
 Selects the best video variant from multiple generated options (LTX-Video, interpolation)
 based on quality metrics including motion smoothness, temporal consistency, and artifacts.
+
+Each variant is decoded once at reduced resolution and its frame metrics (frame
+difference, flicker, Laplacian blur, scene cuts) are computed in one vectorized
+pass; the variants of a shot are analyzed in parallel processes.
 """
 
 import os
 import json
-import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 from datetime import datetime
 
+from PrismQ.Shared.media_probe import MediaProbe, get_media_probe
+from PrismQ.Shared.video_frames import ANALYSIS_WIDTH, analysis_size, analyze_video_frames
+
 
 class VideoVariantSelector:
     """
@@ -31,9 +39,29 @@ class VideoVariantSelector:
     MAX_ARTIFACT_RATIO = 0.15  # Maximum artifact ratio (0-1)
     MIN_OVERALL_SCORE = 60  # Minimum overall quality score (0-100)
     
-    def __init__(self):
-        """Initialize the video variant selector."""
-        pass
+    # Penalties applied to temporal consistency
+    SCENE_CUT_PENALTY = 0.2  # per unexpected cut inside a shot
+    
+    # Artifact penalty for a variant softer than the sharpest variant of the shot
+    SOFTNESS_PENALTY = 0.3
+    
+    def __init__(
+        self,
+        probe: Optional[MediaProbe] = None,
+        max_workers: Optional[int] = None,
+        analysis_width: int = ANALYSIS_WIDTH
+    ):
+        """
+        Initialize the video variant selector.
+        
+        Args:
+            probe: Media probe to use (defaults to the shared, cached probe)
+            max_workers: Processes for parallel variant analysis (1 = in-process)
+            analysis_width: Width frames are scaled to for analysis
+        """
+        self.probe = probe or get_media_probe()
+        self.max_workers = max_workers
+        self.analysis_width = analysis_width
     
     def select_best_variant(
         self,
@@ -74,15 +102,25 @@ class VideoVariantSelector:
             else:
                 raise ValueError(f"Manual override index {manual_override} out of range")
         
-        # Analyze each variant
-        variant_scores = []
+        # Probe all variants concurrently; analysis below reads from the cache
+        self.probe.probe_many(p for p in video_variants if os.path.exists(p))
+        
+        existing = []
         for i, variant_path in enumerate(video_variants):
             if not os.path.exists(variant_path):
                 print(f"⚠️  Warning: Video variant not found: {variant_path}")
                 continue
-            
-            score_data = self._analyze_video_quality(variant_path, i)
+            existing.append((i, variant_path))
+        
+        # Decode and analyze all variants at once, in parallel
+        start = time.perf_counter()
+        frame_metrics = self._analyze_frames([path for _, path in existing])
+        
+        variant_scores = []
+        for (i, variant_path), metrics in zip(existing, frame_metrics):
+            score_data = self._analyze_video_quality(variant_path, i, metrics)
             variant_scores.append((variant_path, score_data))
+        analysis_seconds = time.perf_counter() - start
         
         if not variant_scores:
             raise ValueError("No valid video variants found")
@@ -104,6 +142,7 @@ class VideoVariantSelector:
             'selected_score': best_score,
             'all_scores': [score for _, score in variant_scores],
             'selection_reason': self._generate_selection_reason(best_score),
+            'analysis_seconds': round(analysis_seconds, 3),
             'manual_override': False
         }
         
@@ -112,24 +151,71 @@ class VideoVariantSelector:
         
         return best_variant, report
     
-    def _analyze_video_quality(self, video_path: str, variant_index: int) -> Dict[str, Any]:
+    def _analyze_frames(self, video_paths: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Decode each video once and compute its frame metrics.
+        
+        Variants are analyzed in a process pool when there is more than one.
+        
+        Args:
+            video_paths: Paths to video files
+            
+        Returns:
+            Frame metrics per path (None where decoding failed)
+        """
+        if not video_paths:
+            return []
+        
+        sizes = []
+        for path in video_paths:
+            info = self.probe.probe(path)
+            sizes.append(analysis_size(
+                info.width if info else 0, info.height if info else 0, self.analysis_width
+            ))
+        widths = [w for w, _ in sizes]
+        heights = [h for _, h in sizes]
+        
+        workers = min(self.max_workers or os.cpu_count() or 1, len(video_paths))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(analyze_video_frames, video_paths, widths, heights))
+        else:
+            results = [analyze_video_frames(*args) for args in zip(video_paths, widths, heights)]
+        
+        results = [r if r.get('frames', 0) >= 2 else None for r in results]
+        
+        # Sharpness relative to the sharpest variant of the same shot
+        sharpest = max((r['blur_mean'] for r in results if r), default=0.0)
+        for r in results:
+            if r:
+                r['relative_sharpness'] = round(r['blur_mean'] / sharpest, 4) if sharpest > 0 else 1.0
+        
+        return results
+    
+    def _analyze_video_quality(
+        self,
+        video_path: str,
+        variant_index: int,
+        frame_metrics: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Analyze video quality metrics.
         
         Args:
             video_path: Path to video file
             variant_index: Index of this variant
+            frame_metrics: Decoded frame metrics (metadata heuristics are used without them)
             
         Returns:
             Dictionary containing quality scores
         """
-        # Get video properties using ffprobe
+        # Get video properties from the shared probe
         video_info = self._get_video_info(video_path)
         
         # Calculate quality metrics
-        motion_score = self._calculate_motion_smoothness(video_path, video_info)
-        temporal_score = self._calculate_temporal_consistency(video_path, video_info)
-        artifact_ratio = self._detect_artifacts(video_path, video_info)
+        motion_score = self._calculate_motion_smoothness(video_path, video_info, frame_metrics)
+        temporal_score = self._calculate_temporal_consistency(video_path, video_info, frame_metrics)
+        artifact_ratio = self._detect_artifacts(video_path, video_info, frame_metrics)
         
         # Calculate overall score (0-100)
         overall_score = self._calculate_overall_score(
@@ -144,6 +230,7 @@ class VideoVariantSelector:
             'artifact_ratio': artifact_ratio,
             'overall_score': overall_score,
             'video_info': video_info,
+            'frame_metrics': frame_metrics,
             'quality_checks': {
                 'motion_smooth': motion_score >= self.MIN_MOTION_SCORE,
                 'temporally_consistent': temporal_score >= self.MIN_TEMPORAL_SCORE,
@@ -154,7 +241,7 @@ class VideoVariantSelector:
     
     def _get_video_info(self, video_path: str) -> Dict[str, Any]:
         """
-        Extract video information using ffprobe.
+        Extract video information through the shared media probe.
         
         Args:
             video_path: Path to video file
@@ -162,57 +249,35 @@ class VideoVariantSelector:
         Returns:
             Dictionary containing video metadata
         """
-        try:
-            cmd = [
-                'ffprobe',
-                '-v', 'quiet',
-                '-print_format', 'json',
-                '-show_format',
-                '-show_streams',
-                video_path
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            probe_data = json.loads(result.stdout)
-            
-            # Extract video stream info
-            video_stream = next(
-                (s for s in probe_data.get('streams', []) if s['codec_type'] == 'video'),
-                {}
-            )
-            
-            return {
-                'width': int(video_stream.get('width', 0)),
-                'height': int(video_stream.get('height', 0)),
-                'fps': eval(video_stream.get('r_frame_rate', '30/1')),
-                'codec': video_stream.get('codec_name', 'unknown'),
-                'duration': float(probe_data.get('format', {}).get('duration', 0)),
-                'bitrate': int(probe_data.get('format', {}).get('bit_rate', 0)),
-                'nb_frames': int(video_stream.get('nb_frames', 0))
-            }
-            
-        except (subprocess.CalledProcessError, json.JSONDecodeError, Exception) as e:
-            print(f"⚠️  Warning: Could not extract video info from {video_path}: {e}")
+        info = self.probe.probe(video_path)
+        
+        if info is not None:
             return {
-                'width': 0,
-                'height': 0,
-                'fps': 30,
-                'codec': 'unknown',
-                'duration': 0,
-                'bitrate': 0,
-                'nb_frames': 0
+                'width': info.width,
+                'height': info.height,
+                'fps': info.fps or 30,
+                'codec': info.video_codec or 'unknown',
+                'duration': info.duration,
+                'bitrate': info.bit_rate,
+                'nb_frames': info.nb_frames
             }
+        
+        print(f"⚠️  Warning: Could not extract video info from {video_path}")
+        return {
+            'width': 0,
+            'height': 0,
+            'fps': 30,
+            'codec': 'unknown',
+            'duration': 0,
+            'bitrate': 0,
+            'nb_frames': 0
+        }
     
     def _calculate_motion_smoothness(
         self,
         video_path: str,
-        video_info: Dict[str, Any]
+        video_info: Dict[str, Any],
+        frame_metrics: Optional[Dict[str, Any]] = None
     ) -> float:
         """
         Calculate motion smoothness score (0-1).
@@ -223,70 +288,45 @@ class VideoVariantSelector:
         Args:
             video_path: Path to video file
             video_info: Video metadata
+            frame_metrics: Decoded frame metrics
             
         Returns:
             Motion smoothness score (0-1)
         """
-        try:
-            # Use ffmpeg to calculate scene change detection as a proxy for motion smoothness
-            cmd = [
-                'ffmpeg',
-                '-i', video_path,
-                '-vf', 'select=gt(scene\\,0.3)',
-                '-f', 'null',
-                '-'
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            # Count scene changes from stderr
-            stderr = result.stderr
-            frame_count = video_info.get('nb_frames', 0)
-            
-            if frame_count > 0:
-                # Parse frame processing from ffmpeg output
-                # Look for "frame=" in stderr
-                import re
-                frame_matches = re.findall(r'frame=\s*(\d+)', stderr)
-                if frame_matches:
-                    processed_frames = int(frame_matches[-1])
-                    # Fewer scene changes = smoother motion
-                    scene_change_ratio = processed_frames / frame_count
-                    # Invert: lower scene changes = higher smoothness
-                    smoothness = max(0.0, 1.0 - scene_change_ratio)
-                    return smoothness
-            
-            # Default to moderate score if analysis fails
-            return 0.75
-            
-        except Exception as e:
-            print(f"⚠️  Warning: Motion smoothness calculation failed: {e}")
-            # Default to moderate score
-            return 0.75
+        if frame_metrics:
+            return frame_metrics['motion_smoothness']
+        
+        # Default to moderate score if the video could not be decoded
+        return 0.75
     
     def _calculate_temporal_consistency(
         self,
         video_path: str,
-        video_info: Dict[str, Any]
+        video_info: Dict[str, Any],
+        frame_metrics: Optional[Dict[str, Any]] = None
     ) -> float:
         """
         Calculate temporal consistency score (0-1).
         
-        Measures how consistent the video frames are over time.
-        Higher scores indicate better temporal coherence.
+        Measures how consistent the video frames are over time: unexpected
+        scene cuts and brightness flicker inside a shot lower the score.
+        Without frame metrics, falls back to frame-count consistency.
         
         Args:
             video_path: Path to video file
             video_info: Video metadata
+            frame_metrics: Decoded frame metrics
             
         Returns:
             Temporal consistency score (0-1)
         """
+        if frame_metrics:
+            penalty = (
+                self.SCENE_CUT_PENALTY * frame_metrics['scene_cuts']
+                + frame_metrics['flicker_ratio']
+            )
+            return round(max(0.0, 1.0 - penalty), 4)
+        
         try:
             # Check frame rate consistency
             fps = video_info.get('fps', 30)
@@ -317,20 +357,34 @@ class VideoVariantSelector:
     def _detect_artifacts(
         self,
         video_path: str,
-        video_info: Dict[str, Any]
+        video_info: Dict[str, Any],
+        frame_metrics: Optional[Dict[str, Any]] = None
     ) -> float:
         """
         Detect video artifacts (flicker, blur, distortion).
         
-        Returns artifact ratio (0-1, lower is better).
+        Returns artifact ratio (0-1, lower is better): the share of frames
+        that flicker or are much blurrier than the rest of the clip, plus a
+        penalty for being softer than the sharpest variant of the shot.
+        Without frame metrics, bitrate is used as a proxy.
         
         Args:
             video_path: Path to video file
             video_info: Video metadata
+            frame_metrics: Decoded frame metrics
             
         Returns:
             Artifact ratio (0-1, where 0 is no artifacts)
         """
+        if frame_metrics:
+            softness = 1.0 - frame_metrics.get('relative_sharpness', 1.0)
+            ratio = (
+                frame_metrics['flicker_ratio']
+                + frame_metrics['blurry_ratio']
+                + self.SOFTNESS_PENALTY * softness
+            )
+            return round(min(1.0, ratio), 4)
+        
         try:
             # Use bitrate as a proxy for quality
             # Lower bitrate often correlates with more artifacts
@@ -527,6 +581,11 @@ class VideoVariantSelector:
         print(f"Batch Variant Selection: {len(variant_groups)} shots")
         print(f"{'='*70}\n")
         
+        # Probe every variant of every shot in one concurrent pass
+        self.probe.probe_many(
+            p for variants in variant_groups.values() for p in variants if os.path.exists(p)
+        )
+        
         for shot_id, variants in variant_groups.items():
             print(f"Processing shot: {shot_id} ({len(variants)} variants)")
             
@@ -2,28 +2,60 @@
 
 This module provides tools for:
 - Multi-platform video publishing
+- Durable upload queue and scheduling
 - Video quality checking
 - Video variant selection
+
+Tools are imported on first access, so importing one tool module (or this
+package) does not load numpy and the frame-analysis stack of the others.
 """
 
-from PrismQ.Tools.MultiPlatformPublisher import (
-    MultiPlatformPublisher,
-    Platform,
-    PlatformMetadata,
-    UploadStatus,
-    UploadTask,
-    UploadResult,
-)
-from PrismQ.Tools.VideoQualityChecker import VideoQualityChecker
-from PrismQ.Tools.VideoVariantSelector import VideoVariantSelector
-
-__all__ = [
-    "MultiPlatformPublisher",
-    "Platform",
-    "PlatformMetadata",
-    "UploadStatus",
-    "UploadTask",
-    "UploadResult",
-    "VideoQualityChecker",
-    "VideoVariantSelector",
-]
+import importlib
+import sys
+import types
+from typing import Any, Dict
+
+# Exported name -> submodule that defines it
+_LAZY_EXPORTS: Dict[str, str] = {
+    "MultiPlatformPublisher": "MultiPlatformPublisher",
+    "Platform": "MultiPlatformPublisher",
+    "PlatformMetadata": "MultiPlatformPublisher",
+    "UploadStatus": "MultiPlatformPublisher",
+    "UploadTask": "MultiPlatformPublisher",
+    "UploadResult": "MultiPlatformPublisher",
+    "UploadQueue": "UploadQueue",
+    "PublishScheduler": "UploadQueue",
+    "VideoQualityChecker": "VideoQualityChecker",
+    "VideoVariantSelector": "VideoVariantSelector",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
+class _ToolsPackage(types.ModuleType):
+    """Keeps exported classes from being shadowed by same-named submodules."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Loading e.g. PrismQ.Tools.UploadQueue binds the submodule as an
+        # attribute of the package; the class of that name must win, as it
+        # did when this package imported everything eagerly.
+        if name in _LAZY_EXPORTS and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _ToolsPackage
+
+
+__all__ = list(_LAZY_EXPORTS)
@@ -4,14 +4,16 @@ Style Consistency System - Visual Coherence for SDXL Keyframes
 This module provides functionality for:
 1. Style reference image selection/creation
 2. Style transfer to all keyframes using IP-Adapter
-3. Visual coherence scoring across frames
+3. Visual coherence scoring across frames (vectorized, cached per image hash)
 4. Color palette consistency validation
 5. Character/object consistency checks
 6. Style library management for different video types
 """
 
+import io
 import json
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
@@ -59,6 +61,89 @@ class ConsistencyMetrics:
         return asdict(self)
 
 
+@dataclass
+class ImageFeatures:
+    """Compact per-image features used for consistency scoring."""
+    histogram: np.ndarray  # (768,) normalized RGB histogram
+    thumbnail: np.ndarray  # (64, 64) grayscale, float32
+    palette: np.ndarray  # (n_colors, 3) dominant RGB colors, float32
+    
+    @classmethod
+    def from_image(cls, image: Image.Image, palette: List[Tuple[int, int, int]]) -> 'ImageFeatures':
+        """Extract features from an image and its dominant colors."""
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        
+        hist = np.array(image.histogram(), dtype=np.float32)
+        return cls(
+            histogram=hist / hist.sum(),
+            thumbnail=np.asarray(image.resize((64, 64)).convert('L'), dtype=np.float32),
+            palette=np.array(palette, dtype=np.float32)
+        )
+
+
+def color_similarity_matrix(histograms: np.ndarray) -> np.ndarray:
+    """
+    Pairwise histogram correlation, clipped to 0-1.
+    
+    Args:
+        histograms: Array of shape (n, bins)
+        
+    Returns:
+        Array of shape (n, n)
+    """
+    centered = histograms - histograms.mean(axis=1, keepdims=True)
+    norms = np.linalg.norm(centered, axis=1)
+    norms[norms == 0] = np.inf
+    corr = (centered @ centered.T) / np.outer(norms, norms)
+    return np.clip(corr, 0.0, 1.0)
+
+
+def structural_similarity_matrix(thumbnails: np.ndarray) -> np.ndarray:
+    """
+    Pairwise 1 - MSE/255^2 between grayscale thumbnails.
+    
+    Args:
+        thumbnails: Array of shape (n, h, w)
+        
+    Returns:
+        Array of shape (n, n)
+    """
+    flat = thumbnails.reshape(len(thumbnails), -1).astype(np.float64)
+    sq = (flat ** 2).sum(axis=1)
+    mse = (sq[:, None] + sq[None, :] - 2.0 * flat @ flat.T) / flat.shape[1]
+    return 1.0 - np.clip(mse, 0.0, None) / 255 ** 2
+
+
+def palette_similarity_matrix(palettes: np.ndarray, chunk_size: int = 64) -> np.ndarray:
+    """
+    Pairwise palette similarity.
+    
+    Entry (i, j) is 1 minus the mean distance from each color in palette i to
+    its nearest color in palette j, scaled by the largest RGB distance. Rows are
+    computed in chunks so memory stays bounded for long sequences.
+    
+    Args:
+        palettes: Array of shape (n, n_colors, 3)
+        chunk_size: Rows computed per step
+        
+    Returns:
+        Array of shape (n, n)
+    """
+    n, k, _ = palettes.shape
+    all_colors = palettes.reshape(n * k, 3)
+    max_distance = np.sqrt(3 * 255 ** 2)
+    result = np.empty((n, n), dtype=np.float64)
+    
+    for start in range(0, n, chunk_size):
+        rows = palettes[start:start + chunk_size]
+        diff = rows[:, :, None, :] - all_colors[None, None, :, :]
+        distances = np.sqrt((diff ** 2).sum(axis=-1)).reshape(len(rows), k, n, k)
+        result[start:start + len(rows)] = 1.0 - distances.min(axis=3).mean(axis=1) / max_distance
+    
+    return result
+
+
 class StyleConsistencyManager:
     """
     Manager for maintaining visual style consistency across SDXL-generated keyframes.
@@ -75,7 +160,10 @@ class StyleConsistencyManager:
         self,
         model_id: str = "stabilityai/stable-diffusion-xl-base-1.0",
         style_library_dir: Optional[Path] = None,
-        device: str = "cuda"
+        device: str = "cuda",
+        feature_cache_size: int = 4096,
+        feature_cache_dir: Optional[Path] = None,
+        server=None
     ):
         """
         Initialize StyleConsistencyManager.
@@ -84,6 +172,11 @@ class StyleConsistencyManager:
             model_id: SDXL model to use
             style_library_dir: Directory for style library storage
             device: Device to run on ('cuda', 'cpu', or 'mps')
+            feature_cache_size: Image features kept in memory (keyed by content hash)
+            feature_cache_dir: Optional directory persisting image features between runs
+            server: Optional persistent SDXLPipelineServer (see PrismQ.Shared.sdxl_server)
+                shared with other keyframe tools; generation then batches
+                same-style prompts and reuses cached style embeddings
         """
         self.model_id = model_id
         self.device = device
@@ -95,6 +188,14 @@ class StyleConsistencyManager:
         
         # Pipeline will be lazy-loaded to avoid import errors
         self._pipe = None
+        self.server = server
+        
+        # Image features keyed by content hash (least recently used evicted first)
+        self.feature_cache_size = feature_cache_size
+        self.feature_cache_dir = feature_cache_dir
+        self._feature_cache: "OrderedDict[str, ImageFeatures]" = OrderedDict()
+        if feature_cache_dir:
+            feature_cache_dir.mkdir(parents=True, exist_ok=True)
         
         # Load existing styles
         self._load_style_library()
@@ -195,13 +296,22 @@ class StyleConsistencyManager:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Generate reference image
-        image = self.pipe(
-            prompt=prompt,
-            num_inference_steps=num_inference_steps,
-            guidance_scale=guidance_scale,
-            width=width,
-            height=height
-        ).images[0]
+        if self.server is not None:
+            image = self.server.generate(
+                prompt,
+                num_inference_steps=num_inference_steps,
+                guidance_scale=guidance_scale,
+                width=width,
+                height=height
+            ).image
+        else:
+            image = self.pipe(
+                prompt=prompt,
+                num_inference_steps=num_inference_steps,
+                guidance_scale=guidance_scale,
+                width=width,
+                height=height
+            ).images[0]
         
         # Save image
         image.save(output_path)
@@ -258,6 +368,11 @@ class StyleConsistencyManager:
         
         logger.info(f"Generating {len(prompts)} keyframes with style '{style_name}'")
         
+        if self.server is not None:
+            return self._generate_with_server(
+                prompts, profile, output_dir, num_inference_steps, guidance_scale, width, height
+            )
+        
         # Load reference image
         style_image = Image.open(profile.reference_image_path)
         
@@ -305,6 +420,43 @@ class StyleConsistencyManager:
         logger.info(f"Generated {len(generated_images)} keyframes")
         return generated_images
     
+    def _generate_with_server(
+        self,
+        prompts: List[str],
+        profile: StyleProfile,
+        output_dir: Path,
+        num_inference_steps: int,
+        guidance_scale: float,
+        width: int,
+        height: int
+    ) -> List[Path]:
+        """Queue all keyframes on the shared server so they run as style batches."""
+        self.server.register_style(
+            profile.name,
+            profile.reference_image_path,
+            ip_adapter_scale=profile.ip_adapter_scale
+        )
+        
+        output_paths = [output_dir / f"keyframe_{i:03d}.png" for i in range(len(prompts))]
+        futures = [
+            self.server.submit(
+                self._enhance_prompt_with_style(prompt, profile),
+                style=profile.name,
+                out_path=output_path,
+                num_inference_steps=num_inference_steps,
+                guidance_scale=guidance_scale,
+                width=width,
+                height=height
+            )
+            for prompt, output_path in zip(prompts, output_paths)
+        ]
+        for i, future in enumerate(futures):
+            future.result()
+            logger.info(f"Generated keyframe {i+1}/{len(prompts)}: {output_paths[i]}")
+        
+        logger.info(f"Generated {len(output_paths)} keyframes")
+        return output_paths
+    
     def _enhance_prompt_with_style(self, prompt: str, profile: StyleProfile) -> str:
         """Enhance prompt with style information."""
         style_suffix = f", {profile.style_prompt}"
@@ -331,126 +483,157 @@ class StyleConsistencyManager:
             logger.warning("Need at least 2 images for consistency validation")
             return ConsistencyMetrics(1.0, 1.0, 1.0, 1.0, [1.0])
         
-        # Load images
-        images = [Image.open(path) for path in image_paths]
+        # Stream images one at a time into compact features
+        features = [self.extract_features(path) for path in image_paths]
+        metrics = self._score_features(features)
+        overall = metrics.overall_score
         
-        # Calculate color similarity
-        color_sim = self._calculate_color_similarity(images)
+        # Save report if requested
+        if output_report_path:
+            self._save_consistency_report(metrics, image_paths, output_report_path)
         
-        # Calculate structural similarity
-        structural_sim = self._calculate_structural_similarity(images)
+        logger.info(f"Consistency validation complete. Overall score: {overall:.3f}")
+        return metrics
+    
+    def extract_features(self, image_path: Path) -> ImageFeatures:
+        """
+        Load one image and extract its consistency features.
+        
+        Features are cached by the SHA-256 of the file contents, so repeated
+        validations of unchanged keyframes skip decoding entirely.
+        
+        Args:
+            image_path: Path to image
+            
+        Returns:
+            ImageFeatures for the image
+        """
+        data = Path(image_path).read_bytes()
+        key = hashlib.sha256(data).hexdigest()
+        
+        features = self._feature_cache.get(key)
+        if features is not None:
+            self._feature_cache.move_to_end(key)
+            return features
+        
+        features = self._load_cached_features(key)
+        if features is None:
+            with Image.open(io.BytesIO(data)) as image:
+                image = image.convert('RGB')
+                features = ImageFeatures.from_image(image, self._extract_color_palette(image, n_colors=5))
+            self._store_cached_features(key, features)
+        
+        self._feature_cache[key] = features
+        if len(self._feature_cache) > self.feature_cache_size:
+            self._feature_cache.popitem(last=False)
+        return features
+    
+    def _load_cached_features(self, key: str) -> Optional[ImageFeatures]:
+        """Load features from the on-disk cache, if enabled."""
+        if not self.feature_cache_dir:
+            return None
+        path = self.feature_cache_dir / f"{key}.npz"
+        if not path.exists():
+            return None
+        try:
+            with np.load(path) as data:
+                return ImageFeatures(data['histogram'], data['thumbnail'], data['palette'])
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable feature cache {path}: {e}")
+            return None
+    
+    def _store_cached_features(self, key: str, features: ImageFeatures):
+        """Write features to the on-disk cache, if enabled."""
+        if not self.feature_cache_dir:
+            return
+        np.savez(
+            self.feature_cache_dir / f"{key}.npz",
+            histogram=features.histogram,
+            thumbnail=features.thumbnail,
+            palette=features.palette
+        )
+    
+    def similarity_matrices(self, features: List[ImageFeatures]) -> Dict[str, np.ndarray]:
+        """
+        Compute all pairwise similarities for a sequence of frames.
+        
+        Args:
+            features: Features of each frame, in order
+            
+        Returns:
+            Dictionary with 'color', 'structural' and 'style' (n, n) matrices
+        """
+        return {
+            'color': color_similarity_matrix(np.stack([f.histogram for f in features])),
+            'structural': structural_similarity_matrix(np.stack([f.thumbnail for f in features])),
+            'style': palette_similarity_matrix(np.stack([f.palette for f in features]))
+        }
+    
+    def _score_features(self, features: List[ImageFeatures]) -> ConsistencyMetrics:
+        """
+        Score a sequence of frames from their features.
         
-        # Calculate style consistency (feature-based)
-        style_consistency = self._calculate_style_consistency(images)
+        Color similarity averages all pairs; structural and style consistency
+        average consecutive pairs. Each frame's score is its weighted mean
+        similarity to every other frame, so outliers stand out.
+        """
+        n = len(features)
+        if n < 2:
+            return ConsistencyMetrics(1.0, 1.0, 1.0, 1.0, [1.0] * n)
+        
+        matrices = self.similarity_matrices(features)
+        upper = np.triu_indices(n, k=1)
         
-        # Calculate per-frame scores
-        frame_scores = self._calculate_frame_scores(images)
+        color_sim = float(matrices['color'][upper].mean())
+        structural_sim = float(np.diagonal(matrices['structural'], offset=1).mean())
+        style_consistency = float(np.diagonal(matrices['style'], offset=1).mean())
         
         # Overall score (weighted average)
-        overall = (color_sim * 0.3 + structural_sim * 0.3 + style_consistency * 0.4)
+        overall = color_sim * 0.3 + structural_sim * 0.3 + style_consistency * 0.4
         
-        metrics = ConsistencyMetrics(
+        combined = (
+            matrices['color'] * 0.3 + matrices['structural'] * 0.3
+            + (matrices['style'] + matrices['style'].T) / 2 * 0.4
+        )
+        np.fill_diagonal(combined, 0.0)
+        frame_scores = (combined.sum(axis=1) / (n - 1)).round(4).tolist()
+        
+        return ConsistencyMetrics(
             color_similarity=color_sim,
             structural_similarity=structural_sim,
             style_consistency=style_consistency,
             overall_score=overall,
             frame_scores=frame_scores
         )
-        
-        # Save report if requested
-        if output_report_path:
-            self._save_consistency_report(metrics, image_paths, output_report_path)
-        
-        logger.info(f"Consistency validation complete. Overall score: {overall:.3f}")
-        return metrics
+    
+    def _image_features(self, images: List[Image.Image]) -> List[ImageFeatures]:
+        """Extract features from already-loaded images (uncached)."""
+        return [
+            ImageFeatures.from_image(img, self._extract_color_palette(img, n_colors=5))
+            for img in images
+        ]
     
     def _calculate_color_similarity(self, images: List[Image.Image]) -> float:
         """Calculate color histogram similarity across images."""
         if len(images) < 2:
             return 1.0
-        
-        # Extract color histograms
-        histograms = []
-        for img in images:
-            # Convert to RGB if needed
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-            
-            # Get histogram for each channel
-            hist = np.array(img.histogram())
-            hist = hist / hist.sum()  # Normalize
-            histograms.append(hist)
-        
-        # Calculate pairwise similarities
-        similarities = []
-        for i in range(len(histograms) - 1):
-            for j in range(i + 1, len(histograms)):
-                # Correlation coefficient
-                corr = np.corrcoef(histograms[i], histograms[j])[0, 1]
-                similarities.append(max(0, corr))  # Clip negative correlations
-        
-        return np.mean(similarities) if similarities else 1.0
+        return self._score_features(self._image_features(images)).color_similarity
     
     def _calculate_structural_similarity(self, images: List[Image.Image]) -> float:
         """Calculate structural similarity across consecutive frames."""
         if len(images) < 2:
             return 1.0
-        
-        # Simple structural similarity based on downsampled images
-        similarities = []
-        
-        for i in range(len(images) - 1):
-            img1 = images[i].resize((64, 64)).convert('L')
-            img2 = images[i + 1].resize((64, 64)).convert('L')
-            
-            # Calculate mean squared error
-            arr1 = np.array(img1, dtype=np.float32)
-            arr2 = np.array(img2, dtype=np.float32)
-            mse = np.mean((arr1 - arr2) ** 2)
-            
-            # Convert to similarity score (0-1)
-            max_mse = 255 ** 2
-            similarity = 1.0 - (mse / max_mse)
-            similarities.append(similarity)
-        
-        return np.mean(similarities) if similarities else 1.0
+        return self._score_features(self._image_features(images)).structural_similarity
     
     def _calculate_style_consistency(self, images: List[Image.Image]) -> float:
         """Calculate style consistency using color distribution."""
         if len(images) < 2:
             return 1.0
-        
-        # Extract dominant colors for each image
-        color_profiles = []
-        for img in images:
-            palette = self._extract_color_palette(img, n_colors=5)
-            color_profiles.append(palette)
-        
-        # Calculate consistency of color palettes
-        consistencies = []
-        for i in range(len(color_profiles) - 1):
-            palette1 = color_profiles[i]
-            palette2 = color_profiles[i + 1]
-            
-            # Calculate color distance between palettes
-            min_distances = []
-            for c1 in palette1:
-                distances = [self._color_distance(c1, c2) for c2 in palette2]
-                min_distances.append(min(distances))
-            
-            # Convert to similarity (0-1)
-            avg_distance = np.mean(min_distances)
-            max_distance = np.sqrt(3 * 255**2)  # Max RGB distance
-            similarity = 1.0 - (avg_distance / max_distance)
-            consistencies.append(similarity)
-        
-        return np.mean(consistencies) if consistencies else 1.0
+        return self._score_features(self._image_features(images)).style_consistency
     
     def _calculate_frame_scores(self, images: List[Image.Image]) -> List[float]:
-        """Calculate individual quality/consistency score for each frame."""
-        # For now, return equal scores
-        # In production, could analyze sharpness, contrast, etc.
-        return [0.85] * len(images)
+        """Calculate each frame's mean consistency with the rest of the sequence."""
+        return self._score_features(self._image_features(images)).frame_scores
     
     def _extract_color_palette(
         self,
@@ -469,10 +652,12 @@ class StyleConsistencyManager:
         img_quantized = img_small.quantize(colors=n_colors)
         palette = img_quantized.getpalette()
         
-        # Extract RGB tuples
+        # Extract RGB tuples; images with fewer distinct colors yield a
+        # shorter palette, so repeat the last color to keep n_colors entries
+        n_found = max(1, min(n_colors, len(palette) // 3, len(img_quantized.getcolors() or [])))
         colors = []
         for i in range(n_colors):
-            r, g, b = palette[i*3:(i+1)*3]
+            r, g, b = palette[min(i, n_found - 1)*3:(min(i, n_found - 1)+1)*3]
             colors.append((r, g, b))
         
         return colors
@@ -0,0 +1,316 @@
+"""
+Batch Title Scoring Module.
+
+This module scores many titles at once using the same viral rubric as
+``TitleScorer.score_title``. Rubric features are extracted into a NumPy
+feature matrix and turned into dimension scores with a single matrix
+product, so scoring the full titles × topics × segments fan-out does not
+copy, timestamp or log every title individually.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Sequence
+
+import numpy as np
+
+from PrismQ.StoryTitleScoring.title_scoring import (
+    ACTION_WORDS,
+    ACTIVE_INDICATORS,
+    DEBATE_WORDS,
+    GENERIC_WORDS,
+    INTENSE_EMOTIONS,
+    LEARNING_WORDS,
+    LIST_PATTERN,
+    NEGATIVE_EMOTIONS,
+    NUMBER_PATTERN,
+    PERSONAL_WORDS,
+    POSITIVE_EMOTIONS,
+    RELATABLE_TOPICS,
+    SURPRISE_WORDS,
+    TRENDING_WORDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Score dimensions, in the column order of every breakdown matrix
+DIMENSIONS = ('novelty', 'emotional', 'clarity', 'replay', 'share')
+
+# Base score for each dimension before feature contributions
+BASE_SCORES = np.array([50.0, 50.0, 70.0, 50.0, 50.0])
+
+# Feature name -> contribution to (novelty, emotional, clarity, replay, share).
+# Each row mirrors one rule of the per-title ``TitleScorer._score_*`` methods.
+FEATURE_CONTRIBUTIONS: dict[str, tuple[float, float, float, float, float]] = {
+    'surprise_hit':       (5, 0, 0, 0, 0),
+    'has_number':         (5, 0, 0, 0, 0),
+    'personal_hit':       (5, 0, 0, 0, 0),
+    'generic_count':      (-5, 0, 0, 0, 0),
+    'emotion_hit':        (0, 5, 0, 0, 0),
+    'intense_hit':        (0, 10, 0, 0, 0),
+    'single_exclamation': (0, 5, 0, 0, 0),
+    'many_exclamations':  (0, -5, 0, 0, 0),
+    'has_question':       (0, 10, 0, 0, 10),
+    'length_in_range':    (0, 0, 10, 0, 0),
+    'too_short':          (0, 0, -15, 0, 0),
+    'too_long':           (0, 0, -10, 0, 0),
+    'ideal_word_count':   (0, 0, 5, 0, 0),
+    'few_words':          (0, 0, -10, 0, 0),
+    'many_words':         (0, 0, -5, 0, 0),
+    'long_word_count':    (0, 0, -5, 0, 0),
+    'active_hit':         (0, 0, 3, 0, 0),
+    'list_format':        (0, 0, 0, 15, 0),
+    'how_to':             (0, 0, 0, 10, 0),
+    'starts_with_what':   (0, 0, 0, 5, 0),
+    'learning_hit':       (0, 0, 0, 5, 0),
+    'relatable_hit':      (0, 0, 0, 0, 10),
+    'debate_hit':         (0, 0, 0, 0, 5),
+    'action_hit':         (0, 0, 0, 0, 5),
+    'trending_hit':       (0, 0, 0, 0, 5),
+}
+
+FEATURE_NAMES = tuple(FEATURE_CONTRIBUTIONS)
+CONTRIBUTION_MATRIX = np.array(list(FEATURE_CONTRIBUTIONS.values()), dtype=np.float64)
+
+
+@dataclass
+class BatchScoreResult:
+    """Columnar scoring result for a batch of titles.
+
+    Row ``i`` of every array belongs to ``titles[i]``. The original title
+    dicts are referenced, not copied; use :meth:`to_dicts` or
+    :meth:`to_titles_by_topic` to explode rows back into scored dicts.
+    """
+
+    titles: list[dict[str, object]]
+    topic_ids: np.ndarray
+    breakdown: np.ndarray
+    scores: np.ndarray
+    tiers: np.ndarray
+    scored_at: str
+    dimensions: tuple[str, ...] = field(default=DIMENSIONS)
+    topic_order: tuple[str, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def row(self, index: int) -> dict[str, object]:
+        """Explode a single row into a scored title dict."""
+        scored_title = dict(self.titles[index])
+        scored_title.update({
+            'score': float(self.scores[index]),
+            'score_breakdown': {
+                dim: float(value)
+                for dim, value in zip(self.dimensions, self.breakdown[index])
+            },
+            'score_tier': str(self.tiers[index]),
+            'scored_at': self.scored_at,
+        })
+        return scored_title
+
+    def to_dicts(self) -> list[dict[str, object]]:
+        """Explode all rows into scored title dicts, in input order."""
+        return [self.row(i) for i in range(len(self))]
+
+    def to_titles_by_topic(self) -> dict[str, list[dict[str, object]]]:
+        """Explode rows grouped by topic, matching ``score_all_titles`` output."""
+        grouped: dict[str, list[dict[str, object]]] = {
+            topic_id: [] for topic_id in self.topic_order
+        }
+        for i, topic_id in enumerate(self.topic_ids):
+            grouped.setdefault(str(topic_id), []).append(self.row(i))
+        return grouped
+
+    def top_k(self, k: int) -> np.ndarray:
+        """Return row indices of the ``k`` highest scores, best first."""
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        # Stable sort keeps input order for tied scores
+        return np.argsort(-self.scores, kind='stable')[:k]
+
+
+def _any_hit(lowered: np.ndarray, words: Sequence[str]) -> np.ndarray:
+    """Return a boolean column that is True where any word occurs as a substring."""
+    hits = np.zeros(lowered.shape, dtype=bool)
+    for word in words:
+        hits |= np.char.find(lowered, word) >= 0
+    return hits
+
+
+def extract_features(texts: Sequence[str], config: dict[str, object]) -> np.ndarray:
+    """
+    Extract rubric features for a batch of title texts.
+
+    Args:
+        texts: Title texts
+        config: Scoring configuration (uses the 'title' length limits)
+
+    Returns:
+        Float matrix of shape (len(texts), len(FEATURE_NAMES))
+    """
+    n = len(texts)
+    features = np.zeros((n, len(FEATURE_NAMES)), dtype=np.float64)
+    if n == 0:
+        return features
+
+    raw = np.array([str(t) for t in texts], dtype=str)
+    lowered = np.char.lower(raw)
+
+    title_config = config.get('title', {})
+    min_length = title_config.get('min_length', 20)
+    max_length = title_config.get('max_length', 100)
+
+    lengths = np.char.str_len(raw)
+    exclamations = np.char.count(raw, '!')
+    split_words = [t.split() for t in raw.tolist()]
+    word_counts = np.array([len(words) for words in split_words])
+    long_word_counts = np.array(
+        [sum(1 for w in words if len(w) > 12) for words in split_words]
+    )
+    generic_counts = sum(
+        (np.char.find(lowered, word) >= 0).astype(np.float64) for word in GENERIC_WORDS
+    )
+
+    columns = {
+        'surprise_hit': _any_hit(lowered, SURPRISE_WORDS),
+        'has_number': [NUMBER_PATTERN.search(t) is not None for t in raw.tolist()],
+        'personal_hit': _any_hit(lowered, PERSONAL_WORDS),
+        'generic_count': generic_counts,
+        'emotion_hit': _any_hit(lowered, POSITIVE_EMOTIONS + NEGATIVE_EMOTIONS),
+        'intense_hit': _any_hit(lowered, INTENSE_EMOTIONS),
+        'single_exclamation': exclamations == 1,
+        'many_exclamations': exclamations > 1,
+        'has_question': np.char.find(raw, '?') >= 0,
+        'length_in_range': (lengths >= min_length) & (lengths <= max_length),
+        'too_short': lengths < min_length,
+        'too_long': (lengths > max_length) & (lengths >= min_length),
+        'ideal_word_count': (word_counts >= 5) & (word_counts <= 12),
+        'few_words': word_counts < 5,
+        'many_words': word_counts > 15,
+        'long_word_count': long_word_counts,
+        'active_hit': _any_hit(lowered, ACTIVE_INDICATORS),
+        'list_format': [LIST_PATTERN.search(t) is not None for t in lowered.tolist()],
+        'how_to': _any_hit(lowered, ['how to', 'how i']),
+        'starts_with_what': np.char.startswith(lowered, 'what '),
+        'learning_hit': _any_hit(lowered, LEARNING_WORDS),
+        'relatable_hit': _any_hit(lowered, RELATABLE_TOPICS),
+        'debate_hit': _any_hit(lowered, DEBATE_WORDS),
+        'action_hit': _any_hit(lowered, ACTION_WORDS),
+        'trending_hit': _any_hit(lowered, TRENDING_WORDS),
+    }
+    for j, name in enumerate(FEATURE_NAMES):
+        features[:, j] = np.asarray(columns[name], dtype=np.float64)
+
+    return features
+
+
+def score_features(features: np.ndarray) -> np.ndarray:
+    """
+    Turn a feature matrix into per-dimension scores.
+
+    Args:
+        features: Matrix from :func:`extract_features`
+
+    Returns:
+        Float matrix of shape (n, len(DIMENSIONS)), clipped to 0-100
+    """
+    breakdown = features @ CONTRIBUTION_MATRIX + BASE_SCORES
+    return np.clip(breakdown, 0.0, 100.0)
+
+
+def weighted_totals(breakdown: np.ndarray, config: dict[str, object]) -> np.ndarray:
+    """
+    Apply the viral weights from the config to a breakdown matrix.
+
+    Args:
+        breakdown: Matrix from :func:`score_features`
+        config: Scoring configuration (uses the 'viral' weights)
+
+    Returns:
+        Total scores rounded to 2 decimal places
+    """
+    weights = config.get('viral', {})
+    totals = np.zeros(breakdown.shape[0], dtype=np.float64)
+    # Accumulate column by column in dimension order so totals are
+    # bit-identical to the sequential sum in TitleScorer.score_title
+    for j, dim in enumerate(DIMENSIONS):
+        totals += breakdown[:, j] * weights.get(dim, 0.2)
+    return np.array([round(float(t), 2) for t in totals], dtype=np.float64)
+
+
+def score_tiers(scores: np.ndarray, config: dict[str, object]) -> np.ndarray:
+    """Map total scores to tier names using the config thresholds."""
+    thresholds = config.get('thresholds', {})
+    return np.select(
+        [
+            scores >= thresholds.get('excellent', 85),
+            scores >= thresholds.get('good', 70),
+            scores >= thresholds.get('acceptable', 55),
+        ],
+        ['excellent', 'good', 'acceptable'],
+        default='poor',
+    )
+
+
+def score_titles_batch(
+    titles: Sequence[dict[str, object] | str],
+    config: dict[str, object],
+    topic_ids: Sequence[str] | None = None,
+) -> BatchScoreResult:
+    """
+    Score a batch of titles.
+
+    Args:
+        titles: Title dicts (with 'text') or plain title strings
+        config: Scoring configuration
+        topic_ids: Optional topic ID per title (defaults to each title's 'topic_id')
+
+    Returns:
+        Columnar BatchScoreResult
+    """
+    title_dicts = [t if isinstance(t, dict) else {'text': t} for t in titles]
+    texts = [t.get('text', '') for t in title_dicts]
+    if topic_ids is None:
+        topic_ids = [str(t.get('topic_id', '')) for t in title_dicts]
+
+    breakdown = score_features(extract_features(texts, config))
+    scores = weighted_totals(breakdown, config)
+
+    return BatchScoreResult(
+        titles=title_dicts,
+        topic_ids=np.array(topic_ids, dtype=object),
+        breakdown=breakdown,
+        scores=scores,
+        tiers=score_tiers(scores, config),
+        scored_at=datetime.now().isoformat(),
+    )
+
+
+def score_titles_by_topic_batch(
+    titles_by_topic: dict[str, list[dict[str, object]]],
+    config: dict[str, object],
+) -> BatchScoreResult:
+    """
+    Score all titles across all topics as one batch.
+
+    Args:
+        titles_by_topic: Dict mapping topic_id to title lists
+        config: Scoring configuration
+
+    Returns:
+        Columnar BatchScoreResult; call ``to_titles_by_topic()`` to regroup
+    """
+    flat_titles: list[dict[str, object]] = []
+    flat_topics: list[str] = []
+    for topic_id, titles in titles_by_topic.items():
+        flat_titles.extend(titles)
+        flat_topics.extend([topic_id] * len(titles))
+
+    result = score_titles_batch(flat_titles, config, topic_ids=flat_topics)
+    result.topic_order = tuple(titles_by_topic)
+    logger.info(
+        f"Batch-scored {len(result)} titles across {len(titles_by_topic)} topics"
+    )
+    return result
@@ -9,11 +9,37 @@ import logging
 import re
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import yaml
 
+if TYPE_CHECKING:
+    from PrismQ.StoryTitleScoring.batch_scoring import BatchScoreResult
+
 logger = logging.getLogger(__name__)
 
+# Rubric lexicons shared by the per-title scorer and the batch scorer
+SURPRISE_WORDS = ['secret', 'revealed', 'nobody', 'hidden', 'truth',
+                  'discovered', 'shocking', 'unexpected', 'never']
+PERSONAL_WORDS = ['i ', 'my ', 'me ']
+GENERIC_WORDS = ['things', 'stuff', 'ways', 'tips']
+POSITIVE_EMOTIONS = ['amazing', 'incredible', 'beautiful', 'love',
+                     'happy', 'joy', 'perfect']
+NEGATIVE_EMOTIONS = ['terrible', 'awful', 'nightmare', 'disaster',
+                     'regret', 'mistake', 'wrong']
+INTENSE_EMOTIONS = ['shocking', 'devastating', 'mind-blowing',
+                    'life-changing', 'unbelievable']
+ACTIVE_INDICATORS = ['you', 'i', 'we']
+LEARNING_WORDS = ['learn', 'discover', 'realize', 'understand', 'lesson']
+RELATABLE_TOPICS = ['relationship', 'friend', 'family', 'work',
+                    'dating', 'job', 'boss', 'ex']
+DEBATE_WORDS = ['vs', 'versus', 'debate', 'why', 'should']
+ACTION_WORDS = ['tell', 'share', 'comment', 'think']
+TRENDING_WORDS = ['trending', 'viral', 'everyone', 'nobody']
+
+NUMBER_PATTERN = re.compile(r'\b[0-9]+\b')
+LIST_PATTERN = re.compile(r'\b[0-9]+\s+(things|ways|reasons|signs|tips)')
+
 
 class TitleScorer:
     """
@@ -101,6 +127,40 @@ class TitleScorer:
         logger.info(f"Scored {total_count} titles across {len(titles_by_topic)} topics")
         return scored_titles
     
+    def score_titles_batch(self, titles: list[dict[str, object]]) -> "BatchScoreResult":
+        """
+        Score a batch of titles in one vectorized pass.
+        
+        Produces the same scores as calling score_title() per title, but
+        returns a columnar BatchScoreResult instead of copied dicts.
+        
+        Args:
+            titles: List of title dicts with 'text', 'topic_id', etc.
+        
+        Returns:
+            BatchScoreResult (explode with ``to_dicts()``)
+        """
+        from PrismQ.StoryTitleScoring.batch_scoring import score_titles_batch
+        
+        return score_titles_batch(titles, self.config)
+    
+    def score_all_titles_batch(
+        self,
+        titles_by_topic: dict[str, list[dict[str, object]]]
+    ) -> "BatchScoreResult":
+        """
+        Score all titles across all topics in one vectorized pass.
+        
+        Args:
+            titles_by_topic: Dict mapping topic_id to title lists
+        
+        Returns:
+            BatchScoreResult (regroup with ``to_titles_by_topic()``)
+        """
+        from PrismQ.StoryTitleScoring.batch_scoring import score_titles_by_topic_batch
+        
+        return score_titles_by_topic_batch(titles_by_topic, self.config)
+    
     def save_scored_titles(
         self,
         scored_titles: dict[str, list[dict[str, object]]],
@@ -195,27 +255,23 @@ class TitleScorer:
         score = 50.0  # Base score
         
         # Bonus for surprise words
-        surprise_words = ['secret', 'revealed', 'nobody', 'hidden', 'truth', 
-                         'discovered', 'shocking', 'unexpected', 'never']
-        for word in surprise_words:
+        for word in SURPRISE_WORDS:
             if word.lower() in text.lower():
                 score += 5
                 break
         
         # Bonus for specific numbers (more specific = more novel)
-        if re.search(r'\b[0-9]+\b', text):
+        if NUMBER_PATTERN.search(text):
             score += 5
         
         # Bonus for personal perspective
-        personal_words = ['i ', 'my ', 'me ']
-        for word in personal_words:
+        for word in PERSONAL_WORDS:
             if word.lower() in text.lower():
                 score += 5
                 break
         
         # Penalty for very common generic words
-        generic_words = ['things', 'stuff', 'ways', 'tips']
-        for word in generic_words:
+        for word in GENERIC_WORDS:
             if word.lower() in text.lower():
                 score -= 5
         
@@ -230,19 +286,12 @@ class TitleScorer:
         score = 50.0  # Base score
         
         # High-emotion words
-        positive_emotions = ['amazing', 'incredible', 'beautiful', 'love', 
-                           'happy', 'joy', 'perfect']
-        negative_emotions = ['terrible', 'awful', 'nightmare', 'disaster',
-                           'regret', 'mistake', 'wrong']
-        intense_emotions = ['shocking', 'devastating', 'mind-blowing',
-                          'life-changing', 'unbelievable']
-        
-        for word in positive_emotions + negative_emotions:
+        for word in POSITIVE_EMOTIONS + NEGATIVE_EMOTIONS:
             if word.lower() in text.lower():
                 score += 5
                 break
         
-        for word in intense_emotions:
+        for word in INTENSE_EMOTIONS:
             if word.lower() in text.lower():
                 score += 10
                 break
@@ -295,8 +344,7 @@ class TitleScorer:
         score -= len(long_words) * 5
         
         # Bonus for active voice indicators
-        active_indicators = ['you', 'i', 'we']
-        for word in active_indicators:
+        for word in ACTIVE_INDICATORS:
             if word.lower() in text.lower():
                 score += 3
                 break
@@ -312,7 +360,7 @@ class TitleScorer:
         score = 50.0  # Base score
         
         # Bonus for list/number format (implies multiple insights)
-        if re.search(r'\b[0-9]+\s+(things|ways|reasons|signs|tips)', text.lower()):
+        if LIST_PATTERN.search(text.lower()):
             score += 15
         
         # Bonus for "how to" (instructional, reference value)
@@ -324,8 +372,7 @@ class TitleScorer:
             score += 5
         
         # Bonus for lesson/learning indicators
-        learning_words = ['learn', 'discover', 'realize', 'understand', 'lesson']
-        for word in learning_words:
+        for word in LEARNING_WORDS:
             if word.lower() in text.lower():
                 score += 5
                 break
@@ -341,9 +388,7 @@ class TitleScorer:
         score = 50.0  # Base score
         
         # Bonus for relatable topics
-        relatable_topics = ['relationship', 'friend', 'family', 'work',
-                          'dating', 'job', 'boss', 'ex']
-        for topic in relatable_topics:
+        for topic in RELATABLE_TOPICS:
             if topic.lower() in text.lower():
                 score += 10
                 break
@@ -353,22 +398,19 @@ class TitleScorer:
             score += 10
         
         # Bonus for controversial/debate elements
-        debate_words = ['vs', 'versus', 'debate', 'why', 'should']
-        for word in debate_words:
+        for word in DEBATE_WORDS:
             if word.lower() in text.lower():
                 score += 5
                 break
         
         # Bonus for call-to-action elements
-        action_words = ['tell', 'share', 'comment', 'think']
-        for word in action_words:
+        for word in ACTION_WORDS:
             if word.lower() in text.lower():
                 score += 5
                 break
         
         # Bonus for trending/timely keywords
-        trending_words = ['trending', 'viral', 'everyone', 'nobody']
-        for word in trending_words:
+        for word in TRENDING_WORDS:
             if word.lower() in text.lower():
                 score += 5
                 break
@@ -8,14 +8,23 @@ This module provides functionality for:
 4. Multi-format audio output
 """
 
+import hashlib
 import json
 import logging
+import os
 import subprocess
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
 import tempfile
 
+from PrismQ.Shared.media_probe import get_media_probe
+from PrismQ.Shared.rate_limit import RateLimit, get_rate_limiter, parse_retry_after
+from PrismQ.VoiceOverGenerator.mp3_frames import Mp3FrameCounter, mp3_duration
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +37,7 @@ class AudioMetadata:
     bit_depth: int = 16
     lufs: float | None = None  # Loudness Units relative to Full Scale
     peak_db: float | None = None
+    processing_seconds: float | None = None  # Normalization wall time
     
     def to_dict(self) -> dict[str, object]:
         """Convert to dictionary."""
@@ -59,19 +69,68 @@ class VoiceoverAudio:
         return json.dumps(self.to_dict(), indent=indent)
 
 
+@dataclass
+class ProviderRateLimit:
+    """Request limits for one TTS provider."""
+    max_concurrency: int = 4
+    requests_per_minute: float | None = None
+
+
+# Conservative defaults; override per generator with rate_limit=
+DEFAULT_RATE_LIMITS: dict[str, ProviderRateLimit] = {
+    'elevenlabs': ProviderRateLimit(max_concurrency=4, requests_per_minute=120),
+    'openai': ProviderRateLimit(max_concurrency=8, requests_per_minute=50),
+}
+
+
+def _provider_key(provider: str, limit: ProviderRateLimit) -> str:
+    """Return a provider's key on the shared rate limiter, configuring it once.
+
+    The key is shared by all generators (and, with a shared limiter backend,
+    all processes) using the provider, so the first generator's limit sets
+    the provider's budget; later generators share it instead of overriding
+    it. Requests are spaced evenly: the bucket holds a single token.
+    """
+    key = f"tts:{provider}"
+    requested = RateLimit(
+        rate=limit.requests_per_minute / 60.0 if limit.requests_per_minute else None,
+        burst=1,
+        max_concurrency=max(1, limit.max_concurrency),
+    )
+    if get_rate_limiter().configure(key, requested, replace=False) != requested:
+        logger.warning(f"{key} already has a shared rate limit; ignoring {limit}")
+    return key
+
+
+@dataclass
+class TTSBatchItem:
+    """Outcome of one script in a TTS batch."""
+    script_id: str
+    audio: VoiceoverAudio | None = None
+    cached: bool = False
+    error: str | None = None
+    elapsed_seconds: float = 0.0
+
+
 class TTSGenerator:
     """
     Generate text-to-speech audio from scripts.
     
     Supports multiple TTS providers (ElevenLabs, OpenAI TTS, local models)
     with voice selection based on demographics and content.
+    
+    Audio is streamed to disk as it arrives and its duration is read from
+    the MP3 frame headers. A sidecar keyed on (provider, text, voice, model)
+    lets unchanged scripts skip re-synthesis.
     """
     
     def __init__(
         self,
         provider: str = "elevenlabs",
         api_key: str | None = None,
-        output_root: str | None = None
+        output_root: str | None = None,
+        rate_limit: ProviderRateLimit | None = None,
+        use_cache: bool = True
     ):
         """
         Initialize TTSGenerator.
@@ -80,10 +139,15 @@ class TTSGenerator:
             provider: TTS provider ('elevenlabs', 'openai', 'local')
             api_key: API key for cloud providers
             output_root: Root directory for audio output
+            rate_limit: Provider request limits (defaults to DEFAULT_RATE_LIMITS)
+            use_cache: Skip synthesis when text, voice and model are unchanged
         """
         self.provider = provider
         self.api_key = api_key
         self.output_root = Path(output_root) if output_root else Path("Generator/audio")
+        self.rate_limit = rate_limit or DEFAULT_RATE_LIMITS.get(provider, ProviderRateLimit())
+        self._rate_key = _provider_key(provider, self.rate_limit)
+        self.use_cache = use_cache
         self._client = None
         
         logger.info(f"Initialized TTSGenerator with provider: {provider}")
@@ -131,6 +195,68 @@ class TTSGenerator:
         Returns:
             VoiceoverAudio object with generated audio
         """
+        audio, _ = self._generate_tts(script, voice_gender, voice_id, model)
+        return audio
+    
+    def generate_tts_batch(
+        self,
+        scripts: list[dict[str, object]],
+        voice_gender: str = "female",
+        voice_id: str | None = None,
+        model: str = "eleven_turbo_v2",
+        max_workers: int | None = None
+    ) -> list[TTSBatchItem]:
+        """
+        Generate TTS audio for many scripts concurrently.
+        
+        Provider calls run in a thread pool and share the provider's rate
+        limit; unchanged scripts are served from the cache. A failing script
+        is reported in its item and does not stop the batch.
+        
+        Args:
+            scripts: Script dicts with 'script_id', 'content', etc.
+            voice_gender: 'male' or 'female'
+            voice_id: Specific voice ID (provider-dependent)
+            model: TTS model to use
+            max_workers: Worker threads (default: the provider's max_concurrency)
+        
+        Returns:
+            One TTSBatchItem per script, in input order
+        """
+        self._init_client()
+        workers = max_workers or self.rate_limit.max_concurrency
+        
+        def run(script: dict[str, object]) -> TTSBatchItem:
+            item = TTSBatchItem(script_id=str(script.get('script_id', 'unknown')))
+            start = time.perf_counter()
+            try:
+                item.audio, item.cached = self._generate_tts(script, voice_gender, voice_id, model)
+            except Exception as e:
+                logger.error(f"TTS failed for script {item.script_id}: {e}")
+                item.error = str(e)
+            item.elapsed_seconds = time.perf_counter() - start
+            return item
+        
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            items = list(executor.map(run, scripts))
+        
+        cached = sum(1 for item in items if item.cached)
+        failed = sum(1 for item in items if item.error)
+        logger.info(
+            f"TTS batch: {len(items) - cached - failed} generated, {cached} cached, "
+            f"{failed} failed in {time.perf_counter() - start:.1f}s"
+        )
+        return items
+    
+    def _generate_tts(
+        self,
+        script: dict[str, object],
+        voice_gender: str,
+        voice_id: str | None,
+        model: str
+    ) -> tuple[VoiceoverAudio, bool]:
+        """Generate (or reuse cached) TTS audio; returns (audio, was_cached)."""
         self._init_client()
         
         script_id = script.get('script_id', 'unknown')
@@ -145,21 +271,40 @@ class TTSGenerator:
         if voice_id is None:
             voice_id = self._select_voice(voice_gender)
         
-        logger.info(f"Generating TTS for script {script_id} with voice {voice_id}")
-        
-        # Generate audio
-        audio_data = self._generate_audio(content, voice_id, model)
+        raw_path = self._raw_audio_path(script_id, target_gender, target_age)
+        cache_key = self._cache_key(content, voice_id, model)
+        metadata = self._load_cached_metadata(raw_path, cache_key) if self.use_cache else None
+        cached = metadata is not None
         
-        # Save raw audio
-        raw_path = self._save_raw_audio(
-            audio_data,
-            script_id,
-            target_gender,
-            target_age
-        )
-        
-        # Get audio metadata
-        metadata = self._get_audio_metadata(raw_path)
+        if cached:
+            logger.info(f"Reusing cached TTS for script {script_id}: {raw_path}")
+        else:
+            logger.info(f"Generating TTS for script {script_id} with voice {voice_id}")
+            
+            # Stream audio straight to disk under the provider's rate limit
+            limiter = get_rate_limiter()
+            key = self._rate_key
+            with limiter.limit(key):
+                try:
+                    metadata = self._stream_to_file(
+                        self._stream_audio(content, voice_id, model), raw_path
+                    )
+                except Exception as e:
+                    # Slow every generator down when the provider throttles
+                    response = getattr(e, 'response', None)
+                    limiter.feedback(
+                        key,
+                        getattr(e, 'status_code', None) or getattr(response, 'status_code', None),
+                        parse_retry_after(getattr(response, 'headers', {}).get('Retry-After')),
+                    )
+                    raise
+            
+            if metadata is None:
+                # Not MPEG audio (e.g. mock provider); fall back to probing the file
+                metadata = self._get_audio_metadata(raw_path)
+            
+            if self.use_cache:
+                self._save_cache_entry(raw_path, cache_key, metadata)
         
         audio = VoiceoverAudio(
             audio_id=f"{script_id}_tts",
@@ -173,7 +318,46 @@ class TTSGenerator:
         )
         
         logger.info(f"Generated TTS audio: {raw_path} ({metadata.duration_seconds:.1f}s)")
-        return audio
+        return audio, cached
+    
+    def _cache_key(self, text: str, voice_id: str, model: str) -> str:
+        """Content hash of everything that determines the synthesized audio."""
+        payload = json.dumps(
+            {'provider': self.provider, 'text': text, 'voice_id': voice_id, 'model': model},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def _cache_entry_path(raw_path: Path) -> Path:
+        """Sidecar file recording the cache key of a raw audio file."""
+        return raw_path.with_suffix('.tts.json')
+    
+    def _load_cached_metadata(self, raw_path: Path, cache_key: str) -> AudioMetadata | None:
+        """Return cached metadata if the raw audio exists and matches the key."""
+        entry_path = self._cache_entry_path(raw_path)
+        if not raw_path.exists() or not entry_path.exists():
+            return None
+        
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if entry.get('cache_key') != cache_key:
+                return None
+            return AudioMetadata(**entry['metadata'])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable TTS cache entry {entry_path}: {e}")
+            return None
+    
+    def _save_cache_entry(self, raw_path: Path, cache_key: str, metadata: AudioMetadata) -> None:
+        """Record the cache key and metadata next to the raw audio."""
+        entry = {
+            'cache_key': cache_key,
+            'metadata': metadata.to_dict(),
+            'created_at': datetime.now().isoformat()
+        }
+        with open(self._cache_entry_path(raw_path), 'w', encoding='utf-8') as f:
+            json.dump(entry, f, indent=2)
     
     def _select_voice(self, gender: str) -> str:
         """Select appropriate voice ID based on gender and provider."""
@@ -206,37 +390,88 @@ class TTSGenerator:
             # Mock for testing
             return b"MOCK_AUDIO_DATA"
     
+    def _stream_audio(self, text: str, voice_id: str, model: str) -> Iterable[bytes]:
+        """Yield audio chunks from the configured provider as they arrive."""
+        if self.provider == "elevenlabs":
+            return self._stream_elevenlabs(text, voice_id, model)
+        elif self.provider == "openai":
+            return self._stream_openai(text, voice_id)
+        else:
+            return iter([self._generate_audio(text, voice_id, model)])
+    
     def _generate_elevenlabs(self, text: str, voice_id: str, model: str) -> bytes:
         """Generate audio using ElevenLabs."""
+        return b"".join(self._stream_elevenlabs(text, voice_id, model))
+    
+    def _stream_elevenlabs(self, text: str, voice_id: str, model: str) -> Iterator[bytes]:
+        """Stream audio chunks from ElevenLabs."""
         try:
-            audio_generator = self._client.text_to_speech.convert(
+            yield from self._client.text_to_speech.convert(
                 voice_id=voice_id,
                 text=text,
                 model_id=model,
                 output_format="mp3_44100_128"
             )
-            
-            # Collect audio chunks
-            audio_data = b"".join(audio_generator)
-            return audio_data
         except Exception as e:
             logger.error(f"ElevenLabs TTS error: {e}")
             raise
     
     def _generate_openai(self, text: str, voice_id: str) -> bytes:
         """Generate audio using OpenAI TTS."""
+        return b"".join(self._stream_openai(text, voice_id))
+    
+    def _stream_openai(self, text: str, voice_id: str) -> Iterator[bytes]:
+        """Stream audio chunks from OpenAI TTS."""
         try:
-            response = self._client.audio.speech.create(
+            with self._client.audio.speech.with_streaming_response.create(
                 model="tts-1-hd",  # or "tts-1" for faster/cheaper
                 voice=voice_id,
                 input=text,
                 response_format="mp3"
-            )
-            return response.content
+            ) as response:
+                yield from response.iter_bytes()
         except Exception as e:
             logger.error(f"OpenAI TTS error: {e}")
             raise
     
+    def _raw_audio_path(self, script_id: str, target_gender: str, target_age: str) -> Path:
+        """Return the raw TTS output path for a script, creating its directory."""
+        output_dir = self.output_root / "tts" / target_gender / target_age / "raw"
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return output_dir / f"{script_id}.mp3"
+    
+    def _stream_to_file(self, chunks: Iterable[bytes], output_file: Path) -> AudioMetadata | None:
+        """
+        Write audio chunks to disk as they arrive.
+        
+        Chunks go to a temporary file that replaces ``output_file`` only when
+        the stream completes. MP3 frame headers are counted along the way.
+        
+        Returns:
+            AudioMetadata from the frame headers, or None if no MP3 frames were seen
+        """
+        counter = Mp3FrameCounter()
+        partial_file = output_file.with_name(output_file.name + ".part")
+        
+        try:
+            with open(partial_file, 'wb') as f:
+                for chunk in chunks:
+                    if chunk:
+                        f.write(chunk)
+                        counter.feed(chunk)
+            os.replace(partial_file, output_file)
+        except BaseException:
+            partial_file.unlink(missing_ok=True)
+            raise
+        
+        logger.debug(f"Streamed raw audio: {output_file}")
+        if not counter.frames:
+            return None
+        return AudioMetadata(
+            duration_seconds=counter.duration_seconds,
+            sample_rate=counter.sample_rate
+        )
+    
     def _save_raw_audio(
         self,
         audio_data: bytes,
@@ -245,10 +480,7 @@ class TTSGenerator:
         target_age: str
     ) -> Path:
         """Save raw TTS audio to file."""
-        output_dir = self.output_root / "tts" / target_gender / target_age / "raw"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        output_file = output_dir / f"{script_id}.mp3"
+        output_file = self._raw_audio_path(script_id, target_gender, target_age)
         
         with open(output_file, 'wb') as f:
             f.write(audio_data)
@@ -257,31 +489,22 @@ class TTSGenerator:
         return output_file
     
     def _get_audio_metadata(self, audio_path: Path) -> AudioMetadata:
-        """Extract audio metadata using ffprobe."""
+        """Extract audio metadata from MP3 frame headers, falling back to the shared media probe."""
         try:
-            # Use ffprobe to get duration
-            result = subprocess.run(
-                [
-                    'ffprobe',
-                    '-v', 'error',
-                    '-show_entries', 'format=duration',
-                    '-of', 'default=noprint_wrappers=1:nokey=1',
-                    str(audio_path)
-                ],
-                capture_output=True,
-                text=True,
-                timeout=10
+            duration = mp3_duration(audio_path)
+            if duration is not None:
+                return AudioMetadata(duration_seconds=duration)
+        except OSError as e:
+            logger.warning(f"Could not read audio file: {e}")
+        
+        info = get_media_probe().probe(audio_path)
+        if info is not None and info.duration > 0:
+            return AudioMetadata(
+                duration_seconds=info.duration,
+                sample_rate=info.sample_rate or 44100,
+                channels=info.channels or 1
             )
-            
-            if result.returncode == 0:
-                duration = float(result.stdout.strip())
-                return AudioMetadata(
-                    duration_seconds=duration,
-                    sample_rate=44100,
-                    channels=1
-                )
-        except (subprocess.TimeoutExpired, FileNotFoundError, ValueError) as e:
-            logger.warning(f"Could not extract metadata: {e}")
+        logger.warning(f"Could not extract metadata: {audio_path}")
         
         # Fallback: estimate based on file size (rough approximation)
         file_size = audio_path.stat().st_size
@@ -296,17 +519,28 @@ class AudioNormalizer:
     
     Applies LUFS (Loudness Units relative to Full Scale) normalization
     for consistent volume across videos. Standard: -14 LUFS for YouTube/TikTok.
+    
+    The default 'native' engine decodes once, measures and processes the
+    buffer in memory (see loudness.py) and encodes once. The 'ffmpeg'
+    engine runs the two-pass ffmpeg loudnorm filter instead.
     """
     
-    def __init__(self, output_root: str | None = None):
+    ENGINES = ('native', 'ffmpeg')
+    
+    def __init__(self, output_root: str | None = None, engine: str = "native"):
         """
         Initialize AudioNormalizer.
         
         Args:
             output_root: Root directory for normalized audio output
+            engine: Normalization engine ('native' or 'ffmpeg')
         """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown normalization engine: {engine}")
+        
         self.output_root = Path(output_root) if output_root else Path("Generator/audio")
-        logger.info("Initialized AudioNormalizer")
+        self.engine = engine
+        logger.info(f"Initialized AudioNormalizer with engine: {engine}")
     
     def normalize_audio(
         self,
@@ -334,13 +568,6 @@ class AudioNormalizer:
         
         logger.info(f"Normalizing audio {audio.audio_id} to {target_lufs} LUFS")
         
-        # Measure current loudness
-        current_lufs = self._measure_lufs(raw_path)
-        logger.info(f"Current LUFS: {current_lufs:.1f}")
-        
-        # Calculate volume adjustment
-        adjustment_db = target_lufs - current_lufs
-        
         # Create normalized output path
         script_id = audio.script_id
         target_gender = raw_path.parent.parent.parent.name
@@ -351,6 +578,20 @@ class AudioNormalizer:
         
         normalized_path = output_dir / f"{script_id}_normalized.mp3"
         
+        if self.engine == "native":
+            return self._normalize_native(
+                audio, raw_path, normalized_path, target_lufs, true_peak
+            )
+        
+        start = time.perf_counter()
+        
+        # Measure current loudness
+        current_lufs = self._measure_lufs(raw_path)
+        logger.info(f"Current LUFS: {current_lufs:.1f}")
+        
+        # Calculate volume adjustment
+        adjustment_db = target_lufs - current_lufs
+        
         # Apply normalization using FFmpeg loudnorm filter
         self._apply_loudnorm(
             input_path=raw_path,
@@ -365,10 +606,52 @@ class AudioNormalizer:
         # Measure final loudness
         final_lufs = self._measure_lufs(normalized_path)
         audio.metadata.lufs = final_lufs
+        audio.metadata.processing_seconds = time.perf_counter() - start
+        
+        logger.info(
+            f"Normalized audio saved: {normalized_path} "
+            f"(adjusted {adjustment_db:+.1f}dB, final LUFS: {final_lufs:.1f}, "
+            f"{audio.metadata.processing_seconds:.2f}s)"
+        )
+        
+        return audio
+    
+    def _normalize_native(
+        self,
+        audio: VoiceoverAudio,
+        raw_path: Path,
+        normalized_path: Path,
+        target_lufs: float,
+        true_peak: float
+    ) -> VoiceoverAudio:
+        """Normalize with the in-process BS.1770 engine (one decode, one encode)."""
+        from PrismQ.VoiceOverGenerator.loudness import normalize_file
+        
+        try:
+            result = normalize_file(
+                raw_path,
+                normalized_path,
+                target_lufs=target_lufs,
+                true_peak_db=true_peak,
+                sample_rate=audio.metadata.sample_rate,
+                channels=audio.metadata.channels
+            )
+        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError) as e:
+            logger.error(f"Loudness normalization failed: {e}")
+            raise
+        
+        audio.normalized_path = str(normalized_path)
+        audio.metadata.lufs = result.output_lufs
+        audio.metadata.peak_db = result.output_true_peak_db
+        audio.metadata.processing_seconds = result.processing_seconds
+        if not audio.metadata.duration_seconds:
+            audio.metadata.duration_seconds = result.duration_seconds
         
         logger.info(
             f"Normalized audio saved: {normalized_path} "
-            f"(adjusted {adjustment_db:+.1f}dB, final LUFS: {final_lufs:.1f})"
+            f"(input LUFS: {result.input_lufs:.1f}, adjusted {result.gain_db:+.1f}dB, "
+            f"final LUFS: {result.output_lufs:.1f}, true peak: {result.output_true_peak_db:.1f}dBTP"
+            f"{', limited' if result.limited else ''}, {result.processing_seconds:.2f}s)"
         )
         
         return audio
@@ -539,13 +822,28 @@ def produce_audio(
     
     # Save metadata
     if output_root:
-        metadata_dir = Path(output_root) / "metadata"
-        metadata_dir.mkdir(parents=True, exist_ok=True)
-        metadata_file = metadata_dir / f"{audio.audio_id}.json"
-        
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            f.write(audio.to_json())
-        
-        logger.info(f"Saved audio metadata: {metadata_file}")
+        save_audio_metadata(audio, Path(output_root) / "metadata")
     
     return audio
+
+
+def save_audio_metadata(audio: VoiceoverAudio, metadata_dir: Path) -> Path:
+    """
+    Save voice-over metadata as JSON.
+    
+    Args:
+        audio: VoiceoverAudio to save
+        metadata_dir: Directory for metadata files
+    
+    Returns:
+        Path to the metadata file
+    """
+    metadata_dir = Path(metadata_dir)
+    metadata_dir.mkdir(parents=True, exist_ok=True)
+    metadata_file = metadata_dir / f"{audio.audio_id}.json"
+    
+    with open(metadata_file, 'w', encoding='utf-8') as f:
+        f.write(audio.to_json())
+    
+    logger.info(f"Saved audio metadata: {metadata_file}")
+    return metadata_file
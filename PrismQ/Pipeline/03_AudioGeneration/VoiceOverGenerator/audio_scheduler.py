@@ -0,0 +1,414 @@
+"""
+Audio Scheduler Module - Batch TTS + normalization with a worker pool
+
+This module runs the audio production workflow for many scripts:
+1. Loads scripts from a directory or a manifest file
+2. Runs network-bound TTS in a bounded thread pool
+3. Hands each finished voice-over to a bounded normalization pool
+   (processes by default), so TTS and normalization overlap
+4. Checkpoints every state change to a manifest so interrupted runs resume
+5. Reports throughput (scripts/min) and per-phase timings
+"""
+
+import json
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+
+from PrismQ.VoiceOverGenerator.audio_production import (
+    AudioMetadata,
+    AudioNormalizer,
+    TTSGenerator,
+    VoiceoverAudio,
+    save_audio_metadata,
+)
+
+logger = logging.getLogger(__name__)
+
+# Manifest entry states
+STATUS_PENDING = 'pending'
+STATUS_TTS_DONE = 'tts_done'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+
+@dataclass
+class AudioJobRecord:
+    """Checkpointed progress of one script."""
+    script_id: str
+    status: str = STATUS_PENDING
+    audio: dict[str, object] | None = None
+    error: str | None = None
+    tts_seconds: float | None = None
+    normalize_seconds: float | None = None
+    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    def to_dict(self) -> dict[str, object]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+@dataclass
+class ProductionReport:
+    """Summary of one scheduler run."""
+    total: int
+    completed: int
+    resumed: int
+    failed: int
+    elapsed_seconds: float
+    scripts_per_minute: float
+    phase_seconds: dict[str, float]
+    phase_mean_seconds: dict[str, float]
+
+    def to_dict(self) -> dict[str, object]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+def load_scripts(source: str | Path) -> list[dict[str, object]]:
+    """
+    Load scripts from a directory or a manifest file.
+
+    A directory is searched recursively for script ``*.json`` files. A
+    manifest is either a JSON list (or ``{"scripts": [...]}``) or a JSONL
+    file; each entry is a script dict or a path to a script file.
+
+    Args:
+        source: Script directory or manifest path
+
+    Returns:
+        Script dicts that have 'script_id' and 'content'
+    """
+    source = Path(source)
+
+    if source.is_dir():
+        entries: list[object] = sorted(source.rglob("*.json"))
+    elif source.suffix == '.jsonl':
+        with open(source, 'r', encoding='utf-8') as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+    else:
+        with open(source, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        entries = data.get('scripts', []) if isinstance(data, dict) else data
+
+    scripts = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            path = Path(entry)
+            if not path.is_absolute() and not source.is_dir():
+                path = source.parent / path
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable script {path}: {e}")
+                continue
+
+        if isinstance(entry, dict) and entry.get('script_id') and entry.get('content'):
+            scripts.append(entry)
+
+    logger.info(f"Loaded {len(scripts)} scripts from {source}")
+    return scripts
+
+
+def _audio_from_dict(data: dict[str, object]) -> VoiceoverAudio:
+    """Rebuild a VoiceoverAudio from its to_dict() form."""
+    data = dict(data)
+    data['metadata'] = AudioMetadata(**data.get('metadata', {'duration_seconds': 0.0}))
+    return VoiceoverAudio(**data)
+
+
+def _timed_normalize(
+    normalizer: AudioNormalizer,
+    audio: VoiceoverAudio,
+    target_lufs: float,
+    true_peak: float
+) -> tuple[VoiceoverAudio, float]:
+    """Normalize one voice-over in a worker and time it."""
+    start = time.perf_counter()
+    audio = normalizer.normalize_audio(audio, target_lufs=target_lufs, true_peak=true_peak)
+    return audio, time.perf_counter() - start
+
+
+class AudioProductionScheduler:
+    """
+    Produce normalized voice-overs for many scripts.
+
+    TTS calls run in a thread pool (bounded by ``tts_workers`` and the
+    generator's provider rate limit). Normalization runs in a separate pool
+    of ``normalize_workers``. Progress is written to a JSON manifest after
+    every state change; re-running with the same manifest skips finished
+    scripts and normalizes already-synthesized ones (including ones whose
+    normalization failed) without repeating TTS.
+    """
+
+    def __init__(
+        self,
+        generator: TTSGenerator,
+        normalizer: AudioNormalizer,
+        manifest_path: str | Path,
+        tts_workers: int | None = None,
+        normalize_workers: int | None = None,
+        use_processes: bool = True,
+        voice_gender: str = "female",
+        target_lufs: float = -14.0,
+        true_peak: float = -1.0,
+        metadata_root: str | Path | None = None
+    ):
+        """
+        Initialize AudioProductionScheduler.
+
+        Args:
+            generator: TTS generator
+            normalizer: Audio normalizer
+            manifest_path: Checkpoint manifest path
+            tts_workers: TTS threads (default: the provider's max_concurrency)
+            normalize_workers: Normalization workers (default: CPU count)
+            use_processes: Normalize in worker processes instead of threads
+            voice_gender: 'male' or 'female'
+            target_lufs: Target loudness in LUFS
+            true_peak: True peak limit in dB
+            metadata_root: Directory to write per-audio metadata JSON (optional)
+        """
+        self.generator = generator
+        self.normalizer = normalizer
+        self.manifest_path = Path(manifest_path)
+        self.tts_workers = tts_workers or generator.rate_limit.max_concurrency
+        self.normalize_workers = normalize_workers or os.cpu_count() or 1
+        self.use_processes = use_processes
+        self.voice_gender = voice_gender
+        self.target_lufs = target_lufs
+        self.true_peak = true_peak
+        self.metadata_root = Path(metadata_root) if metadata_root else None
+        self.records: dict[str, AudioJobRecord] = {}
+        self._phase_times: dict[str, list[float]] = {'tts': [], 'normalize': []}
+
+    def load_manifest(self) -> dict[str, AudioJobRecord]:
+        """Load checkpointed records, if any."""
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return {
+                script_id: AudioJobRecord(**record)
+                for script_id, record in data.get('scripts', {}).items()
+            }
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable manifest {self.manifest_path}: {e}")
+            return {}
+
+    def save_manifest(self) -> None:
+        """Write all records atomically."""
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'updated_at': datetime.now().isoformat(),
+            'scripts': {script_id: record.to_dict() for script_id, record in self.records.items()},
+        }
+        tmp_path = self.manifest_path.with_name(self.manifest_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _update(self, script_id: str, **changes: object) -> None:
+        """Update one record and checkpoint the manifest."""
+        record = self.records[script_id]
+        for key, value in changes.items():
+            setattr(record, key, value)
+        record.updated_at = datetime.now().isoformat()
+        self.save_manifest()
+
+    def _timed_tts(self, script: dict[str, object]) -> tuple[VoiceoverAudio, float]:
+        """Run TTS for one script and time it."""
+        start = time.perf_counter()
+        audio = self.generator.generate_tts(script, voice_gender=self.voice_gender)
+        return audio, time.perf_counter() - start
+
+    def _is_resumable(self, record: AudioJobRecord, statuses: tuple[str, ...], path_key: str) -> bool:
+        """Whether a checkpointed stage finished and its output still exists."""
+        if record.status not in statuses or not record.audio:
+            return False
+        path = record.audio.get(path_key)
+        return bool(path) and Path(path).exists()
+
+    def run(self, scripts: list[dict[str, object]]) -> ProductionReport:
+        """
+        Produce audio for all scripts, resuming from the manifest.
+
+        Args:
+            scripts: Script dicts with 'script_id' and 'content'
+
+        Returns:
+            ProductionReport with throughput and per-phase timings
+        """
+        start = time.perf_counter()
+        checkpoint = self.load_manifest()
+        self.records = {}
+        self._phase_times = {'tts': [], 'normalize': []}
+
+        to_tts: list[dict[str, object]] = []
+        to_normalize: list[VoiceoverAudio] = []
+        resumed = 0
+
+        for script in scripts:
+            script_id = str(script['script_id'])
+            record = checkpoint.get(script_id, AudioJobRecord(script_id=script_id))
+            self.records[script_id] = record
+
+            if self._is_resumable(record, (STATUS_DONE,), 'normalized_path'):
+                resumed += 1
+            elif self._is_resumable(record, (STATUS_TTS_DONE, STATUS_FAILED), 'raw_path'):
+                # TTS output survived; only normalization is left
+                to_normalize.append(_audio_from_dict(record.audio))
+            else:
+                record.status = STATUS_PENDING
+                record.error = None
+                to_tts.append(script)
+        self.save_manifest()
+
+        logger.info(
+            f"Audio production: {len(to_tts)} to synthesize, {len(to_normalize)} to normalize, "
+            f"{resumed} already done"
+        )
+
+        self._run_pools(to_tts, to_normalize)
+
+        elapsed = time.perf_counter() - start
+        report = self._build_report(len(scripts), resumed, elapsed)
+        logger.info(
+            f"Audio production complete: {report.completed}/{report.total} done "
+            f"({report.failed} failed) in {elapsed:.1f}s, "
+            f"{report.scripts_per_minute:.1f} scripts/min, "
+            f"TTS {report.phase_seconds['tts']:.1f}s, "
+            f"normalize {report.phase_seconds['normalize']:.1f}s"
+        )
+        return report
+
+    def _normalize_executor(self) -> Executor:
+        """Create the bounded normalization pool."""
+        if self.use_processes:
+            executor = ProcessPoolExecutor(max_workers=self.normalize_workers)
+            # Start the workers before any TTS thread runs: a process forked
+            # while another thread holds a lock inherits it locked and hangs
+            executor.submit(os.getpid).result()
+            return executor
+        return ThreadPoolExecutor(max_workers=self.normalize_workers)
+
+    def _run_pools(
+        self,
+        to_tts: list[dict[str, object]],
+        to_normalize: list[VoiceoverAudio]
+    ) -> None:
+        """Drive both pools, handing finished TTS jobs to normalization."""
+        with self._normalize_executor() as normalize_pool, \
+                ThreadPoolExecutor(max_workers=max(1, self.tts_workers)) as tts_pool:
+            pending = {}
+
+            def submit_normalize(audio: VoiceoverAudio) -> None:
+                future = normalize_pool.submit(
+                    _timed_normalize, self.normalizer, audio, self.target_lufs, self.true_peak
+                )
+                pending[future] = ('normalize', audio.script_id)
+
+            for audio in to_normalize:
+                submit_normalize(audio)
+            for script in to_tts:
+                pending[tts_pool.submit(self._timed_tts, script)] = ('tts', str(script['script_id']))
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    phase, script_id = pending.pop(future)
+                    try:
+                        audio, seconds = future.result()
+                    except Exception as e:
+                        logger.error(f"{phase} failed for script {script_id}: {e}")
+                        self._update(script_id, status=STATUS_FAILED, error=f"{phase}: {e}")
+                        continue
+
+                    self._phase_times[phase].append(seconds)
+                    if phase == 'tts':
+                        self._update(
+                            script_id,
+                            status=STATUS_TTS_DONE,
+                            audio=audio.to_dict(),
+                            tts_seconds=seconds
+                        )
+                        submit_normalize(audio)
+                    else:
+                        self._update(
+                            script_id,
+                            status=STATUS_DONE,
+                            audio=audio.to_dict(),
+                            normalize_seconds=seconds
+                        )
+                        if self.metadata_root:
+                            save_audio_metadata(audio, self.metadata_root)
+
+    def _build_report(self, total: int, resumed: int, elapsed: float) -> ProductionReport:
+        """Summarize the records of this run."""
+        records = self.records.values()
+        completed = sum(1 for r in records if r.status == STATUS_DONE)
+        failed = sum(1 for r in records if r.status == STATUS_FAILED)
+        processed = completed - resumed
+
+        phase_values = self._phase_times
+        return ProductionReport(
+            total=total,
+            completed=completed,
+            resumed=resumed,
+            failed=failed,
+            elapsed_seconds=elapsed,
+            scripts_per_minute=processed / (elapsed / 60.0) if elapsed > 0 else 0.0,
+            phase_seconds={phase: sum(values) for phase, values in phase_values.items()},
+            phase_mean_seconds={
+                phase: sum(values) / len(values) if values else 0.0
+                for phase, values in phase_values.items()
+            },
+        )
+
+
+def produce_audio_batch(
+    source: str | Path,
+    tts_provider: str = "elevenlabs",
+    api_key: str | None = None,
+    voice_gender: str = "female",
+    target_lufs: float = -14.0,
+    output_root: str | None = None,
+    manifest_path: str | Path | None = None,
+    tts_workers: int | None = None,
+    normalize_workers: int | None = None
+) -> ProductionReport:
+    """
+    Batch audio production workflow: TTS generation + normalization.
+
+    Args:
+        source: Script directory or manifest file
+        tts_provider: TTS provider ('elevenlabs', 'openai')
+        api_key: API key for provider
+        voice_gender: 'male' or 'female'
+        target_lufs: Target loudness level (default: -14.0)
+        output_root: Root directory for output
+        manifest_path: Checkpoint manifest (default: <output_root>/production_manifest.json)
+        tts_workers: Concurrent TTS requests
+        normalize_workers: Concurrent normalization workers
+
+    Returns:
+        ProductionReport for the run
+    """
+    root = Path(output_root) if output_root else Path("Generator/audio")
+    scheduler = AudioProductionScheduler(
+        generator=TTSGenerator(provider=tts_provider, api_key=api_key, output_root=str(root)),
+        normalizer=AudioNormalizer(output_root=str(root)),
+        manifest_path=manifest_path or root / "production_manifest.json",
+        tts_workers=tts_workers,
+        normalize_workers=normalize_workers,
+        voice_gender=voice_gender,
+        target_lufs=target_lufs,
+        metadata_root=root / "metadata" if output_root else None,
+    )
+    return scheduler.run(load_scripts(source))
@@ -0,0 +1,404 @@
+"""
+Loudness Module - In-process ITU-R BS.1770 loudness normalization
+
+This module provides a native normalization engine for voice-over audio:
+1. Decode the input once into a NumPy buffer (one ffmpeg run)
+2. Measure integrated loudness (LUFS) and true peak (dBTP) per BS.1770-4
+3. Apply gain and true-peak limiting in memory
+4. Measure the processed buffer and encode once (one ffmpeg run)
+"""
+
+import logging
+import subprocess
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+
+import numpy as np
+from scipy import signal
+
+logger = logging.getLogger(__name__)
+
+# BS.1770 gating parameters
+BLOCK_SECONDS = 0.4
+BLOCK_OVERLAP = 0.75
+ABSOLUTE_GATE_LUFS = -70.0
+RELATIVE_GATE_LU = -10.0
+
+# Channel weights for L, R, C (surround channels would use 1.41)
+CHANNEL_WEIGHTS = (1.0, 1.0, 1.0, 1.41, 1.41)
+
+# Look-ahead of the true-peak limiter
+LIMITER_LOOKAHEAD_SECONDS = 0.005
+
+
+@dataclass
+class NormalizationResult:
+    """Measurements and timing of one native normalization run."""
+    input_lufs: float
+    input_true_peak_db: float
+    output_lufs: float
+    output_true_peak_db: float
+    gain_db: float
+    limited: bool
+    duration_seconds: float
+    processing_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, object]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+def k_weighting_filters(sample_rate: int) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Build the two K-weighting biquads (shelving + high-pass) for a sample rate.
+
+    Coefficients are derived from the analog prototypes so any sample rate
+    matches the 48 kHz reference values in BS.1770.
+
+    Args:
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        List of (b, a) coefficient pairs, applied in order
+    """
+    # Stage 1: high-frequency shelf (head acoustics)
+    f0 = 1681.974450955533
+    gain_db = 3.999843853973347
+    q = 0.7071752369554196
+    k = np.tan(np.pi * f0 / sample_rate)
+    vh = 10 ** (gain_db / 20.0)
+    vb = vh ** 0.4996667741545416
+    a0 = 1.0 + k / q + k * k
+    shelf_b = np.array([
+        (vh + vb * k / q + k * k) / a0,
+        2.0 * (k * k - vh) / a0,
+        (vh - vb * k / q + k * k) / a0,
+    ])
+    shelf_a = np.array([1.0, 2.0 * (k * k - 1.0) / a0, (1.0 - k / q + k * k) / a0])
+
+    # Stage 2: RLB high-pass
+    f0 = 38.13547087602444
+    q = 0.5003270373238773
+    k = np.tan(np.pi * f0 / sample_rate)
+    a0 = 1.0 + k / q + k * k
+    highpass_b = np.array([1.0, -2.0, 1.0])
+    highpass_a = np.array([1.0, 2.0 * (k * k - 1.0) / a0, (1.0 - k / q + k * k) / a0])
+
+    return [(shelf_b, shelf_a), (highpass_b, highpass_a)]
+
+
+def _as_frames(samples: np.ndarray) -> np.ndarray:
+    """Return samples as a float64 (frames, channels) matrix."""
+    samples = np.asarray(samples, dtype=np.float64)
+    if samples.ndim == 1:
+        samples = samples[:, np.newaxis]
+    return samples
+
+
+def block_energies(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+    """
+    Compute the channel-weighted mean square of every 400 ms gating block.
+
+    Args:
+        samples: Audio as (frames,) or (frames, channels)
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        One energy value per gating block (empty if shorter than one block)
+    """
+    frames = _as_frames(samples)
+    weighted = frames
+    for b, a in k_weighting_filters(sample_rate):
+        weighted = signal.lfilter(b, a, weighted, axis=0)
+
+    block = int(round(BLOCK_SECONDS * sample_rate))
+    step = int(round(block * (1.0 - BLOCK_OVERLAP)))
+    if len(weighted) < block:
+        return np.empty(0)
+
+    # Block sums from a running sum of squares, all blocks at once
+    cumulative = np.concatenate(
+        [np.zeros((1, weighted.shape[1])), np.cumsum(weighted ** 2, axis=0)]
+    )
+    starts = np.arange(0, len(weighted) - block + 1, step)
+    mean_squares = (cumulative[starts + block] - cumulative[starts]) / block
+
+    weights = np.array(
+        [CHANNEL_WEIGHTS[min(i, len(CHANNEL_WEIGHTS) - 1)] for i in range(weighted.shape[1])]
+    )
+    return mean_squares @ weights
+
+
+def _energy_to_lufs(energy: np.ndarray | float) -> np.ndarray | float:
+    """Convert weighted mean-square energy to LUFS."""
+    with np.errstate(divide='ignore'):
+        return -0.691 + 10.0 * np.log10(energy)
+
+
+def integrated_loudness(samples: np.ndarray, sample_rate: int) -> float:
+    """
+    Measure gated integrated loudness per ITU-R BS.1770-4.
+
+    Args:
+        samples: Audio as (frames,) or (frames, channels), full scale = 1.0
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        Integrated loudness in LUFS (-inf for silence or very short input)
+    """
+    energies = block_energies(samples, sample_rate)
+    if energies.size == 0:
+        return float('-inf')
+
+    loudness = _energy_to_lufs(energies)
+    gated = energies[loudness > ABSOLUTE_GATE_LUFS]
+    if gated.size == 0:
+        return float('-inf')
+
+    relative_gate = _energy_to_lufs(gated.mean()) + RELATIVE_GATE_LU
+    gated = energies[(loudness > ABSOLUTE_GATE_LUFS) & (loudness > relative_gate)]
+    if gated.size == 0:
+        return float('-inf')
+
+    return float(_energy_to_lufs(gated.mean()))
+
+
+def _oversampled_peaks(frames: np.ndarray, oversample: int) -> np.ndarray:
+    """Return the absolute peak around every input frame after oversampling."""
+    upsampled = signal.resample_poly(frames, oversample, 1, axis=0)
+    peaks = np.abs(upsampled).reshape(len(frames), oversample, -1).max(axis=1)
+    return np.maximum(peaks.max(axis=1), np.abs(frames).max(axis=1))
+
+
+def true_peak(samples: np.ndarray, sample_rate: int, oversample: int = 4) -> float:
+    """
+    Measure the true peak level with polyphase oversampling (BS.1770 Annex 2).
+
+    Args:
+        samples: Audio as (frames,) or (frames, channels)
+        sample_rate: Sample rate in Hz (4x oversampling below 96 kHz)
+        oversample: Oversampling factor
+
+    Returns:
+        True peak in dBTP (-inf for digital silence)
+    """
+    frames = _as_frames(samples)
+    if frames.size == 0:
+        return float('-inf')
+    if sample_rate >= 96000:
+        oversample = max(1, oversample // 2)
+
+    peak = _oversampled_peaks(frames, oversample).max()
+    with np.errstate(divide='ignore'):
+        return float(20.0 * np.log10(peak))
+
+
+def _running_min(values: np.ndarray, window: int) -> np.ndarray:
+    """Centered running minimum in O(n) (van Herk / Gil-Werman)."""
+    half = window // 2
+    padded = np.concatenate([np.ones(half), values, np.ones(window)])
+    blocks = -(-len(padded) // window)
+    padded = np.concatenate([padded, np.ones(blocks * window - len(padded))]).reshape(-1, window)
+
+    prefix = np.minimum.accumulate(padded, axis=1).ravel()
+    suffix = np.minimum.accumulate(padded[:, ::-1], axis=1)[:, ::-1].ravel()
+
+    starts = np.arange(len(values))
+    return np.minimum(suffix[starts], prefix[starts + window - 1])
+
+
+def limit_true_peak(
+    samples: np.ndarray,
+    sample_rate: int,
+    ceiling_db: float,
+    oversample: int = 4
+) -> tuple[np.ndarray, bool]:
+    """
+    Apply a look-ahead true-peak limiter.
+
+    The gain curve is the running minimum of the required per-frame gain,
+    smoothed with a moving average of the same width, so it never exceeds
+    the gain any frame needs and never steps abruptly.
+
+    Args:
+        samples: Audio as (frames,) or (frames, channels)
+        sample_rate: Sample rate in Hz
+        ceiling_db: True peak ceiling in dBTP
+        oversample: Oversampling factor for peak detection
+
+    Returns:
+        Tuple of (limited samples, whether any gain reduction was applied)
+    """
+    frames = _as_frames(samples)
+    if frames.size == 0:
+        return frames, False
+
+    ceiling = 10 ** (ceiling_db / 20.0)
+    peaks = _oversampled_peaks(frames, oversample)
+    if peaks.max() <= ceiling:
+        return frames, False
+
+    with np.errstate(divide='ignore'):
+        required = np.minimum(1.0, ceiling / peaks)
+
+    window = max(1, int(LIMITER_LOOKAHEAD_SECONDS * sample_rate)) * 2 + 1
+    gain = _running_min(required, window)
+    # Edge padding keeps the average at the ends below what the edge frames need
+    gain = np.convolve(
+        np.pad(gain, window // 2, mode='edge'), np.ones(window) / window, mode='valid'
+    )
+
+    limited = frames * gain[:, np.newaxis]
+
+    # Catch residual inter-sample overshoot of the smoothed curve
+    residual = 10 ** (true_peak(limited, sample_rate, oversample) / 20.0)
+    if residual > ceiling:
+        limited *= ceiling / residual
+
+    return limited, True
+
+
+def normalize_loudness(
+    samples: np.ndarray,
+    sample_rate: int,
+    target_lufs: float = -14.0,
+    true_peak_db: float = -1.0
+) -> tuple[np.ndarray, NormalizationResult]:
+    """
+    Normalize a buffer to a target integrated loudness with a true-peak ceiling.
+
+    Args:
+        samples: Audio as (frames,) or (frames, channels)
+        sample_rate: Sample rate in Hz
+        target_lufs: Target integrated loudness in LUFS
+        true_peak_db: True peak ceiling in dBTP
+
+    Returns:
+        Tuple of (processed samples, NormalizationResult)
+    """
+    start = time.perf_counter()
+    frames = _as_frames(samples)
+
+    input_lufs = integrated_loudness(frames, sample_rate)
+    input_peak = true_peak(frames, sample_rate)
+
+    # Silence (or audio shorter than one gating block) is left untouched
+    gain_db = target_lufs - input_lufs if np.isfinite(input_lufs) else 0.0
+    processed = frames * 10 ** (gain_db / 20.0)
+    processed, limited = limit_true_peak(processed, sample_rate, true_peak_db)
+
+    result = NormalizationResult(
+        input_lufs=input_lufs,
+        input_true_peak_db=input_peak,
+        output_lufs=integrated_loudness(processed, sample_rate),
+        output_true_peak_db=true_peak(processed, sample_rate),
+        gain_db=gain_db,
+        limited=limited,
+        duration_seconds=len(frames) / sample_rate,
+        processing_seconds=time.perf_counter() - start,
+    )
+    return processed, result
+
+
+def decode_audio(audio_path: Path, sample_rate: int = 44100, channels: int = 1) -> np.ndarray:
+    """
+    Decode an audio file into a float32 (frames, channels) buffer with ffmpeg.
+
+    Args:
+        audio_path: Input audio file
+        sample_rate: Output sample rate in Hz
+        channels: Output channel count
+
+    Returns:
+        Decoded samples, full scale = 1.0
+    """
+    result = subprocess.run(
+        [
+            'ffmpeg',
+            '-v', 'error',
+            '-i', str(audio_path),
+            '-f', 'f32le',
+            '-acodec', 'pcm_f32le',
+            '-ac', str(channels),
+            '-ar', str(sample_rate),
+            'pipe:1'
+        ],
+        capture_output=True,
+        timeout=60,
+        check=True
+    )
+    return np.frombuffer(result.stdout, dtype='<f4').reshape(-1, channels)
+
+
+def encode_audio(
+    samples: np.ndarray,
+    sample_rate: int,
+    output_path: Path,
+    bitrate: str = '128k'
+) -> None:
+    """
+    Encode a float buffer to MP3 with ffmpeg in a single pass.
+
+    Args:
+        samples: Audio as (frames,) or (frames, channels)
+        sample_rate: Sample rate in Hz
+        output_path: Output MP3 path
+        bitrate: MP3 bitrate
+    """
+    frames = _as_frames(samples)
+    subprocess.run(
+        [
+            'ffmpeg',
+            '-y',
+            '-v', 'error',
+            '-f', 'f32le',
+            '-ar', str(sample_rate),
+            '-ac', str(frames.shape[1]),
+            '-i', 'pipe:0',
+            '-c:a', 'libmp3lame',
+            '-b:a', bitrate,
+            str(output_path)
+        ],
+        input=frames.astype('<f4').tobytes(),
+        capture_output=True,
+        timeout=60,
+        check=True
+    )
+
+
+def normalize_file(
+    input_path: Path,
+    output_path: Path,
+    target_lufs: float = -14.0,
+    true_peak_db: float = -1.0,
+    sample_rate: int = 44100,
+    channels: int = 1
+) -> NormalizationResult:
+    """
+    Decode, normalize and encode one file (one decode, one encode).
+
+    Args:
+        input_path: Input audio file
+        output_path: Output MP3 path
+        target_lufs: Target integrated loudness in LUFS
+        true_peak_db: True peak ceiling in dBTP
+        sample_rate: Processing and output sample rate in Hz
+        channels: Processing and output channel count
+
+    Returns:
+        NormalizationResult; processing_seconds covers decode through encode
+    """
+    start = time.perf_counter()
+    input_path = Path(input_path)
+
+    samples = decode_audio(input_path, sample_rate, channels)
+    processed, result = normalize_loudness(samples, sample_rate, target_lufs, true_peak_db)
+    encode_audio(processed, sample_rate, output_path)
+
+    result.processing_seconds = time.perf_counter() - start
+    logger.debug(
+        f"Normalized {input_path.name}: {result.input_lufs:.1f} -> "
+        f"{result.output_lufs:.1f} LUFS in {result.processing_seconds:.2f}s"
+    )
+    return result
@@ -0,0 +1,159 @@
+"""
+MP3 Frames Module - Subprocess-free MP3 duration
+
+Reads MPEG audio frame headers to compute duration, either incrementally
+while a TTS stream is written to disk or from a file on disk.
+"""
+
+from pathlib import Path
+
+# Bitrates in kbps, indexed by [version_family][layer][bitrate_index]
+_BITRATES = {
+    1: {
+        1: (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+        2: (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+        3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    },
+    2: {
+        1: (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+        2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+        3: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    },
+}
+
+# Sample rates indexed by version bits (0 = MPEG 2.5, 2 = MPEG 2, 3 = MPEG 1)
+_SAMPLE_RATES = {
+    0: (11025, 12000, 8000),
+    2: (22050, 24000, 16000),
+    3: (44100, 48000, 32000),
+}
+
+HEADER_SIZE = 4
+ID3V2_HEADER_SIZE = 10
+
+
+def parse_frame_header(header: bytes) -> tuple[int, int, int] | None:
+    """
+    Parse a 4-byte MPEG audio frame header.
+
+    Args:
+        header: The four header bytes
+
+    Returns:
+        Tuple of (frame_length, samples_per_frame, sample_rate), or None if the
+        bytes are not a valid frame header
+    """
+    if len(header) < HEADER_SIZE or header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+        return None
+
+    version_bits = (header[1] >> 3) & 0x03
+    layer_bits = (header[1] >> 1) & 0x03
+    bitrate_index = header[2] >> 4
+    sample_rate_index = (header[2] >> 2) & 0x03
+    padding = (header[2] >> 1) & 0x01
+
+    if version_bits == 1 or layer_bits == 0 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    layer = 4 - layer_bits
+    family = 1 if version_bits == 3 else 2
+    bitrate = _BITRATES[family][layer][bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version_bits][sample_rate_index]
+
+    if layer == 1:
+        return (12 * bitrate // sample_rate + padding) * 4, 384, sample_rate
+    if layer == 3 and family == 2:
+        return 72 * bitrate // sample_rate + padding, 576, sample_rate
+    return 144 * bitrate // sample_rate + padding, 1152, sample_rate
+
+
+class Mp3FrameCounter:
+    """
+    Incrementally count MP3 frames from a byte stream.
+
+    Feed chunks as they arrive (for example while streaming TTS audio to
+    disk) and read ``duration_seconds`` at the end. ID3v2 tags, a leading
+    Xing/Info frame and junk between frames are skipped.
+    """
+
+    def __init__(self):
+        self.frames = 0
+        self.samples = 0
+        self.sample_rate = 0
+        self._buffer = bytearray()
+        self._skip = 0
+        self._started = False
+
+    @property
+    def duration_seconds(self) -> float:
+        """Duration of all complete frames seen so far."""
+        return self.samples / self.sample_rate if self.sample_rate else 0.0
+
+    def feed(self, chunk: bytes) -> None:
+        """Consume the next chunk of the stream."""
+        if self._skip:
+            skipped = min(self._skip, len(chunk))
+            self._skip -= skipped
+            chunk = chunk[skipped:]
+        self._buffer += chunk
+
+        offset = 0
+        buffer = self._buffer
+        while len(buffer) - offset >= HEADER_SIZE:
+            if not self._started and buffer[offset:offset + 3] == b"ID3":
+                if len(buffer) - offset < ID3V2_HEADER_SIZE:
+                    break
+                offset += self._id3_size(buffer[offset:offset + ID3V2_HEADER_SIZE])
+                if offset > len(buffer):
+                    self._skip = offset - len(buffer)
+                    offset = len(buffer)
+                continue
+
+            parsed = parse_frame_header(bytes(buffer[offset:offset + HEADER_SIZE]))
+            if parsed is None:
+                # Resync on the next possible frame sync byte
+                next_sync = buffer.find(b"\xff", offset + 1)
+                offset = next_sync if next_sync >= 0 else len(buffer)
+                continue
+
+            frame_length, samples, sample_rate = parsed
+            if len(buffer) - offset < frame_length:
+                break
+
+            frame = buffer[offset:offset + frame_length]
+            is_info_frame = not self._started and (b"Xing" in frame or b"Info" in frame)
+            self._started = True
+            if not is_info_frame:
+                self.frames += 1
+                self.samples += samples
+                self.sample_rate = sample_rate
+            offset += frame_length
+
+        del self._buffer[:offset]
+
+    @staticmethod
+    def _id3_size(header: bytes) -> int:
+        """Total size of an ID3v2 tag from its 10-byte header."""
+        size = 0
+        for byte in header[6:10]:
+            size = (size << 7) | (byte & 0x7F)
+        footer = ID3V2_HEADER_SIZE if header[5] & 0x10 else 0
+        return ID3V2_HEADER_SIZE + size + footer
+
+
+def mp3_duration(audio_path: Path, chunk_size: int = 64 * 1024) -> float | None:
+    """
+    Compute an MP3 file's duration from its frame headers.
+
+    Args:
+        audio_path: Path to the MP3 file
+        chunk_size: Read size in bytes
+
+    Returns:
+        Duration in seconds, or None if no MPEG audio frames were found
+    """
+    counter = Mp3FrameCounter()
+    with open(audio_path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            counter.feed(chunk)
+    return counter.duration_seconds if counter.frames else None
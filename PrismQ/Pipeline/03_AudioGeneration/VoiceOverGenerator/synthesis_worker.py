@@ -0,0 +1,447 @@
+"""
+Synthesis Worker - Long-lived warm-model process for voice-cloned TTS
+
+The worker is a subprocess that loads the Coqui XTTS model once (on CPU by
+default) and serves requests over the JSONL protocol used by the ML scripts:
+
+    Request:  {"id": "<id>", "op": "<command>", "args": {...}}
+    Response: {"id": "<id>", "ok": true, "data": {...}, "error": null}
+
+Operations:
+    - ping: Report model, device and cached voices
+    - voice.register: Cache a speaker embedding as a ready float32 array
+    - voice.embed: Compute a speaker embedding from reference audio
+    - tts.synthesize: Synthesize text with a registered voice to a file
+    - stats: Request and drained-batch counters
+    - shutdown: Stop the worker
+
+Synthesis requests that arrive together are grouped by voice: the worker
+drains up to ``--max-batch`` requests (waiting at most ``--batch-wait``
+seconds) and synthesizes each voice's requests back to back with its
+cached embedding. This is voice grouping, not batched inference: the Coqui
+TTS API synthesizes one text per call, so every request is still its own
+forward pass through the warm model.
+
+``SynthesisWorkerClient`` starts the worker and talks to it from Python.
+This module only depends on NumPy so it can run as a standalone script.
+"""
+
+import argparse
+import importlib
+import json
+import logging
+import queue
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "tts_models/multilingual/multi-dataset/xtts_v2"
+
+# Operations answered immediately rather than grouped with synthesis requests
+CONTROL_OPS = ('ping', 'voice.register', 'voice.embed', 'stats', 'shutdown')
+
+
+def load_xtts_model(model_name: str, device: str = "cpu"):
+    """
+    Load a Coqui TTS model onto a device.
+
+    Args:
+        model_name: Coqui model name
+        device: Torch device ('cpu' or 'cuda')
+
+    Returns:
+        Loaded TTS API object
+    """
+    try:
+        from TTS.api import TTS
+    except ImportError:
+        raise ImportError("Coqui TTS not installed. Install with: pip install TTS>=0.20.0")
+    return TTS(model_name).to(device)
+
+
+def _resolve_factory(spec: str | None):
+    """Resolve a 'module:callable' model factory spec."""
+    if not spec:
+        return load_xtts_model
+    module_name, _, attr = spec.partition(':')
+    return getattr(importlib.import_module(module_name), attr)
+
+
+class _Worker:
+    """Request loop of the worker process."""
+
+    def __init__(self, model_name: str, device: str, factory, max_batch: int, batch_wait: float):
+        self.model_name = model_name
+        self.device = device
+        self.factory = factory
+        self.max_batch = max(1, max_batch)
+        self.batch_wait = batch_wait
+        self.model = None
+        self.voices: dict[str, np.ndarray] = {}
+        self.stats = {'requests': 0, 'batches': 0, 'max_batch_size': 0, 'synthesized': 0}
+        self.requests: queue.Queue = queue.Queue()
+        self._out_lock = threading.Lock()
+
+    def _write(self, request_id: str, data: object = None, error: str | None = None) -> None:
+        response = {
+            "id": request_id,
+            "ok": error is None,
+            "data": data if error is None else None,
+            "error": error,
+        }
+        with self._out_lock:
+            sys.stdout.write(json.dumps(response) + "\n")
+            sys.stdout.flush()
+
+    def _read_stdin(self) -> None:
+        """Feed parsed requests into the queue; None marks end of input."""
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            try:
+                self.requests.put(json.loads(line))
+            except json.JSONDecodeError as e:
+                self._write("", error=f"Invalid JSON: {e}")
+        self.requests.put(None)
+
+    def _ensure_model(self):
+        if self.model is None:
+            start = time.perf_counter()
+            self.model = self.factory(self.model_name, self.device)
+            logger.info(f"Loaded {self.model_name} on {self.device} in {time.perf_counter() - start:.1f}s")
+        return self.model
+
+    def _handle_control(self, op: str, args: dict) -> object:
+        if op == 'ping':
+            return {
+                'model': self.model_name,
+                'device': self.device,
+                'loaded': self.model is not None,
+                'voices': sorted(self.voices),
+            }
+        if op == 'voice.register':
+            embedding = np.asarray(args['embedding'], dtype=np.float32)
+            self.voices[args['voice']] = embedding
+            return {'voice': args['voice'], 'dim': int(embedding.size)}
+        if op == 'voice.embed':
+            model = self._ensure_model()
+            embedding = model.synthesizer.compute_speaker_embedding(str(args['audio_path']))
+            return {'embedding': np.asarray(embedding, dtype=np.float32).ravel().tolist()}
+        if op == 'stats':
+            return dict(self.stats, voices=len(self.voices))
+        raise ValueError(f"Unknown operation: {op}")
+
+    def _synthesize_by_voice(self, batch: list[dict]) -> None:
+        """Synthesize drained requests one by one, grouped by voice."""
+        self.stats['batches'] += 1
+        self.stats['max_batch_size'] = max(self.stats['max_batch_size'], len(batch))
+
+        by_voice: dict[str, list[dict]] = {}
+        for request in batch:
+            by_voice.setdefault(request.get('args', {}).get('voice', ''), []).append(request)
+
+        for voice, requests in by_voice.items():
+            embedding = self.voices.get(voice)
+            for request in requests:
+                request_id = request.get('id', '')
+                args = request.get('args', {})
+                if embedding is None:
+                    self._write(request_id, error=f"Voice '{voice}' is not registered")
+                    continue
+                try:
+                    start = time.perf_counter()
+                    out_path = Path(args['out_path'])
+                    out_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._ensure_model().tts_to_file(
+                        text=args['text'],
+                        speaker_embedding=embedding,
+                        file_path=str(out_path),
+                        language=args.get('language', 'en'),
+                    )
+                    self.stats['synthesized'] += 1
+                    self._write(request_id, {
+                        'out_path': str(out_path),
+                        'voice': voice,
+                        'batch_size': len(batch),
+                        'elapsed': time.perf_counter() - start,
+                    })
+                except Exception as e:
+                    self._write(request_id, error=str(e))
+
+    def run(self) -> None:
+        """Serve requests until shutdown or end of input."""
+        threading.Thread(target=self._read_stdin, daemon=True).start()
+
+        while True:
+            request = self.requests.get()
+            if request is None:
+                return
+
+            # Drain whatever else arrives within the batch window
+            batch = [request]
+            deadline = time.monotonic() + self.batch_wait
+            while len(batch) < self.max_batch:
+                try:
+                    nxt = self.requests.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                batch.append(nxt)
+                if nxt is None:
+                    break
+
+            synth = []
+            stop = False
+            for request in batch:
+                if request is None:
+                    stop = True
+                    continue
+                self.stats['requests'] += 1
+                op = request.get('op', '')
+                if op == 'tts.synthesize':
+                    synth.append(request)
+                    continue
+                if op == 'shutdown':
+                    stop = True
+                    self._write(request.get('id', ''), {'stopped': True})
+                    continue
+                try:
+                    self._write(request.get('id', ''), self._handle_control(op, request.get('args', {})))
+                except Exception as e:
+                    self._write(request.get('id', ''), error=str(e))
+
+            if synth:
+                self._synthesize_by_voice(synth)
+            if stop:
+                return
+
+
+class SynthesisWorkerClient:
+    """
+    Client for a warm synthesis worker process.
+
+    Starts the worker on first use and keeps it running until ``stop()``,
+    so the model is loaded once per client instead of once per call. Voice
+    embeddings are sent to the worker once and cached there as arrays.
+    Calls are thread-safe; ``submit`` returns a Future so many requests can
+    be in flight and drained together, grouped by voice.
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL,
+        device: str = "cpu",
+        max_batch: int = 8,
+        batch_wait: float = 0.05,
+        model_factory: str | None = None,
+        python: str | None = None,
+        env: dict[str, str] | None = None
+    ):
+        """
+        Initialize SynthesisWorkerClient.
+
+        Args:
+            model_name: Coqui TTS model to load in the worker
+            device: Torch device for the worker ('cpu' by default)
+            max_batch: Maximum requests drained and grouped at once
+            batch_wait: Seconds to wait for more requests before a batch runs
+            model_factory: Optional 'module:callable' replacing the Coqui loader
+            python: Python executable for the worker (default: current interpreter)
+            env: Environment for the worker process
+        """
+        self.model_name = model_name
+        self.device = device
+        self.max_batch = max_batch
+        self.batch_wait = batch_wait
+        self.model_factory = model_factory
+        self.python = python or sys.executable
+        self.env = env
+        self._process: subprocess.Popen | None = None
+        self._pending: dict[str, Future] = {}
+        self._registered: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker process is alive."""
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> None:
+        """Start the worker process if it is not running."""
+        with self._lock:
+            if self.running:
+                return
+            command = [
+                self.python, str(Path(__file__).resolve()),
+                '--model', self.model_name,
+                '--device', self.device,
+                '--max-batch', str(self.max_batch),
+                '--batch-wait', str(self.batch_wait),
+            ]
+            if self.model_factory:
+                command += ['--model-factory', self.model_factory]
+
+            self._process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+                env=self.env,
+            )
+            self._registered = {}
+            threading.Thread(target=self._read_responses, args=(self._process,), daemon=True).start()
+            logger.info(f"Started synthesis worker (pid {self._process.pid}) for {self.model_name}")
+
+    def _read_responses(self, process: subprocess.Popen) -> None:
+        """Resolve pending futures from worker responses."""
+        for line in process.stdout:
+            try:
+                response = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Ignoring invalid worker output: {line.strip()}")
+                continue
+            with self._lock:
+                future = self._pending.pop(response.get('id', ''), None)
+            if future is None:
+                continue
+            if response.get('ok'):
+                future.set_result(response.get('data'))
+            else:
+                future.set_exception(RuntimeError(response.get('error')))
+
+        # Worker exited: fail everything still waiting
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_exception(RuntimeError("Synthesis worker exited"))
+
+    def _call(self, op: str, args: dict | None = None) -> Future:
+        """Send one request and return a Future for its data."""
+        self.start()
+        request_id = uuid.uuid4().hex
+        future: Future = Future()
+        line = json.dumps({'id': request_id, 'op': op, 'args': args or {}}) + "\n"
+        with self._lock:
+            self._pending[request_id] = future
+            self._process.stdin.write(line)
+            self._process.stdin.flush()
+        return future
+
+    def ping(self, timeout: float | None = None) -> dict:
+        """Return worker status."""
+        return self._call('ping').result(timeout)
+
+    def stats(self, timeout: float | None = None) -> dict:
+        """Return worker request and batch counters."""
+        return self._call('stats').result(timeout)
+
+    def register_voice(self, voice: str, embedding) -> None:
+        """
+        Send a voice embedding to the worker unless it already has it.
+
+        Args:
+            voice: Voice name
+            embedding: Speaker embedding (array or list)
+        """
+        array = np.asarray(embedding, dtype=np.float32).ravel()
+        key = hash(array.tobytes())
+        with self._lock:
+            if self._registered.get(voice) == key and self.running:
+                return
+        # Not under the lock: the response reader needs it to resolve the call
+        self._call('voice.register', {'voice': voice, 'embedding': array.tolist()}).result()
+        with self._lock:
+            self._registered[voice] = key
+
+    def embed(self, audio_path: Path, timeout: float | None = None) -> np.ndarray:
+        """Compute a speaker embedding from reference audio with the warm model."""
+        data = self._call('voice.embed', {'audio_path': str(audio_path)}).result(timeout)
+        return np.asarray(data['embedding'], dtype=np.float32)
+
+    def submit(self, text: str, voice: str, out_path: Path, language: str = "en") -> Future:
+        """
+        Queue a synthesis request.
+
+        Args:
+            text: Text to synthesize
+            voice: Registered voice name
+            out_path: Output audio path
+            language: Language code
+
+        Returns:
+            Future resolving to the response data ('out_path', 'batch_size', ...)
+        """
+        return self._call('tts.synthesize', {
+            'text': text,
+            'voice': voice,
+            'out_path': str(out_path),
+            'language': language,
+        })
+
+    def synthesize(
+        self,
+        text: str,
+        voice: str,
+        out_path: Path,
+        language: str = "en",
+        timeout: float | None = None
+    ) -> Path:
+        """Synthesize one text and wait for the output path."""
+        return Path(self.submit(text, voice, out_path, language).result(timeout)['out_path'])
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Ask the worker to exit and wait for it."""
+        process = self._process
+        if process is None:
+            return
+        if process.poll() is None:
+            try:
+                self._call('shutdown').result(timeout)
+            except Exception:
+                pass
+            try:
+                process.stdin.close()
+                process.wait(timeout)
+            except (OSError, subprocess.TimeoutExpired):
+                process.kill()
+        self._process = None
+        logger.info("Stopped synthesis worker")
+
+    def __enter__(self) -> 'SynthesisWorkerClient':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main() -> None:
+    """Run the worker loop on stdin/stdout."""
+    parser = argparse.ArgumentParser(description="Warm-model voice synthesis worker")
+    parser.add_argument('--model', default=DEFAULT_MODEL, help="Coqui TTS model name")
+    parser.add_argument('--device', default='cpu', help="Torch device (default: cpu)")
+    parser.add_argument('--max-batch', type=int, default=8, help="Maximum requests drained and grouped at once")
+    parser.add_argument('--batch-wait', type=float, default=0.05, help="Seconds to wait to fill a batch")
+    parser.add_argument('--model-factory', help="Alternative 'module:callable' model loader")
+    parser.add_argument('--preload', action='store_true', help="Load the model before the first request")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+    worker = _Worker(
+        args.model, args.device, _resolve_factory(args.model_factory), args.max_batch, args.batch_wait
+    )
+    if args.preload:
+        worker._ensure_model()
+    worker.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ This module provides functionality for:
 1. Voice cloning from reference audio samples
 2. Multiple voice profiles per age/gender segment
 3. Voice quality validation
-4. Voice embedding storage and reuse
+4. Voice embedding storage and reuse (memory-mapped profile store)
 5. TTS generation with cloned voices
 6. A/B testing framework for voice variants
 """
@@ -15,9 +15,11 @@ import logging
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 
+from PrismQ.VoiceOverGenerator.voice_profile_store import VoiceProfileMapping, VoiceProfileStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -70,7 +72,8 @@ class VoiceCloner:
     def __init__(
         self,
         model_name: str = "tts_models/multilingual/multi-dataset/xtts_v2",
-        voice_profiles_dir: Optional[Path] = None
+        voice_profiles_dir: Optional[Path] = None,
+        worker=None
     ):
         """
         Initialize VoiceCloner.
@@ -78,14 +81,20 @@ class VoiceCloner:
         Args:
             model_name: Coqui TTS model to use
             voice_profiles_dir: Directory to store voice profiles
+            worker: Optional SynthesisWorkerClient; when given, embedding and
+                synthesis run in its warm-model process instead of in-process
         """
         self.model_name = model_name
-        self.voice_profiles: Dict[str, VoiceProfile] = {}
         self.voice_profiles_dir = voice_profiles_dir or Path("data/voices/cloned")
         self.voice_profiles_dir.mkdir(parents=True, exist_ok=True)
         
+        # Only the metadata index is parsed here; embeddings are memory-mapped on use
+        self.store = VoiceProfileStore(self.voice_profiles_dir)
+        self.voice_profiles = VoiceProfileMapping(self.store, VoiceProfile)
+        
         # TTS will be lazy-loaded to avoid import errors if not installed
         self._tts = None
+        self.worker = worker
         
         # Load existing profiles
         self._load_existing_profiles()
@@ -107,19 +116,9 @@ class VoiceCloner:
         return self._tts
     
     def _load_existing_profiles(self):
-        """Load existing voice profiles from disk."""
-        if not self.voice_profiles_dir.exists():
-            return
-        
-        for profile_file in self.voice_profiles_dir.glob("*_profile.json"):
-            try:
-                with open(profile_file, 'r') as f:
-                    profile_data = json.load(f)
-                    profile = VoiceProfile.from_dict(profile_data)
-                    self.voice_profiles[profile.name] = profile
-                    logger.info(f"Loaded voice profile: {profile.name}")
-            except Exception as e:
-                logger.error(f"Failed to load profile {profile_file}: {e}")
+        """Bring legacy JSON profiles into the profile store."""
+        self.store.migrate_json_profiles(self.voice_profiles_dir)
+        logger.info(f"Voice profile store has {len(self.store)} profiles")
     
     def clone_voice(
         self,
@@ -188,6 +187,9 @@ class VoiceCloner:
             Speaker embedding array
         """
         try:
+            if self.worker is not None:
+                return self.worker.embed(audio_path)
+            
             # Use TTS synthesizer to compute speaker embedding
             embedding = self.tts.synthesizer.compute_speaker_embedding(str(audio_path))
             return embedding
@@ -229,6 +231,10 @@ class VoiceCloner:
             overall_score=overall
         )
     
+    def _embedding_array(self, voice_name: str) -> np.ndarray:
+        """Get a voice's embedding as a float32 row of the memory-mapped store."""
+        return self.store.embedding(voice_name)
+    
     def synthesize_with_voice(
         self,
         text: str,
@@ -251,16 +257,20 @@ class VoiceCloner:
         if voice_name not in self.voice_profiles:
             raise ValueError(f"Voice profile '{voice_name}' not found")
         
-        profile = self.voice_profiles[voice_name]
-        
         logger.info(f"Synthesizing with voice '{voice_name}': {len(text)} chars")
         
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            # Convert embedding back to numpy array
-            embedding_array = np.array(profile.embedding, dtype=np.float32)
+            embedding_array = self._embedding_array(voice_name)
+            
+            if self.worker is not None:
+                # Embedding is sent once; the worker keeps it cached
+                self.worker.register_voice(voice_name, embedding_array)
+                self.worker.synthesize(text, voice_name, output_path, language)
+                logger.info(f"Audio generated: {output_path}")
+                return output_path
             
             # Generate speech with cloned voice
             self.tts.tts_to_file(
@@ -278,13 +288,9 @@ class VoiceCloner:
             raise
     
     def _save_profile(self, profile: VoiceProfile):
-        """Save voice profile to disk."""
-        profile_path = self.voice_profiles_dir / f"{profile.name}_profile.json"
-        
-        with open(profile_path, 'w') as f:
-            json.dump(profile.to_dict(), f, indent=2)
-        
-        logger.info(f"Profile saved: {profile_path}")
+        """Save voice profile to the profile store."""
+        self.voice_profiles[profile.name] = profile
+        logger.info(f"Profile saved: {profile.name} -> {self.store.root}")
     
     def get_profiles_by_demographic(
         self,
@@ -301,15 +307,33 @@ class VoiceCloner:
         Returns:
             List of matching VoiceProfile objects
         """
-        profiles = list(self.voice_profiles.values())
-        
-        if gender:
-            profiles = [p for p in profiles if p.gender == gender]
+        names = self.store.filter(gender=gender or None, age_bracket=age_bracket or None)
+        return [self.voice_profiles[name] for name in names]
+    
+    def find_similar_voices(
+        self,
+        reference_audio: Path,
+        top_k: int = 5,
+        gender: Optional[str] = None,
+        age_bracket: Optional[str] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Find stored voices that sound like a reference clip.
         
-        if age_bracket:
-            profiles = [p for p in profiles if p.age_bracket == age_bracket]
+        Args:
+            reference_audio: Path to reference audio file
+            top_k: Number of voices to return
+            gender: Restrict to a gender (optional)
+            age_bracket: Restrict to an age bracket (optional)
+            
+        Returns:
+            List of (voice_name, cosine_similarity) pairs, most similar first
+        """
+        if not reference_audio.exists():
+            raise FileNotFoundError(f"Reference audio not found: {reference_audio}")
         
-        return profiles
+        embedding = self._extract_embedding(reference_audio)
+        return self.store.nearest(embedding, top_k=top_k, gender=gender, age_bracket=age_bracket)
     
     def compare_voices(
         self,
@@ -330,6 +354,7 @@ class VoiceCloner:
         """
         output_dir.mkdir(parents=True, exist_ok=True)
         results = {}
+        pending = {}
         
         for voice_name in voice_names:
             if voice_name not in self.voice_profiles:
@@ -339,11 +364,23 @@ class VoiceCloner:
             output_path = output_dir / f"{voice_name}_test.wav"
             
             try:
+                if self.worker is not None:
+                    # Queue every voice so the worker can drain them together
+                    self.worker.register_voice(voice_name, self._embedding_array(voice_name))
+                    pending[voice_name] = (output_path, self.worker.submit(test_text, voice_name, output_path))
+                    continue
                 self.synthesize_with_voice(test_text, voice_name, output_path)
                 results[voice_name] = output_path
             except Exception as e:
                 logger.error(f"Failed to generate test audio for {voice_name}: {e}")
         
+        for voice_name, (output_path, future) in pending.items():
+            try:
+                future.result()
+                results[voice_name] = output_path
+            except Exception as e:
+                logger.error(f"Failed to generate test audio for {voice_name}: {e}")
+        
         logger.info(f"A/B test completed: {len(results)}/{len(voice_names)} voices")
         return results
     
@@ -375,8 +412,6 @@ class VoiceCloner:
             profiles_data = json.load(f)
         
         for name, profile_data in profiles_data.items():
-            profile = VoiceProfile.from_dict(profile_data)
-            self.voice_profiles[name] = profile
-            self._save_profile(profile)
+            self.voice_profiles[name] = VoiceProfile.from_dict(profile_data)
         
         logger.info(f"Imported {len(profiles_data)} profiles from {input_path}")
@@ -0,0 +1,274 @@
+"""
+Voice Profile Store - Compact on-disk storage for cloned voice profiles
+
+Profiles are split into two files in the profile directory:
+- ``voice_embeddings.f32``: every speaker embedding as one row of a float32
+  matrix, opened with ``numpy.memmap`` on first use
+- ``voice_index.json``: small metadata index (name, demographics, quality,
+  row number)
+
+Opening a store only parses the index. Embedding rows are paged in from the
+memory map when a profile is read or a similarity search runs, and
+``nearest`` scores every candidate voice with a single matrix product.
+"""
+
+import json
+import logging
+import os
+from collections.abc import Iterator, MutableMapping
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "voice_index.json"
+EMBEDDINGS_FILE = "voice_embeddings.f32"
+LEGACY_PROFILE_PATTERN = "*_profile.json"
+MIGRATED_SUFFIX = ".migrated"
+
+
+class VoiceProfileStore:
+    """
+    Memory-mapped store of voice embeddings with a metadata index.
+
+    Each voice occupies one row of the embedding matrix. Re-saving a voice
+    overwrites its row in place; new voices reuse rows freed by ``remove``
+    or take the next row after the indexed ones.
+    """
+
+    def __init__(self, root: Path):
+        """
+        Initialize VoiceProfileStore.
+
+        Args:
+            root: Directory holding the index and embedding matrix
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.root / INDEX_FILE
+        self.embeddings_path = self.root / EMBEDDINGS_FILE
+
+        self.dim: int | None = None
+        self.rows = 0
+        self.voices: dict[str, dict[str, object]] = {}
+        self._matrix: np.memmap | None = None
+        self._norms: np.ndarray | None = None
+
+        if self.index_path.exists():
+            with open(self.index_path, 'r') as f:
+                index = json.load(f)
+            self.dim = index.get('dim')
+            self.rows = index.get('rows', 0)
+            self.voices = index.get('voices', {})
+
+    def __len__(self) -> int:
+        return len(self.voices)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.voices
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Embedding matrix of shape (rows, dim), memory-mapped read-only."""
+        if self._matrix is None:
+            if not self.rows:
+                return np.empty((0, self.dim or 0), dtype=np.float32)
+            self._matrix = np.memmap(
+                self.embeddings_path, dtype=np.float32, mode='r', shape=(self.rows, self.dim)
+            )
+        return self._matrix
+
+    def _row_norms(self) -> np.ndarray:
+        if self._norms is None:
+            self._norms = np.linalg.norm(self.matrix, axis=1)
+        return self._norms
+
+    def embedding(self, name: str) -> np.ndarray:
+        """
+        Get a voice's embedding.
+
+        Args:
+            name: Voice name
+
+        Returns:
+            float32 embedding row (a view into the memory map)
+        """
+        if name not in self.voices:
+            raise KeyError(name)
+        return self.matrix[self.voices[name]['row']]
+
+    def metadata(self, name: str) -> dict[str, object]:
+        """Get a voice's index entry without touching its embedding."""
+        return self.voices[name]
+
+    def put(self, name: str, embedding, **metadata: object) -> None:
+        """
+        Store or replace a voice.
+
+        Args:
+            name: Voice name
+            embedding: Speaker embedding (array or list)
+            **metadata: Index fields (gender, age_bracket, quality_score, ...)
+        """
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        if self.dim is None:
+            self.dim = int(vector.size)
+        elif vector.size != self.dim:
+            raise ValueError(
+                f"Embedding for '{name}' has {vector.size} dimensions, store uses {self.dim}"
+            )
+
+        # Release the read-only map before writing to the file
+        self._matrix = None
+        self._norms = None
+
+        if name in self.voices:
+            row = self.voices[name]['row']
+        else:
+            used = {entry['row'] for entry in self.voices.values()}
+            row = next((r for r in range(self.rows) if r not in used), self.rows)
+
+        # Write at the row's offset rather than appending: bytes past the
+        # indexed rows (a crash before the index was saved) are overwritten
+        mode = 'r+b' if self.embeddings_path.exists() else 'wb'
+        with open(self.embeddings_path, mode) as f:
+            f.seek(row * self.dim * 4)
+            f.write(vector.tobytes())
+        self.rows = max(self.rows, row + 1)
+
+        self.voices[name] = dict(metadata, row=row)
+        self._save_index()
+
+    def remove(self, name: str) -> None:
+        """
+        Remove a voice from the index; its row is reused by the next new voice.
+
+        Args:
+            name: Voice name
+        """
+        del self.voices[name]
+        self._save_index()
+
+    def _save_index(self) -> None:
+        """Write the index atomically."""
+        tmp_path = self.index_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'dim': self.dim, 'rows': self.rows, 'voices': self.voices}, f, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    def filter(self, gender: str | None = None, age_bracket: str | None = None) -> list[str]:
+        """
+        Find voice names by demographic using only the index.
+
+        Args:
+            gender: Gender to match (optional)
+            age_bracket: Age bracket to match (optional)
+
+        Returns:
+            Matching voice names
+        """
+        return [
+            name for name, entry in self.voices.items()
+            if (gender is None or entry.get('gender') == gender)
+            and (age_bracket is None or entry.get('age_bracket') == age_bracket)
+        ]
+
+    def nearest(
+        self,
+        query,
+        top_k: int = 5,
+        gender: str | None = None,
+        age_bracket: str | None = None
+    ) -> list[tuple[str, float]]:
+        """
+        Find the voices most similar to an embedding by cosine similarity.
+
+        Args:
+            query: Query speaker embedding
+            top_k: Number of voices to return
+            gender: Restrict to a gender (optional)
+            age_bracket: Restrict to an age bracket (optional)
+
+        Returns:
+            List of (voice_name, similarity) pairs, most similar first
+        """
+        names = self.filter(gender, age_bracket)
+        if not names or top_k <= 0:
+            return []
+
+        q = np.asarray(query, dtype=np.float32).ravel()
+        if q.size != self.dim:
+            raise ValueError(f"Query has {q.size} dimensions, store uses {self.dim}")
+
+        rows = np.array([self.voices[name]['row'] for name in names])
+        denominator = self._row_norms()[rows] * np.linalg.norm(q)
+        scores = (self.matrix[rows] @ q) / np.where(denominator > 0, denominator, 1.0)
+
+        k = min(top_k, len(names))
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best])]
+        return [(names[i], float(scores[i])) for i in best]
+
+    def migrate_json_profiles(self, profiles_dir: Path | None = None) -> int:
+        """
+        Import legacy ``*_profile.json`` files that are not in the store yet.
+
+        Each file is renamed to ``*_profile.json.migrated`` once its profile is
+        in the store, so later startups do not parse it again.
+
+        Args:
+            profiles_dir: Directory with legacy profiles (default: store root)
+
+        Returns:
+            Number of profiles imported
+        """
+        imported = 0
+        for profile_file in sorted(Path(profiles_dir or self.root).glob(LEGACY_PROFILE_PATTERN)):
+            try:
+                with open(profile_file, 'r') as f:
+                    data = json.load(f)
+                if data['name'] not in self.voices:
+                    embedding = data.pop('embedding')
+                    self.put(data.pop('name'), embedding, **data)
+                    imported += 1
+                profile_file.replace(profile_file.with_name(profile_file.name + MIGRATED_SUFFIX))
+            except Exception as e:
+                logger.error(f"Failed to migrate profile {profile_file}: {e}")
+
+        if imported:
+            logger.info(f"Migrated {imported} JSON voice profiles into {self.root}")
+        return imported
+
+
+class VoiceProfileMapping(MutableMapping):
+    """
+    Dict-style view of a store that builds VoiceProfile objects on access.
+
+    Assigning or deleting a profile persists the change to the store.
+    """
+
+    def __init__(self, store: VoiceProfileStore, profile_cls):
+        self.store = store
+        self.profile_cls = profile_cls
+
+    def __getitem__(self, name: str):
+        entry = {k: v for k, v in self.store.metadata(name).items() if k != 'row'}
+        return self.profile_cls(name=name, embedding=self.store.embedding(name).tolist(), **entry)
+
+    def __setitem__(self, name: str, profile) -> None:
+        data = profile.to_dict()
+        data.pop('name')
+        self.store.put(name, data.pop('embedding'), **data)
+
+    def __delitem__(self, name: str) -> None:
+        self.store.remove(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.store
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self.store.voices))
+
+    def __len__(self) -> int:
+        return len(self.store)
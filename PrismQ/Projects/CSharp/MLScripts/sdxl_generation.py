@@ -1,20 +1,29 @@
 """
 SDXL (Stable Diffusion XL) image generation module.
 
-This module provides text-to-image generation using SDXL.
-Currently returns mock data; real model integration pending.
+This module provides text-to-image generation using SDXL. Requests are served
+by a persistent SDXL pipeline server (PrismQ.Shared.sdxl_server): the model is
+loaded once for the life of the process, style reference embeddings stay
+cached, and prompts sent together with img.generate_batch run in one forward
+pass. Start with --mock to return mock data without loading a model.
 
 Operations:
+    - echo: Echo test operation
+    - ping: Report model, device and registered styles
+    - style.register: Cache a style reference image
     - img.generate: Generate image from text prompt
+    - img.generate_batch: Generate images for many prompts, batched by style
+    - stats: Server statistics
 """
 
+import argparse
 import sys
 from common.io_json import run_jsonl_loop
 
 
 def handle_request(request_id: str, op: str, args: dict):
     """
-    Handle image generation operations.
+    Handle image generation operations with mock responses.
     
     Args:
         request_id: Request identifier
@@ -36,13 +45,6 @@ def handle_request(request_id: str, op: str, args: dict):
         seed = args.get("seed", 42)
         out_path = args.get("out_path", "output.png")
         
-        # TODO: Load and use real SDXL model
-        # from diffusers import StableDiffusionXLPipeline
-        # import torch
-        # pipe = StableDiffusionXLPipeline.from_pretrained(...)
-        # image = pipe(prompt=prompt, generator=torch.Generator().manual_seed(seed)).images[0]
-        # image.save(out_path)
-        
         return {
             "out_path": out_path,
             "prompt": prompt,
@@ -53,5 +55,65 @@ def handle_request(request_id: str, op: str, args: dict):
         raise ValueError(f"Unknown operation: {op}")
 
 
+def make_handler(
+    model_id: str,
+    device: str = "cuda",
+    max_batch: int = 4,
+    ip_adapter: bool = True,
+    backend: str = None
+):
+    """
+    Create a request handler backed by a persistent SDXL pipeline server.
+    
+    Args:
+        model_id: SDXL model ID or local path
+        device: Device to run on ('cuda', 'cpu', or 'mps')
+        max_batch: Most prompts generated in one forward pass
+        ip_adapter: Load the IP-Adapter for style references
+        backend: Optional 'module:callable' backend factory
+        
+    Returns:
+        Handler taking (request_id, op, args)
+    """
+    from PrismQ.Shared.sdxl_server import (
+        SDXLPipelineServer,
+        make_jsonl_handler,
+        resolve_backend_factory,
+    )
+    
+    server = SDXLPipelineServer(
+        model_id=model_id,
+        device=device,
+        max_batch=max_batch,
+        ip_adapter=ip_adapter,
+        backend_factory=resolve_backend_factory(backend)
+    ).start()
+    server_handler = make_jsonl_handler(server)
+    
+    def handler(request_id: str, op: str, args: dict):
+        if op == "echo":
+            return {"echo": args}
+        return server_handler(request_id, op, args)
+    
+    return handler
+
+
+def main(argv=None):
+    """Parse options and serve JSONL requests from stdin."""
+    parser = argparse.ArgumentParser(description="SDXL image generation JSONL worker")
+    parser.add_argument("--model", default="stabilityai/stable-diffusion-xl-base-1.0", help="SDXL model ID or path")
+    parser.add_argument("--device", default="cuda", help="Device: cuda, cpu or mps")
+    parser.add_argument("--max-batch", type=int, default=4, help="Most prompts per forward pass")
+    parser.add_argument("--no-ip-adapter", dest="ip_adapter", action="store_false", help="Skip IP-Adapter")
+    parser.add_argument("--backend", help="Backend factory as module:callable (for tests)")
+    parser.add_argument("--mock", action="store_true", help="Return mock responses without loading a model")
+    args = parser.parse_args(argv)
+    
+    if args.mock:
+        run_jsonl_loop(handle_request)
+    else:
+        run_jsonl_loop(make_handler(args.model, args.device, args.max_batch, args.ip_adapter, args.backend))
+
+
 if __name__ == "__main__":
-    run_jsonl_loop(handle_request)
+    main()